@@ -0,0 +1 @@
+"""Benchmarks of salat, see benchmarks.bench"""
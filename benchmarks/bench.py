@@ -0,0 +1,403 @@
+"""Benchmarks of the calculation hot paths.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench --output results.json
+
+Every benchmark reports the best time per call over several repeats, in seconds, and benchmarks
+calculating prayer times also report the solver iterations and solar function evaluations of one
+call, as recorded by salat.instrumentation. Results are written as JSON, and can be compared against
+a stored baseline, in which case the run fails if any benchmark is slower than the baseline by more
+than the tolerance:
+
+    python -m benchmarks.bench --baseline results.json --tolerance 0.25
+
+To compare how thread workers scale with and without the GIL, run the generate benchmarks with a
+regular and a free-threaded interpreter and compare the threads entries of the two results:
+
+    python3.13 -m benchmarks.bench --filter generate --output gil.json
+    python3.13t -m benchmarks.bench --filter generate --baseline gil.json
+
+Benchmarks needing optional dependencies that are not installed are skipped.
+"""
+from typing import Callable
+import argparse
+import datetime as dt
+import json
+import math
+import os
+import platform
+import sys
+import timeit
+
+import salat
+from salat import calculations
+from salat.instrumentation import instrument
+
+
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+
+# 2000-01-01 12:00 UTC
+NOON_SECONDS = 946728000.0
+EMPIRE_STATE_BUILDING_LAT_LONG = (40.748333, -73.985278)
+
+# registry of benchmark name to function returning the function to time, or None to skip
+BENCHMARKS: "dict[str, Callable[[], Callable[[], object]]]" = {}
+
+
+def benchmark(name: str):
+    """Decorator registering a benchmark setup function under name"""
+
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@benchmark("micro.eot_decl")
+def bench_eot_decl():
+    time = dt.datetime(2000, 1, 1, 12, tzinfo=dt.timezone.utc)
+    return lambda: calculations.eot_decl(time)
+
+
+@benchmark("micro.eot_decl_seconds")
+def bench_eot_decl_seconds():
+    return lambda: calculations.eot_decl_seconds(NOON_SECONDS)
+
+
+@benchmark("micro.kepler_solve")
+def bench_kepler_solve():
+    return lambda: calculations.kepler_solve(1.0, 0.0167)
+
+
+@benchmark("micro.kepler_solve_series")
+def bench_kepler_solve_series():
+    return lambda: calculations.kepler_solve_series(1.0, 0.0167)
+
+
+@benchmark("micro.timedelta_at_altitude")
+def bench_timedelta_at_altitude():
+    altitude = -math.radians(18)
+    latitude = EMPIRE_STATE_BUILDING_LAT_LONG[0]
+    return lambda: calculations.timedelta_at_altitude_seconds(altitude, 0.3, latitude)
+
+
+@benchmark("micro.linear_interpolation")
+def bench_linear_interpolation():
+    def function(seconds):
+        return math.sin((seconds - NOON_SECONDS) / 10000) - 0.5
+
+    return lambda: calculations.linear_interpolation_seconds(
+        function, NOON_SECONDS, NOON_SECONDS + 60
+    )
+
+
+def _bench_time_altitude(solver: calculations.Solver):
+    altitude = -math.radians(18)
+    latitude = EMPIRE_STATE_BUILDING_LAT_LONG[0]
+    zenith = calculations.time_zenith_seconds(dt.date(2000, 1, 1), 0)
+    return lambda: calculations.time_altitude_seconds(
+        zenith, altitude, latitude, True, solver=solver
+    )
+
+
+def _bench_calc_times(method: salat.CalculationMethod, solver: calculations.Solver):
+    try:
+        pt = salat.PrayerTimes(method, solver=solver)
+    except ImportError:
+        return None
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    date = dt.date(2000, 1, 1)
+    return lambda: pt.calc_times(date, dt.timezone.utc, long, lat)
+
+
+def _bench_timetable_year(solver: calculations.Solver):
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, solver=solver)
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    start = dt.date(2000, 1, 1)
+    end = dt.date(2000, 12, 31)
+    return lambda: pt.calc_times_range(start, end, dt.timezone.utc, long, lat)
+
+
+# the joint solver is the default, so its benchmarks keep the plain names
+_SOLVERS = [
+    (calculations.Solver.JOINT, ""),
+    (calculations.Solver.SECANT, ".secant"),
+    (calculations.Solver.NEWTON, ".newton"),
+]
+for _solver, _suffix in _SOLVERS:
+    benchmark(f"micro.time_altitude{_suffix}")(
+        lambda solver=_solver: _bench_time_altitude(solver)
+    )
+    for _method in salat.CalculationMethod:
+        benchmark(f"macro.calc_times.{_method.name.lower()}{_suffix}")(
+            lambda method=_method, solver=_solver: _bench_calc_times(method, solver)
+        )
+    benchmark(f"macro.timetable_year{_suffix}")(
+        lambda solver=_solver: _bench_timetable_year(solver)
+    )
+
+
+@benchmark("macro.timetable_year.eastern")
+def bench_timetable_year_eastern():
+    # converting to a timezone with daylight saving time, rather than to UTC
+    try:
+        import pytz
+    except ImportError:
+        return None
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    start = dt.date(2000, 1, 1)
+    end = dt.date(2000, 12, 31)
+    timezone = pytz.timezone("US/Eastern")
+    return lambda: pt.calc_times_range(start, end, timezone, long, lat)
+
+
+@benchmark("macro.timetable_year.persistent")
+def bench_timetable_year_persistent():
+    # reading a year that is already stored in a persistent cache
+    import tempfile
+    from salat.persistent import TimetableCache
+
+    path = os.path.join(tempfile.mkdtemp(), "times.sqlite")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path))
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    start = dt.date(2000, 1, 1)
+    end = dt.date(2000, 12, 31)
+    pt.calc_times_range(start, end, dt.timezone.utc, long, lat)
+    return lambda: pt.calc_times_range(start, end, dt.timezone.utc, long, lat)
+
+
+def _bench_precision(precision: salat.Precision):
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, precision=precision)
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    date = dt.date(2000, 1, 1)
+    return lambda: pt.calc_times(date, dt.timezone.utc, long, lat)
+
+
+for _precision in [salat.Precision.TABLE, salat.Precision.FAST]:
+    benchmark(f"macro.calc_times.isna.{_precision.name.lower()}")(
+        lambda precision=_precision: _bench_precision(precision)
+    )
+
+
+@benchmark("macro.calc_times_methods")
+def bench_calc_times_methods():
+    # every method and asr method, as shown side by side
+    try:
+        methods = {
+            (method, asr): salat.PrayerTimes(method, asr)
+            for method in salat.CalculationMethod
+            for asr in salat.AsrMethod
+        }
+    except ImportError:
+        return None
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    date = dt.date(2000, 1, 1)
+    return lambda: salat.calc_times_methods(methods, date, dt.timezone.utc, long, lat)
+
+
+def _grid(count: int) -> "tuple[list[float], list[float]]":
+    """Longitudes and latitudes of count locations spread between latitudes -45 and 45"""
+    longitudes = [-180 + 360 * i / count for i in range(count)]
+    latitudes = [-45 + 90 * ((i * 7919) % count) / count for i in range(count)]
+    return longitudes, latitudes
+
+
+@benchmark("macro.locations_100")
+def bench_locations():
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    date = dt.date(2000, 1, 1)
+    locations = list(zip(*_grid(100)))
+
+    def run():
+        for long, lat in locations:
+            pt.calc_times(date, dt.timezone.utc, long, lat)
+
+    return run
+
+
+@benchmark("macro.urban_100.tiles")
+def bench_urban_tiles():
+    # 100 users within a few kilometers of each other, sharing the solar state of their tiles
+    from salat.cache import TileCache
+
+    tiles = TileCache(salat.PrayerTimes(salat.CalculationMethod.ISNA))
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    date = dt.date(2000, 1, 1)
+    locations = [(long + (i % 10) * 0.003, lat + (i // 10) * 0.003) for i in range(100)]
+
+    def run():
+        for long, lat in locations:
+            tiles.calc_times(date, dt.timezone.utc, long, lat)
+
+    return run
+
+
+def _bench_generate(jobs: int, threads: bool = False):
+    from salat import batch
+
+    locations = list(zip(*_grid(200)))
+    start = dt.date(2000, 1, 1)
+    end = dt.date(2000, 1, 31)
+
+    def run():
+        method = salat.CalculationMethod.ISNA
+        for _ in batch.generate(locations, start, end, method, jobs=jobs, threads=threads):
+            pass
+
+    return run
+
+
+# a single process against one per CPU shows how generate scales
+benchmark("macro.generate_200x31.jobs1")(lambda: _bench_generate(1))
+benchmark("macro.generate_200x31.jobs_cpus")(lambda: _bench_generate(os.cpu_count() or 1))
+# thread workers only scale on free-threaded builds, see the gil entry of the results
+for _threads in [2, 4]:
+    benchmark(f"macro.generate_200x31.threads{_threads}")(
+        lambda jobs=_threads: _bench_generate(jobs, threads=True)
+    )
+
+
+@benchmark("macro.calc_times_batch_10000")
+def bench_calc_times_batch():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    date = dt.date(2000, 1, 1)
+    longitudes, latitudes = _grid(10000)
+    return lambda: pt.calc_times_batch(date, longitudes, latitudes)
+
+
+def time_function(function: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> dict:
+    """Times a function with timeit.
+
+    Args:
+        function (Callable[[], object]): Function to time
+        repeat (int, optional): Number of repeats, the best of which is reported. Defaults to 5.
+
+    Returns:
+        dict: seconds per call of the best repeat, and the number of calls per repeat
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {"seconds": best / number, "number": number}
+
+
+def run(pattern: str = "", repeat: int = DEFAULT_REPEAT) -> dict:
+    """Runs the registered benchmarks.
+
+    Args:
+        pattern (str, optional): Only run the benchmark with this name, or the benchmarks in this
+            group, like "micro" or "macro.urban_100". Defaults to all.
+        repeat (int, optional): Number of repeats of each benchmark. Defaults to 5.
+
+    Returns:
+        dict: machine description and results, ready to be written as JSON
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and name != pattern and not name.startswith(pattern + "."):
+            continue
+        function = setup()
+        if function is None:
+            continue
+        results[name] = time_function(function, repeat)
+
+        # count the work of one call, outside of the timing so it does not slow it down
+        with instrument() as recorder:
+            function()
+        if recorder.events:
+            stats = recorder.events.values()
+            results[name]["iterations"] = sum(event.iterations for event in stats)
+            results[name]["solar_calls"] = sum(event.solar_calls for event in stats)
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        # sys._is_gil_enabled only exists from Python 3.13, before which the GIL is always enabled
+        "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+
+
+def compare(
+    results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> "list[tuple[str, float, float]]":
+    """Finds benchmarks that are slower than a baseline.
+
+    Benchmarks missing from either results or baseline are ignored.
+
+    Args:
+        results (dict): Output of run
+        baseline (dict): Output of an earlier run
+        tolerance (float, optional): Allowed fractional slowdown. Defaults to 0.25.
+
+    Returns:
+        list[tuple[str, float, float]]: name, baseline seconds and result seconds of every
+            benchmark that regressed
+    """
+    regressions = []
+    for name, result in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["seconds"]
+        after = result["seconds"]
+        if after > before * (1 + tolerance):
+            regressions.append((name, before, after))
+    return regressions
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark salat calculations")
+    parser.add_argument(
+        "--filter", default="", help="only run the benchmark with this name, or the group"
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", help="path of the JSON file to write the results to")
+    parser.add_argument("--baseline", help="path of earlier results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed fractional slowdown compared to the baseline",
+    )
+    args = parser.parse_args(args)
+
+    results = run(args.filter, args.repeat)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    for name, result in results["results"].items():
+        line = f"{name:40} {result['seconds'] * 1e6:12.2f} us"
+        if "solar_calls" in result:
+            line += f" {result['solar_calls']:8} solar calls"
+        if baseline and name in baseline["results"]:
+            ratio = result["seconds"] / baseline["results"][name]["seconds"]
+            line += f" {ratio:8.2f}x"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after in regressions:
+            print(f"regression: {name} {before * 1e6:.2f} us -> {after * 1e6:.2f} us")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
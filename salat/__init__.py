@@ -1 +1,2 @@
-from .methods import PrayerTimes, CalculationMethod, AsrMethod
\ No newline at end of file
+from .methods import PrayerTimes, CalculationMethod, AsrMethod, Precision, calc_times_methods
+from .calculations import Solver
@@ -0,0 +1,752 @@
+"""Chebyshev coefficients used by salat.chebyshev.
+
+Generated by python -m salat.chebyshev, do not edit.
+"""
+
+START_SECONDS = -2208988800.0
+SEGMENT_SECONDS = 5529600.0
+SEGMENTS = 1148
+DEGREE = 7
+EOT_SCALE = 0.001
+DECL_SCALE = 1e-08
+
+# base64 of zlib compressed little-endian 32 bit integers
+COEFFICIENTS = (
+    "eNpcfAV0FcnzdfW8JC8GJDjBg7sE9+Cui7s7i7u7u7O42+Iuwd0hwSVY0CAh+ma6vttM8//l25zzzi6vX890l9y61VKz"
+    "6sbw7Aom13hrUG9BVPwLcwX8tygR/WLm55fbyLi8H2hYr6x0NbXJoeHMN7yI8qDtGz55kll8vLmTPlVnXrSJeYE7USz6"
+    "4j+Ex9DYkRtoiywhuEMUp55h8ihvIvyMa6DNB5/GSYg6THNx3YLME7oS1fUkemMx38Jv8L+0KayEsbFuZToz/z5PE8xf"
+    "WxCddxAVRvsnfOQyi9eMdKMPsYIaPWYeGMUchX6++LjQfuH+ABER7eTDRd5x5eQOCvQj2mwyz0M7mjngjTd9rO9O995b"
+    "fHAbc3UnUQ8MPBXZf/84c/OXJnfkokJJyfuJg9z8iY5J5o56/vVbGNRnRBRXnAxZrSPq64ax4fnP0ZYa/eMLXbCKnfzM"
+    "7B9E06YTpR/I7EL7L7wjJdrb74/mEW0MytHdoKBjzCWjmdehDdNgiIFp8g+571cOca1hCrr2xcUvIJQ5mH9RtCVF/yq5"
+    "iNZNd6PWtSQPv8E8AkJ1Q/8EtOM1HD+lhqi22UdUWhbBLS+Y3AvzX2YQTUNfDJUG/LD4SRMXv9wInfYh6o2O2/DibGiD"
+    "qmhbZAUjzPMJd/e8z4P34d+tMW60p8SzIQp69hU69vakZxkFPd3JnD+e+aeatxo7/mbmCaPP5cNktVbf+VMVB33yIFLj"
+    "bo9PDH6zP8aHco1iDve32O8V898Y30qM/zvaYvHxezlDpnsgOIuZnubHOygYD34Vx+zB9t/dvCanOPCLF88T9HgyUQ10"
+    "7Inx/Y3nw0zpbpPH1tDj7anQgsIUlVRyg6nMDdFQFu+4jP7RD2M55VwPCikmqN5K5pbom12/H2KiktY6budbRSzt7U4t"
+    "C5r8A+Nbq8aNTzK0/xwsyL8m0WI3ySVgy6fwZT18fxvtSgfexg0xPvgSnUnznG/WtPhNHjwbztEMv1H283y4ya8zSt52"
+    "XVCmMkQZfzDXxPfV0Q4z4xlzkxgxb4ay0/GIe2Q0aHx5okaQwQe0ZcRv+g1yp7AMXpT/LuxtOcaPTk/xPUyE1PjzDs1B"
+    "z3uEyG1ZTPb/20F14BjjMD+n9u/yd7xo5c84nhtssVmW6FUqW3cr8FH6qTTbX44a0Jh7Ream6s0ddPs083kYJ0yVC+EZ"
+    "34fGstwcz1fPG5QOcysDpxyM71viA1PmssPzybHLLlKPCzkpuLfJ7leY98FGoQZ+gs+msS7+FeKkGxCY8x/mahj4N40d"
+    "avzVtrcga2slkXZYHH8aaLJy7KTol1X7eKYLRJ3Hmvxrl+RrjYjm48u5kMFJ/EbJoN/hQCPJud6UvU8o3+go+SyUs87d"
+    "fv9rfDLcNLnkSoM2pDeoMeY1AvI/rJ5Ltg8VqL5NBFzNxmXeveIZHwzyDyBKB2CZhHaFT082eVGor5OcvSVPW82cE05V"
+    "UPu2msN0//5s5rsoHQc9acNRB3VOTlQK3y/Ds5WNpX3pRj51frHfbsk358O/MP5PcNwN2r9P57hljRcnecbKImTNFFRq"
+    "HOwS9q90GIT2TwujOSX+vf+oQRGwgSoY/y5h+7bS48LoPXJefz/xs2g6GvHBxQVh3/7wQX+04T+03RdyiHKnQeskHzwK"
+    "mcE3vIRtP8r+Cqz1EMVCs4gPzb5wum0mP4Xu8qF9iJ5/ttuSs7q7uCj+UWQAUUV8N9SyfVPpp9G2ysaG5O60adY9voEH"
+    "VoXjv1W4JG18qNGMOf0dD7qAubU8wXwfRifwfIVd6v23DqQTXgsjZK5dn7lLMQc1wHvuoWG0nl+6dz7knw6xq5HFaS4w"
+    "z8ZLtwh7bAr/L/e9LAst+iiLVUlNWxMcVAGGvxgN6dGm7L/1Zsn/bI3iMrCj0asQGwA6/fDySuifAp/3b65YS3YXpitr"
+    "i9JVJ3PXIfA9CPce3vFC2fC+GPbP5U4PQgQNg9Kaw2haoA1hlJX+n2xtxtutMuKstw89T2pyY+DHHXw/WuNnQQizRhqD"
+    "JrhLrg6DmAKln8b3bzR+fK67UuQ9+44OFgznCQ6LU8LpT+H94/T8i3wwecl2k53dBd1sAkyDDU9UctYYMGJ1buNQ4zX8"
+    "uF0oX1guaHBdopx4sLJ/ZeOPpjmomJcXde1EVBP2W9208cPS+Pfw/N8UOeyizFoslrO0clA62EdRTKyg9u/AtD70YYGL"
+    "Kzgtrg+BhcHwv6PtlJavc2R5uXZfAS74JhsNO+GgbnD68uhYUekOv2uYOZ7n1Yrldb0MCmgMvwB+1EbbEO1/7S8acu1f"
+    "a6jS6HzUOcrkEYgxuaHjHGTj9+KP8Txpo5PudgSewaniVFzRfdX43xVIQoObVBNb9lpcuaXJHSDfL9KOLYBrql1ZkOO5"
+    "xTPqSJ5XEvgL/G6KtuPa/u6XcTes9Ivoa8AjTvvE4pYw8CFwnAi0KR2FdzF57y7gVFqDCkO3zaDDKmTzJzWGErsfim3T"
+    "q/DNiGe8eZtBDRCvn0NxoDGk9N/Az5M+1fKkcy7J3zH+KZCtRXaMVOPfE3ycq5cOkT+6Oci5zEGP8Y7M+M1VPPsnPu3y"
+    "O2n93WhOG21xi0FEq4AvWaStX6V/37Ovraal5/KKGwVpc2+D8i9lPgXFwNypAilbiObi7TGvcIOeADtmfmUehOdn0/q9"
+    "UXawfNg+ms6JzPQSXlkbVOYUnCs12gA7/GCfxbEG8NsPvGU7OKCHPX53zZ/WlDtLhzoWEZvK/+CwBSa3B6lQuNNM84uq"
+    "e+CzlV2cqy9zcG+MF43/wvieqtiJ9qPDyxnh6QrTQd/7vKYO7L0N0QEIJqXmX9c9JceUc6cPzwW1Rwzph7lJst+hMKTi"
+    "ohaiVHNLjkgfwS8yOcgF22mC58/RNl66DgDtbzdqcNDiHhjLecxtvLB9X+n/XJA3lzwXJs8s8qM67x0UBPuIsGwbVfhd"
+    "paKg2DZR3AOgdnMDkeKVafFihT1p8P+lq5+3lnUHJ64YRLkQWxv2t7mjw7AxOvvHaO5bA7y0jEFf9jI/BP7NFTY3UO/P"
+    "IpLxzwEFRJG7fjTkl4tTY/z/oG91xY3Qf8tUorahDppaQHLLMOZRaI/XsV3Nf+7GjuJnCSF8Vr/jrfdNHoaJVYRhzNTx"
+    "aeUSi9uvdXGnN/CnbtA7lPoU8yus8b1JnTLG8PuXufXM++zlIioAw3XDgwtpfrt1pyAe4En+H4GrW8AbYfSfNDap5z9M"
+    "dZTuVbgjF3f+yd9qOSgz8HeUigua/1V74EN5G0v+AWzLHom4AKcYjY6vNf8YO3yAfPQ8Cefulon6fHNQM9joITivD9qU"
+    "jZUu6uJBraLZ66mgnsOIImG/vzD+4ZrfXlj6xnIFDqLFtQpRIDCg9nzmtTAsDJfO4xm9+8YxWR5UBqAxA/xpPISeQvNv"
+    "5X/rqpxlt2dVRUHkDmvKmjwQQq+Ltiua/4mhgn5MAh/2l5wC3OBtMjuvUdikbCD80wuRcuMR6jziKTftZ3EgBFsdxgmq"
+    "R59VDtPGZI+HwJ7Pgh4VAC+BUa3C95W1/aYKYvHlXjeu3OYxz6ln0N4SRLXi7XcHKB1V9iDD8qSeC5gzAz+C0eeVtn81"
+    "/jSt3Klnk9NyVnXJC0c46DxAb4ywZa9s5EZmL+LPsbylt8UdwY1mwkYR4niOitH4FJ0gZPjUzux8lZfyZnBQTxDftVG2"
+    "bgGXVO5zDC87mcDZHxl0AQb/EPj9EN/X0ja4ZF5F2Tj2Aa2YlZ0aBJs85T5sHwJqpvGzU36T161z0slF4E4g1hWhtB86"
+    "dql3ZBg3nPyylRfvq8XwgNEmF0ZfNceiOn98BZ1XdQcuhUsui9zkC3RbATo8q+3j9vD8xrGSrajm5Ad8Z6PkAMTIH3hH"
+    "O7QrHjIRycyFPg5K4W/QcYB6RYBqGPql1vjtcXaBGNYlDYzuNZ8wDWoG+ZyGYmdr+ypb2ptKtPegOYUh3/WwJ7y0us4f"
+    "1fjff23I3ZpelTk8fOjnJQeVBz4jzeTxGj+m3XdQnqdRHOMO311B1BrxdRoUDyrG+CktWnbF2lj2Dp/vWpTuAvgrDgfu"
+    "QjEn8XCEEjq4KJpDkPB5gsMOuwSdYvy7hc191Kd1i+tycqMA0X9vauodgfwRRvELA0+v8bUOFB3T3p0uD5O8+gxsH196"
+    "Cxu7Ff4Em4GiQ9O0YnnNTxyx3+TesJ+zaB+rbax6L8ltUrnYqoOcrj8RwgGPs2z7VPwvbcXKRvZlP7nphnvcDNxjejtg"
+    "Fh4s8VE5SAoIeXoXJyVpLyjPQebH8G1Ty1795a5tUbv1L2WBnV+5UlkHNUanzvgeryIVw7uxDy1zCOpQxOJswP9SCJzb"
+    "hZ3bK/v17bVL1m0QJW8dTEtBloOgZhqChyfV8Wv6YouvOX5xx0yCxi+CPcNor5p2fFZz2LLulhUANtXgYxHyWym5OXJV"
+    "Fya+Cu+4h/53csWy3y3ID4G7xhrmfyH0YLR91fjXuuBQ/h5QUQSs9aQX6U3+Avwop/Sq8XtUE0FuDQTVhLSRHnF+vHSx"
+    "4o2a/x0dvFf8CHlEjo4vOXcmcJhAcAbY2AAdn1fvRKfyFp9YKqg3nK6Xsl9pr6+o99/KnMlIlgNK7hnGeUIxRiSW2yAY"
+    "hBrOjPZOLdwoe3YvqgNCNR/5b17o7rFeG1H4kS17Q7rT5JzsUTeeAzo5qDXso6Ow8yP1fm+AaZJ+CRyYzuJ+2ZF7wfAh"
+    "Rtql8WXQrjyy6KNyHB2Qk94shZ9BRwPR0JvtNYa77eN4e6U4rrbMoNMg3QHAj/sKl7V+0/mlkL3W7aGiC/LQR9jf8SOQ"
+    "EQxL8QO1RtRwaQKL007aCLnkRtIaK2z8+MNfpy4qQAOiq4jC/V08BFytSRKb/6m1AcX//P0F7S5jcdIBknuCuFWA/ajA"
+    "e0yvX2z6ntzov2AitXgWxu7A+OvV4PPQ/2mdP26dYHIZEIYvmQxaANDaB6dW8S2PtuFX1S+Iy2OLc9jCF5z9skGVkbg2"
+    "TbDXJ9T7z130pDcPnPTlpORDGL9am/ETNjdU4//cfCUfKHBWTtjsTmc2OegCGm7j+0N4NkIh1yvvQVFponk8QK/sBKKe"
+    "MKpFmPxctv2rxP5HVtiI9Vwje2HygvGPmYWYBMWlFbYd3j4TzefHSG4calA3AHJSEI+lOn9V8h8TP1umWCXEkdkZqMRP"
+    "FyNV4n+cdg6u/vLWldx5hQelfyF5yh67De74m/+p9ksdX9K9N3mFV5ZvHLLS5H2wn5Fo66LXZ44gmM5P7eKwf5HTQyhr"
+    "FTfB+D+ir8L3tfUqGXEnMlLDw/f4KeLbX8CP6Xi+oflBnZmSC/5yJ/fTgsoB/wZjbur9QtvAhJoVxPWJUfK770fOlMdB"
+    "k/B+Cw3TdH54crUP9R2NuDbV4rawraZoX4zOfrr/yoCvslH+FzLcSk5LvjtoNGwvAS5XTMu/FfwmfdcovoyEa9d6IuWO"
+    "OfAJ0DGkRJsL1sPUqehe7iBqgvjwGfzvuuL4mmPsLhbDblncqLmnQT/An7sAlIZr/FB/rlIFOORTkMjaLCmNki7uBvu8"
+    "hPa2Gj/MUMSAtA4y0ko2wpn7wqjek91fza/CtpEigwn+vvsNX3pnciHE6AjIeIbG9/hKFl83YMOILVuRm6eCUDOgoazG"
+    "94QXQYbr8SHOUuoBDwKw7UX8TIsHN0Lf9GjfPMCgpyDNpfeBayD/TY6219r2lQ4GDFhBW9Nel/H9f3GJhg46AftQ8bWy"
+    "5n+blvlQ+5wWf5Qmt4LAW4Gf1kPH+xo/xrRoJTs/D+CZl7JQ8xcOqvEBnAId0+n8LahmAg/LGMOF4X91ehBlReI9Vdo+"
+    "qOR39sg3K0BMpXTXC9DGlhZ3A7ma4WNj7Dm09/SN5zsIKk8Ow6dgX0iP2E3zI+V/WfaF87aD1cSQM0QDa5q8E/icAm3P"
+    "9PpMaDdBGy5JrptD8uec4JRoV9zjjObfWZt+F9U6b6Ncvx6zc4XFG8HfhkGwKvdVOaRPI5NnYEwebgYVATYEf7fX9spp"
+    "+0xZ9ZuY0ag5n7/7hEsNN+hTIaJ+8Tb/UfmF09dJ8yD/v6CQSAy+iFoT0r6lxv9XkXd8MttpmRy5Yf4pDiqA8XUV9hqM"
+    "sr+OrTypSlwM31xrcVn41nY4/nvIb5oe/8lCUVaR5kM42Y78VPqhQSnB8cPQUfF3NcbRw2L452MXN3htkDt0ewekNpew"
+    "17iU/nLmaCqn9n9DP8sE0l9ZTK76gjnQ216/Vmsk88JMPt3TSa9bIl/aCLsDcEQn2j9I/W0ZmYdLibkBv3j0FJPXo+8M"
+    "zY8VPvwL3J+23sUXApjLdIZNI2mJgx1d0/hXd1Qx40rLmhR58T5f+Sh5e3NgG/hPGbblnBqcvHQZN1oLa70GpWbD3L7q"
+    "/FvJP8htpOgT4sPXFr7l2kkcVBX421vvH6i/XCe9Kdsqd3LEW3wAsrkC3bZPtH8QUqsoFxlyS5bokIQuPXDQEPQ3Id+e"
+    "On/tdsYgr7lRnASkpudaohOYOGjy7xionjHYuGi5H3nLTb4VJWMvUatBiH9o/yhsG8q0K5rXw3aODDao80n4E4S+Wfwv"
+    "/xu4P0IeK5BNTC6QktZ/QgyEUJDGUj7tP2q9Lu8pN6rxl+SOV2GvEKpTr78p/BsyoIKIkklFfPAHbhRi8irYT0cY1lTN"
+    "f186Jc+s6OLDc6GXvsA7CG2VZXMLpZ9nbpWMgwVe8amIe3xrOdEC5O+D0J5E+0/DHXjGeydlKiTo5m5wD+Dfr0T7B5Uy"
+    "vKLtkx/Jvf9+44HBDnoD+b5HWxcdn2qBZe5B3Jqb1uJJIAUvMb51ev6K3x0fvFA28ZSyQo70FJvgoFMYX2083Knn13C2"
+    "yX0m/OL8gwTFTEc++eM3neJeevwHGoVZxawWtPZnYbpURHLJSfYaQTO9BjN0VyyvaetBXWoJygs//g7B5dP5u/K/1mmX"
+    "8swylYVZxoPK5THZBGhfQNsOjd+beglaC2HONSQr292I8Xcgm1sqDC1f9aLY7bxOBzY/52AMLAak/wZspB3ZexSZkBN9"
+    "UxtmIYJ8K4DPYfz59f6awr9sUf7Ggh6j+cTyhzzQ16D9UHi7eHvtXXG4p3ncqXZOLzoFoS5D/ptE2vzP0J8GlQrTumRn"
+    "5I+eLk7XG/mjj52fJ9H+vTqJN3n8Fc9Nilv8oTjR81T22tFqHZ+f9k0j3z+uy5NK5aZfPRyUAUn3O/gYXJ3z43fDkczv"
+    "rRHPy48ZlBPYlhn8T+2ftNP88p5HDrkh2xmqMCEX5cVcn6H/M4wBVJUfqjy8qou7hzhpMACtEOT/w7D3D0iPv+yNesTb"
+    "g0XTEvH8rp/JjRG/HTp2qfwk132iCdsQe1ZL7lYfuImJbZf2+p/qn93MZATOG0CZz4ZyArjOe+Q5oPu0WPO/w3tNbtsU"
+    "Poz4UwsGGQz5b0e/rDoGthu3R3jlyM1hDV5xxCv4KV78Dg3jNEaH9POiwBpOmj1Ocvd/gLfwzRx6/Um9P8mBkbzM/4Is"
+    "8sVJ8fsdVC+5zZ3W6vxxYCV3Sj36F7ebJzn7HKL9GH9ymMM/ev3964w7lk+xQ3y1chGa86+gXBOBORgnwhaVUPF5XTRy"
+    "B9gDcKhgGPMePHS7Xj9X/mN83CKXP/QVY5MF0PePLg7H2IfCB5Pp/Lr1M8nTM3hQmz2SaxxGX3T01PsPyv7kPZNOT8sm"
+    "Rnh+5aBNJk/ysdcHB+j1pRMRkoPdXFwceYs7vkyDvsMtnbsp/G5c2chQzYdmzb3HDd5BvuAodRU+SNt/RyCRjVntQSeW"
+    "C4o8xTwaRmcIm7spfiM8swmf0Z/kBbfPPKuIgw7hpWulLX/1juKPfaj+CIPet7V4DYJ2HMa3QdhrkwoDe4bekXMWvZd9"
+    "+qSi7HEOuoL+v4AhWXX8HAog+2dBFK/eCExcDWyC0Jqho1obURw6+YDLVvs9eejxjaL0sSDzG+A36B69EvYaf9tFMdzh"
+    "rRvNuCeo6Cb4CwbVUe8fKBse7F+Xp3coLSJf+VBeb5M/qvUltA/W+webUyJ3hP1V8JLcAZ2qAVSvko2Ryv4Cxi8UeRI+"
+    "UsPr4VzRZfJc2N9MvH+its9R0SYvg1/1AaDFNwP3glN3l3Z8VTrctyef0bHAJt6RLJR/TRLUCj7SEh2H6/3Ha+Ud9BbA"
+    "dXsofBb5bwJk80zL7jcHbzySuty8JNdNjGGf5g7a6WmvXwdp/+ZKPtTV5eLWDounw3bHpbTnd17zv0dLqsrIG7n5Ttps"
+    "NOyig/KAP8xHx6A/++sgQ9/BX3K2MCgSsf3dJ5sbDtfx+9N2y/KstJzOBuSnsr4WV9qKuAPDCkY70gVesz+ey89zUtAw"
+    "oovgf+uUXLRt/N5/zG9QvhXVRIGhkjf/ZfJhyDdK2r6nMLB8TUGpU0jOHCx5Iib1F/TTn+39R2WDRRC2y8xZTjlnPWLH"
+    "VYvLlSca42Fjp+JgxWEsM8FbX6Q0qCfmrvaA1N5Kca2fbrefi8heNblxh2c8brVBrZFYnsDgGur9KffbThrT35P6+jPP"
+    "wfgLQHZxOrdU4/dJeZHnPDstb24x6BoSVLV+WQK/uaP3D15McJJ7+hie/NziDP0Q//DQJnr/QOmv69b3Vva70/hF9YK0"
+    "Z7pBhQG8AzD4LXr/oE2GGC6EhGg7+F8m4IofEo9O6Jhb67dctj7yaPx3+udhZtruNDk5SFdGL3v9SbUnHWVx0wxOOhPI"
+    "/By6QTpLrkT7B53DD1PjbkHi068fXGOuyd3gmICB3/xT+WgnKPHjXy4e3AJ20RPzUrk5BA8o+53j5zxSxshfugTlD7rP"
+    "BKOp2hrYBYzNgHaVI3V4bHEEu9GeCEFLEXRBM9mlsUnZ8PXAjsL7JfG0Ee/5bICDXkOwASq/1vnTsXw+5HnOjdJdtNja"
+    "hfGj4zCdPyvzblYhJb+Z80CuP5uMZoU76AvsIwgdG2v8nrpN0OMuUbwHyUjXDcgJ0DejaeeWyr639zpv3W8Zz6mKB1FN"
+    "2M4pGNcMtXdq2PEjzdNozhVt0OxaBm07AD4E/Fuizy+o8WX/5MZb3PKJlbv8KfiHi92Ab1/Rt6Jev26DYHI8iRsNKSHZ"
+    "wvxz+dr4HKP5Y9ePLcTdUDdRtup7fnzT5P6IP556/0DZl9sOi/0mAb9vw2eVHQP/rlh2bFfjM11ljUUfbnJ0q/sc/Aa+"
+    "0RL4oXJkzW9rIxkZ2tSThkLolbch3sO2vyTifzEVz1HKCvdky8M/uEcNB/3wsM8WNNNjLBnhQ/3U2onT4jwfEQ/97fWB"
+    "CM0/sm8ZIXOd9OJqCzKSZ5SDykK/GTFGT70/1myei5tniuaSZwUVHw28iwS/w/iH6vz3Q+RLa868PlQqpBA1uWPxwdnA"
+    "HrWHJWwet7V8HD9+4EFNAFr+K/BsCD0d2n5q/Iisc5gLta8qViF3nV/C5DXwv+46P1Tyf9sf/ZAwjvOVfBcCUfw1UOGq"
+    "xu+2Ox6Jd+tO0gJ+ygU6WpwW4FAAA1P7uypGZG1t8uvlkuu8FhSN5E/Fb7W2XFWvX3QJdDNS5+vDCRGPuE0FgyKQmFWL"
+    "t8emONDXeHfKlcyLisH32gM/FLa90P6nfvOxkB/t2X1a1ptjIY+B/GD/E3R+oDAsTVcvOlkjjp+1trgjSOeBVPb5rgWa"
+    "f7e96yHb72jLJUrkpbqIv5fAETYhcCr9FFPrq1lj+WyrBJ5yF9wUAWU58PsIvq+v+WXk0lIyzZ3blKRxDoqtb/KC25gb"
+    "bLirWlvDZ+dPF5fc5qQrGL8n4s9nh73//Ie/DgvpS5cHVRBHjFjeONzkwehbSHNPxS98Ycifcpt8+7bkqi2IxqO9BWQQ"
+    "otYBlH81yWP8yNaB0tx4wCvmSB4K4CkE4fTW+F3kp8kF8jgoNJVB45H7uuC4N9W6t8bv6O4rxLGJ6TlZhtfcNsagi3Dq"
+    "qQhMM7WMk3p50+D1HlS2quTU68B78NLyifYPjD6t+X3EZZmmrDc1PeugVsntcwfTNX60K+VGIyGp3kjaDy6F7cM2t5j2"
+    "+q7iBwMaXbOON7zKZrai1LuaoMkjEdvjbY6nZLBteTQ/A5jv3mRQTRhdexguaOJvbFPjP/njrHztn0acnJOGskW4WOXm"
+    "TTHwNBpfL3RAjj8XHHQKuDH41zEve/9AaHw8PiKdGNwwvRgd+4nX/gtbhdDnCXsPUOXnPSdK9vB1cVqQ0Vf9MX50GmnZ"
+    "exNKP02mVDYuXI7jO0vu/V70+IrEwFetbUmbf6Y+Ad5fykkz+wkaBtuaHGvv/7r0+tm+9x7iVbXXMkp85V2lHDQFLy3O"
+    "9hklZZ/9TR/y7SFoXlmLg64jL0li7x8YWn91xxyS/eO+yZbP01Cg6SAFGk/RkFzjy4AE8MbwKC4FtBoD+XdEUNtq2vFZ"
+    "yf/ohBtWeOoK1KZAUToSIjntCOaa8N+9eIeKUV0dsfxjoTsNW4E8EKS+LAZeK9H+Qff+vbl6aHkxfaAXvU1t8nHgB9Js"
+    "mq3zx2qVBb2aI2i5kNwKE0oAPwEVpedafz/SbBdNSz6nz7EveWFKi2dlQW4CwQ3V+PnpoMmvvBH7AZrxINYPoP/j0j5/"
+    "pmSQ7GJW49XzhTw5aRhHAiNb1gQ2xdvnk1T++BmxI0ugF9Uvg7Ei/3pp2vmj1PjX9W4r8ml/Xr5aHse72znoOeyjaaLz"
+    "BWF3vMk9NIFP+ls8GA9U+2uH0LZf40u/6oXl000lOVmLHOS1yUFZ7jMfREMrtTeO383fFscdPsZydXCTcxh0KeDHZrbX"
+    "13/v77RLIm/f2E6R5fNShyvwf8TIor42ttxQ9tE2gYP3O+k+CPte5L/r1bqsjv1q/GGrAqnr7KrCCDI5oIPJu/X+gUNz"
+    "rCrpBeXoY3HdLpKXILdekNTmNse0/R0cnNSoVmA6jQ9+yFWlxSFVYNPQ/3WdP6bva3LqsoJ8kD8egW3O+W6vPeTX9ud8"
+    "e0345inDl91e8PJTBuWC4PKioYfen9o83ZOcbp5U9p5kd8SfUoZ9fstP629DwGY+OP6MLPnajSqvddAIGGUkvj+p+V/n"
+    "5R60pnk0J8sueRHiXym0q/g3S58P+xX91BoTvpJT7itEqYsYlHUeYmy0zZHKq/XtJ9G8KB3i72ODqoLbTUH8nKXXppR9"
+    "pRs0WQ6YZVGbbhlpRoyL735XORnGp/nFszTg1cc86EWk5JG7matABkL8j//NqBBKu4MKCH7wjTMvM3kRgKEJ2WskCiO+"
+    "d2G+lMXFTTD3FOCv/YGfiy0bm9X6TeFcFY1xEdlo8817vHUsuElb6E+df9T2tbup5Gon3OngVUEFryJ+R9v5o6Hj59TC"
+    "NcTSyzFyUI8PvCuHg4rgoZcsG78VxpSa6kOrQx00a4nFEw7i+bDvOXr/RvlA3NsY+c/6p7JfnuS04ouDZsBoGqB/Ob1/"
+    "cAlEslCHKA6EXpuA/xnopPhfMr1/UP/eeWuvV1L6BP43GOOb0N9eHxOGzZEaZI5h5wMHNU1nUDnwz+fAv/GJ9g/GvQvk"
+    "42FFxPpCyWgskrMNeH9Swz7jpGxk31H8+y8H3cwkuRtAIwvav+q1JTW/sg0Giv4v4ulVw7fsAef+Dv/cp/mfev7JxhZ/"
+    "euHiDr6CinSCXUHp7phDKY3vg3OXMJY+PsGLEu7zjbyCqjSF7vDgavr8V/Y8Bj3515OWXiCatJH5Amz7baL9g8nXN9Lm"
+    "2zek77konlzPQf3w0BPq3KC2r58HfCj/AotnwposzP1Ncnv99bHOL/xTd5Klu6fmtNGZacRbBy1EjEa6yCn0/nfqdQn8"
+    "/mE0N3IatB7Auh+kqoneP1Dv9+/32cq1dhw1a1KQng4FRi37nbLSfr1/kONxHGcNclLRG7ArtJVWcVHY2KZsqMmeMD40"
+    "q5r4PkPQrComR0KxOdEWqtc/D3cT1EyAj0D++0H8Hiaz9zbPafnLpZ9E+SW7acmAJ1xkJnJkkKbeHvb5N7V+/aaWyYEA"
+    "w4qWoO74siEUp3K7Cto+bx37JZqOaMOz/nrCN3sZlBYxtA0MJ5fmKEGXPGjQC08qBFL6eSnwG33e6/xHjf+c93ceXvi0"
+    "THMEueh4B+3GoAdgfp/0+gdv8ST3erE8f7bFQ9TZINhHWnVuWY9/64dYK0fZv7lZ0vx045tBnXYgvkTZ3E+dgRm8OYY/"
+    "D3FxvpcGHQUuD4J+kgg7t1T+2WtXPbljxQsK9MpGH/KavPQJ8yB1xoPtPcJTq00uNMJJ2fsyH1iPscP/f+m1C6W/mL/m"
+    "UNemZYRX6C8OmwCeh74D1LqqXt/tDdz3P+3ivQCECwCV7fDfpND/Zb1/cOxLEeNI+/p0l+9zO2BsXSQeHfBwZb+Kw8ZW"
+    "s/hunIPWexjUHIQ0DKAaQTb+qvmHJJ8oMqxJxp7Rb9gdidNI2GcRvX+gxrdioTdFvHWntT6Sw0Cc63nYa8t/9g9erirH"
+    "Iw/ckD4LfanTbfgpgKWs4h16/+BcLgf5bY3iopWZV62GzjBotf6k1qZVDvol2SWr7ZHnPOlCUUr7EBxrMPJzDOyp3sO/"
+    "tC2a8+8UtHiCQSdBev0gdKSkv9fWFT6PT3guQ2tkEQu8U9HnDy7+DGCu7GbbsOJnUQ+hy+9udLe9ZJWLX/G21/8svf7x"
+    "smJxUTk4uQj/+oFHHzf5GewnPwxrsua/L2D3jwu4uP4I+FQ/+2zZPMveP1X6+fq+ktGv2XuOv36Pv48jag38fmDZ6/fq"
+    "/Xu7g4OccVJ0RUFhe4DXCPqxOn9Ufz/jP9KN10/kBcc3tio46KOHfTa1h94/mOjhS23rYExZLM6EudSD/20SNndQn0z5"
+    "VskJrRJklvoBtMvloJSwjQN4uJe2b/9vJu9v8otNkJpbsxE/of8Ulr0/ocYXMf2+tS+oMe2oW4R6INY0RnKWH871N96h"
+    "+MfNibE8MK8H3WsrKOc/4K+YfxDaIjV+nCo7i9vUCRaTfZyUI7vJcX523rdR4/eZdoLaXCRqC/53U63rYfwD1b6k5n/d"
+    "254WN47fpmQlXnCxohanyon8AILvSnaO+n28OlNr8cIDgiKCIU8EJb9E+wfZc6c2TiZM4I9FHvKnBEEv8Zu/423u9Nt+"
+    "XrrRtfxev226EGLwWcz9UaLz+08cZenE7TOy0MEErtEd+SOUOlSvbyuMNGt4U5Yj8dwyr8VhhcCLUtnruxs0ficZl1Eu"
+    "bl2DaVwu6jfCQW0u2zaqzjeoMxbHYmI5yec4zvevQcWLEyUHMCls7KzjQ7aLmeSQpcepfJncVHGuydtg4xJj2KPOruJT"
+    "08fFyU46qQrm1H8l82rDzh//nH95/b4yZVxQWSyMiefrvUzeCqWq3COV1m/OcMStByb3miv5TW2i4YifF/X+gZLBMr/0"
+    "xrOGw6hyQBhvLCXZrAW7g/zXa/5XcqnJJfwM2pDZoPowKF/IfxXZ/Pj3GagFh8Wmxfk568mXHPrIoL7IkQ+gYaTmP4tL"
+    "eNHGsU6qt1hyF/DvZojNGfHi5Fr+x9tO4WwpzsvtOZzUdLeDcqFBnX3dqvlHlXXulHzfLx44UHLxGUT/wj/V/tdSzZ+a"
+    "5Lpv5Rv0L596U5iq3RVUewowDoKtq/d4k++L5jnFgDVXDFoNbM6E+KP8x1fz75TWaumexUtM+RxA6b64uD++fOZhnx9R"
+    "HDrzTsk5q3jQ2dMSsRx8xtNeW/mzf9Dr2086lzWncDvxlTutM7k0BnWX7BzI6/c5EujCw8XVnzGvQ/74DX1HWza3U2MI"
+    "uxxsPB3qT2OX3uNQkO707YkOkq1D5b8+ryVH9fSg3FsErTyDXDbGPj8i9frZruD8YtforzJju0+8vKCD8uGlvdEwUWNM"
+    "tms+9OahQel7W1wfwNIV41uj56/w82uzJ/Lrvjey7NKUVDTaQYWhtMZoyK35t3Mo3jc+irfggSXWggtCt5XRXoDsGFCj"
+    "9CXLuSuQTvwoSl2aAZsHgp84bA6r4l+5YTFce60bPXwrKPkWZhXbeybaP+g9M5hzbi4pUiO4rnM3uSfwoTba++j1gVkm"
+    "+NRCg84mkTwLhEJA/w80t1D2d2vuTBGfMZKO9HzNHaJMTgdgbgblTNHxzeWweE8j2HA1QaIVuAsEX0/a9ycUvj+YV9Aw"
+    "/Xfw7gsPeBty9IJIjBck2Oe/1P7BsyiDrv/wJBcI5cy19vm5F/rZyn/6h06mxmWvyIi70ZwaPLWap72+UErjx9xuPjS0"
+    "K/waEecxYl9mBD11f+uK5vfzn9aRrdyyc5+6gdTrloPuhIM3oKO6v6gw6MWZePbZGcMTqxq0DbGlGvhHBMY/QvN/81yc"
+    "tTL1Qrp5ID+Vy2lxSgDvB+i4LdnrfxtHx3PAcCetAPbvWWbjpvVn70zlALlj8Yxq4gYIf3QDkz0hf0va3EXxvzA4Uvfa"
+    "kieWlNy1kI3fKrc/peNndleCGPdtNT2Qj3j4UYszliUa72Hjq1oH7wb+F5adaB0wZBMIXXn4X1p9Nlfp7+mlN+JBu3pc"
+    "/OlTvr3AoAH5iFbH2+NU/KD2bCcFLPakfLmABcvss68/Nbap8X/4cJs3rjwtwyME7ZjtIIefbT8PNf/LEuqked1j2OOy"
+    "xYcRVC9CqOr8zRQdf++d/2TtHDWBg04UoGWbDKq3hrkIFDNd7x9sD47hOktMfvraINAz/geG2xDPL6D1m1Cki6wx9Atd"
+    "2JmFuiYz+TgSuxHwwUDtPw+qWFwF/DtpcTwX9v/e3T7//uf8yKXBu6hno+IiYPdPPjjT5GHe9r5PXc0vUiDnud3TxWmr"
+    "wtfBJebChm5D8Pf0+taVs6WMXE3K0cR293m9OmMCG++h9mjV3RzFbxE75511oxvfBb1B0FX3b2Lpf/uHyxb2FNNGu/Gi"
+    "R++4W2oHPYfSX2n+p/Clp5cP3UzuTt3CLD4CbnzMaXODP/sHT1tn4l9D78ml35PS0mfIMyH/MdJe/1A5Wg9/g8oMiOK0"
+    "CChr10P/GFtOPP+93j/oee281af+T/6QNYjKIegPBnE8gPkhlP9eP7h7O5rNdQa1amHQrMOIWxC6Otv6Q9vf4Y8Jcurw"
+    "3GLZ9OTULdLF9yGUynhHKb1+vROO/qSqGyWrJPnobcjNx87f4zR/DEvWULxu6ynOfHnPda+YPAqgc9ewz58p/A8Kgf4g"
+    "/x3HEZd6Ea2FbR7Bi3NrGX4bXt4Y6HjADQrf59zXiZZD/vvw4Azaf9dnFvR3CU8ai6TBCflNQP9vifYPpjS/Qd5NH8gr"
+    "Xj/4W1XH7/0htbfWWvODCzE+VAFkdqKvxX/Btj5Avgs1fip+2Dp2gkx31J33nshAocBvM8bmmE6NT+6QyZN3v3g44seV"
+    "8eC1IOXq/OVAnf8WH/fMSvG1K8UWKEzDflhcA4nRCWW/6HwRzxiZLI4jtntQzSyCDoM/HVVnZ7T8lf+NbLmTe1+sIvLv"
+    "cqOxIFmn/ey7i8e0/Mv2ErQf9nDOU/ICyPZ+Mtv3b2j89ql4T5yefZaGTn+GHNDiNPmR73jYd1TVGoFXa5O/tZZc+pEg"
+    "9xJE4TAqtbZeTeNfrzeeRsGFAzhs6CNeUdCgzMCfGvH22mcGNcd97tQwkxf9OAlbAX5slvb+r5vGjzsiPR3IGiIDQk2O"
+    "6e+g/QCWSXp9ReHzwq1etGZzHNevZ3ELcMubCHp31b0BLf8aTXzlsHfNOeX0PFS8moOynID9Rtlnf9VZtx+tYjljQjzv"
+    "vGrQLpCmruB/6mzfX/r5264XkUnnXqNmIL4hbU2eDg4wFjY6jO072v7H4Pu7neSN8TtWg/fo/YM//PXUr07ktqOiGHMm"
+    "ls8PNvkU+mZR59o0RrYEWdtX3+TP4C+5mgJT8CWo1G/8VjLI7cphTPPoRo3ShvLtYZJPNwB+AJyG6/sPIXdNjn9r0IN0"
+    "BrWA7RyH4s/pvRmlv1qf1onWhzLznEnhvAb5c3WAewOXfX5Vrc8tDvMi93APKt1C8glgq9rbL5bo/mm+mK58a+kl2WCA"
+    "F+05Yd8/VXnDfI0f9I8bufL84pGXJf+ziGgH5qfOv2/T9jWg2g1r5N/neOSTItQStuY5BvKF/S/Cw9Udoa3rovkqgslo"
+    "8O9gKOXaD/v+gdA+eHnbUdnjQArxoVdaGhzh4o+QzVF3+/6WWmPIHgR/Ou5OPxZKrgHdttf7B4bGxybPk4nhQZlEn62f"
+    "efgO8BfIt506I6L968FKyZ3dXZwlC2Q9ALk5+gyzbNkr/QQuq2xsjpfcaO49XpAOY25vn52I12u4dTGfM15OmjVG0LOj"
+    "zAVhdKTvT6j3e/b2E83FO9mt5Rf2KeGgK3ipuz5foDCuKPAj33VB86tb3Be5SVLw/616/fL3/cXdp+WWkC+yoEcampbg"
+    "oGtoqIiHp9H5Te6Okvefj+KJL9X5dXAjONZ0yL8m2Ry+6uprVp+cJWlMz6L09Z3kABjuHDzjnLDvCGQOj+GqTd3pwS5B"
+    "6dbb62eNEt0/PXe6Ax8ZUE44kWcZyU0eCuVvUOtqOn8cVkjQmBvAHofkpnCY84hP+9S9Go0f2xavFx1XhtPL+a+4t4/F"
+    "b5D0/XSz92+Ufy5XZwIfm3x7uKCe4HY14JtrpI0fSodBpXMYVTYs5++HQzn/v4LaIUf6CcNYrPPHRucdVCGjFwXCL5og"
+    "/12k9w/+nN+fObgrpZl0QRZ9H8udWjuoi5d9vyaP5gd/szd5lXfxfIxtBnwjBfAjVO27aP73wLekXDS7KI9emJ2S7EX+"
+    "DuJioaGuxq8LUXHcYXEs+w836BhIQXfgh7r/NEjb74KXTlnr9UZ69y4vOV+aXASJYwFf+3yoWmO5kiOBt250UmoAasPl"
+    "zHWEfX7Vpce/fm0aeuWsJsJjTN4OrHVHx0h9dkntH5QBWc251uI68N9dwNanSe3Y+uf+qfOql7H6xBzqu+Mhe3+xkI8Q"
+    "dfOw1zcVfgxrZbJ/DDh5BoPeqauMcOrmeG4hbX/5W9wV795V4MvDn/PsAwYFIDkWaOio16ju1vKkKoU96V+Q3v7L7XUh"
+    "Q3MDNf5dr/ewFRkiC2dxo8crHJTN/3/ncxT/mvzDg26tjOYl3pIPDUNMRbu6fzdd41+VAS+tzi0Xc+OShSh9Q4M+L4SP"
+    "QHHPNf87ERPNaQ5ZnOS5QTUQkESkfbc9k47Ppf1Hy1tt4+lJhUx0wOXix/hNF0/7DLaa37vXFq976AGuABzZCU4G2XCi"
+    "8yN1ndepV69CInzmd54C4xrvbXPL1ppfRI0GbyrgYm84xM0+4E/ouM6y10FV+4Ib5Y2dyfJSzMd7vBKBMQOIfz0IJonO"
+    "nzcESr493p0uPhBUEkH38i8bP9w0/5MJDcSYwAR590IE+wY66Cd0NNey74+p9mO9fehifjeqvtnim/uYy8O+p+r8Xem/"
+    "/EXi1cUey7dN/anhBwcNh31sQP8qGr/zxcGG20f9zvlWw7EVLwww7b1RdT78wqTz1gGXB+0uE0QbMODO/W27V/dP1fPn"
+    "+cbwxykOupkH8fNf5r/g1NP1+pNqH785LftvKiQ+efnRhRgXn4ftt0Tfeho/PgCzBs51UIOckl/CKO/42vtnP/X62NIH"
+    "PcXKHRaNi37LSx6ZfB6BaYTeP1B/w7pa3PmUi5OAtM/tAr6K93+z7PVhFR/uVChl3H51luefvc8hKQSdbgabxIPV+W2V"
+    "5wSECyq1zJM2PYTON8N3E+z11z/3Tyel+pe2rrkl76eI4g+1HZQX+L2a7DUmZV8vbvjQTxd4mbD4HAbdPbnNv19ofI6P"
+    "7ykLJ03OfQMz096PDjoGwbSNte+PqfE9jE/glUuiuds3QddB+prCPrPq/FHFl+ytI6yZ+UZQcGhBClxi8dpFsFFv+w6P"
+    "WuMvsTWOV/o5aXg4/AH+9xh9k+rzy8r/ru+5zpWrVxNz/jJoWQWT8/rZ67+3dP6YsaugV8gtw9PI3/unr5PZ90ouavn3"
+    "3PVWDDq8n3x+PuH3oyzuXxS272Hjg8pBJ1Y1+Z90zJuiBS0DqHaHUR1mO39X9rnPSBD193XkwCeP+V4bg2pDMQ3ibRtS"
+    "+zcNxnlQixhP8kIcVUUt5rF9/8Op8cN6ncAdmp+WZUzJF0dB/hj0SH0+Sc3RHbl/202xPGmkxcsbw66A37XY3n9U/l07"
+    "1LSuFuvJy/rmg+4cdBQ2uj3K3jtSawC9w2J4fXIXhz5B/gjdZUZSpu5/VdX8b2676vLilsd0+0E2mlkCcSoMnAvyV/e3"
+    "VY50uYvJjqlO2j0eul8HPupm2++f/QP33RPp2OOyYuD8aM421vx9fkr5WEmdPw6vg7k8c3G6aMmB7TB+PDsHdHhB759m"
+    "z1fIeND2L2pRATnMCclhIKbb8HB1f0bl79syWzzusIM++BoUC0CfBRt8qc/2Kf0dlzPE5QUpeEyLN9zPcNA5NMS67PNn"
+    "yr4mdvOmHPk9aF0myek3Moe62/dn/uwfJJjVeVXS6zLdRR96d9VBfslt7jtC40cwfHfIhSg+kxW+Ay4brNamTft8khpD"
+    "UIvLVuPTYbx1QVE6aCHfGwq8TLDvMKk1yg7bork4Evb9cwyqgKAwGrrZKWz/U+Mv1vaBdFTJKEIjUtE+8L9gzH2dm82h"
+    "lfx6Qp/bsrpTdG/JI9H/b33/lHX+KX/kE9w7lfi+8iM/PGRyYdhPHNonaP7bpoTkW5lcvK8z0ea/icIw9qmWvT6rnn9u"
+    "cbDRceIXznnoHr/qBn1CR6WgH0Pje7Kcat/fSe0xh2jgb1GQuvhE909Dz0ZRyRbP5diWkTytnENdFSeEMO6j+U97L1/y"
+    "2090KLfF4feA50lt/mfq+6cVxCb577UY+WVoOjrqcpA6V5Ehwb6/rtrjGlsswb9TlhLUZj64DeT3GZ3b6Tso5+LvWD/a"
+    "1aFca4vQlRGSN8PPZsK5pgm7xlCS1rG8/Jc7OQYKCkb+kgp9y2j8Vvbbpcd43lmhksj73ElpM5v8zs+OC6v+nB8BWSyo"
+    "LjwJPFvFxWT23sxD7X/Z6x8RU1o9oNNXXvC6XBZXzk40Rp1/Ihtnak0zedlgi7sj/90B0uf8aZ8hq6HtL3eBAINWTuPd"
+    "t8L4wQfkmHDMqfH2+SoV42sucaPWhb1oEnjDU+S/Q/X+wZ/z+x9DqpHb9rOyDaS1qrODDkNp/YS9d6nwue44bzqVPoHX"
+    "ZLH4KvBrVyp7/2Obxm/vkGzSERvMWc/lpKPTHTQb+V8VAMMoncNtLBPHFefH8cT1BlUF/0r5Se+b6Pjw40BaOfP7Qcr5"
+    "LTdNXG9yH+QoqgaDWkNSeWrZewn88ZCTSqhz1xh/TcO+f/rn/EvBhJJUoG0VcfdIAq/qZrJEX0DF/92P9otEzDAszj9e"
+    "chUI7SVI4etE90+z/Upt7PEYQ0OGhfG17JLdkRgEeNj7F2r/YN0Yk59dE9Qni0HtVU773eYWObUNDxpzSuxMU4QL533J"
+    "De4YVDwzMCPBrq+i3v+36UkNDjip6nbJ41aC02HQqRPdP13iN5//LnxO9u7gQae2OuiXv733/a/mP/2kO0V8/MUtm0k2"
+    "psCuMLFe0OFCvX42wwq1noRs5SVjClOqKEFrQAwbQrCFhb3/e/tCNP97V3KLWwYFgXTNQw68Wp9fUf51regSGVvLXby8"
+    "lJ440sXPoNRgff9U2bcnfGJndw9CiOdD8N8YlZ8lun9aM/oDpdyYW0zuF8nr/4H8YT9b0dZD7x8kRez7x9vF/aBQR3+i"
+    "i5j0BMveW1XyifUMNkpvTUOjN97j7vuBB3DM9Gp/QNr+671DcvZiHuR+QFBb4Ndtff/0D34l7VBcXF/0XZY4+pGn5HPQ"
+    "Qby0uFof1fr5fsSHjhZzkBhhcS6Q/gcY33Jh+77q3+DHG1k28pU8cSYFPf3hoGEAtd3w8YKaf0eCqDwbGMXdQOhnrSMa"
+    "C9Atatp3q9X63+ZyF60dm9JTh6RBlHMsYvsAxHzMMVpjxIy2MfyiuRsdjhGUCk7zFPg3INH+wY0UJbnb9eIi3/wkVE2Y"
+    "fB8Dm432Lho/3iDYT7ltkDOF5CtvEa9gv891bQuF/0dHTBTN8/+kMK83/ArAdgiOq+4/TNPz25TC4u+5Te4bJCi8DXwX"
+    "8ism7fMLSocryxcx4nkPu8Y84HctBH1rBJuB4Nrp/C3HDoOiwj0pYg24EuJ3R5cdP//sHzSvPY+Wnb0qI7NGc4VGDnrn"
+    "tNe3y2v8uDLdh6JumxzIJleHXI4g6Cn8vKX5Sc3aTWT+Fpm59Nis1CLMQc0RtKvBfrPo+b9LmcBuHWL4ZCGDqiAGHcLE"
+    "D0p7f+53/Sz/X1amx7MoX40C1D7Y4oQ10IGPfQda5VBHa8RzunZOstYTHVhm34kUev/99/m7HF/45J1qYipkVrSOyU3h"
+    "X94691M24ou49XKi5AMFJZfPB9tG+xa0ndbrr9mWRotmlTfS0yGPecQ2xJpS9v2DJPqOyEBwyv3h4B0+Br2EQMt+t+VW"
+    "RsvQd9FH4dalMS9o8ZQXTTFoPpKnifH2+QllXyVrOunkQU+KAwf1x/hVXP6qcys1/uYhT7jFoNMyR15B26c5aA7G11rz"
+    "axU/vHN6UoYjMbxpHzAQ8quU0q6vOFXnHyGpvllHS4/i+3kKULMQg8ZtwPdR9hk5NQavXjG8t7DJn8INMvDCQhBgWX2/"
+    "ROkvukcbeTs0gtygv4C0JlfFXO952fcflY+X8bX4YA0n7avBvGYT8/z/1K/cEbue7gWWFMW7RXF6xLoFmNj2RPUra0ap"
+    "GikuzlQYuU5XohrgT68T1a+8uryEEdS9Mu2ce5+ng3SkbEl0ymGfQVZnaLaPs9gx0Y3KxAuqjvxp6H/qV0aGDxBTCnny"
+    "1lLv+Iq/gz4ns8/3ztf41vatN5Xv6E75P1i8DP5bGvbdLRH/qzcrN1cdc0fuzJKUBj8E/wN+n4NgO+n5XxlhUKqJUXx4"
+    "HPMY4Mdc2FmQad9vVs/o2PWCNab6Zx7hEUTfEFiGDESuoe4n6He0vRzN7nUM8FCDliJo5flP/cq39ENOvplDpOiagiI/"
+    "u3gKhLI8Uf3K1ekxn5Fu1Ki25BnIn0f52Pj9p37l5jQ1xLdbPmLO0gi2zpm8HE63KlH9ynShkF9jF18HeckGUtZV16/M"
+    "rm3Q/VwFY3i2JzzE+z5fRODagMTfN1H9yjNPoO+UnpQjs6DXO5kLxdv5w5/9g/2tw2jZpDD5qu13Hl/ZQcc97Nj0p37l"
+    "F8OXhiHpqZ/c4s2IX63RuEKv3ysfztN7prx+V/Did+npWayDluPB3/X+gbLv/PVNDtj3ix/NFJRhip1/ISXmfjo+pa75"
+    "2JpQrj2tX1KYJgJjnXCMUmiooOtXxr6O5cKjPSh5cUHDEL8bom/ORPUra/Vdx/OTVhHhI92pV37gt5/Njfbp9V1HJ0En"
+    "yxE9c5e/a2OEJLNz4z/1K8dsvy4qdrtECSmec++aFmfOi7nBOZrq+pXL2wA3s0hue1OQB0AjAyZeK1H9yiNDkhhXnMM4"
+    "yvMRV8lkUFM4bb1E9SsHdHencXm9aAW4c6CuX/kkUf3Kd7dyUJ09IfJzRpNf93GQqv02Ud9PVP6dL8KLRrnHs6xocc2y"
+    "qt6UHVf+1K8M8kguQ0o15vDQ3BTR3EGDQDxvwDiP6PqVfstiOWxlPC87Y9A+8McKn+yzw3/qVy4tmE8eLnKRyoTmpJ19"
+    "Tf4bQt/jY99BV2twW8e5uOweJ427A5v6h7nyf/YPnmVuQf9crCTKjYvjO/1NRrrwe+3qT/3K4zthy0NN3viv5PeIbXPw"
+    "5ZxE9SvrDwg0Pr7oTa97hPLQTpKj6xH9A/lP0fyv8AGTg9cZ5J3RoIqY15gf9v2JP/Ur29TYJrKb2Xjel1c84oNBT9L9"
+    "//UrX633ohcZMf4+4H/IHzLBqfIn2j/oNqs/R3a8KO9u8yQn8tTWye0748t1/thQutGy5r+4KPhjSYBSCMb/LVH9yqqD"
+    "bllflp/grjOK0My5gi4BZ37AMUZpjD68M5q3RjD3PWJQF9hAiR92/uiufXDK2D0yZwk/8aBGOurywcXH1d5fovqVo90Q"
+    "r965U+P1ks8eZXb/T/3KF7k8RDmZRXRq8YX7KuBU9z/U/Uk9/2EHJA8VwG+ARckBRKX/U79y7ODKRvb87vR01r3feNgY"
+    "jq+wMU7Xr7xQCRztsQd5gxS1OGHXb0tcv7JHWDqx5X6EnLHvM7cMclAGvPR+ovqVB7/40KP8BrVGHngHhGAkXro5Uf3K"
+    "yvGXZcSmj7JXodTUO85BA4Hv6132/ufv8w1XJKfaEcWNQxDXkb9fh2xhplxRryGMjbpi3SpYmJavLkrrfcGbhiB3h47v"
+    "4x1qjdP/bAynSeVOj0MEHYbS6sBoWibif8MCmnGm72XEvAw+VCGJyZmAH08S1a9MCTJ8ztug9R6S28MgpkPppxLVr5z2"
+    "eYW49uEdXc0XznuR59SF059JVL9y1XXE5B0mP+kh6HgTtR4P20xUv/L9qNzGgQFruG3nUH4HYFU1pLIkql+5c7iDJqXy"
+    "onPgDn/BfmuaNn782T845NufbodclM2KxXLZFg76BsEWT1S/8lpeH4rc7OLVHhbvg21fTGnzw9NavpdleXliXgEecS0b"
+    "xR5H/yeQETpW0OeXWwXH853gWN6B+LemMfjXJ/ts85/6la8XGXJu+Gp6ND0fPYkxOWoHcM/X3r9Q+L0rMp6LLnRSj06I"
+    "V8vt2B+XqH7ly7W+dLR7NXH3hMXZmpvcGvL9KW1sUxzuSz5Bq+5bnKye5D0lgb/A778S7x9EuhlxZReRW5pH3OKJxYth"
+    "GIN0DQWlo6O1TK61D3aTzqB00G2L/9SvPLXhoXAeqsKRkc/Y2mZQQC7YPxTXUt9vaeflSfNaelIlC9ik+J+y/UT1K1Pu"
+    "Oc5thofIHu0dNGOxg8772edzrun8ZTH4Y5fwaM700+JNSNw3Qgc5df2R3/sn2d5Y3V/P4RJHClLSfgaFLsWYoZgzev+g"
+    "beoYHoyg1+SlQX3wwIlfmfsnul8S+mCQ7Jg8mjhVZgpB/hIC/Vz0tO8vqfjcbLfF1aI8aAUAZQeI3eL/1K/8dvIMhU8r"
+    "IvYE/+DIeSaP9LZ5xZ/6lf8uBu6Xd7Hb38yNexN5oP/uRPUrn5cvZzwKKkxlfe7zibrMjZDj7EpUv7LED4tfV3Wn4i8F"
+    "Nde1sRLXryy8tYVouciSyQMjuHQmB12E7fyVqH5l3fo+dG+CGy08ZHGlPczqfvvYRPUrux335qB3YbLpJD+6+MZBtWAf"
+    "eCXX0fjdq6OgZ52jeC/AYPoG5CBq79m0fVetEy3rf96SkGn6kkF0DQY/rz98U+lG168cYUbzqeIOOlLaoKogFVdhmPMS"
+    "1a/0GZmU/21cQHx860fNolx8Ffi7LVH9yh0jYAuXHTQV+UufMOax/6lf6VO6o2jXQYhFq97xgHsmb0thnz/5U78yA/Lm"
+    "amtcXOsdcKcb4p6uX1lE4/vDrGWMpN8uc54597kJDBPhmEzX/+pXrgamyNGe1OET/h+JUw5M/GOi/YMV9Y/SnCl3ZM1u"
+    "P7l9Tfv+6ZhE9Su7vfahmd0kp3OzeDvk9M7frq/4RvOPyo6Bcui9JHy8fiZyj3TQKcS3C4nqV7Zt6uJ9zaJ5ZJigC8MQ"
+    "uyLt/Y8/9SuHj3tj5dk6kDY3LET9D1r8BVxzBgzri84f9w6N40qfPWhzDOwK+DEcQk+ZqH7l7ANnOMfbqqJeFgetKG1y"
+    "Gz8bHy5r/ucG/pdtBGJGcslFA8C3/lO/8sOSF2LMpSP095CnnK2fxe3/U7/ybSWT/Z9ILvFVUIiuX/lPovqVlTOxSBbf"
+    "jdd3esxV6xs0oQT6x9u6V2e8B5T0oIo+4CALmfMus+sCv0xUvzL9MXeqsfy0HFJZcs1hDtqo75/+qV/ZHmQ4h4zlnT0t"
+    "3obYMAVBeiTb54OVDhN+CXm9amdOfiUvNczooBQH7PunyjZV/Yum3rFcbm8C1w01qF1aojBVfy5R/cqB5SrKissfUMjq"
+    "7FSlisnfwVHcIaCWGj/P5zO56HwnDQMOFF2LvNjNjh9/6lcWihtGd6uUF9frxnDHkSZX9LFt/0/9ysvt4KvSxZ5vJDdF"
+    "bvIBui2fqH7ljRL5jSlNWtHACQ94wybJtRAjv7jZ9b/UHaeiLuh0kIMGJDdoB3hUlZ92/c1UGr+HXl4gyqxMw2VOveZx"
+    "pkGZ/1O/MqakN93u70FWEckT1zN3wEurJrp/6tenEfecelV2jfemphfs+pXqbukEjR8XohyU530UXxGQ9XLwBfCv2abN"
+    "r9Uept/TK1bMjdv8uFlRuphN0LHhiIlQzLE/NQJ2RPNDBD2fFQZ9vMQcoetXmpo/rHx6TVbLHCCKXUxN5nsXD4FRqI3l"
+    "DBpfd09iHtTInf6F4e88g5z1P/Ur100PFK6xaUX6Wp+49T6TF6vz2YnqV9auL/nv5C7+BF7doT/4xH/qV9ZIWtn4vPcn"
+    "19t4j7fiN3Ohr9W6fqXCl/HvmCv1c1LTDoLyHbTvXyWuX5lpkEU33r6Ur/Z8Zd8yDsritO8u/6lfGeHpS9vTCMpc1OJb"
+    "t4A/CJzb9PiV/QbE7JIvWkTJi2vTUi6Xg5pg/pPw8GT6fsK7IxZ3dfvFE9IJWrMIc4DRXjLtMwBqDvM33bLkuKoU/bEI"
+    "PVojOWgU/AsTX63rV9YtHsvpT7rTtymCRq9h3gjbqJy4fuXaIdwoZUXxcY8npQsw+Rwct1qi+pVB+HEcPsOEZFW3tNB/"
+    "6lemSLNXTH7/iLa1fcmTM1o8KhDYmah+ZUbE1I7I3SYuF9QUTtdd2W+i+pU3RSbjdbU5HPh3GBcCRmZDYrkx3s5fVY2p"
+    "4bVhDEW8aE9OzEnXr3yU6Pz+ikENqdmqc7JfnXhO1cFBxWAfXRLVrxx3wJsOTUjgrGktvgTSMB6Gv1TZlcYXUSCv3LGr"
+    "HGc3ctLDpQ7agRg97pddv0vd088xIY77lozjNYsMqh8MbgP8uJlof8i8n1yOK7qHTq7NQ1GHTM4Hx8jha69/qTWioysS"
+    "+PsuJ1XHu8sgaf0pbPz4w1+TOwuQR9KqIvVIFzfrZHLTJDb/+1O/8hGC5esiFm8eKHk6iFu5pPba9P/tH2xNbqTcO5HW"
+    "PwrjQf6SHeqOrL4Do/LH6G4m94Luu2YxaBRA68B3Ozf5U78yc/AF8WR3cc6w8gU3umyQDxLXvxLVr+xxxpMyvXNS79N2"
+    "/coFGHTSRPdPN19byXV6npVDkbQGbXDQfn/7fPmf+pWhrTxoWM5ozlpW8oLx0KdaP0lUvzKH72PLO/16HudXmH6mMCjj"
+    "bNhHtB3jVP25rU+juWI/yevuG/QNgOwA8Vis8UvJP9us2XJBUyE6rc9AqlZADmD/Fqddv0jhQ47qkj1nelDkC8nzwZ9W"
+    "/6d+5cB3L2iWTz4RG/iNI5ebfMfbxo4/9Su3FGG+64+8FKBYEEJZoWorJqpfeTpVJWNBaEaaeOgeJ4V8+raz64v/qV85"
+    "eZDktaY7NUD+VRL4N/w/9St7dqogqp+NkmlSfOT6uR1UH+9XC2vTdX64bYMP7Z/noHnTLM4N26rmbZ9f/VO/cubGr7JD"
+    "zRdSfElOucA/1sD2kOpwcS1/r5rIhXpF8XfkBVPWE92FD6vzw+n0+m7lUResTitT0snAIEoPfpRkgMZnfUahcfUYLpjU"
+    "jTJ7GlQBuU0zgNKIRPdPt/ybn/PeDxKBPZNSVsvF2WGfd9HeRuPHwcvAVB8HJU0nOW04cPE/9SvnBo8UlCOGVu98w8fe"
+    "mtwZpPQTZDxd43v37Bb3MUwOyCpoOXJzv//UrzxzNMi4EnOIt5d9wHuAU6sQP6Gu3/VX1BnLkx0M6nzbk+buJ/p/bL0F"
+    "VFVb9/89197AoZRQLEQFGwMBu1GxuwPB7u5uDOxWbPTa3Z3YDaigomKLgUpz9l7zndu1z/vs3xn/O8Yznns97lprxneu"
+    "+Cxvqn/z0m9Jhv2nCUc3gmuv+/woCfM5ramdyT7iDfzKvXuo/WuqeJ2TbVC7NSF92poujNPnH/Mmded77hTCEYeLQbNE"
+    "0n9fEf8z8Cuzh9CT8mfgK6q/zg8i36TCe7a+/1T7J+/aFHXAwnDYHlcBtvdUMY1i3CQyrA26/kvPk411gkzQ7QzFc9JP"
+    "2rpOWwO/cqJ3EgZdD2YhDwHCGiu4heJzIQO/Mr4dgz4XOZ6mosuJarto+v2qgV+5V/7NmoXvBZ/fCWhLjvnOil/ZqYqC"
+    "1Uj3bLOl+pFiQ4PfwvYt/MqxgSms5JQuOCv+Jd6dJMFZP4BhFL8D9fVJHyUT9I6xh0fUIVnrBPvom4FfOWjdJ5wx4DJf"
+    "O5zqhDkyuNL7DTbwK8PH2cN8h0wcsEXF2T2pnsgr9udb+JUrN6eqLs7j0byqPHyJl+Aa2fCLVMGY095x7NoMDH9gxqdU"
+    "P2q+f59ELcmUf+NAmn0XuNuR7yzwAUq39oGn3goeS0Qs7SgYEtoYSec4Bbd1M8HO7pQPdiLWtBXnT/z/+0+HrId+L6uz"
+    "WsXScMpcBU/RtcsM/MrfJCJMm8y4nARN275kD/TfmQZ+ZdfalaWj45pC5I1YvJjMMZYSO7kb1ND5laM6qRgSZEPPlOAS"
+    "dWppK36ll+sUFp/phDEbP+J7Zxly6fzKFbp97bzoCI0P2UL/HBUjqW0u2ml7Cf83f3DwfgDu3/6IJ7fLBRViZJjuJta/"
+    "DtHr1/AkCXqvT8XN2oTcVoBX9P3Bitg/od1jZK2bqnfDj5jwPgBanaS8M5Y0gbY/gQn9f+taOvZIZWAeK8G9i4jrdH5l"
+    "ut5/5yp94evk4iwjKC+8/2bG/Nr8nYFfWZv+osMRG6jaieOYu4glrPiVG1lddqOMC9sQ9BW/XFLwtsY/NfArd35XsTvV"
+    "71HUIOFkY35W/MqCL+pJpqbvcOK3GCwWSfUv1e9DdX6lpq8urNPGvE0wqBKDWBINiVb8yiMt3sHmu/F86/EUzF+f8p+d"
+    "2Ftl4VeecHKGdPqXvAVVLPIK8T7ddJv+/Zq+WwWreTsHzgu5eELZbIqT9GHdsgW/SPvGQ0cU9JuVhv1HMPBbBNCdgnoN"
+    "er/Blv2zzZ6rsTO6gnNGJRhUlWPWHMT9ZGNddX5l1bOZeKmFHRxoxqDLJuoXRTDELPzKPgvX4tiaDdjp5nbQtbSCL13F"
+    "3gILv7Im3ciNgtVDmaMnOe1/VvzKZsnRzKnCfZCjEvFhbRUDygh+Yk+dMXAzTEH4rOK5awzS69C19P4VDPtP38S7SaMW"
+    "T8NhW19g91wSLKI8pX3/K338r6GXLZwJdICy1Ki7dH5lvIH/02BdJWjT+So/PdCMGYMo/zmJ869y6/79tLgj+A7Mxh+B"
+    "KlatQu/tIbj6W/X8HPYtP7+9qyUmFi0D/QZT/Kagm0I+tkNnCP19lokedbKx8WkJLlJsK5ks1m5b+JXzrpbgay9cgSkr"
+    "S8PVGQo2pesTnAQfU+O/hDc2Y+RhE3hTHVGX2v+Xvv/Usv7lVlArGHAriGXWzca7wxTsTvnb3sCv9L5AfbldQbaN47zW"
+    "lPPIKfYa+JUvTxWRwg+OhhOXnuGaVtRHVCNra9BX6/ovYp2C3j0kmFBUAioFsBG1/34Dv3LJjCMsvnMZLNXlHX57J8Es"
+    "K36lw1AHSO1iAntKWr2p8D8li/E9C7/ylO9ULNAsmm9Oojh/VIYGVBRqc7fbdf1RMcwWqi9Kw6jFpF+pKL1N709S/N8Z"
+    "GNr3rXv5RHV7dBI/VPKHlGMMLpD9dskUjDmtfn9xLh1Xz0eceEWCw9SgO3+L/esO+vr87LG7uV+kM+teohAgxY/B9O6z"
+    "dX6l5v/xcRzn57KDqkc5djiNeMCKX1mpuwLrjxZnXR1/4rQoBf/T9zdZ+JX1HnCsS5G2aJqmjUhb6PzKHP39B3g1kDaG"
+    "OsGYZTG46jPpjjCxNlHbf6Dpl2UUTH/stgM5ksEPEuWzrfiVzmWKs4MU+Hs5fseVlWSYTQ/dbuBX4lsnyFgiwddQygOU"
+    "tD/T++0w8Cv/hj3lJfd+5mW7eUB8ugwZdD2jH3z0/Dm/EmLcmlQ8S7F72hbS9HTTTooYG9HmgNbNu616+ZeFDXcD4Gog"
+    "1asUv2VqnCQ9B7famYETY2xgegyD8buopskWfWOZP1gzrwV2a1uD5Ut1gi32lD8pPngY+JVeJFZWN5WgsyPHSXRRUyt+"
+    "ZQ2vVayxTzKsu5OEITkK3iT7W2rgV36KVzBlmoINKA596QzQjPphkIFf+XxJOWl/i134Ic8z9KI6py75SPscsf5Rm390"
+    "rShDpqMD+E4iuySnV6z4lQ4bp4Cbx23eeG4GVu4k2t/bwK98294JFrsomCip+Js6fAQ1Wi4Dv3KQZzDff7gM2UhxeBQt"
+    "w2Eq/LbRhQH6+GOtldn44k8GenSUYHhXygnJgk1i4Vf6TFPVrvfXQ0Sp8hDvouIVytHMWdTg2hq0cWezMWm6Ca5PBHhN"
+    "+i8SBD/Rwq9cTIX+jQPB7Bn556L2Ch6h9s0x8CvbBDAY7MBxUwOOO3R+5Uj67YKeP4t/RPbi0AaosCAeK91VcSLF6Kl2"
+    "YnxR6/83NRV8QcXukHwStMsrzl/0M/Ary91IZN7rmmLnga/xyxYJSlNheS5b8Bu1GNH/tgm+zLSHH+6Iq+n9yzChnyz8"
+    "yi8zbmJU4Sv81TYJOlCd081VnN34VJ8/mEqirW65DDzxUsX+lL/r0U27GfiVC52/qP2mL0BzpYrwMUKCV6Sfh1PHROnz"
+    "B/lqZGDMdwXnUGw7RnHFngqPXgZ+5cfLQ/ngfb8h8ntROEH2G06itwQFFy+9fxtMVHGBswkWFiff0PmVimH+oGOv0/B1"
+    "cSAbnP0HuyxRcIajWHdt4Ve6HiQ7bGPGFqQfd1LSvqfV5gZ+ZdWpNaU+HarCcP9YdK9M9U4PwV+08CvHXlNxtYme9o3B"
+    "Ukq6RXR+pUm34b6VezObQgwbzPqMFQrJcJAa1lP93/5TVtEJDsXZwKBbKibQu/jZCz6DZf/pyBt5sdaJOP6IHJe/kUET"
+    "Pdr5Oh308b8+9xiMG5aK9pdJ71GjOlGnFVOENtTs+/KGG+qRpCysXi4QngdRfqL6cbgW+/QYVTglHTd9kMC5mQTySarb"
+    "rPiVfv1scMZ7X7bkqhvU+m3G43RRtoFfqXbRvkOGEdU4usYi+pJvcAO/suv0rmw22jDnhp9x9QMFt1P+cdLPP9DsK3Kp"
+    "iltmm9HrKfyrvzT+OJn5v/33Wvt3e1pLOi8/wtE9Y3HZR4rn3QDaaTWyrm+vt2dQs5c9RFOnN9+L+MyKX5k+/jrUmBfD"
+    "B5/7g1+DZbhhJ/aeWPiVC9Oc4MkTjjkmFU+ShgnT+ZVfdf2RUWkKDzjpgBWneMGcPzJspv6tYOBXLjluxlae6bj+IoMF"
+    "00hb/UK8oor5R63+XfDqrZriPgza3vSD83Eqhi6h+thRzJFra9QPNMnCfPRSJ5wYVN1IOpQavZCBX7nxwikM6N+I+f2U"
+    "YU1lsn9XER8s/MoBVCyYKG8+JuGlsaGSXIR2uKvHb1PHePY3+iLsNb/Cr71U7EQFXkV6sYY6vxLqUU26iXTpBwavdX6l"
+    "NrbcUB+/cHC2kQLaDsNSv+LRpx7VyNVJ02WLb9c00MlftlDGywH2UtsPpfjxh4u9RRZ+ZcASV5BSL/Nri1T8O0aGgmT/"
+    "4QZ+ZfY0B6jcPQuduqu4vzHAIQ+xvmuVrr9tm5j406E90VTEF+oFkJ2dIX2UKmKftkelTFAmfm6dg4sfSdCcBOlGit/a"
+    "+tg2ur7827g6XzDiMZzuWxLyk+GYHyEGU44ehGKP0c2/Zjyx3gTT6f09KP98lcX6YYt+7VVtOMxZXZcVcMzE5RMUnO0k"
+    "ak8Lv7IZaY4hVJfOf8oxjPLHNPq9i4Ff+delrBRYvxe43I3DHss47qHA40uNM0SP3xspf872k6FGfglGfReizMivbDFs"
+    "I2t4xhPbFX+PgRkSLLPiVzqYHOEFFTXHgjk6kKhLsRHx2bJ+xOdrDzxV6A5Pr+gIZy/L0NldcAsW6fGjfFcb8HROwx7v"
+    "OZajWiqKbPMgdc4Rvb5ouOGe2uXjHayRNwBqUo1iN5U0Y7aoEbU2WHw0Hf3ourU7JbhMRXM7ff4ALfzKCdf4ztf52LKo"
+    "/PDis/nfuFlvW8Go0vz7URfEWTNtISucY+olsTfbycCvXG1TkNlO8WQ9s5LR7pCCGh9+tYFfuXYAx6v2ZrQhu/wwinSJ"
+    "Fb9yWIcG0iCKf+PWxWArMpgMKgxsDPxKD8rn+4NMEDuSwSTyo4VW/Eq7XCY2dOF7nmz3ExdVk6EDPbSqgV9ZzNYZTNMY"
+    "9KXa6gN9/4pcYv5A1vvvmP1pnsf2N394Jz/IOTLUpv75liM0hhZfznlR7Hmfih1zAFZQO86npKedj91Gn99fv+iB+ml9"
+    "HUgtHwDzo/k/8Hc58t9jOgNis1sm2s22hRUbGcRvo3itna9gmD84kDQEyzyowy7MdYCKHgqSO8JErd/0/o3wZ7B9NoPL"
+    "Esdx9EGqFb/y+dm9bHxoIpxOe4uv8qgYXYzqCwO/su8GBX86qfh1EYOPVNs8pf6/oPMrteef/s9beq+uwt55KKNeZ1CN"
+    "irOb2YKfpNX4IyiSXKvoAMdqkSbV+ZXxhvX7jkV6wJLdN3jYhiw8FSLDKbKPLob1BQs/OsKrrzn4zlXFxyQom1D8OKud"
+    "G6HHlyJ3KvGsadWwab2S8GQn1f+Uo67RD9305/vey8Ir7zJxzjwJWlPRG0zxY5uBX6mUzMWzQ/bBtRa+sPq+gt+OI5Z1"
+    "FmMHWh3+rHcOeu8wwUiyvxtU/25mgn9m4VcuyO0DM3Y2YgPqUOzpqeBBff7Awq8cY8PAva+KL/tzPEW19YrcYnzQwq80"
+    "l80tzWu5EA7VeYHbuYrZFJjbGfiVgaQp1XoMIqh+pNeA5Vb8yiGv77HkzjUxx+kNvrgkwR8fgLI5YnxCyx/r5tiDfV57"
+    "uBDL0UT5J0AS4zeW+YPUiP9wwaWr/FaCDVzYLEN/N/F9l3T91/OUHewZkI7Pi3H8RE4ZTL/fNfArj7d/re4Nj8Qjm/3g"
+    "SaAEt5bTs9MFo0NbP7w5PR0HUO3x8YUETyjpTqX8uUgfm9Lsq6hpHoeGKryn/Fsq04wt6fsc7cX6M62NF7hzLL/fDg6m"
+    "UP19iOpnk9g/a9F/0VfjQOlegXWPT8HgtQoepcDQxcCvLNycfNTTjIFke94jKC7biPO7LPzKOr/qSnVZCVj8IAZjZtKf"
+    "96S6i+5vp9vXQhJjE2/Q0+4zKKOd32LFr+RNmrAcm0x+a8RX/FlCBoUeetvAr+wS4QTnKelcWadi+5OC37vYwK/cNCyT"
+    "B119xb0LuEOxZBl2k9H0oOvr6PW7du6T2j8VOxfRxs8pH9JFRRUxtqzpv/LpN9RWy3LBvYqBUIly3+FRYn4adH7lXv8M"
+    "bHldBoeCEiwh/fkkU6whsswfmEJ8sOtFf/a9gQvUzDZjD3p+QQO/UjoAcKGxDE+LcpxKQaO4Fb/S9stodsKUAzmtP+LX"
+    "RAWL00ud1PWfdv+qVVUMeGPGhrkZlOhD8cKKX2liVaUX6RfwvhqLucsz8O8E0JVu3Fhf/3Wa8map8/aQfJPqUgoqt6z4"
+    "lcXsd8HWfA95mehUfNNCBm3vykUDv7LsDSdY+p+Kc8maJtO3P6H82MvArzRt68NtO+fDuolFoekHGSQSTfaZ/+NX8us5"
+    "WDQ2HT9LEjiQ/dyn31vr+w+059dp811tWnImpPaoCBmUmBy0MwKcBGNX2386knLTQm8T7H1AeY/ih792XwO/skrR5xi2"
+    "Ppi1W89gRhDVueS0FQz8ygDSvy8yOC6l9o8h3453EXO/Fn5lQKNk9vXMIVgx/CUWjqD4rfMrS+iMKYeKVHv1pDqSCoI2"
+    "Or/yqYFfuXRPGkvYHoJFe7zEEUMl+OIvxv/K6BplyEU7cPhpD/tIUGWsE0yPTwZ+Zfnhv/HL2Mu8DMXN3DNkWE4vPd7A"
+    "r5xyla4NzcQO9G4XyDFlit9FjPzKLlnq8NQRmJxRDhr/kSD3AdIUqWJ9kbYG5t2NDPw7yIyLX0vQlmxv5HfB/7TwK1t2"
+    "aMWL1HsD6Z7FYWV5BSVqHI1BVF/nV9bcrGDmIBMkDUe8vIPe3UbwAyzzBysfL4GMiTWZ36s0fDRTYzWL81lr6+O7CuWc"
+    "emfMOM4B8TUFlf/If3MZ+JX7DvpLbGprCCL7bUQxdiIVHj3o5o10fqVUQcXjlA0UkwTN3iG+tOJXji88h3V85oLeygc8"
+    "YpKhoRW/su0q0n8ZtuBAD726CzGI+rajYf4g1bMOKu8e8JB5znD7gQwxbuLZY3T9N6upDHmPpeJLCihltlAMoZfurojz"
+    "dTUNOaTlLXVEcCJ6nQmAhq8AWtLHt6AXi6dnaPkz35V0zB/J4MosCUpTUSJZ8SsbTknk5woVYyWLekDzr2ZcpO2PNfAr"
+    "Vz+kOjrJBs734jj6FuJ9vTay8CsnParMyg11Z89/fkWbcwqayL4raWswdP17nXRL23JmrEm55yj5H6d3W2HgV+Y+W1+a"
+    "Oeozhj2MwaDZACEUvx8Y+JW7OwB8v2eC+kEMXpLoXWTFrzxaKhnMpV5RckzB43VkOKufPWnhVxZyc4Z1YeT3xVS8TBKn"
+    "Br3fTn3/raYfNpzexC+E5vCh1QuR7pEhjGzjhoFfOcRdxcod0rB8OwbqErIN6n8Xer++un7NHx6rOp5qB7na+EOB7hy9"
+    "ZiG62QsGrKY/mi3PxLUF7MA5lEHnzYiTtbMRDfzKhwci8EfTILbf0wStfMT+A80vovT4/aYlg/XnqB+oHZM1rpzOr4yz"
+    "1I/SZRb97jFMCXiDB/1VbFuK9K2tmH/X8v+CfgpWPUS56xSDJ0FUv1FScjPMH4x3ziedKDwHQ6q9wLdmBmfp7wzJFms0"
+    "tPmDtTE2YK7hAJs1JvP/g18pd6kFa/Nd4+OP52Cl/jLko06dbOBXju3pCLPuZWPBsiqW9gO44iFqv516/LZRvLiHbxNs"
+    "OqA0HJ4sQzY5pic1gMZ402LYwvxZKFMMPr9fgrtVKLclC11o4VfWmVOE1yx/Hl42KwNspYIeVNhlOwl9qZ0RdzWXGf0P"
+    "mCCZvmlWJNVz+v5Ty/qX4T0aQI2DDdhxzMZDg0j/OYsfLfzKOXfJ1x9QXbOCI2tBuppiWLSBX1n0biHp4YiJcDTfcyxX"
+    "g2NAc/JpWzF+r+m/h1MVPOEhgYe3BDXJoFyo/Tcb+JXVl59mtW6Wx8E33uK3eAmqUbyipvw3v63lrxIBDlBzuQkerOXY"
+    "mzRQa21sy8CvLBIbjp4tb/BjZD/X9stQyF2cL2vhV06/bAu3L6dhwgiOq6m4u0bxvaHOr9Tub5oaq35yOYxFn1aCKXEM"
+    "PoRTbKGGbaozBF3up+OxEohrbkng/QrRnYJSlH6+meY/ZSK28B1v7Vl78ITWP8yYRk73WedXau/XfBdHm8p2sO4KR5U6"
+    "pZ290K+W+YOi4/9C9+alWPNLP3H7VgW7Owk+jYVf6fWJ4wVmxvJvqA4c9W8YD6Ya+JWJK4OkXivcIB/Vj+5ktBq/6KCB"
+    "X3n+PscDY+xgzB7yI4p/vlb8yoCw8qz5xZ88pW8yHqkgQya93zADv7LoEycY+l2CCsNUdCNR3ZHeb7OBXzn03Uve7u4H"
+    "Pm9uXoj/K0N3atQwRfATNf/7QZrBPDcVb02n2L0NoLPOryyvr0E83vaWOqaiDwz9GQDVeiCeocBfxcCv/LAgA8cvpfhL"
+    "orYr1cIaW2KIYf6gFK+PTVZVY6vvOUNpGwW18ys76vxKLX6sJ7H3PFyCmNwco0hQ2FjxK4f5RrAljX9BwMD3OOyvgm0o"
+    "MHcz8CsHf1HwWDsFXZsw+N2Nato0oZ8s/MqzQytKm/z2Y+SdOEygGt2jLdWsBn7l+g8SRKn20Jli5zoq3I6axfiTZf/p"
+    "wQLhcH7OHZ4dk46t2stQkNrf2cCv3DXRCc5Q0GxFGacJ5b5cecX5b3d1ff+0d0t+7FtxtKvsAxsfytCGnC4zXfBDtRjU"
+    "/kM2btqVgV3rk/2GkjYl/ZFk4FembshSh2xfCdculweFYtSGKDH/2FvnV1adm40nBpig2FKAO9r58SDGTy38yh0bM/BZ"
+    "bDD73ZT0RSsFeW4xfmHhV3avxmBSfY5p1TmGU/yb6yJqewu/8vGBHHbddSs8yonH1WdV7EZ19kw7oQ20caCPFRR8QYHQ"
+    "3530Pwm6ur+FrrbwK7+d/cCSFrbCAu9fYdNVEtQtB7DJwK/kc03QZKc97KcGaUHvHwMi/jnp8aNyuye47dVlPjeJQe0I"
+    "Gb66iPU58br+8/ptguqTMrBntIp8IMA9atQl+vyB9s+gct/VcuVm48tdFWDjbgmytyL6UcfM0+cPPoRmYKcFCq55J0E+"
+    "+uC1ZLitDPtLujzpy8sV/wGTrxSDSFcFy1FhN4scv4TuPxfrq9ijuAmeVqH8o/Mrcwz7T0P+HoAuE6qw3Mf/4sWFCi51"
+    "FHsnLPxKhxuIR/qa8Vsw5S56/0VkQ48M/Mpr86pLe4fXhlkhsbjHE7FXd+p7nV+p+Vh/Kjaz79hAsb8MEkjU36dGybKc"
+    "3US/J+0YzDqftsHBbz/hRw8Z9lCnJxn4lcmOTtCopC1cfkG2tR/xID1/uGH+oMPbIrhqawwPTcoNNi9lagPBB+2h679U"
+    "KvgjJqdiOGmHxjsottC7lVUEG0WrH0srN9R3L/5g7vyBcHww1a6jKcfR92XpYwRzP6bjhuUS3OgiQfJper7Or/yr2192"
+    "vxw+pkMZdmmzO0z9acbp9GGtdH6lZr8/tDG5qjYgBXG8+5jqGidRv1v4lfWi2rD7C+zZm++fMeuWgvtIvz6TxPozbQzl"
+    "fZSKkwaacQ0VdfOHAGzMFgxHC7+ybKs6UvUicTghIBYnUo21ktp/H93YS/ffrRQMMuvbw0OqP3NT+82j638Z5g9uRTyA"
+    "JZFxvFKuPzijoQzb7YRvWPiVwbIzbK1J/eSs4qcPiHE6v/Knvr/Fa84cHn7CFjN3FYaANBm0ufN1+v5T7f5N3RSM+JCG"
+    "d3cwcCN9ujNF8Nct89s3Rr5WH4zsD26BlSA9nWxlIeJOBxGjNMZQrUJZWGKDHWwpxiCR9NMRuraYgV+ZeWc/Bt1tyAIv"
+    "2MBiPwWjXMX6p7P6/EG9LgxGkM05OHI8orWtFb+yw5enbOSxa7Bl3msM6KhiB0os7nZij6r2jU/qKtg1lOOPBAY/ST+9"
+    "I6MaYOBXrrhvL7U6PRofTIvH4X4SpFLR1tDAr6z0ny3kLe8A/UhUX6f4QekcXxn4ld17eMLAgVe4R4yC10dQ/egs+FwW"
+    "fuXlyw7Q52wW7m6hYhQljZse4lyfdXr7H7vnzCfv74KnR5aFzGAZbl0Q5x/c1/mVz6Zk4p1f2biS9EejEoI/t8LAr/w4"
+    "w5/n870HU0uVAqdeCqaS8093EnsctDV8H8+ZceZmE5y/SPlwC+kYff7Aol/Dh/aB/+7UYz3uZOLBMQredhK+b+FX/iEh"
+    "8LGxghuvcmzUifqc/nC0gV+ZeLqk1LT4ACjo8QxnTeL4h8RtP1vBENL2P3w4QzUR6YfanhI0JtvR9rfcMPArl//Yzg58"
+    "LYoxEUk4P0UCVyt+5ZNYB/D/awcnunE8RrF1trb/3DB/EDBqALa7f4vf7+8Aec/JEOIu1g2u1ONHd7KrmlXTcNENjs4k"
+    "DK/T9z028CvDlz9QZ9tex693/f+BY1ZOJ+2TJfYoafzKMufSsScZXNNDElx4pJ13JeYPJN0Hd/id5WWn5mHXZxaA5l/M"
+    "//bX3ND5lVp9He9L33zAFh6u5tiR+ra3Fb9yzwAX9jukCDu89zvG7FVwGbVvHwO/svxMjjdJ/zn6AFQYLdhSGr/S1sKX"
+    "79dAqpyHfG5ZDL4m7VI7TGgfC7/y7UDSee4meDaD/I+cKiBTOLaFX3lzmSvLbPCJbw39gdmVZVhnEmOHFn6lG3eCXG8p"
+    "hzdR0YdqE4UeupuJvvk3B1HtCm/y+Acv/jcfdM6SgWnsWPqhgF7fdJ7H8dHNVNz6ktpzoxg/m6+I/KxpeI9999RTe6qC"
+    "zaAAuJbM0YkMZyR93A0mzjlx+Z2BAxvawtuDDDrtoLhARtPewK/sU6kXOg6ozSK7OkII5c9GrkL/ztX1X8uiDJyuMnhm"
+    "w3GEtvfBil/pUXkHc7yeBM+WvsMo7ZwrKq7SbAR/Q2uqXDsVbP9Swe1TqH4lbdeIfHObgV8ZUaCkNOvaBpx/4Rk2OcKg"
+    "HtU/P7IFn1arHxudlCGqrAPMo2t7UQ5bY8Wv7HW5P8y8F81Lfc7ESd1kqEn20dTArwxxdwJTOzO+pHf7ll+MP70w8Cvn"
+    "L6/GOw4KwLuTS8C+I/SsF1TX0IXN9fi1zSMbw5ZkYqVxEtRvRfUbxY9RBn7lrv0mvnvUTsj86wu931P+OoxY3FmM72oa"
+    "c59vDk5eZYKDdG1/0vLB+voLC79ynlt+GOoVzG4wFRd3U1Ci9k3jIjdqNdKzXAwerVXxMfnvA51fWc2w/9RtuoM05dVS"
+    "mLP7BXb8oaJ2xkQ/O6G//p1/W0/BIyR4XnlJ8Ih8dzQ5dVcDv/JK66dsjXs9/DAzEV+fkOBTCfGDhV/p2tAe7Cl/VvrG"
+    "cSy9/3Mm1mdZ+JWL2h7Fv+Wv8q4FbKDrerH+1VWf+9Y0QnIuE3Ten47zTBzliXQtGW2OgV959slbNRLWYHcfP9jZXoJV"
+    "qxHt00Ufa/rvgHsGBu8mu3olwTNKSJn0v+n62JSWY07tmcrHu2dDpQ5FYLJixnb0+zB7ET+0/gl6o6LjHTuIJbW04gBp"
+    "MjsR+CzzB54L70G9lX7s0LLfGEX1/2ZHsTfXwq8M7UP1VBkzfqK69s0wanu6cJsqzkbUfo9YVUeKLOsLq7/G4AVKjLV6"
+    "AmicG2f9+72dOF5faAse1HCVKOk+SBP71y38SjfXtuxGaA5vcf8LhnnLcNGKX+k00gnO1bOB+dQGUccQK5J9zzPwK6e1"
+    "YHitUwIvH+wGjz/J/+aXtP2xjfT43bMQg1YDUvEA3SwsimoDza4V/exFbfxv/w11wWw7CA8IhNbUoJGjhC7X9p9q/x9Z"
+    "NANbjZNheFkJ2BHSkFb8SqVwAUyY78cmeLnChnSK32T7/Qz8ymf0IemzZGhVmuPfBMRYK35l/JDBLCBOhcTUjzjwhYLp"
+    "lJimG/iVrBlpkotm/Es2PLcf3Zue/9vAr6ySr7q0QrmGE6Jj0c6DwZHOALsM/Mpyjxk0ibKHrHiA3P9R7M8R5y9Z9p92"
+    "bXMYvD894m3zpWK7ZjIoZB9bDfzKxq+cKC5yDCX/1Pb+daCGH2XgV/rNHcKngju+cSwKPb/KUJxy9HCdX6nln1eFzTh/"
+    "ZTp+TWZQjoLGqJ9i/4SFX+lX/4v639FJkPK6InQn4V2b7P8FGVasvv+gztEsVLgdfEwi7U7+F6OxzQz8yhZF7+OPNsFs"
+    "QB8JVtZWMB81ekMDv9KjHQOfAMQaBTmupoD6wUW0fbTe/o27fmS3Eo6D46+XeGmqioes+JWLyih4qDBis0wGMymoDvgt"
+    "9h5a+JWvfmWzay9644J3CTinpwSe1DEtDPzKd+Ps4LiNA8ydQba8XozLJRn4lecamHHApss8IZPjhMkyOOYW+6v/WPjC"
+    "Dg7Q83Qmjpyk4pt2AM218T8U99HiV7fGqrrg9yB826kcjLKXoS/Z6KFUMf6mjQEEp2egt50Z88ZLUIgKAq/vYv2+hV85"
+    "zr4x39YsAap+KQ69qitYU5vGdhT2q62RNPdV8NR4E/SfjThmO8UQ/fwry/7TfqXmQB9zLea+Ph3zTVMwD/lvmIFf2ZPa"
+    "8+EzM2pzOLVCAZrRvUsY+JUZ3ypKiyZ3hBW14rD0RY42pBF30jPa6s8fbEex75IMTXJL8JUC+nIrfmVjuwh253Ye3BX2"
+    "AX0lGZbQD1kGfuWE/o7wro4duBbj6LATUVub3MIwf1BiahN0rXufm846QbPbMriRfWvn207R48fGwzJ4P07FOVRQ5URS"
+    "PCSnG6eI9S/aOxTfcFud3Po5hswNgMsU2IqR/lhIHXOHiTmozlfSsWM9BtFLJDhEBj3Cil+59E0sT3b3YvMUD6hE+u8V"
+    "vfQBA7/y8C7ygTy2ED+MkwalPrDiV+aeWY6lrfVgdTd9w7YnFeyWW+ydsvAr+xfi+NPTjFv6C37lEyt+5f1+QVLdzT+w"
+    "+ukYrDSI6nLqo0oGfuUaymfjokywn/wom+JvFZ1faZk/SP6eCus2JXKb0F/YqpYM9+3E2m/L/sRSeZyhxi2Ks2VVXBCD"
+    "uDu30H8WfmW9Jbt4npgMfqB3QbiQTf2nxSxqP2f998YTVKzrm4a1SbTPpsJlMLXfV7q4p74H5Wv2E9X3XXOYtd0fwmdw"
+    "nEr6WzvDb5HOrwwelInX39tCpTEMxlH94kjX1jbwK9fEz8TYGvXZuZ8maOml4CWKH9q5n5F6/P5JfReYBVBR4v+YEKEu"
+    "Ym7Gwq/s8Oc085gdB01vvkHb0ipOo06faeBXxg1RUAO+lN/LYC2JPhuy3zQDvzK/ayGp4IUF+Db2OcZ9Y/CuIfWdgV85"
+    "a4ENtKnjAD/JLr/p/MoXhvX7jV0bQ0bKNV6EU43Xm+pHRxGfC+r6z2aNI3Tyy8HwoioWKavpOYDxBn5lpzoleKm7Qdhn"
+    "Xym4u1CGUpSj26SJ9cvaOVfXe2Th3flZ+HcL6Q/SX17J4rpBen6YN64ArznvJHjyMjBil4KvSZi5Ogvtp50TOPJZDubs"
+    "MsEL6qyX9P6NJLH/1LL+JXp4NfgxoSEbeS0Hp/ejtsolxp4t+6OfPtfGPKg2ns2xDzVaIv2epO8/1fpv4oF8UpWS0+Ha"
+    "2OcYVJJjnabUpnaCH6nNH6h9FHR7wuCTt/SPyavV70sN/Mrrky4xpyb+ONz/LY57IgGnRp+dI87n/rc/O9MeDt4wwa39"
+    "HKeTUXzX2BoGfuXeuSvw1pDr3KWLHVT4T4aPbmJ9zhF9/qBYYTsok5WGn9pz7DGPfJs+bJQqzq/WxsACOj5X+4TtwWZD"
+    "KkHhDAa1Fgn+X3mdXxn6Nh29r3M8/0CC828R56aI8Sc33b/yXl/DI+1s2dpXntAjxYw9qXNa6PtPNRt5N4bj0K52MOIx"
+    "2S/5b6ZJnH9l2X86b/JX6Hm/DKsy+hc+i1TQi4LCAQO/ElWO321JV96hPhkFcMWKX/njaX0p9mp+uBkVg1tOkL7UeANM"
+    "nEGk+W8Xqlu31raD9icZdKP4FWvFryw4tQoLjfnNa17+hod8ZZhJD61q4Fd6XXICz6Yy+ExRMYU6PZrse72BX7l/8kfe"
+    "2T6JrzqcB8alyLCZ3l9jOPnp+lNjxa2amIpLQ6iu3S60kcav9NHXj/zqclP9UtoTmEMg/J1DNjsasZ/Or9S+8dOIDCzW"
+    "2AYWUN+EkdM8ovg3xjB/UHNhVXxwqgrLjspFNaEZV9OLrTPwK+fHAYy9LoFbXo5vPlItb8WvjM0zh3Xp9BcWmz7gy2QF"
+    "k0m0Fdf5lVqMLJSpYCRpkBZVGMTQNwyn9qti4Fc2KuAvmQsfxcjZcejVnUECaYQ71HBhev3WbaMES3/aQwP69ueUv/ta"
+    "8StvRSyHvfb3+JDiVKO0kUE7HyhNX7uk+bf7RsqLHxX8yhU8SxfsoqRXW4+tmn7wfNqB5w8qig4DvKH3MxmefELsaOBX"
+    "hlfLwfrdM3BKOQlO9RX7H48Y+JW/klPV5b0XQ1C7CtAgWMV5WylHOIk90Jr+c2iTjftbmmAqafdH68W4rWTgVxZb+x2j"
+    "3wazkuQQRTTWkItYO/Ve1392tdg/doMXJbWe5chfrfiVs4PTWb1+O+HR6AScvVfFmjUEv9JZ3yNy10fBAfRQn1wS3KYG"
+    "rf1bPNfCrxwx9xv7s6Q9tg17hYXnSxBagWJ2tugfzb7q1zNR3reHSXWpL+n9te/6YeBXOpR8hSVOXeY9SjBoFC7DaBdx"
+    "vqyFX9lPqz3vZGCJIyqO6UPaluqDKwZ+5aGZKeqiH1PQNU8FKHFNgnI7Bb9ygN6HlxZkYKniCs55K8F6eqAvGW41un9l"
+    "Xf95OYbw1JlfYNBKb5haUMETVNjFO4g1OJr9xzuoeKKaCUY2Rdyr8yuzDPMHP8fuALsm1di2oanoFa7gbkfBNrDwKyOo"
+    "5rkyxYzf/OldSYM0IP2UZOBX7uteVXKY0wAGL4nFOTLl5m4Ap0kDVdT5lR4DKXcusoFVOQxq0r2mWPErM36NZqUG2eO6"
+    "ep+wq5sMp6z4lR6fHGHuWFtY+k3FqeS/FUyCz2DRf265yqLrnic8t3tueBMngyfZ0QNq2L66/jNHSuCxOBVrTKX+Ix86"
+    "Sr5ZTRH7A7V7nI+MVg89TcZ9OQHQfCXlqzGIt7X9Cfozzr9Oxwc1JIjtL0E2xS9PK37lxOm/+cz/SrIBk/NAse9m9KVG"
+    "2UXf76/b70yNRznMBuq04Bj5QJwtZORXzt3bmNlmOzFl7ReMvKbgTfr7Ww38yg9nVXzbxoyn9gAUJVEWRhfuM/Ari6yt"
+    "K32v8xKbOcdivpN0LRX+NgZ+ZfBt6rOi9jCuGIOvBxADrfiVtZc8h0F3nvNNvX9jkSAZIuxEbrLwKzfndobHZJN33Km2"
+    "o/zVxIpfeTk9gi96wrDeY08okiHDT31hiYVfOW60guFH0tBrPoMQSgoLqVN60/tZ5rfX1k5QT18OhXMbK0HeAhxvhCMW"
+    "pR/q6/zK8b+odhpiBz0ofkZR/m5C15Y28CsPvt6GpV0bsi4RtjDbV8GTroI/Y+FXLmnDoJ4/QCETx9EUu6/RH7Yw8CtD"
+    "295nKxffgiquiQhNVezuS/rGwK9sUV/Bnj4cPagOT6HYUuiPGFuz8CsHhuSS/vhOxKO547FEUQnKk9M2yxbzn9r8L+9u"
+    "C6bqDuAURzmN6t+uXIwNWfiVh0qWgubpV/gQTwXPD5FBdhb7Dyz8ym2qA4QXyMYZdVVcQ0HrkYfw20h9fXbQTHfelbXH"
+    "sEtlYGJXGfJdRXxGxnkSxV75tmcy0XFFNva8JEET+rYG5JSatu2u68vCn3z5sPvR8PhTKSgxSsGXt8jPncQZg9oaw8qz"
+    "zbh8qwnKPqUYupn0vtX8wfK1XcDtQ322fkEWnh6hoLuzWDtfTPfxo6sBRtCfNz9KtWF7iifOYv7Uwq98Wc5HqqQMhen9"
+    "n2H+vhzLtgbYYCvOH9JyQN6NCjrulmBSEQkq0HfNsuJXbmuyl9WqWAJjUt/h2K8S7NL5lfP0Gj1sqwM8rWgCdTjHiRr/"
+    "npzKV1+fo31DQ3k05t5wkydvsYcRJ2RoRzpd69uNevzw87KFkf3SsPd/HLcvpxys8dkVsb9XG99ccPWROsn/AjpN8gfT"
+    "KgadqPh8R44xUd8D+DQ6HWdQsVH4tAQa/7+stn/WwK9sbzrCP+e4sEMhBSH0qxm1vfGlyQfd9fo6QeFY4LktlI3i+PAs"
+    "+ZU+f2DhVx45YsuWlvZmpu4/8CLpd23sNtDAr8T1HGeqOWhHf153tBgbNPIrR9RvIO0LtoXXi2OQ5Af0DhNrqyz8yl++"
+    "VE+8t4POSwW/8pUVv3JtZkHWLu9Xrp7+jl0DZPhGjR5n4Ffe0PZ11pegUwcVI0gQDHIW688s/EqbuXf4mDPf+EfPfFCW"
+    "4geVGnDELOY/Nfvf9J3j74OpOPI8wNRN5PfUtsMUkZ+1Pqwj31XnHvUDl00BMIGEQ/fxZL86v1Ib4zz3JAObybYQe4VB"
+    "ehRdR0bT3aD/IpZ0wudJNdmMik6wz4l0EsUHbX3uVF3/THFiUJQzOEvxYyIZxGIrfuWERRtZuutn+FUmCZ8xFeeS01+3"
+    "EfpH+36XIwr+t1/Bw0MY7O0AcJVseJ6BX5narYxUbcVW3D/wGTpQYVCjJdlvjuBTaDbuMliG/d4OUIJyb2+y32ZW/MqL"
+    "HUZBLtMtfqlyJoZ2lkFjF1YzrC9Iqe0ELufN6GSnYj6y7ZN5hT608CtD59TlhUdWwPfHisPg8zJMpMTYLV2s39Zq0FF9"
+    "s3FMzUw83EeCYvT+Z5IFg83Cr9zeR+I1R2wBn7XloEeOgiP3U95xFuv7tfjdPC0bs2aZIIO0T7EN+ty1gV8p01+OmhrM"
+    "Kt1W0dRJwc65xd5nC78yw4MBv0u205rjY51f2cEwf/Bku400MWQ1mPLE4/KXKj6uBzDGTqwd0fpoZEUFN50C6OwpgUQd"
+    "2v23aHsLv3Lx+hds0buG+Dv9NYbuk+AzFZYvqeO66/tbfjJ7KDDYHqI5xxzSf9OY2D9r4VeOLXQBe5y5wktT7HVZJcMB"
+    "ekZZJvY/aPVLn34m6P8nHSunUP1D/neQ+qC8gV95MvyDennJUjyzoyL0HSXBDHrGceqYi/r8wdOADJQbqNgwUQKFbjj5"
+    "J2lWfWxK6993w8dy3+g0KOxbFA5LClbR+FJkAwX1/NyPxMKaD3YQSgHllM6v5Ib9p11rX4Wyh/3Zz+A/KC1TcLWjmBux"
+    "8Ct7TkHsVM2ML0ch9qfEwaz4ldek2pLcuhKsdIjFmFZUW1GN858kGMZa/gxJoOe3tIWF7xi0oaQ7wYpf+e1cVzb9kcqP"
+    "lPmCW73E/HknA78ytq0TbFxjA29Oq1iIivI99G3TDPzKcvWc8Kr9C155rCvUTpL/je8oqji/TYvfHecyKEzaltEL148S"
+    "c2deiqhtNX2fHXlD9aOYkVIhEPqQwz0ZJdZOaZ2rtVFl1wxsVEKGBqQBN5OouGDFr1z7NxeuD6jATmS5QoO/Zpysrb3U"
+    "+ZVaOwaS0ClBfjXdj+Lwc6pXrPiV1x/2YvUjGKse+QkDniqYQB/W2MCvPBeiYuJmM1b6QrZCRUEB7XxsA78yT1YNKcTx"
+    "Dl5eHotbVPrvrmQXFD8r6XxOvwUMni6wh5PfqV+ocCpjxa88GH4Wptx/wn0G/8V4evB1OxG7LPxKnuIEWVM4tiZRWemn"
+    "xrIS/MqPuv7YtGQMr3wnF86oVgRW/ZDBm2w0zsCvnDjJjB07pGPyUwaekwBK/kL8Tu8/Ude3gwd9UHuXGwOhXfzgBmnd"
+    "FctJMzoKxoVWP46flYXbEuzAlEl9Q/FjlHa2uoFfedHnKl783ohtqihDJAn7YFfBjrqlt/+U1gx8R1C/5eHYrhDAFxdh"
+    "1xZ+5eD6b9iE5DMwcfQr/DJcxc2VAJrYCb6PVuM/KqFgzGuOSb8Y7NH5lVsM/Moke2STiwzE54MSUGojQYeqYv+phV/Z"
+    "u7wdhBR0gC5rEKuuF1zgNwZ+ZfF8dvDo9WW+rS7po/EyzM4l5scy9fg8va0DTHHNwqtUR6W0EPw5bQ5suT6+ah4ocQeb"
+    "vljwqC/0KyLDxRPi/Cuzzq/cWDYTa+7KwSExEmTo/ErtbLHmug2O+laXr6oeB0ePlIBgEh89SKOYyIZ76PrrSDkFH80k"
+    "/beW3n0bYi39/CvL/EGPURNher867HOHDGw7ScFWdG0Lfe3KvzOiSUxFZZjxykeOo6g2oXIOahv4ldPSykmHR3aHCTPi"
+    "cAhprMmUY77YiD7UbOxAkoKnJsvwLI8EkV9I/1vxKz89WMlsH+fHIdHvsZUiwde8/5dfWbaqI3SaYwfjAjmOJdHWmR7a"
+    "wMCvrPe1HZ45c5f/+eEI567JUMtdzK3P0ePH0Tw2MPlPKu5ROU7YALCK9NdKA7+yV5G7avuwx3isSQAcoMKkymSKv9Qx"
+    "p3VGwNLr6VjpA7XDBglCyOgS6P0PGviVUaH3eMUfBVlmQj7Y/JnyNBmFo+3/+JWRFH8/NbCFJZM5niVtX8BR7D+18CtL"
+    "5fVhv/YWYLeaJeMd0hoXyH7uGviVUwM4VnEx47M2AH1GUQzQ+ZWuev/USAyStt/7i067YjCdtPfaUPqfgV+57gn50kQT"
+    "RPVmUJGKiqRMwQ+w8CtXR6rQpvQ7fvDkT/xQXYZf9NABBn5lIuX3S+UYJAeoOPkRtZl+/pWFXxk+6xAP6ZvK1YgC4JEt"
+    "w2r6/lV0c1c9f3m/UrGfbRruysvgHNUS88hoo6nxOuv7A/fvfaTWZo2gfrI/bN3JMQ8JNy2GbaVnaOvf6zTMxNb7bSE3"
+    "1Z/HtyJuINtoaNh/esVlPEq56rHEq/YQUkDBddQw1Az/zvDS2migP4N7VRlsljhG0XMDXMT6cgu/8sHZI+y/XAnQuftb"
+    "fF5YxVM+pE+o/0bp+Xn7GAXH11exZSSDoGYA/aj/4w38yj4fvKRSA5ai27jnWPMFA9ZYnL9u4VcWrm0DZ+s4QEEypv1U"
+    "9JXT5w8s6/d9r7WFVu+v8wPNs7FAqAzOjuJ8Dwu/ctxtR5i+Ngf98qtYpDjAaDL8jfr5TJr/zznoy0fNqY2Dv5WEC+tk"
+    "qEf9vZh+GKjzK5dEZeGKiln4e7kEr4IonySLvTeW+SGPDe68SvRhwENlweGcgltOk24lw3qvz+Hu3ZKDfzaZIIme3ZKK"
+    "ql9MxA+Lfr0xuTx0KtWIBc4zY7Vegl+ZZeBXMvKdN2VUDBjHcU9DgFq5xdi0hV8Z1NNdqvx4DjyOe47xbhxrU/tVpf6/"
+    "qMcvz5YKdolg8MFbggEUtE5b8SuX14xmdq+rYNMdb3DhbQmeU+HaIUfYr/b8xeftoX66CVKucNTO346QBL/Fsv+0e61N"
+    "+G3XNX5ytS3s3SbDdjfBvz+tzx+YJ9pB/SrpGFON46eZlD9cxfoLC7/yYP8EdeKl7bhc8YN7+SS4QoX3Q+o4V51feTMj"
+    "HU1hHD88pRqYAmIW5c9VBn7lxcJLeAMXxrJOFYaKqWbcSfZ1hG7squuTg/U57p9iB+fectxE+olKebAxzB9UH/QGxgaW"
+    "Y3lLpWCB9Qr+chTsHAu/MjYf4j1nM248jlh7JNm+zq9M1uc3tyfWk1qkeMHMkzFYm+xzQajY/8J0fTAmhGOCjR1svcog"
+    "gJLyNCt+pTy1LrvNU3nTgt9wYWkZCjmKwGbhV5r2OEFKlAxXFqqYQY1K4RxWGviV+31/8cL93/DBL93h1HcZLpPtudMP"
+    "VfX2nzuE3nFkKnrXor7aQW2m1deKWFuh6b/ekdHqhiJ5oX3hQHhNtUvAaMQVBn5ln64ZGKHI8NokwWL6vRnprymG/adv"
+    "i5fHe+cDWa1pueGp2YzvyGheGfiVv88BtOESuBbiWCEJcawVv9Ln5WTWr3UGLN/3AaM+UPwh0fbTwK/8ZlLxMlMwx4fB"
+    "YqrNnahRvQz8yiqrAqUaeU5jVt04/EWBbSHlT0cDv3IoaZKrL+3hywmqO6j+zWfFr5z5ayNc3H2frx6Xhs9bytDHJOy3"
+    "oa7/Sp5xgoJtVNzHlX9nJwSSPm1j4Ff2GNSDe50qhFPXFQO/1zL4f0M8mSHW/2n+c2lpDia7Z+AcDwlKDaZrqfCeps8f"
+    "aP/sHpOibnQJh6eJFWBnbxXDyYYGkGFt0vWfXDgbb/mZ4PEZ0tzrxbork4FfabfyHfZ7HMzG00u3baSgdn6UN4r6RKvR"
+    "mtdh8PcYx3xlOJYrTf5kxa88eSyFvdyzF9x/JGD2BhULU405wU7sHdX2Py4sSDGN2q0O9T/T+ZXJBn5loE8Ky9zRBfO/"
+    "fYl9JkuwwI80rYFfGZxtB/mS7KF1R3pfev9y2py3gV85JfsTyvsu8x6DAIbPkiE1t1gf/0mfP6i+zB6wUCa6blLxNtVW"
+    "B0jfaAyThfr7X7RPU+tdH4cvp5aHOS8lGL6H8gtdqOk7zUY2n8jAYVfM2JTqx0BK6Le/i/XXFn6l9/CO3OPqe/Dr7QOh"
+    "xRUsmkjv6CjW6GljJPtiFJzfzAQhJAgr6PzKTMP+05+f1sEDtTrzKpWG42crSOnm3/oBC79yNhVKDdeYsUMRxEF9KSfR"
+    "O2To/EpNXxRWA6VPy5uC57VY3Pedo8brsTfwK5fWVrFBUxtoL0lw9DW9W6oYQ7DwK1MKTWFN/ZwxbvtHDHeW4QU53TAD"
+    "v3LdRUfodsUWHplVnEP1z1Hq2xDD/MGeFoG45MEjntwwF6x5LMM8N7F3a6iu/3pIVNfvSMWq3UnrbKVn0vdrYzBP9fmD"
+    "DuNuqhWffMCCzwNg8VnS8+PIr+nFPuiMgAcv0rHde9KFYyXwv6TxfP4vv/LM4c98c7wPG9k5L/mOGbX9m6qBX3mNjC1h"
+    "uw0U7sxx9l3Se1b8yuQVdVh2exfWI+grjr+o4F+y70GS2L+k9dGyx1Q/1jTj0lUU16kWLWvFr8y3r54U2OcdZibH4Ghy"
+    "umVkY30N/Mp7c7RrTHCGdFD8IcR3VvzKiMnv4GiuBL7vdAreqisDSe1/664s/MqV+ZyhgbZmuKCK50k0nbHiVyZGrOYd"
+    "nDj3zy4E7TJl6EkfNtjAr0wl++syMw23DWbQfxHpWQrqVVWxfkF7/7AGz9X90BW8siuBUy2Ol0i4r7AXZ8hpNjZSO0yh"
+    "hh18bcZg3iaqnbWzEQ38yiuZa/BCjQYssrsdTC2p4FmyH23v+j49fjdvzKAn5T1my/+dq6XNP2pzI091/Xd5eTTLaX8f"
+    "Om9NxNZkq8NJpz028CsHNVQw+ouKE28weFsHIPSPOJvRsv/U+7KbdOjQNPyx8wU2zS1B73oAHbPF2n1Nw1VxtQUW5ACR"
+    "1KjHqf515kL/Wfg/wcmVYN7mq/x0fzMmkMDRxh9m6/PrWhsvquEI46Zk4xrS3+GVyf/JaLUYtE2P32l9C3BlVEtsaCoD"
+    "NwZT+0dTv5CPaXxL7e9FZGTii4Bs/HlcgrZUG5dLFuNnYfr9B04pwV06XIEJO0pDP/L/U9fFHpntOr/yQVMzJm4xwU0K"
+    "aK02ifUXfwzrX0aebgmb3wexJ02y8dAQBXs5C/8rpNcnk3dSnCJdsm076W8S5jbkFHsM/MpqI4tI3e6NhtLnn2GJ1lTj"
+    "t6RvtBX6/d/5V9MU3NlLgm/FJPAhU2ii8yuL6TnwxbQj7OyCMtg39B2mvZOgOSXNj/TDLD1GPxzgAIcGmSBiDseQzYiH"
+    "yDd9DPzKHtun4oVZ0bz9CxPcpx+rugv24w5dfyybbgv/rUvDtAUcvy8mbUDvX8TAr/zj+1StM/gk3i/iD0GnGLSZi9iU"
+    "3jNU51dGxKbjiQlUC16WoOILxHVkVLsN/MoY/h9P7eHMytQoBEWSzfibbGexndB/mv+/f8hxBrcFE+XAUG3/k73Yv27Z"
+    "fzr7nRmOJhRnfZ1/4tXtYv+HNj85Sh9fUo5y/G3OQRtKuPlGi9rTyK9s+DVI8pnkBD7LYjCGEma/MKFbLfzKDikcDx+x"
+    "g3abqAak+Bduxa882bg466Ykc2fX7xjlJ0MreugOA7+y7mcn2LRdgtQwys1XddtiOttAy39fn/IFlz7z8o09YEGqDMWp"
+    "YVy08031/Dm4A+KIDakYT0XPyC0AgTq/srK+P7DOhttq/xNlAG8GwOrqlE/GUr0tC36lloMPUv68eNUGBsYwOLuLaku6"
+    "vq9h/sA/szkOqleD9bR1Bk+TghMpPmj5daweP/JnUAyvJUF/J44r6KIWOr/ykx4/9pxbyb43T4afN5NwVLaCZrK/FQZ+"
+    "ZU+K6dlkw57dGbygojdYO1vAwK/cMbicNGvwLvyU/xk2pxq3BPlIS51fqcWPb14yJOVzgMWTSdeQU6tmsX/Jwq9slDgF"
+    "8oTc5p7zMnBABxk6U/sXN/Ara/ZzgnukC0ZIKnajDg+hRnPR18dr+iF6WzDfs7IMPvriA/mjSf+9JR/R+ZVafgw/kY3F"
+    "vlOnkw5N7kq2912sLZ6kv8P61qo6uvN6sAkoDzPzqFifcnQadW5TnV/56HI2bh5mgqaTtDiAuBYEP9HCr9QOE8i6FMyO"
+    "LeU4qq3yb30i6GPPWv68X5jBIsqUuRtxvP7/4FfuXotMebQBfObGY8e7Kp6gGE3l0r81xtr40+CiCiaSM+Tkl6AmfXsz"
+    "nV9ZWe+fuqcT2fSrTbHGiNfYbSvZKcX/MwZ+ZeMrJqi83B5G5UWMpPfX2LfplrExLf98uYlrQq5wv40SJC2RoT4ZTT0D"
+    "v/LgWRMcr5WBf16oeISK7mC6aZiBX+k1+ov603cBBcyKYFoqwXwKLEPS/qG2/80fOHXOwJuJCrZ7I0EjChiMCo+ehv0l"
+    "a7oP5WFdf8MEUgQPHRTM+kxxn3yoqN6/8jgVLyl20LQExbP/B78y5M0pWHUskBXif7BvBNUvjmJtpoVfaUeB2LGZGT2p"
+    "IDpD+v+mVpsb+JU29WpKccOrwky/WCxShWJXD2oX8j9PnV/ZaJ+KNi620DmZwVztDEgrfuXDRr2Z1JGhMv8z7ioo/+MT"
+    "GPmVV/ycoPEXG7h8W8UzB+l6bf2vYf/pzsYeWCghjjeJcoGRVL+4UPs3pQs76vpP/c5gyLhUHHYO8cYObR0p+Qc9+Jc+"
+    "f/Dk1g01bEgW5vYOhG6NAdpT/dhe2/+ix6h5cgY2iZFgdlMJwk6ShrbiV75NlHH2FV+2JM4NglLMGEqNZiP/j19ZivKZ"
+    "318ZQqtz9Iml6634lXNdu7KdZW2ZEvQZg+8r+Ijyj4uBX9lmtIqvZ5rRNhbgBImmWCt+5ajdtaSdRR7h8bBYfPWJdEs3"
+    "oW8t/MoEMsYnQ+yhAD20/V6qLci2vxv0X8v912Hx3Ri++eIfHNVIBm1+KcTAr2zLnKHOJ47N7VUkiYotrPiVHc5P4Z0P"
+    "OWDLvl7wJ0UGM/VvbZ1f+W9+7JkZ9xZIx8wzDJ5Po7hLDX9eFXw7rf7tc+etOmDdUMh93w9KJqjotATR1lHsoddiVPn2"
+    "WTj+mB040R+EbBT6ydPAr1zqewp3D2nEfptl2Bqg4FBXsXfxit7+oc0ZxFLdn9eFo0s+sf/AyK8srb5gK79dhEuZr3Bj"
+    "LxVXVqT+MvArY30UdN7Kcd8nBjf9AQ7/FmPLFn5lqXRZ2jxuGJZKi8eUehIsq05+my1yt1a/23yg3E0O6U3vMInix28u"
+    "+MMWfuXcz66QXu0KHztfxXOjZMh0Fu2r6v7bd40DxA/LwuZdVfwbTNrJQ6zvsvArX14w8Y0Ve2KCrS94B8rgcZZqJEqc"
+    "SShq2Ce9MnFAwxxcdF+C95RQIkn/HTbwKz0zq/GBzo+hzPiSENxBwQE6v3Kozq8cnGrGWgtM4EuC2pvyz2dZrB+26Ne+"
+    "h4dBsRN12RG3TJwyTsEldG1NA7/yLeWMA1SDV4nlOI3+XdO3nQ38yukPykgJIb0g6WYc5l3OUVs/WYoaZ7Aevx9eVnBt"
+    "FRmiCpD/Ue6RqOMfGfiVe0duZM+TPTHc9z3myZCgixW/cpqNI5SKtoPyTag2JdH82Uac/23ZfxrcJwSjW93hRYo7gtdF"
+    "sX5Ei1sRevzYPdEGnAukYdc3HLdR8qJyFI4Z+JVJb+6ppsl3sJZNAGS3ZBChrVOj/t+h8yuv3UnHW1TMjY6i+v0+xUMr"
+    "fuUS81W+ZHc+FnImP2z8bP6nm4cZ+JV921CtOsoWnsznqE36X7LiV65cVoB93enJBmYn44ADCvrlEutzLfzKP805VrQ1"
+    "488aAF8oD0614lc29W4gyeYsfLcuBjdWofuS/lP4//iVV1ZQHmtuAu/RDKaQ/lxM2lY1zB+89zcxh3vveZbTTxxdVZx/"
+    "Vd3Ar2yUyxnkFQwa1FFxDRV0M3KJ/QcWfuWQVaf5BvfffO7J/JBI9SM1N2TmiPVvWnxJrM/x7MdUHE9Jd/s6siVKejup"
+    "/Vvr8/u7Vj5Q2xSsA37lA6DDXY7fJpE+If89rvMrGxfLxMYjbWH7RgZuVNSUINtoYZg/CGk/BDtcr8Pc1zrArDwK9qRO"
+    "1WqHCL1/W3kzqD+ewSuZ4zL6IG3SIsrAr8zfbS8rPj8Rlv55i56kf9Riwn4t/MqkqRqTR8XTixk8pVzwiPr/ooFfmRXu"
+    "LYV6rUanAs/RI5pBfhJOVwz8ytm/ZahVywEKka6ZTdrgnSLqR8v6/aeDesD4nzd4ng1ZGN1dhiVkH90M6wvOZTrCYyUH"
+    "87qqWN6L+obix3kDv/J0U3/eq3M1jCxVEhbslKFBHPkX/dBFf/6z71k4Kz4Tz8yS4AUVve0pfkTq80Na/+776cyf/NgL"
+    "zbv5wtNHCoYdRyzmLMZ2tDUUswfkoMcKE8hkf8+p/t2g6ycLvzJsljc0P9+IQVPSaT0U3K/PH0j6+L3pF8CdbiqGDuT4"
+    "jGprje9W0MCvTHyTSwoathCu13iBqVzFQCpuW9uJsQOtfixdjWpPun1ubwkWk22u/C3Wz1n4laa4e+zz3JrolucNFqUa"
+    "7aIPQGmdX6lJUdtp9pBS3B4aPOPoQPmnvCTW71v2n9bL/g875FzlW57aQNVIih9uYn2AhV/556kd/Bmfjoe9OFYlp9R+"
+    "f6zzK/+N4R9+rbqVi8RSC/1gQlUJhpC/9U4Xa2y19cON3DJwvllF++cShHxDHE35c4GBX+m1aS6/la1Aq+VeEJNpxtsk"
+    "nN3txfozrY2v5OJ4PNIOxlDiWU6JI9iKX1mwQRyMnVOBfXmVggNWK//4aD308QEtRiz0Iy2Vz4y5tyD6jwDop/MrP+nz"
+    "B06n6kolPUtA3fsxmDmLfCqUfMPAryxYmuOY+7bQ4QEDH238y4pfGRDahPUJyuRFx3/FGiVk0MYf7xj4ld+WOsFDyu3m"
+    "9SoWJ/21j+w7wsCvHPg3ky96+4p7mdzhvy8yXCejGaCKeXqtfh9HuqnssFRcXRDgO+m/VnSRxi/Ppc8fFCgQrW7Pkws6"
+    "lw6ED6RPE0eRbWn9oq/xHdIoA28dleEE5Z9E0p/XdX7lL93+fGK8scwOf9a8swuwLDPSraCEJM7g1OJHPNWs7WvI8KAY"
+    "tT8FjVJW/EqXGaPZWP8cqNDqI159rWAneqkzBn7l7YIqVkg0YylXBgX7UO6hTrcz8CtbJVSRot0u4j2Iw/YVGHh3IhvT"
+    "+ZWajXywlaDJTXtodJvygrYOmD7qg2H+QGq4C+JCHvLht1KxQXMZ8tBNL4Oo3zT7evHUCfCciovImjLoDy5SfuzNxPyp"
+    "Fl+iSvXlanA+XHWzKDi+l2EUiab81Ebu+vx30qccvPgoHSdzBsPJfj7S780M/Mq9lb6rYQdmQM1+FaHATBV3rKP3JsM6"
+    "p88f1EzOQmdXE3g8BPCl+OGr2Z2BX9lp2TNcEhXM3u9iML6e8u98ncravi99/qBYXQZlf3D8SO2vsWkTXAR708Kv/Pb7"
+    "G/N5dQhmD36J6iIVWRXBryyuM6YKuyukCzWelgTVdH5ljIFfeWpNGtt4OwQjer/E/MMkOEMasbOBX1niuB3MMttDmSGU"
+    "O0j/ae320cCv3PjwN+Y+c5lPJ9+8MJXaj156EhNrV7TxjzkJ9jBrVCbFB3q3LtRmFL+L6/pEe/7fm1mqw6EROOFtOTj8"
+    "V4LzB8jnU0V9oO2RmPw+A9uGmDEpQYKvZHvD6MZa/Kqn67/mOS35zw+JsKFicWheUcGR1DhTqeMa6OP3DTcpeKerCdaO"
+    "oLpjB727zf89/6pRsyUwK7Imi0hKw+jpCv5xFOwSC7/yHf3FckfNGOBE9tILYAf5r7OBX9l2mL+0dV1rWJgTi8XjOO6i"
+    "wqOTgV8ZRzm1o50NhDhIUOsd+acVv7JwyTlspZMrBsofsZ9JBmeyzwADv3LmSkc4ZW8Hk3NzPLALUZtb7mCYP8gbWQdf"
+    "537IsyY4Q/l7MjxzE3tvx+r67+8gGYZdSMWlNRBPbKZ2Mwk+2m2dX3lv4S11StxrHLcvAHq/BbgwnnQ3vdgzJsYorz1L"
+    "x/qLGLybKcGqqxQTU//Hr9Te/2b2ax79oyi7FOgBZ7+Qn1Ng7mrgV2rnEW2MtYHI3hxn3aLcbMWvrBNSmY1b687+/PyK"
+    "884o6K/Zv4Ff+fSzilPKmLHEdMGvzLLiV/5ZWF8aE/EZFz+KwVVzqF7qSXWXzq/UYmRDMpQLcSZY2YDBWxK9SynpZxj2"
+    "n75vlwyNh7zinZ1TcHRtGebbifk5C7+ylKczxI2lmt1bxV7P6b+t+JUz6m/mKX1z+F+fQvCM9N8+so0Y+tFR11d7q6hY"
+    "sEMa9iRtXXYp1QvU/ySnsI+uD6bPjlX3VG0H+dr5wz2NEzST3o/6aCw9Q2NA1t6ciW/s7KBOKIP5mxFHUt9VMfAra3lG"
+    "4LPgIJZdzgTTKDEcchVtu0OP3xO1/UuHSJOR/rOjBl1gxa903n2JtTY9ge8V32AhfxUXlwLYZ+BXepGu2X1YRQ+qfy8E"
+    "kX79I2KjZf6gw//X1nlHVZE0f79mLlwyggomxIQKCioiJsyKuijqKmKOmMMqRsSsq67rImZRMYtizjkgigEjyQDmhAIG"
+    "kMyd6Xpr6LnnmR/n/eM5Zx+u905Pd3XVt7qrP53tIJZrtwx3tnmBqZIAG+jfjC3mtRfK+l92nAmYd7Mo5Tn8ofIrX2jq"
+    "9ztG+8CPobEs71QJ1gzSwS+yj/kafuXUGZZg8rYYM+rLOI9y27Nk+P0U3az6byHEmX0r7op7/OvDm3k62HwfsW4e9y+K"
+    "D5vRsggHvCjCjodEGNKccudMbjtj1Piwpr0zC4+9DM0GucJT0g9/3+DrfxdUfuUtOwMGbTeD1dRZ60g4blHPnxrrXyo/"
+    "7QhO9zoJ5hYluG6chKesuXaoqOYn7c5QDnSbNNx6hjV7AMymQb+t4Vf2WFpVbBY2l174OR5pxXCiH/WZhl/ZapSEP6pS"
+    "Xl5bhHpk++XL8Cu3rLkgfMlzx8gH71BPPlIgjXxaw69s7GEBV3abwZ9bGQ4n/d2NYnNVDb9ycdeV6LbiNtOVN4Mm0Tqw"
+    "Ks/rc6JV/THwtSncepSHvSczzF4FkEz+/Q8Nv3LMk2T58fHjGHCjCex6IcDClbxGtbO6xxvwJR+dHSgXvCPCgVfku7N5"
+    "bmnkV9artJNN3mUulHOoBhu/GzBE4VOo91+Vrq/uYvjWRQ+jbjI0J/3Ut8z9V7+Lc8BjZj0hJuYHpkZKGEpjp5xvmaKu"
+    "L9k/YOgol6At+d4LJPo/leFXRg/pKJYctoe5m5Owh7J2QMLxAPA7iEr983mGHvP1cIuc3iZyDI3K8CuHz3cXckp+sMcT"
+    "MzHRXQe3qX1TNfzK8GdW8IOJ0H2qjM+vUT6p1Bao76/oW5cJr9isD59YheCKMI9ypaWWfP+4gaq/d1+ld/4nF7+H0Pvs"
+    "Blig8isbqjWIrSfclWeergW3vzUFE4rzD2aQflH5lUqdQGFEASbMN4ENnwXYdZDGhRo1WbN/MCa4A+5f1EJwf2MNF0UJ"
+    "s2l8lb2fyar/qE8x4UWICC/LMbxMAdW8DL8y8M5q4cC0nxA75iP+lUPzpyrnN/+txrdvDyQc86eE37sL8GEQQBJ1fG8N"
+    "v7Jbt0ZiYs8j2PtRCtpQjs5603fph6eo55cykkTobWEBF8h37t2NeEa9/8p4/tR58AqYFn+ftU7Jx7A+OvhpxuujWqn+"
+    "o9k/VmC7VqJ/K+N5sisDOZb66t6sYgPJ6T1Zp4Q6eK9abbj6iHQuTTp9Aa/BVubIA9MSXLurAN3aiBAxnOuP1xp+peu0"
+    "ItmuwXoIineHux4y1thHeSON8ViVX+n/bzGO7W8Gu6j9H0k/KZoGNfzKEIsC7PzZV+jen2JyDwmV+gsrDb+yR20BBjRn"
+    "OKw1w4Mqv/JfDb9SP7RECGu6Cy4XvMT9l2Tc7AOwSM/nhpLj/EH6bz0li/criDCLBF37bO7/jPxK/yOfhGpn/DH12yt8"
+    "sEEEKzKsiGJ+R6Diw7zmm8GAM+bQmAyy71a+dpWt4VcuvJiAU51i2ORXAiSt0sFjal9fDb/yuKU5VFtdgHHk+LuOB3hC"
+    "/b9Bw68cvyFLLn61BKeu9YB/okWIojFulMf3P5X8sd+CAjwzT8JOb0U4oqyrK/pb4HwVZXxv/RXEBj3NAovkmvDOXsLI"
+    "T4grLLj+UPyXZzsZ51JSsKY55RRk/19M+fkJ4/lTy2lHoe8Ob8H74m+8tVLC/Zb8bJ6RX9njMGnMYQY8143iFrX/7zL8"
+    "yjndWopT/mkDfQYn4yEnym0Hk/3rOD9TmWOfQmV0SzCB0FwBnjxDfFqGX2l+aqLg9ssE26V/wakOOghW+ZXr1PzwnZUV"
+    "HGthCs6pFP+OkD+g50/W7B98GlkDj95NYsFJtjD9hQ4O0qRdR18cquq/VgEieC7LRZnGLnMPwFJqm4fE1yaV/PGVR5zs"
+    "NToHM628wIn0lRP5j0X0fvlqjduW4nycukiEWgNE8LuIuKsMvzLjXTH7x8NV+HmqPOwk/12PXmyghl953o362c0Esjoy"
+    "TKOOfVmGX/naq7dQ64y5UD0rHXfckfA56deXGn7l2ZUyDh9rwAWU1C2dRLm7yq90M54/rdVWjG+ZgmOaJeM9yrHWUP/v"
+    "1fArfYoBevcwh1qUfzpQ/60qw68cf+0ReL9LYZftctCxE+Uves69MfIrfcpZg7432YMN2RHZ1k07Xv9n5FeOtlrOxFOm"
+    "OHutE/z9Wwen6I9RGn5lSDOK/ZRbVNspQOBSgFu/SHNo+JVrRr6Wo3+PgYQWTWBOiYwn/6HPqQ+Ve+aU/ce5dYtwOYnS"
+    "jJoC6El/HKTv1tLwK2+1OIJLHnUWxj0wgV0e/P6rLRp+5dUuAojflDVxho+pb1+U4/v6Rn6lTXiicPp5LNxe8hqf9pMx"
+    "nHxFBQ2/cm1tCeeMZLif5vdzyi3fZfPaXCO/0vusuRiTGoybl73Ebk1EiG/N9w8KVX7AxwhTuNDKAl7HkO2TDe5n/PyY"
+    "kV+ZfaYanDwWw/yfSrh5ig4mW3P2ik7N74KfWUCfh0Vo4yfjd9Ly1x147m7kV7braMMSpw/AYQPc4GBXHUyiGHuL5li8"
+    "egbg9fZCfPKpGKfdFiHNBWASBcU1wM/XKr/fo6kn23onHsa0qAdjR0s4ggKDckfVQpVf2fGqAfPWmMFocrjVdyKuV/cP"
+    "jPp14odRUPtre2FaQiFumi5hIn23gYZf+ZlsNrWdhB1uMRxFDzWlP07X8Cvbz6grBncYB9ftn2GDeQzr9qH8TFl/Vc+P"
+    "Pd8p4bNs8n1OIniT7cSW4Vd+/bFHMKtWE802fMCQXyKkVvq//MoVCRbQTWcGXkMYHtqFGEIP9dTsH7T+No782D22YbAF"
+    "zL+gg4DyvHZ7g+o/hqaZwJ1OeXgwhuG8DdT39H4pNL8OqfY1NPWRvC8yFqtf9oQtFL+rLUKcTva/RuVXFifmo3d98nfH"
+    "RGhG8/9kDj9/YORX9rtwkZXvVEHYtKkyNKL8UVkbUu7fdVDza8c6NF8jTWH3JoYjSQsFqfsHRn6l8y9b4exKZ6HqkSys"
+    "d0jCM9a8/tzIr7wcxPAV6b8cEsxewfzsnpZf+bNJJzHWncZjbRLWIYP1G8HZG0Z+ZY2+5KOdzKDuEs6vbF6GX1n+tJ1w"
+    "cPkXlhH0HX978fpVMw2/cgwN+I/fAkzqLmMqTehMemiUhl/582YMi333nQ1561h6fr2Fcv+egd+/Xlrfeohhj/u5eOMZ"
+    "zVsS5q/JKa2Q+Pq7ok/KnX8gz3BrDp7jmsL6XwyVzcO+9HJx9AzFfoOxAM97cn7lBkoKj5HR9NPsH8zaOwL3D2oj9J5k"
+    "CTG2Etrb8btXlqn6b085AeafFSDDlJXWDsaTUz+l4Ve+SNojtM/8AC//fY8JFjL2q0F+U8Ov/Jdi6tU0CWcsEKAL2XYH"
+    "mpt7NPzKJYUuYof3Efgt5hmOOyVALcp/0jX8yvsHdPDO2wK+/0nai/Lfzer9V8b6/WH6cdDd/g7rlV6ImwfowJ7sw09T"
+    "X3DXxQpqUfzwspTRj+ZGbkWeH1xW9V8l+5ZsqG9TbDrKBbxP6sCDhEtl+uIfav3yqhbFePPvQvSbLsIdf4r/mbw208iv"
+    "zJ1txi6zfXADG8C9LxLWOUHft+baXPFBdk1KcNRSM2jZC2BeBOlegdevGvmVG5Y5wp6mvkKatYzTBkgo2/Dcw8ivfEn/"
+    "uMN/1Haav99J26XZ8vvVLqv2d7aJhZhmCINl+17gxu8y1uoEMFrP944U/1HbRUI9GezYGiJcork7kyb1IA2/clOXRCGo"
+    "XXv8uPINep8T4TT5SFbM1yeU8X/sYw5ne5vDpUyGIdT+RIHrV+P509HXTuGzSTfZPTsTeLVJB4V2/P5cI78yw80Mql/J"
+    "x2UmDPvMgdL8Etj/+JWnG7+XKxzeiJ1tGkPl/iK02kR2Sf3/TK0fSaWE69ZWei/KbYN+0nz5wevfjfzKpu3ms4F3i2DC"
+    "eGfoJRsw/rvCpCO/oZ5Pa5Am45xLetgokG5R+ZWCZv/AxPwBeF1qLBzZkI1XwiU8b8njo5FfadsdcXltA15ZRf6Qksqm"
+    "9MVdGn5ll4FtxSudGwBLT8LnFBiHDCOfruFXDs6Vcf46U5hEubEbBd2EMvzKzDp9BNvtJSw+8Ster6mDlTRG4Rp+ZVKw"
+    "FeztawJPD5H+O41Yk+x7mYZf+e6pgAvnprKYZvbQ85MOomlgFH3kq/rvvm0E8JyaiwU0GWvs4+smzhK3PUX/VUq8LTub"
+    "68G6gRdkk0GkTOfrDqWDq/SBVwF+Ha0D0U2EwJOkJwv5/WNGfmXFTZXw6YTGgqOnHczNM6A72f40Db+yGwn5oJk66ODK"
+    "UE+BW+EX5Gn4lYEwUejMZAj8/RmbPJewLk2cJRp+5UF3GfOvGPCFRD5lDOWm9Pwcej9vVT/1+dFC1Fe+hS73krGXowD7"
+    "AgF20g/7qPzK1GsCNDxuDn1JdFSOItspw68MXXUCkho8ZbmVczGumw6ekH3s0fAr62ZYQYoLw+WCjHcpdrVX+ZXvVP8s"
+    "Wk1mmbn2uCTXGZTigv8oRi/U8Cuft6e2h+XjhHQBVpHTWEP2W0nDrwyt+1W+5R0Cvp8bwbadMr7awPmJz9X9g7jLRbjw"
+    "hx66fST9S/PvAX3XXsOvtF37AO0G+Qp/kX8Kby2hMmkVPshjNT4vaStAq/qkB6oyPEsO9UsZfuVe3WchWj4DQmYa/jtf"
+    "xkyVX9lI5VcusZZwZg3yc0UCTFD5lZc0/MrZacXCHHkU3k5PxVbDRfjhBdC9mOfuyvn9wol6yCpvAeISyje28nW59xp+"
+    "ZegeA1Z9d4NdzmXYaK4OMmx4/bCRX+lR2wLC7hfilDky1qUY0NWB700Z+ZWHL8jy9uMTsHa7hhBloQPbU4inc3nuruh4"
+    "v4qFWFxcgn7PyLdRQuCUxc8f+6r6b/4ZX/Ym6yVMKq4DvtR/B59xRlhvNX++GiRh8FgzqEgBceEe0sNl+JWvdy2FEqc2"
+    "wred+WgWKmFtK64fjPzKLdQJk54YMKyIYeBwei79dh0Nv3JBdCMxYnMA7KEcpvAaw6akEXeZ8Ocr/Kjc7xLOv62D4+VI"
+    "25FD3/Cb95+RX/nE+l8hUaqAN8d9wmxBB/01/Eqlfz8GWcLq3npYVYth4T7KX0x5fDSePx1U2A2fT33IOh61guNxnF+p"
+    "+Ob5qv/Y+0QHNdJysS8JkgXbAebTpAuROP9KacOPF/fk/e+eYcKspnDZVIAtpD9m0MDcUffw9z3Px/ONBHi4RoRq9NIj"
+    "VX5liWp/x0cks+IPTkIze0e4nm7AWcoZORN+hkbpv0U7EO+ZmMKZqQy33uZns600/LeuVg2FLjcdhLM7MvD2GQmXqoHJ"
+    "yK/cwWS8UdmAKyl3PzQN4AG1fZWGX7m5WUfR5MJ3tL+YhIsn0nwazu8INPIrY+nf64+ZgdRXAIn8b6sy/MoFFfPA+u0b"
+    "tm/0T3RqrYPt9NDNmvOJo5ysYQz5ngYNZGychKV8tyh1/0P5jX0OUWxiWgGL7lkFzhfqQDkb3bqEn39QPp+9TcaPDfJw"
+    "PPXh/nUAYdR/6dSmoWoM7liSIJ8f5QcL93pCp+UMAyhxUe5gVfaYFX7i79mFWDHRFPrNEODQTt7pbTX8yvrdF2PvZh2E"
+    "acwMVleTcKMd105GfmX5xgJU+g7wp46VrruNKsOv/LTxgtAsOgXSYt/iyHoyXqBBX6rc36vyK0f1ktCJBHfuYQGW0KRT"
+    "6p/yNfzKbb+riLtercJ3L59jaqYA1zvTnCjm56MU/dd1ngk4+1nAMNJtBSq/8rmmfv/G8K4wvPktVkUuxrUjdDDBku+d"
+    "GPmVbaItwaZzCS5wlnGmK+XuNPCK7z2s+u8dV1xYRGRHvLiuHjz4RwfXKUYPIccwV+VXFiwowrMLi3DIdtIfbQDqZfLa"
+    "XuP+kL93Zbai0jmIt3aDcZR/+F8hu7HmezdK/zdMLcHqm8xgGvVbJrW/g8jPnxrrXxa/bw6T1nUWOj8swRGUf4o2/Oyi"
+    "rZqf5MVQzM6WsDeN7VLqtNf0+XsNv/Kv0Y5isy4LIWfaczxRl+Hs7pTb6XmNXen9p93pN58JEFRHLNWNH8vwK9vPvC4s"
+    "m+2J61u+w/0JlL9Tpy/R8Csjc8whJ9kM/I8xmv+In0XOZzTyKy/mrUPXqFtM8tfD3n38/jxl//2Uuv4W3EoPx/X5uLg3"
+    "xR8ynKvlOP/HyK+cf+S57AyHMDmwCZQvFiBtNc0xZf1V5Vd6leTjuzMM7R+K0IFEVwh1/jZV/yj93/vPTWzaLROheXY1"
+    "uPvLgG9o7ALU86eKjfiS33D9Qw/NEhg+pPlbVIZf+Vr6Ci9zXQWHWT/RZJuEPuQUTmr4lY0+McwmT9v4AcW06ZQ3lOFX"
+    "HtjeQVydVgnS9ibh03OUV47g/snIrxy0gOGHLnqIOi9Af/JfL8rwK1M2eQtF5XJY97gM/OCmgx700BYafuWNWCuYO0QH"
+    "PSk2X6ZBP0f2vVnDr2wFX1jdOh/Y6cgKYPFDBzHU/rsS528ocd6Z5mPUgtzSuyO7k7B5QPPfiz6vpeq/PjPvyPeOVgV/"
+    "nRdcII37I5h8qoZfeWxJAW5qZgI9CwQ4HI0YS/5vppo/Kv3bVPLGCbu9hffnbWAlM+Cf1DBlfydI9R8n7tJzz4tg58Aw"
+    "7zN9vwy/0vv4UiFt0W/ob/oJH2ZI6EwTtx75/5WqvjhAuWNBfQndWghwh5zeBOq/5hp+ZeTvJmJkq1MorEjBgUMEiCON"
+    "EKvhV9b9RwS5yBz27gX4QPGbUsFS/oWxfmRGfDgIvR+w8nXzMclfB2FmvD6gnar/nkdbwdkiCa8zqZSpup6CXlsNvzIq"
+    "MIA1b1gDxV61YFiKDrpT0A6iL9ZQ9ZfL4BJ8H1CAzeqLUJf06wd68cMafuWPuFz5Y8a/YDLEAxr9IaP9LsQtVvz8haL/"
+    "XgcWY38fM8gh7Z65lde06jT8yokmWTjwp69QSILLphvZbzlee2nkV06rJ0Cvv2juejJc1JD8Hn0epeFXTsjLE86t3A9n"
+    "p6biomgZ57Yi/6vnsVHRH5ZmEiZ+Q4yxFeEUdWjbbL4uYuRXeszMEOzP98XMsa/wxEoRPDwAFmr4lY+8zWBJkjlI7RHr"
+    "bOXvnaXhV1775xVeKrjBUpwF+LRMV3o+IkjV10r86D3YHEJTC/D8MbL/UTSfK/L7/1ap+Ufxt1/y4T2h2E5yh/e3RHip"
+    "8iuV+wmVGo4DUQWY4yCh3RsR3JV7pb7z+x+N/MpBR4ew8W5fYd+BWpBVlfJ3pUaD5qDCfy2Nkeb03Ppm4PIH5dqUPIWb"
+    "8vo44/5B9197oP3kFkLb4Fx0Wi7hZXqxMxp+ZVUKZBazDHjcizTfWLKrMvzKLk7NRdedncCwOhlnmZB9UnJ+SsOv7NJL"
+    "xsrrTCDbIECjVMRFZfiVn0uChYe7zXFJ1y+Ya6eDxdR/hzT8yi5fLOHSClMoyJRxJM1fpb41SFM/8u0/N+yRmMCu62yh"
+    "W5IOXJQ7jqhjx6j6L/2qCFM25eK9OeR7dgMk0tz0kXgdUKmGTIiT7w7LxPU/m8K2zQBNZiKeoM+V/Udl/Gf/zsenriJU"
+    "HSvCMIqNNiq/Mk/1fzeLf7F9C+oKsWEVYHimAZ8q/DUNvzKLOnrZcBOo2ZPhEYrNS8vwKze07Cosr2MthG3+io1uSphN"
+    "Tmefyq9U7DQlUsap/gbcdZi0P4myQWX4lQXj24lNBqbhJ5tkHHee/Akl/hL9sIPKr5xyFmCYmznE1xLg51HyPWX4lY2u"
+    "Poeh1i/Y7LHZeK+9DgbruTY38itjq1hDY0qY/CvImPKWfK/Kr/ytrl8/XrSG9UkQ0OVyNQjM00F7al859fypYt9RmyQM"
+    "OJGHoykpiqCgEE2DMlzm+lKJT708U2WnjsNhzs4mEO1EGmEF6VX6QNl/VzgZU0sKMWmgHiK9BXhM8butzGOrkV8Z1GM3"
+    "1rLvLBRvM4Xdrlz/KfndKdV/rSVnF0lCyN+cYbhy92YZfuXxggfCrNN3Idj6Da7uJuOWBjS2pvx+KCV+FNWR0JXy58QE"
+    "AVLJt1QhUdBDw6/c2clGnO0/F9tWfIlWNUXQtaU5UcxtX8khHXqZwiRfC1hGeVkbyn8HML7+Z+RXrgitB89a32QuVSSM"
+    "mKCDt2QfqzT8yq0VLOFCw2K0pRf/QM+Pc1DzArU+e0Jhedb14Z/49YAr5A/UgcK4eUtz7IzKrzz1ohB3rCjGqldEeE3v"
+    "1i2Ts3GN/MqkHQ3Y/jFxULegHhyZIWG3u5TfKGs4Kr/Sb7kBcymoPEykmBxJ71Bm/2Ck5QAYBB0F13VFGDlFQjKX0vud"
+    "jfxK3QLy5+Mk/HaaYe2+lJvRH9do+JV26bXEz1WmQNGoZ3gqiOHwXgCbTPn9Q0oMiF8k4fqjImTVoDlI77Wc+l/hi1dX"
+    "Y6DUNVoYNcIFRcN7nPtNhKkUfytr+JUDt1vAifZmsGwaw+mUP9iYcL6ckV9Za14wBj65w3ptNIcX5Li6ledrJ9tV/3HO"
+    "xxTWB+fhnr0MzcJpPiu11Rp+5TKbp3K9h1dw4ThPmEnC5ssSfsf6TPUMYOu3+Rh5j+bROfIfyRTTqf2H1fVzZQ6y8BMs"
+    "+UY5ITS4Coz/ZsAEarunyq9UfPRtSjbc7pH/28cwlQzbvAy/cm9zU6H2n7WEl0O+o+l+CX2tOb/QyK+MIf3WrrgEs6ix"
+    "3YJ53bWWX1nHupPYfIQpRK1Jwp00oDNG8L01I7/yfkXEqll6OLRWgAFXKX6X4VcOrVRVMA/4xpZey8LRnjo4T53+XOVX"
+    "KvsHviVWMDxAhEEBMnYlQRBID92n4VfaWMWzRw8y2H5zR/iQq4MU5f52+sBZ1Sehtojup3JxPfm22TvIJ9OPTqaHt1XX"
+    "EGpViJevNG0M7hFNoasj5T6zKcbRGKeo/Mqk9wV4JMcE4mIE8KbY2pSMZoimfsSRBeCTpNbCfx2soLqlhKfJP/zU8CtH"
+    "SWTjOaTLyH+sI4NYW4ZfeaneNuFwq3SoXe8D+VUZr5Bh3tHwK9dtkPDSEQn/niLA1n70bmTDKzT8yqgWrqLviV0YO/kZ"
+    "ekYK4EzGV6GEry8r+aP5IB0c9rCAf2nSTiX79VPvvzLW7+dETIcD/ndZgHchrg6g/J06tqWGX7m+lxX4PTHgKlMZF1BA"
+    "2F+R68MYtX/vm7RnMb09cMq2OvDosg7kV4jj6Ytt1PXHteQ75noV4vHhIuyh9t/P5HfrGPmVkZ4iiy6JhOp7G8JXWcKf"
+    "lJgqe4RNVEbclJJifDbNDOaToGlO/k9hd5Ro+JWBFBA9wn2FuCQZf/aVsBf1r2JY+er8mkSz1OOmjBLlX9kqv7Kvhl/p"
+    "3s9EXLBwIxTYvsRraTJadoDSPXAjv9KigoQHL9P/dyIfQt8dks33boz8yv1rXghNrbpgkvQa7x8W4Swlli81/Eqp2AxW"
+    "hpiTTyB7ieBc2mK19lFpf8Lyq9iuIIZ5/KmDbeE62EBG46HhV95dbAb7hQIc8l3G1jT/zir1sRp+ZYevn+ShLcOw+n+N"
+    "4OAMEVzpGRQuS32cokGX9i7Aj14yur4S4T+yneAfvP7JeL4kRz+Tec/OgyrtasBxnYRHMignIxuoqsZnjJIxPVkPVSqQ"
+    "Blb5lag5f5p2JQb+TfEUhvnlYPn/JDxqyeeVkV/ZbyRiH08DHp6BOG8y53cc0/Arx97zEcdNaAIXzZLxYy/EzUM5f7uC"
+    "6j/bx8poHWAKHz4I0JWC7nyVX2mq2nDww4FClDlj/o2/ok110h9kO4EyX/9T3FRCXyvod8gEml6SMe8E5c70bqGq/1Ze"
+    "z/aWFaa6v2AjguzgzFvOjzej/vU3nj89IMCFGbk47DnZ1F5eO1ND4rWvir4bdue27E7J7mwXL1Dq0x2C+d0rqProvi4F"
+    "KFbQwa2WIuSfVvQC5xsZ+ZWxk2zwmL2H8J+1PfjkGNCNYucNen9fVX90Ic0/6ZgOJjZhuIHa8HcZfuXZUSOFrecEoSTi"
+    "C2Y9ldBcOSOt4VfO6SBjvR0GdMygficfUL4Mv9L8SStxYt37WHlDMmZQx1oMpNxWw68cOUuAuRvMweYH5bIHEZW7Zb5p"
+    "9g8qXr0EEXaJrNaU3zjYVwcb9fz8lZFfaSNbwYxw0k4mlEeQ07xehl+5suJMZhtjg7NrOkPFLB38TUb/WcOvXE5tH9In"
+    "Hwc+FmB6CEAnSkrSZb4+o3y+7c9P8qGTwXBjWGOodl3GliQ8lDO8uWr92cV/i7DGfT2MKKS/0dwYT53uqOFXeq+PwXu/"
+    "uwiV2+pgr7eEHnY8dzfyK8f5CKCnPwDl78FVATLKcd1p5FeOyXwjQLlLMG/qK9w7VcaX5Li6qzU0So5/3FzC7u8Yrs8W"
+    "YB3lhiuyOdvDyK8s/M0E987j8d1fqXi/twj1m/P6EXuVX/miph4G1LeA55vpO1u5X32j4Vc2C9ZDcc0YZu7D8O4MHYyw"
+    "4frPyK90mWABcu0iTB8rYwsSrvMduDYy8iubpolsZ9xorBnRAMbV0MHYc4gnc7l9K3tMJn8U4vqIElz8VISwKpxf+VDD"
+    "r9y0pR3r8zIZJse6QCDl33dJ55mTDQ9X9Vc9dwnnkP9Opvb77UZsVWb/YO/XOVB+RVuh5ZACbDtHwkFW/O4qI79yM/VZ"
+    "zk8DTk1n+B/lJh9pbH00/Mq3pxuKLf4bDP3mp2DDg5QjUYz5aML5mYqNZd9T+JmUVziIsOYrtaEMv3JQ4nrhpVgZwx5+"
+    "xLqSCKdVfmWYWqOT4mUJd8moc5oxHEOizZ8e2lGzfzBndF/0y4hn8e8toXqMDlqU5/Xzy1X/8YeXCVSRc3FjMcWfrQDH"
+    "yXi20MBfUPOrpaPi5au/n2CPlk1haUMBzs5DvEwDc0bdww9Jy8eHSeQvtojwhIzuocqvlFX9MO9DPGt3qYpw4acj+KUb"
+    "SnNLRw2/0p78rn8zUxgZSvZBDatahl+ZvKuW4J1cWYjwy8RGlLh+JPt5rOFXvnZkeNLKgNdpQo+bzvd+tfzKH0c7it0/"
+    "/8b1B5KwUx/6fDhAmIZfGUiar+pSM8gbLUCTc3xua/mV/92U4euE92zt5R94u4UOrtFDJyCvD1NsuGtVa0hsL0AMxbD6"
+    "T3hQP6i2X/mNHhYn2O2/ctnsOZWhpEAHSTQp9mj4la2ZjHf1efiwnAAJGyl/JKO9Rf3fX93fzz/2RH61rDM0yfSEMdEM"
+    "C0IRD+o540Q5I7D/z0I8FmEKdVYK8I0mbhjZRhdN/cjaxbNQMG0vFCaawyFHCSfQjw7U8CurUt48vwHFEB3Da8rZhTL8"
+    "ys+DTgqB3qlgO+Ad1nAiDUMxJFDlVyrzyzVQwjYdZaxM2s7jD9KTNP6pGn5leFx18cOKMHwU8hx7vBTgHYmTrcU8f1Nq"
+    "BPp4mMAffhawiozpIiUl7ur+gbF+/431n3Da9Tar7leMtYfq4BPZ5wQNvzIjzRLGHC7Bno4yhlDbgsjwI9X7mZT25TZo"
+    "yJYNaoN3EurC2i3U/wmUc+bxO56VNVZ9XBFWrFeEbf4TYRw5PR/yH7c1+0MThpZn6/qfgJKrbtCAOqg8TQxHa66/Ss9Q"
+    "7CtBszVmMIMEy/BtlBcL3H8Y61+2ZTWEwe26CCvWGrDqcAkDyD6MtqdorPBHpFlryHhhNsP7nSmfsuXno438Srl8eTHh"
+    "5zL4nPAcvcoznEOJuReN/1XVfzl7SsgodxlfRwSSaHCJJvVCDb+yhVec4G/RHAdFv8X790TYS4lrXw2/suE5c+huag7z"
+    "YhlepPb/LfL5Z+RX2hzZgSvfxzKfNaZQe6cOwsgpKPcLXVT3D66R4PLrko8byf+0Wky5rR1nyBr5lfE3UmXnUXsw9Ftj"
+    "CK8iwqgw6l8aOGuVX1m3fAFW68OwWoIIAnXqz59cfziq/d/zxBrmdh+E2Q+cIDbXgDXJvi6Z8TuAFP9wk5xtj8l6CH3P"
+    "MOokr7811ewfVMl8A6uGNBRGu/3CdpsltLTia9dGfmVH6uxQMwPOoLnfcxr5BoWtqOFX+ka1FxtYOEP3s0k4dgfNN/If"
+    "wRp+ZSVfhq+t9ZAbS/ZPQXlJGX5l4IZ2gr9PHltSIwMf1dPBF4v/y698dcQKal/QQeFqGePItuqR/wvX8CuLTv5kS5e9"
+    "ZVXjy0OHDB3NB4Dq9EELtf/j/gP4a3YuDqK47L6Xf+Yqce2n/G/j5Th5wf4KsNHBCzZT/wwO5vdbGdQzjmmTCij/1UG4"
+    "mQipRzhbY76GX3k4oiFG7vUSJofbQliJAbcrfEoNv/L0MbKzbBHMqzHs9IF0Txl+ZXHwPKF7SAFEHPqEyz9KGE+iLUfD"
+    "r1yWJeEtUhqvXARYQrm5UtvvrOFXDpvsJfZtfAHLdUrBxr4CzKH4qaMf7qfWf51rK0LuF3PoSvlz832U0xn4/rtx/2BS"
+    "g+1w6PtDtntOHnr10EEzso/XGn5ltbtWsC5Ixp1Mwlj6bk0S3n0EznhT+qf3zyEsdl9VPL+oJpi90sF+yj/iVH6lEl8W"
+    "nSrBVrYFWN9ehPCJAONJQ87V8CtD+vySr2z5G06ke8AJ0jhVyMcFkGHtVvcP1rsU41RnM2hDCZE16b+lyrqzhl+ZhO/Q"
+    "5rWvcPMr2WInCReQf3bT8Cs93AQIOMRwqhvNg/oAd8vx3NfIr+w64pdQ/CAaCr+m4qcIGQep/MpKKr8yWjbglSjEd+Yi"
+    "ZNbk/MosDb9ygN0vwSR+AP7zJQ11oSIMaExxtpjzsZTfaPBLD0d+mUNyf37/qXKmK13DrwwfnI6+WTdYEOXHjot0kGLL"
+    "54+RXxl6yByOuhfiA2qbDeVWR0jfFGr4la1n5ck3583C42Pcweq1CFWiyWZz+fqkYiP5iQV45IwBz6eJEE9O9TY13knd"
+    "m1T8fyf7APZ23EewnFUbSlwkDHtNuYMl50cq77kqUcLZrczAhgy6xX7Sf+r9V8bzp9KILeBZq5XQzD0Ppy2WMJW+G6HU"
+    "Hav7B0GU87ShoGtXk8aO3jGH2pAvczaB4uN3XPcSJx3tDsE3knHtd4ZuFHxFE15/r5zRmV5HxqxeJnBeJ8IBalvjMvzK"
+    "Uy6hwo2x1phw6DN6WutgTxl+pQIMGZxoCu1lGSdR/nOAxnawZv/gbLwXJhY9Yd7NbaDkkQ5Wk/+uhPz8jqL/PtfWgf3R"
+    "XHxN4+eyi/SAcj+7xPfGlRpk5+N35MbDP2HF+KZw9RrAmlkUd5Q5JvAa54Y/83FFogBjKLffdp3GU+VXGvlDM9zT2f1j"
+    "tYUfkypC2DcDDtJzfqeRX5nwHjFygwkUB1IOEo+l+aW5hl85qUZbYcPCckKnjt/QcEVCJ+X9NfzKvWdlrNDSgLM3kVad"
+    "ClCH2hap4Vcmh7YXfRa8x7bfk/AWCYNwsrEhGn7l4r/Iz1D8s/YS4M1x6o8ivn9j3D9IiXoPH/uksoQrv3Ax5WB99Dxv"
+    "MvIrP9e0hk00b7pUlXEgiaYD5ThbvEA9f7q9wiYWYMvY8k9VYXq+Do7Qi4XQj1uo/VOjQMJPi/IwbYwAEasBdpJTb0rt"
+    "G6+239LnuXxj2QBIMTSBk+0ZrlhGPpYMa5h6RqpmYiFOcNWDk58AZyg+JSl3I2r4lSHjNuGIlp2E6El6OFCH7x+81fAr"
+    "U5oJsILs1l3PsD9N2iNl+JW7msUJ8+c9hBPb32Ccj4zRNMHJ3EoZTor9mNcn/ZdBudsdAeLb0t9z+N2MxvOn2fvsRf+n"
+    "C7DN4RfoU06E1u0Bemv4ledEU6jfywLsqFNj/j/8yhFtPKHtx5ssJ8iAcWN00NeK339g5FfG9bKEj2HF6O8p4zMvmg4O"
+    "vHZ2j+q/t7ypzJa164kXftYH+0k6MFDSrSMbjVT5lW0rFWGBazGuOSnCR8qNPZX7azT8ygXNXFiFzBvgebo+OPwtYZ1b"
+    "WHqG4IDKr9zRw4BNwsxgVDriUOr/r+r5U2P9S8sGPSGSdRTe9SnG9RMkHGvN146M/MrGFL/7h0vovY9hbC/6jpI/aPiV"
+    "bV2dxV3fgmHBhWd4tBfDVT3Jx1H/r1f139FRlBONFWF0bRHKkUH+Qf1/VMOv9A09KRy+6Iprxr5Hyw8iVCjDr7QebQG9"
+    "55mB/d8MB1CnRFFsrqXhVwoVF+D8S3Gs72MzaHlUB66UP87V8CvX7TCFQQfysD99v+casjuFT6HhVxpCE+VNpudwubUn"
+    "LL0kQDolnq0L+R1LSh3vyh/5WG084oZrIpx4gfhvNvcflur6+obVUeyzk7Xwzb8q9Mw04Fyl9lzP9Z8y/0PuMQz+ZQpP"
+    "TjOcRPrphPn/9g9K7W+sAcx0LkKk7Q9kuyT8ZsU/N/IrczczHFhYgl+oTbWCuXacq+FXfjnTUby63goiw5LQlmJ/yAi+"
+    "N12k8ivjX5LuvaSHKMp/vpH/W12GX8mC6gh2PlnsjkMWXmukgyr00H0afmVOlhX4nBPBbJSMbyhwx1lx/2HkV96dlsSO"
+    "J6ez2V4O4EnCiaYKKPfbu6jxs9oc8hWR9F/k/4bvpNyOfjRA4mwuxX+bHrsn+zR3BdtbTWFkW3qvmYj3NPzKEBIznidN"
+    "oGuSAAYy6vP0/TGa/YNeE/3wnEcr4WYla9hnSnO9HL8fzciv3Ei6JKWRCBNp4h6iL/Uqw68c03+9UGlWJgy4/QFDiyT0"
+    "dKLc04TX/5Xml7slvLBAwrwhAtwPJD1Oc3OShl/p0LWhmLHyAJ6q9gxDVwlgTXPEt4Tf3634j0E2pMlqW0AOCa5lu7jo"
+    "TNPwK8/VmA/j991jNVYU4G5KkJT7F+uq9QXK/LafbQU1WkpoK8qlfe9Hnaaw9e+o+WNG7a7s/WxXXP60NvS9rYMz7yjn"
+    "oS96qvvrKc+K8dHnAvzcQ4SgQbx+VfHtc9U29KglywM/bAGPtu7QqBI9g7RWuhXfg1PW8I7dKcbgIWZwN4TrP4UrIWv4"
+    "ldGUzN176ivEbmM4uJeEkbb8/IqRX3nWTIC5JDjmUB7ySeVX/qXhV17qisLh7AgwXfwSp8bL+It89DwNv/KVjn5zFsA6"
+    "ys3q0Lv70fxrouFXRkW/EUwyu2PJrNeYvEuEWPL/io30Vfenoi+YwZhd5lDsgLh3K2eH52n4lVt63cWRkTEsfoMIs/7V"
+    "QT07vvedpNrv9GTynT0LsMMzGQsnA/SgHx2rnj9V7K/Os6/yrdSV+MOkEVQKF8GTfNR4Gpjt6v5Bi5kFaJUgoSNpw2dK"
+    "7ed37lsaqOPbp2AS26HPBvcKNaHQUsLJ5Kc9LXj9qjK+fYLpud/1wGhCGQ6RltPz/jfuHywcch78X5A40P3GKf9IeMyS"
+    "952RX9ktBPFsJwN+GYb4mPT/zTL8ynVia3HFP81hlEcy1mmOeHoI+USR8yuV+pWUdTK2djSFM1kChFKn1KNGSRp+pV3A"
+    "KEEXJuDFsHSsW0UHHWwUJrpqJ8oeTBMrSCg2ASca283HSLORfc/QnD/9fc8B52EKs9pYDt6l6sCZ+l/hT/Y33n9lI8LF"
+    "BbmYRvnvNMof+1Db6kmcrankj6/zbsvfcgtxq6MXJPhRXKX8Ual/K1F9VM/KBegRK0JWNxGunlP0DMVctT5caV/rATo8"
+    "saOBsP2bPQT8NKClJedPtlP114sO9MzPOujSiqFXMo1NGX7l530DBO8AU8GqYzr+ipdQovhTXsOvrN9fxicLDfg9BeDE"
+    "BIDHZAMPNPzKzvN9xH6tnuCVUcnoRr4qcJCS8/+PX7nOXYCWs80hmKxtMOUWr8rwK+HNLTC3TWY5MTkodtbBGBrf4Rp+"
+    "5VobazhXTL7PXManlFC1UPmVGer6gE+n+Sz8kAXu7lkdAn/qYAAZZc8i7iOU9j8sMuB4x3wMPCtALZrrljSxL2j4lfPP"
+    "v5NLqkyGmQmNYfMbGa+uIbux4IxdxUe5DSvC/N16GGgtwLJtpG0Yz3+M/MqnEedw5bQuwntLEzjeRMLedvx+KCO/8lEL"
+    "8h+7aR7YMWzkyM8f1NTwK69FvRBiba/D09xX2G6kjI8bATShhnVS+ZWRevLpexgO/yrASU+A49l8bdnIr4x9oxP7R0zB"
+    "kuKXeLsD+ciWlJtp+JWvnptCXEsL2H0U8W/yH78Y5w8b+ZXv29nDsgUxLGi5jCv/0kGyUl+h4VcGHLWA6MVFuC1Qxja+"
+    "ZJ8OvL5ro6q/Xzc2Z+d/D8UTP9wg20sH1y4hXiTH81blV+5YUogdWpbgovsihFDSEJnJ+d991Pzxr0Mt2JXDT2DUyrqw"
+    "rL+ESY85v/IvlV/5/wAKVKF/"
+)
@@ -0,0 +1,114 @@
+"""asyncio interface for calculating prayer times without blocking the event loop.
+
+AsyncPrayerTimes wraps a calculation method and runs its calculations in an executor, by default
+the event loop's thread pool. Identical requests made while one is already being calculated wait
+for that calculation instead of starting another, so a burst of callers asking for the same
+location and date only costs one calculation:
+
+    prayer_times = salat.aio.AsyncPrayerTimes(salat.PrayerTimes(salat.CalculationMethod.ISNA))
+
+    async def handler(request):
+        times = await prayer_times.acalc_times(date, timezone, longitude, latitude)
+"""
+from concurrent.futures import Executor
+from typing import Callable, Hashable
+import asyncio
+import datetime as dt
+import functools
+
+from .methods import GeneralMethod
+
+
+class AsyncPrayerTimes:
+    def __init__(self, method: GeneralMethod, executor: Executor = None):
+        """Asynchronous calculation of prayer times with a method.
+
+        An AsyncPrayerTimes is meant to be shared by all tasks of one event loop, which is what
+        lets it merge their identical requests.
+
+        Args:
+            method (GeneralMethod): Method to calculate the prayer times with, for example from
+                salat.PrayerTimes
+            executor (Executor, optional): Executor to run calculations in. With a process pool the
+                method needs to be picklable. Defaults to the default executor of the event loop.
+        """
+        self.method = method
+        self.executor = executor
+        # key of a request to the future of its calculation, while it is being calculated
+        self._in_flight: "dict[Hashable, asyncio.Future]" = {}
+
+    async def acalc_times(
+        self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float
+    ) -> "dict[str, dt.datetime]":
+        """Same as GeneralMethod.calc_times, calculated in the executor.
+
+        Raises:
+            ValueError: If the Sun does not reach an altitude needed on the date
+
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            dict[str, dt.datetime]: dictionary from time of interest (string) to time
+        """
+        key = ("calc_times", date, timezone, longitude, latitude)
+        function = functools.partial(self.method.calc_times, date, timezone, longitude, latitude)
+        times = await self._calculate(key, function)
+        # every caller gets its own dictionary
+        return dict(times)
+
+    async def acalc_times_range(
+        self,
+        start: dt.date,
+        end: dt.date,
+        timezone: dt.tzinfo,
+        longitude: float,
+        latitude: float,
+    ) -> "dict[dt.date, dict[str, dt.datetime]]":
+        """Same as GeneralMethod.calc_times_range, calculated in the executor.
+
+        Raises:
+            ValueError: If the Sun does not reach an altitude needed on one of the dates
+
+        Args:
+            start (dt.date): First date to calculate the prayer times for
+            end (dt.date): Last date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            dict[dt.date, dict[str, dt.datetime]]: dictionary from date to the output of calc_times
+                for that date
+        """
+        key = ("calc_times_range", start, end, timezone, longitude, latitude)
+        function = functools.partial(
+            self.method.calc_times_range, start, end, timezone, longitude, latitude
+        )
+        times_range = await self._calculate(key, function)
+        return {date: dict(times) for date, times in times_range.items()}
+
+    async def _calculate(self, key: Hashable, function: Callable[[], object]):
+        """Runs function in the executor, unless a request with the same key is already running,
+        in which case its result is shared.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, function)
+            self._in_flight[key] = future
+            future.add_done_callback(functools.partial(self._done, key))
+
+        # a cancelled caller must not cancel the calculation the others are waiting for
+        return await asyncio.shield(future)
+
+    def _done(self, key: Hashable, future: asyncio.Future):
+        """Forgets a finished calculation, so later requests calculate again"""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # mark the exception as retrieved, in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,125 @@
+"""Fast approximate solar position and prayer times.
+
+The low precision formulas for the Sun's position of the Astronomical Almanac need no root finding,
+and are accurate to about 0.01 degrees of declination and a few seconds of equation of time for
+1950 to 2050 (degrading slowly outside of that range). ApproximateSolarDay uses them to calculate
+the times of a day in a single pass instead of solving for them: the zenith is found with one
+evaluation, and every other time with one correction for the declination at its first estimate.
+
+Prayer times calculated this way are within 2 seconds of the exact ones for latitudes up to 45
+degrees, which is more than enough for minute precision. Nearer the poles the time of an altitude
+gets more sensitive to the declination, which the series only give to about 0.01 degrees, so the
+error grows quickly where the Sun only just reaches an altitude. For an 18 degree Fajr or Isha in
+summer that starts at about 47 degrees, and the error is about half a minute at 48 degrees and a
+minute from 50 degrees. Further correction steps do not help there, as they converge to the time
+of the approximate declination.
+"""
+import datetime as dt
+import math
+
+from .calculations import (
+    J2000_EPOCH_SECONDS,
+    calc_altitude,
+    timedelta_at_altitude_seconds,
+    to_seconds,
+)
+
+
+def eot_decl_approx(seconds: float) -> "tuple[float, float]":
+    """Approximates the equation of time and Sun's declination with a low order series.
+
+    See https://en.wikipedia.org/wiki/Position_of_the_Sun#Approximate_position
+
+    Args:
+        seconds (float): epoch seconds to calculate equation of time and declination for
+
+    Returns:
+        float: equation of time (in seconds)
+        float: declination of sun (in radians)
+    """
+    n = (seconds - J2000_EPOCH_SECONDS) / (60 * 60 * 24)
+
+    L = math.radians((280.460 + 0.9856474 * n) % 360)  # mean longitude
+    g = math.radians((357.528 + 0.9856003 * n) % 360)  # mean anomaly
+    lam = L + math.radians(1.915) * math.sin(g) + math.radians(0.020) * math.sin(2 * g)
+    epsilon = math.radians(23.439 - 4e-7 * n)
+
+    alpha = math.atan2(math.cos(epsilon) * math.sin(lam), math.cos(lam))
+    decl = math.asin(math.sin(epsilon) * math.sin(lam))
+
+    # put the difference in range [-pi, pi)
+    eot_rad = (L - alpha + math.pi) % (2 * math.pi) - math.pi
+    eot = eot_rad / (2 * math.pi) * 60 * 60 * 24
+    return eot, decl
+
+
+class ApproximateSolarDay:
+    def __init__(self, date: dt.date, longitude: float, guess: float = None):
+        """Approximate equivalent of salat.calculations.SolarDay, solving nothing iteratively.
+
+        Args:
+            date (date): The utc date for which the zenith should be found
+            longitude (float): The longitude in degrees East
+            guess (float, optional): Unused, accepted for compatibility with SolarDay
+        """
+        self.date = date
+        self.longitude = longitude
+
+        utc_noon = dt.datetime(date.year, date.month, date.day, 12, tzinfo=dt.timezone.utc)
+        time_zenith_approx = to_seconds(utc_noon) - longitude / 15 * 60 * 60
+        eot, self._declination = eot_decl_approx(time_zenith_approx)
+        # number of evaluations of the series, like SolarDay.solar_calls
+        self.solar_calls = 1
+        # the equation of time changes by less than a second between the two
+        self.zenith = time_zenith_approx - eot
+
+    def time_altitude(
+        self, altitude: float, latitude: float, rising: bool, guess: float = None
+    ) -> float:
+        """Approximates the time when Sun's altitude is as given.
+
+        Args:
+            altitude (float): The desired altitude of the Sun above the horizon, in radians
+            latitude (float): The latitude in degrees North
+            rising (bool): Whether to calculate the time before zenith or after zenith
+            guess (float, optional): Unused, accepted for compatibility with SolarDay
+
+        Returns:
+            float: The epoch seconds when Sun's altitude is approximately as given
+        """
+
+        def offset(declination: float) -> float:
+            return timedelta_at_altitude_seconds(altitude, declination, latitude)
+
+        return self._correct(offset, rising)
+
+    def time_shadow_factor(
+        self, shadow_factor: float, latitude: float, rising: bool, guess: float = None
+    ) -> float:
+        """Approximates the time when shadow factor is as given.
+
+        Args:
+            shadow_factor (float): Multiplication factor from height to shadow length
+            latitude (float): The latitude in degrees North
+            rising (bool): Whether to calculate the time before zenith or after zenith
+            guess (float, optional): Unused, accepted for compatibility with SolarDay
+
+        Returns:
+            float: The epoch seconds when shadow factor is approximately as given
+        """
+
+        def offset(declination: float) -> float:
+            altitude = calc_altitude(shadow_factor, declination, latitude)
+            return timedelta_at_altitude_seconds(altitude, declination, latitude)
+
+        return self._correct(offset, rising)
+
+    def _correct(self, offset, rising: bool) -> float:
+        """Estimates the time from the declination at zenith, then once more from the declination
+        at that estimate
+        """
+        sign = -1 if rising else 1
+        estimate = self.zenith + sign * offset(self._declination)
+        _, declination = eot_decl_approx(estimate)
+        self.solar_calls += 1
+        return self.zenith + sign * offset(declination)
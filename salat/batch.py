@@ -0,0 +1,168 @@
+"""Parallel generation of timetables for many locations.
+
+Every location is independent, so generate spreads them over a pool of worker processes, each of
+which calculates the timetables of a chunk of locations the same way as calc_times_range. Results
+are yielded in the order of the locations, as soon as they and all locations before them are done.
+Only a few chunks per worker are read from the locations and in flight at once, and more are only
+submitted as results are consumed, so the timetables of a large batch do not need to be held in
+memory at once, even when the consumer is slower than the workers:
+
+    locations = [(-73.99, 40.75), (39.83, 21.42), (10.75, 59.91)]  # (longitude, latitude)
+    for result in salat.batch.generate(locations, start, end, salat.CalculationMethod.ISNA):
+        store(result.location, result.times)
+
+Days on which the Sun does not reach an altitude a method needs are reported in the errors of their
+location rather than aborting the batch.
+
+With threads=True the workers are threads instead of processes, which avoids pickling the method
+and the results. Calculating prayer times changes no state shared between calls (GeneralMethod,
+the solvers and the solar functions only read module level constants and their own arguments, and
+EotDeclCache holds a lock), so the threads run without any locking on the hot path. With the GIL
+only one of them runs at a time, but on free-threaded builds of Python they run in parallel.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, NamedTuple
+import datetime as dt
+import functools
+import itertools
+import os
+
+from .methods import CalculationMethod, GeneralMethod, PrayerTimes
+from .timezones import OffsetTransitions
+
+
+DEFAULT_CHUNKSIZE = 16
+
+# chunks in flight per worker, so workers do not wait for the consumer to submit their next chunk
+CHUNKS_PER_WORKER = 2
+
+
+class Timetable(NamedTuple):
+    """Prayer times of a location for every date of a batch"""
+
+    location: "tuple[float, float]"
+    # dictionary from date to the output of calc_times, for dates that could be calculated
+    times: "dict[dt.date, dict[str, dt.datetime]]"
+    # dictionary from date to the error raised calculating it
+    errors: "dict[dt.date, ValueError]"
+
+
+def timetable(
+    location: "tuple[float, float]",
+    start: dt.date,
+    end: dt.date,
+    method: GeneralMethod,
+    timezone: dt.tzinfo = dt.timezone.utc,
+) -> Timetable:
+    """Calculates the prayer times of one location for every date from start to end (inclusive).
+
+    This is the same as calc_times_range, except that dates which can not be calculated are
+    collected instead of raised.
+
+    Args:
+        location (tuple[float, float]): Longitude in degrees East and latitude in degrees North
+        start (dt.date): First date to calculate the prayer times for
+        end (dt.date): Last date to calculate the prayer times for
+        method (GeneralMethod): Method to calculate the prayer times with
+        timezone (dt.tzinfo, optional): Timezone of the output datetimes. Defaults to UTC.
+
+    Returns:
+        Timetable: prayer times and errors of the location
+    """
+    longitude, latitude = location
+    times = {}
+    errors = {}
+    transitions = OffsetTransitions(timezone)
+
+    for date, day_times in method._iter_times_utc(start, end, longitude, latitude, errors=True):
+        if isinstance(day_times, ValueError):
+            errors[date] = day_times
+            continue
+        times[date] = transitions.to_datetimes(day_times)
+
+    return Timetable(location, times, errors)
+
+
+def generate(
+    locations: "Iterable[tuple[float, float]]",
+    start: dt.date,
+    end: dt.date,
+    method: "CalculationMethod | GeneralMethod" = CalculationMethod.MWL,
+    timezone: dt.tzinfo = dt.timezone.utc,
+    jobs: int = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    threads: bool = False,
+) -> Iterator[Timetable]:
+    """Calculates the prayer times of many locations in parallel workers.
+
+    Closing the generator early cancels the locations that have not started yet.
+
+    Raises:
+        ValueError: If jobs or chunksize is not positive
+
+    Args:
+        locations (Iterable[tuple[float, float]]): Longitude in degrees East and latitude in
+            degrees North of every location
+        start (dt.date): First date to calculate the prayer times for
+        end (dt.date): Last date to calculate the prayer times for
+        method (CalculationMethod | GeneralMethod, optional): Method to calculate the prayer times
+            with, which needs to be picklable unless threads is True. Defaults to
+            CalculationMethod.MWL.
+        timezone (dt.tzinfo, optional): Timezone of the output datetimes. Defaults to UTC.
+        jobs (int, optional): Number of workers. With 1 everything is calculated in this thread.
+            Defaults to the number of CPUs.
+        chunksize (int, optional): Number of locations sent to a worker process at once. Defaults
+            to 16.
+        threads (bool, optional): Whether the workers are threads instead of processes. Defaults
+            to False.
+
+    Returns:
+        Iterator[Timetable]: prayer times and errors of every location, in the order of locations
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs <= 0:
+        raise ValueError("jobs needs to be positive")
+    if chunksize <= 0:
+        raise ValueError("chunksize needs to be positive")
+    if isinstance(method, CalculationMethod):
+        method = PrayerTimes(method)
+
+    function = functools.partial(timetable, start=start, end=end, method=method, timezone=timezone)
+    if jobs == 1:
+        return map(function, locations)
+    # arguments are checked above when generate is called, not when iteration starts
+    executor_class = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    return _generate_parallel(executor_class, function, locations, jobs, chunksize)
+
+
+def _generate_parallel(
+    executor_class, function, locations, jobs: int, chunksize: int
+) -> Iterator[Timetable]:
+    """Maps function over locations in a pool, with at most CHUNKS_PER_WORKER chunks per worker
+    submitted but not yet yielded. The pool is shut down when the generator is
+    """
+    locations = iter(locations)
+    executor = executor_class(jobs)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < jobs * CHUNKS_PER_WORKER:
+                chunk = list(itertools.islice(locations, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_map_chunk, function, chunk))
+            if not pending:
+                return
+            # drop the reference to the future before yielding, so its results can be freed
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _map_chunk(
+    function: "Callable[[tuple[float, float]], Timetable]", chunk: "list[tuple[float, float]]"
+) -> "list[Timetable]":
+    """Calculates the timetables of a chunk of locations in a worker"""
+    return [function(location) for location in chunk]
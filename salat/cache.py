@@ -0,0 +1,312 @@
+"""Caches for solar calculations.
+
+EotDeclCache memoizes the equation of time and declination. Every solver converges to within
+minutes of the same times, so when many prayer times are calculated for nearby dates or locations
+the same solar state is evaluated over and over. The cache samples the solar function on a grid of
+configurable resolution, keeps the most recently used samples, and interpolates between them.
+
+TileCache memoizes the solar state of whole days instead. Locations are snapped to the tiles of a
+grid, and the zenith and declination of a day are calculated once per tile. The times of every
+location in the tile are then solved from them for the exact location, so nearby users share the
+expensive part of the calculation without being given the times of a different location.
+"""
+from collections import OrderedDict, namedtuple
+from typing import Callable, NamedTuple
+import datetime as dt
+import math
+import threading
+
+from . import calculations
+from .calculations import DeclinationModel, SolarDay, Solver, to_datetime
+from .methods import Altitude, GeneralMethod, MinutesAfter, Precision, ShadowFactor, Zenith
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class EotDeclCache:
+    def __init__(
+        self,
+        resolution: float = 600,
+        maxsize: int = 4096,
+        solar: Callable[[float], "tuple[float, float]"] = None,
+    ):
+        """Bounded least recently used cache in front of a solar function.
+
+        Calling the object gives the same outputs as eot_decl_seconds, so it can be used as the
+        solar function of the solvers and calculation methods, and shared between them. Inputs are
+        quantized to multiples of resolution, the solar function is evaluated (or looked up) at
+        the two multiples surrounding the input, and the result is linearly interpolated. This
+        keeps the output continuous, which the solvers rely on, and with the default 10 minute
+        resolution it is within microseconds of equation of time and 1e-9 radians of declination of
+        eot_decl_seconds.
+
+        The cache is safe to use from several threads at once.
+
+        Raises:
+            ValueError: If resolution or maxsize is not positive
+
+        Args:
+            resolution (float, optional): Seconds between cached samples. Defaults to 600.
+            maxsize (int, optional): Maximum number of cached samples. Defaults to 4096.
+            solar (Callable[[float], tuple[float, float]], optional): Function giving equation of
+                time (in seconds) and declination for epoch seconds. Defaults to
+                salat.calculations.eot_decl_seconds.
+        """
+        if resolution <= 0:
+            raise ValueError("resolution needs to be positive")
+        if maxsize <= 0:
+            raise ValueError("maxsize needs to be positive")
+
+        self.resolution = resolution
+        self.maxsize = maxsize
+        self.solar = solar
+
+        self._samples = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, seconds: float) -> "tuple[float, float]":
+        """Calculates the equation of time and Sun's declination at a given time.
+
+        Args:
+            seconds (float): epoch seconds to calculate equation of time and declination for
+
+        Returns:
+            float: equation of time (in seconds)
+            float: declination of sun (in radians)
+        """
+        position = seconds / self.resolution
+        index = math.floor(position)
+        fraction = position - index
+
+        eot1, decl1 = self._sample(index)
+        if fraction == 0:
+            return eot1, decl1
+        eot2, decl2 = self._sample(index + 1)
+        return eot1 + (eot2 - eot1) * fraction, decl1 + (decl2 - decl1) * fraction
+
+    def _sample(self, index: int) -> "tuple[float, float]":
+        """Returns the solar function at index * resolution, from the cache if possible"""
+        with self._lock:
+            value = self._samples.get(index)
+            if value is not None:
+                self._samples.move_to_end(index)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        # evaluate without holding the lock, so other threads are not blocked. Two threads may
+        # evaluate the same sample, but they get the same value
+        solar = self.solar if self.solar is not None else calculations.eot_decl_seconds
+        value = solar(index * self.resolution)
+
+        with self._lock:
+            self._samples[index] = value
+            self._samples.move_to_end(index)
+            while len(self._samples) > self.maxsize:
+                self._samples.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the number of hits and misses of sample lookups, and the size of the cache"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._samples))
+
+    def cache_clear(self):
+        """Removes all samples from the cache and resets the statistics"""
+        with self._lock:
+            self._samples.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# seconds the zenith moves per degree of longitude, ignoring the equation of time
+SECONDS_PER_DEGREE = 24 * 60 * 60 / 360
+
+
+class _Tile(NamedTuple):
+    """Solar state of one date at the center of a tile"""
+
+    longitude: float
+    latitude: float
+    zenith: float
+    # rate of change of equation of time at zenith, in seconds per second
+    eot_rate: float
+    model: DeclinationModel
+    # epoch seconds of every event at the center, which seed the solutions at nearby locations,
+    # or None if the Sun does not reach it there
+    times: "dict[str, float | None]"
+
+
+class TileCache:
+    def __init__(self, method: GeneralMethod, spacing: float = 0.01, maxsize: int = 4096):
+        """Bounded least recently used cache of the solar state of days on a grid of locations.
+
+        Locations are snapped to the nearest multiple of spacing in longitude and latitude, and
+        the zenith and DeclinationModel of a date are calculated once for each such tile. The times
+        at a location in the tile are then corrected analytically from the center of the tile: the
+        zenith moves by the difference in longitude (with the equation of time changing at its
+        rate at zenith), and each event is solved again at the exact latitude with
+        timedelta_at_altitude and the declination of the model. This evaluates no solar function,
+        so locations after the first of a tile cost a fraction of a calculation.
+
+        The only approximations are those of solving against the model, so the times are within a
+        few milliseconds of calc_times of the method whatever its solver, and the error hardly
+        grows with the spacing. Up to 66 degrees of latitude the largest error is about 1
+        millisecond for spacings up to 1 degree, and about 2.5 milliseconds with a spacing of 5
+        degrees, so larger tiles can be used to raise the hit rate on sparse workloads. Near the
+        latitudes where the Sun only just reaches an altitude the times change quickly with
+        declination, and errors grow as they do for the solvers. Locations where the Sun does not
+        reach an event on a date raise like calc_times, whether or not it reaches it at the center.
+
+        The cache is safe to use from several threads at once.
+
+        Raises:
+            ValueError: If spacing or maxsize is not positive
+            ValueError: If the method uses Precision.FAST, which is cheaper to calculate directly
+            ValueError: If the method has events other than Zenith, Altitude, ShadowFactor and
+                MinutesAfter, which can not be corrected
+
+        Args:
+            method (GeneralMethod): Method to calculate the prayer times with
+            spacing (float, optional): Size of the tiles in degrees of longitude and latitude.
+                Defaults to 0.01.
+            maxsize (int, optional): Maximum number of cached days of tiles. Defaults to 4096.
+        """
+        if spacing <= 0:
+            raise ValueError("spacing needs to be positive")
+        if maxsize <= 0:
+            raise ValueError("maxsize needs to be positive")
+        if method.precision == Precision.FAST:
+            raise ValueError(f"{method.precision} can not be used with a TileCache")
+        for event in method.events.values():
+            if not isinstance(event, (Zenith, Altitude, ShadowFactor, MinutesAfter)):
+                raise ValueError(f"{type(event).__name__} events can not be corrected")
+
+        self.method = method
+        self.spacing = spacing
+        self.maxsize = maxsize
+
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def calc_times(
+        self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float
+    ) -> "dict[str, dt.datetime]":
+        """Same as GeneralMethod.calc_times, starting from the solar state of the tile.
+
+        Raises:
+            ValueError: If the Sun does not reach an altitude needed at the location
+
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            dict[str, dt.datetime]: dictionary from time of interest (string) to time
+        """
+        times = self.calc_times_utc(date, longitude, latitude)
+
+        for name in times:
+            times[name] = to_datetime(times[name]).astimezone(timezone)
+        return times
+
+    def calc_times_utc(
+        self, date: dt.date, longitude: float, latitude: float
+    ) -> "dict[str, float]":
+        """Same as calc_times, returning epoch seconds.
+
+        Raises:
+            ValueError: If the Sun does not reach an altitude needed at the location
+
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            dict[str, float]: dictionary from time of interest (string) to epoch seconds
+        """
+        tile = self._tile(date, round(longitude / self.spacing), round(latitude / self.spacing))
+        # the zenith is when longitude plus the equation of time reach noon, and the equation of
+        # time changes by eot_rate for every second the zenith moves
+        shift = (tile.longitude - longitude) * SECONDS_PER_DEGREE / (1 + tile.eot_rate)
+        return self._solve(tile, date, tile.zenith + shift, latitude, shift)
+
+    def _tile(self, date: dt.date, column: int, row: int) -> _Tile:
+        """Returns the solar state of a tile on a date, from the cache if possible"""
+        key = (date.toordinal(), column, row)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self._hits += 1
+                return tile
+            self._misses += 1
+
+        # calculate without holding the lock, so other threads are not blocked
+        longitude = column * self.spacing
+        latitude = row * self.spacing
+        day = SolarDay(date, longitude, self.method.solar, solver=Solver.JOINT)
+        eot_rate, _ = day.eot_decl_rates(day.zenith)
+        center = _Tile(longitude, latitude, day.zenith, eot_rate, day.declination_model, {})
+        tile = center._replace(times=self._solve(center, date, day.zenith, latitude, None))
+
+        with self._lock:
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.maxsize:
+                self._tiles.popitem(last=False)
+        return tile
+
+    def _solve(
+        self, tile: _Tile, date: dt.date, zenith: float, latitude: float, shift: "float | None"
+    ) -> "dict[str, float | None]":
+        """Solves the events of the method at a zenith and latitude against the model of a tile.
+
+        With a shift the events start from the times at the center moved by it, and raise if the
+        Sun does not reach them. Without one they start from zenith, and are None instead.
+        """
+        times = {}
+        for name, event in self.method.events.items():
+            if isinstance(event, Zenith):
+                times[name] = zenith
+                continue
+            if isinstance(event, MinutesAfter):
+                reference = times[event.reference]
+                # only None at the center, where nearby locations solve the reference themselves
+                times[name] = None if reference is None else reference + event._minutes(date) * 60
+                continue
+
+            if isinstance(event, Altitude):
+                offset = calculations._altitude_offset(event.altitude, latitude)
+            else:
+                offset = calculations._shadow_factor_offset(event.shadow_factor, latitude)
+
+            center = tile.times.get(name)
+            guess = None if shift is None or center is None else center + shift
+            try:
+                times[name] = tile.model.model_time_offset(offset, event.rising, zenith, guess)
+            except ValueError:
+                if shift is not None:
+                    raise
+                times[name] = None
+        return times
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the number of hits and misses of tile lookups, and the size of the cache"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._tiles))
+
+    def cache_clear(self):
+        """Removes all tiles from the cache and resets the statistics"""
+        with self._lock:
+            self._tiles.clear()
+            self._hits = 0
+            self._misses = 0
@@ -1,11 +1,56 @@
 import datetime as dt
-from typing import Callable
+from enum import Enum, auto, unique
+from typing import Callable, Sequence
 import math
 
+from .instrumentation import count_iterations
+
 
 MAX_ITERATIONS = 1000
 TIME_TOLERANCE_SECONDS = 1e-6
 
+# Newton steps taken by kepler_solve_series after its series start
+KEPLER_CORRECTIONS = 1
+
+HALF_DAY_SECONDS = 12 * 60 * 60
+
+# January 1, 2000 at noon in UTC, as seconds since 1970-01-01 UTC
+J2000_EPOCH_SECONDS = 946728000.0
+
+# distance in seconds between the two starting guesses of a solver seeded with an approximate
+# solution
+SEED_STEP_SECONDS = 60.0
+
+# The solvers work on epoch seconds (seconds since 1970-01-01 UTC) as plain floats, and the
+# functions taking and returning datetimes convert at the boundary
+UNIX_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+@unique
+class Solver(Enum):
+    """Root finder used to solve for the times of events.
+
+    SECANT needs only the solar function. NEWTON additionally uses the analytic rates of change of
+    equation of time and declination, and of the hour angle, so it needs fewer evaluations of the
+    solar function, and it keeps the root bracketed so it cannot diverge. JOINT solves the events
+    of a day against a DeclinationModel shared between them, so each event needs about one
+    evaluation of the solar function of its own. The zenith is solved with SECANT for JOINT.
+    """
+
+    SECANT = auto()
+    NEWTON = auto()
+    JOINT = auto()
+
+
+def to_seconds(time: dt.datetime) -> float:
+    """Converts an aware datetime to epoch seconds (seconds since 1970-01-01 UTC)"""
+    return (time - UNIX_EPOCH).total_seconds()
+
+
+def to_datetime(seconds: float) -> dt.datetime:
+    """Converts epoch seconds (seconds since 1970-01-01 UTC) to an aware datetime in UTC"""
+    return UNIX_EPOCH + dt.timedelta(seconds=seconds)
+
 
 def eot_decl(time: dt.datetime) -> "tuple[dt.timedelta, float]":
     """Calculates the equation of time and Sun's declination at a given time.
@@ -24,13 +69,28 @@ def eot_decl(time: dt.datetime) -> "tuple[dt.timedelta, float]":
         time (datetime): time to calculate equation of time and declination for
 
     Returns:
-        float: equation of time (in minutes)
+        timedelta: equation of time
         float: declination of sun (in radians)
     """
-    # January 1, 2000 at noon in UTC
-    utc = dt.timezone.utc
-    epoch = dt.datetime(2000, 1, 1, 12, tzinfo=utc)
-    days_since_epoch = (time - epoch).total_seconds() / 60 / 60 / 24
+    eot, decl = eot_decl_seconds(to_seconds(time))
+    return dt.timedelta(seconds=eot), decl
+
+
+def eot_decl_seconds(
+    seconds: float, kepler: Callable[[float, float], float] = None
+) -> "tuple[float, float]":
+    """Same as eot_decl, except with epoch seconds instead of datetimes.
+
+    Args:
+        seconds (float): epoch seconds to calculate equation of time and declination for
+        kepler (Callable[[float, float], float], optional): Solver for Kepler's equation, such as
+            kepler_solve_series. Defaults to kepler_solve.
+
+    Returns:
+        float: equation of time (in seconds)
+        float: declination of sun (in radians)
+    """
+    days_since_epoch = (seconds - J2000_EPOCH_SECONDS) / 60 / 60 / 24
 
     # e = 0.016709
     # lam_p = 4.938201
@@ -47,7 +107,7 @@ def eot_decl(time: dt.datetime) -> "tuple[dt.timedelta, float]":
     D = days_since_epoch % TY
     M = MD + 2 * math.pi * D / TY
     M = M % (2 * math.pi)
-    E = kepler_solve(M, e)
+    E = kepler_solve(M, e) if kepler is None else kepler(M, e)
 
     nu = math.acos((math.cos(E) - e) / (1 - e * math.cos(E)))
     if E > math.pi:
@@ -76,13 +136,51 @@ def eot_decl(time: dt.datetime) -> "tuple[dt.timedelta, float]":
     if eot_rad > math.pi:
         eot_rad -= 2 * math.pi
 
-    eot_min = eot_rad / (2 * math.pi) * 60 * 24
-    eot = dt.timedelta(minutes=eot_min)
+    eot = eot_rad / (2 * math.pi) * 60 * 60 * 24
     decl = math.asin(math.sin(epsilon) * math.sin(lam))
 
     return eot, decl
 
 
+def eot_decl_rates_seconds(seconds: float) -> "tuple[float, float]":
+    """Calculates the rates of change of equation of time and Sun's declination at a given time.
+
+    This uses a low order series for the Sun's position and ignores the secular effects, so the
+    rates are only approximate, which is enough to take Newton steps with.
+
+    Args:
+        seconds (float): epoch seconds to calculate the rates for
+
+    Returns:
+        float: rate of change of equation of time (in seconds per second)
+        float: rate of change of declination of sun (in radians per second)
+    """
+    e = 0.016709
+    lam_p = 4.938201
+    epsilon = 0.409093
+
+    MD = 6.24004077  # M at epoch (Jan 1 2000 at noon)
+    TY = 365.2596358  # days in a year
+    n = 2 * math.pi / (TY * 60 * 60 * 24)  # rate of change of M in radians per second
+    M = MD + n * (seconds - J2000_EPOCH_SECONDS)
+
+    # equation of the center to second order in e
+    nu = M + 2 * e * math.sin(M) + 1.25 * e ** 2 * math.sin(2 * M)
+    nu_rate = n * (1 + 2 * e * math.cos(M) + 2.5 * e ** 2 * math.cos(2 * M))
+    lam = nu + lam_p
+
+    sin_decl = math.sin(epsilon) * math.sin(lam)
+    decl_rate = math.sin(epsilon) * math.cos(lam) * nu_rate / math.sqrt(1 - sin_decl ** 2)
+
+    # derivative of alpha = atan(cos(epsilon) * tan(lam))
+    alpha_rate = math.cos(epsilon) * nu_rate / (
+        math.cos(lam) ** 2 + (math.cos(epsilon) * math.sin(lam)) ** 2
+    )
+    eot_rate = (n - alpha_rate) / (2 * math.pi) * 60 * 60 * 24
+
+    return eot_rate, decl_rate
+
+
 def kepler_solve(M: float, e: float) -> float:
     """Solves Kepler's equation inverse problem for elliptical orbits.
 
@@ -102,11 +200,42 @@ def kepler_solve(M: float, e: float) -> float:
         # E = M + e * math.sin(E)
         if math.isclose(E, M + e * math.sin(E)):
             return E
-        
+
         E = E - (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
     raise RuntimeError("Did not converge")
 
 
+def kepler_solve_series(M: float, e: float, corrections: int = KEPLER_CORRECTIONS) -> float:
+    """Solves Kepler's equation inverse problem for orbits of small eccentricity without an
+    open-ended loop.
+
+    The eccentric anomaly is started from its series in e to third order, whose error is of order
+    e^4, and refined with a fixed number of Newton steps, each of which roughly squares the error.
+    For Earth's eccentricity (about 0.0167) the start is within 1e-7 radians and a single step
+    reaches double precision, so the result matches kepler_solve in bounded time.
+    See https://en.wikipedia.org/wiki/Kepler%27s_equation#Inverse_Kepler_equation
+
+    Args:
+        M (float): mean anomaly
+        e (float): eccentricity
+        corrections (int, optional): Number of Newton steps. Defaults to KEPLER_CORRECTIONS.
+
+    Returns:
+        float: eccentric anomaly
+    """
+    if not 0 < e < 1:
+        raise ValueError("Eccentricity of elliptical orbit required in range (0, 1)")
+
+    # E = M + e sin(M) + e^2 / 2 sin(2M) + e^3 / 8 (3 sin(3M) - sin(M)), with the multiple angles
+    # expanded so only sin(M) and cos(M) are needed
+    sin_M = math.sin(M)
+    cos_M = math.cos(M)
+    E = M + sin_M * (e + e * e * cos_M + e * e * e * (1 - 1.5 * sin_M * sin_M))
+    for _ in range(corrections):
+        E = E - (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+    return E
+
+
 def calc_altitude(shadow_factor: float, declination: float, latitude: float) -> float:
     """Calculates altitude when shadow of object is shadow_factor times the height of the object
     plus the length at zenith.
@@ -129,6 +258,35 @@ def calc_altitude(shadow_factor: float, declination: float, latitude: float) ->
     return alt
 
 
+def calc_altitude_derivative(
+    shadow_factor: float, declination: float, latitude: float
+) -> "tuple[float, float]":
+    """Same as calc_altitude, also returning the derivative of the altitude with respect to the
+    declination.
+
+    Args:
+        shadow_factor (float): Multiplication factor from height to shadow length
+        declination (float): Declination of sun in radians
+        latitude (float): The latitude in degrees North
+
+    Returns:
+        float: The Sun's altitude below the horizon in radians
+        float: Derivative of the altitude with respect to declination
+    """
+    phi = math.radians(latitude)
+    delta = declination
+
+    tan_difference = math.tan(phi - delta)
+    u = shadow_factor + abs(tan_difference)
+    alt = math.atan(1 / u)
+
+    # d(alt)/du = -1 / (1 + u^2) and du/d(delta) = -sign(tan) / cos^2(phi - delta)
+    sign = 1 if tan_difference >= 0 else -1
+    alt_derivative = sign / math.cos(phi - delta) ** 2 / (1 + u ** 2)
+
+    return alt, alt_derivative
+
+
 def timedelta_at_altitude(altitude: float, declination: float, latitude: float) -> dt.timedelta:
     """Calculates the difference from zenith to the time when Sun is at altitude.
 
@@ -140,6 +298,20 @@ def timedelta_at_altitude(altitude: float, declination: float, latitude: float)
     Returns:
         timedelta: Offset from zenith. Note that this is always positive
     """
+    return dt.timedelta(seconds=timedelta_at_altitude_seconds(altitude, declination, latitude))
+
+
+def timedelta_at_altitude_seconds(altitude: float, declination: float, latitude: float) -> float:
+    """Same as timedelta_at_altitude, except the offset is returned in seconds.
+
+    Args:
+        altitude (float): Altitude of sun above the horizon in radians
+        declination (float): Declination of sun in radians
+        latitude (float): Latitude of position on Earth in degrees North
+
+    Returns:
+        float: Offset from zenith in seconds. Note that this is always positive
+    """
     alpha = altitude
     phi = math.radians(latitude)
     delta = declination
@@ -151,12 +323,49 @@ def timedelta_at_altitude(altitude: float, declination: float, latitude: float)
         raise ValueError("Sun does not reach altitude")
 
     hour_rad = math.acos(cos_hour_rad)
-    hours = hour_rad / (2 * math.pi) * 24
-    T = dt.timedelta(hours=hours)
-    assert dt.timedelta() <= T <= dt.timedelta(hours=12)
+    T = hour_rad / (2 * math.pi) * 60 * 60 * 24
+    assert 0 <= T <= 60 * 60 * 12
     return T
 
 
+def timedelta_at_altitude_derivatives_seconds(
+    altitude: float, declination: float, latitude: float
+) -> "tuple[float, float, float]":
+    """Same as timedelta_at_altitude_seconds, also returning the partial derivatives of the offset.
+
+    Args:
+        altitude (float): Altitude of sun above the horizon in radians
+        declination (float): Declination of sun in radians
+        latitude (float): Latitude of position on Earth in degrees North
+
+    Returns:
+        float: Offset from zenith in seconds. Note that this is always positive
+        float: Derivative of the offset with respect to altitude, in seconds per radian
+        float: Derivative of the offset with respect to declination, in seconds per radian
+    """
+    phi = math.radians(latitude)
+    delta = declination
+
+    denominator = math.cos(phi) * math.cos(delta)
+    cos_hour_rad = (math.sin(altitude) - math.sin(phi) * math.sin(delta)) / denominator
+    if cos_hour_rad < -1 or cos_hour_rad > 1:
+        raise ValueError("Sun does not reach altitude")
+
+    hour_rad = math.acos(cos_hour_rad)
+    T = hour_rad / (2 * math.pi) * 60 * 60 * 24
+
+    # d(hour_rad)/d(cos_hour_rad) = -1 / sin(hour_rad), which is infinite where the Sun only just
+    # reaches the altitude
+    sin_hour_rad = math.sin(hour_rad)
+    if sin_hour_rad == 0:
+        return T, math.inf, math.inf
+    scale = -1 / sin_hour_rad / (2 * math.pi) * 60 * 60 * 24
+    altitude_derivative = scale * math.cos(altitude) / denominator
+    declination_derivative = scale * (cos_hour_rad * math.tan(delta) - math.tan(phi))
+
+    return T, altitude_derivative, declination_derivative
+
+
 def linear_interpolation(
     diff_function: Callable[[dt.datetime], dt.timedelta],
     guess1: dt.datetime,
@@ -176,7 +385,32 @@ def linear_interpolation(
     Returns:
         datetime: input to diff_function which results in zero timedelta output
     """
-    if math.isclose((guess1 - guess2).total_seconds(), 0, abs_tol=TIME_TOLERANCE_SECONDS):
+
+    def diff_function_seconds(guess: float) -> float:
+        return diff_function(to_datetime(guess)).total_seconds()
+
+    guess = linear_interpolation_seconds(
+        diff_function_seconds, to_seconds(guess1), to_seconds(guess2)
+    )
+    return to_datetime(guess)
+
+
+def linear_interpolation_seconds(
+    diff_function: Callable[[float], float],
+    guess1: float,
+    guess2: float,
+) -> float:
+    """Same as linear_interpolation, except with epoch seconds instead of datetimes.
+
+    Args:
+        diff_function (Callable[[float], float]): The function to find the root for
+        guess1 (float): First guess
+        guess2 (float): Second guess (cannot be the same as first guess)
+
+    Returns:
+        float: input to diff_function which results in zero output
+    """
+    if math.isclose(guess1 - guess2, 0, abs_tol=TIME_TOLERANCE_SECONDS):
         raise ValueError("guess1 and guess2 need to be different")
 
     # make guess1 left of guess2
@@ -186,32 +420,127 @@ def linear_interpolation(
     diff1 = diff_function(guess1)
     diff2 = diff_function(guess2)
     # stop iteration when both guesses converge
-    for _ in range(MAX_ITERATIONS):
-        if math.isclose((guess1 - guess2).total_seconds(), 0, abs_tol=TIME_TOLERANCE_SECONDS):
+    for iteration in range(MAX_ITERATIONS):
+        if math.isclose(guess1 - guess2, 0, abs_tol=TIME_TOLERANCE_SECONDS):
+            count_iterations(iteration)
             return guess1
 
         guess3 = guess1 - diff1 * ((guess2 - guess1) / (diff2 - diff1))
         diff3 = diff_function(guess3)
+        # stop iteration early when the guess is already a root
+        if math.isclose(diff3, 0, abs_tol=TIME_TOLERANCE_SECONDS):
+            count_iterations(iteration + 1)
+            return guess3
 
         guess1, diff1 = guess2, diff2
         guess2, diff2 = guess3, diff3
+    count_iterations(MAX_ITERATIONS)
+    raise RuntimeError("Did not converge")
+
+
+def newton_seconds(
+    diff_function: Callable[[float], "tuple[float, float]"],
+    guess: float,
+    lower: float,
+    upper: float,
+) -> float:
+    """Uses Newton's method to calculate when diff_function outputs zero.
+
+    The root needs to be bracketed: diff_function is non-negative at lower and non-positive at
+    upper. Every evaluation narrows the bracket, and steps that would leave it (or have no usable
+    derivative) bisect it instead, so the method converges even where the derivative is a poor
+    guide. Near the root it converges quadratically.
+    See https://en.wikipedia.org/wiki/Newton%27s_method
+
+    Args:
+        diff_function (Callable[[float], tuple[float, float]]): The function to find the root for,
+            returning its value and derivative
+        guess (float): Starting guess, clamped to the bracket
+        lower (float): Lower end of the bracket
+        upper (float): Upper end of the bracket
+
+    Returns:
+        float: input to diff_function which results in zero output
+    """
+    if not lower < upper:
+        raise ValueError("lower needs to be less than upper")
+
+    guess = min(max(guess, lower), upper)
+    for iteration in range(MAX_ITERATIONS):
+        diff, derivative = diff_function(guess)
+        if math.isclose(diff, 0, abs_tol=TIME_TOLERANCE_SECONDS):
+            count_iterations(iteration)
+            return guess
+
+        if diff > 0:
+            lower = guess
+        else:
+            upper = guess
+
+        if derivative != 0 and math.isfinite(derivative):
+            step = guess - diff / derivative
+        else:
+            step = math.nan
+        if not lower < step < upper:
+            step = (lower + upper) / 2
+
+        if math.isclose(step - guess, 0, abs_tol=TIME_TOLERANCE_SECONDS):
+            count_iterations(iteration + 1)
+            return step
+        guess = step
+    count_iterations(MAX_ITERATIONS)
     raise RuntimeError("Did not converge")
 
 
-def time_zenith(date: dt.date, longitude: float) -> dt.datetime:
+def time_zenith(date: dt.date, longitude: float, guess: dt.datetime = None) -> dt.datetime:
     """Calculates time of Sun reaching its zenith on a date.
 
     Args:
         date (date): The utc date for which the zenith should be found
         longitude (float): The longitude in degrees East
+        guess (datetime, optional): Approximate time of zenith, such as the previous day's zenith
+            shifted by a day. When given, the solver starts next to it instead of bounding the
+            whole range of the equation of time
 
     Returns:
         datetime: The specific time of zenith. The zenith found will be the closest to utc noon on
             the given date
     """
+    if guess is not None:
+        guess = to_seconds(guess)
+    return to_datetime(time_zenith_seconds(date, longitude, guess))
+
+
+def time_zenith_seconds(
+    date: dt.date,
+    longitude: float,
+    guess: float = None,
+    solar: Callable[[float], "tuple[float, float]"] = None,
+    solver: Solver = Solver.SECANT,
+    rates: Callable[[float], "tuple[float, float]"] = None,
+) -> float:
+    """Same as time_zenith, except with epoch seconds instead of datetimes.
+
+    Args:
+        date (date): The utc date for which the zenith should be found
+        longitude (float): The longitude in degrees East
+        guess (float, optional): Approximate epoch seconds of zenith
+        solar (Callable[[float], tuple[float, float]], optional): Function giving equation of time
+            (in seconds) and declination for epoch seconds. Defaults to eot_decl_seconds.
+        solver (Solver, optional): Root finder to use. Defaults to Solver.SECANT.
+        rates (Callable[[float], tuple[float, float]], optional): Function giving the rates of
+            change of equation of time and declination for epoch seconds, used by Solver.NEWTON.
+            Defaults to eot_decl_rates_seconds.
+
+    Returns:
+        float: The epoch seconds of zenith
+    """
+    if solar is None:
+        solar = eot_decl_seconds
+
     # Calculate when sun will be at zenith ignoring equation of time (eot)
-    utc_noon = dt.datetime(date.year, date.month, date.day, 12, tzinfo=dt.timezone.utc)
-    time_zenith_approx = utc_noon - dt.timedelta(hours=longitude/15)
+    utc_noon = to_seconds(dt.datetime(date.year, date.month, date.day, 12, tzinfo=dt.timezone.utc))
+    time_zenith_approx = utc_noon - longitude / 15 * 60 * 60
 
     # The equation of time depends on the date (and therefore changes slightly
     # over the day) the time of zenith depends on the equation of time. therefore
@@ -219,24 +548,49 @@ def time_zenith(date: dt.date, longitude: float) -> dt.datetime:
     # solution. However equation of time is periodic over year scales, so this
     # is not that necessary, but also only takes 3 iterations usually.
 
-    # x is the datetime guess
+    # x is the epoch seconds guess
     # f(x) is the difference between time calculated using the guess's
     #   declination and the guess itself
     # here x is guess and f(x) is diff (found with calc_difference)
 
-    def calc_difference(guess: dt.datetime) -> dt.timedelta:
+    def calc_difference(guess: float) -> float:
         """Using guess to calculate eot, calculate the time of dhuhr, and return
         difference between guess and calculated dhuhr.
         """
-        eot, _ = eot_decl(guess)
-        actual = utc_noon - dt.timedelta(hours=longitude/15) - eot
+        eot, _ = solar(guess)
+        actual = time_zenith_approx - eot
         return actual - guess
 
+    if solver == Solver.NEWTON:
+        if rates is None:
+            rates = eot_decl_rates_seconds
+        # the rate of change of equation of time hardly changes within the bracket, so it is only
+        # evaluated once
+        eot_rate, _ = rates(time_zenith_approx)
+
+        def calc_difference_derivative(guess: float) -> "tuple[float, float]":
+            return calc_difference(guess), -eot_rate - 1
+
+        start = time_zenith_approx if guess is None else guess
+        return newton_seconds(
+            calc_difference_derivative,
+            start,
+            time_zenith_approx - 20 * 60,
+            time_zenith_approx + 20 * 60,
+        )
+
+    if guess is not None:
+        try:
+            return linear_interpolation_seconds(calc_difference, guess, guess + SEED_STEP_SECONDS)
+        except (ValueError, RuntimeError):
+            # fall back to the bounding guesses below
+            pass
+
     # eot is usually between -14 to +16 minutes, so bound that by guess1 and guess2
-    guess1 = time_zenith_approx - dt.timedelta(minutes=20)
-    guess2 = time_zenith_approx + dt.timedelta(minutes=20)
+    guess1 = time_zenith_approx - 20 * 60
+    guess2 = time_zenith_approx + 20 * 60
 
-    return linear_interpolation(calc_difference, guess1, guess2)
+    return linear_interpolation_seconds(calc_difference, guess1, guess2)
 
 
 def time_altitude(
@@ -244,6 +598,7 @@ def time_altitude(
     altitude: float,
     latitude: float,
     rising: bool,
+    guess: dt.datetime = None,
 ) -> dt.datetime:
     """Calculates the time when Sun's altitude is as given.
 
@@ -257,11 +612,52 @@ def time_altitude(
         latitude (float): The latitude in degrees North
         rising (bool): Whether to calculate first time (before zenith, when Sun is rising) or to
             calculate the second time (after zenith, when sun is setting)
+        guess (datetime, optional): Approximate solution, such as the same event on the previous
+            day shifted by a day. When given, the solver starts next to it instead of bounding the
+            12 hours before or after zenith
 
     Returns:
         datetime: The time on the given date when Sun's altitude is as given and it is either rising
             or setting, depending on value of rising
     """
+    if guess is not None:
+        guess = to_seconds(guess)
+    time = time_altitude_seconds(to_seconds(zenith), altitude, latitude, rising, guess)
+    return to_datetime(time)
+
+
+def time_altitude_seconds(
+    zenith: float,
+    altitude: float,
+    latitude: float,
+    rising: bool,
+    guess: float = None,
+    solar: Callable[[float], "tuple[float, float]"] = None,
+    solver: Solver = Solver.SECANT,
+    rates: Callable[[float], "tuple[float, float]"] = None,
+) -> float:
+    """Same as time_altitude, except with epoch seconds instead of datetimes.
+
+    Args:
+        zenith (float): The epoch seconds of zenith of the day
+        altitude (float): The desired altitude of the Sun above the horizon at the output time, in
+            radians
+        latitude (float): The latitude in degrees North
+        rising (bool): Whether to calculate the time before zenith or after zenith
+        guess (float, optional): Approximate epoch seconds of the solution
+        solar (Callable[[float], tuple[float, float]], optional): Function giving equation of time
+            (in seconds) and declination for epoch seconds. Defaults to eot_decl_seconds.
+        solver (Solver, optional): Root finder to use. Defaults to Solver.SECANT.
+        rates (Callable[[float], tuple[float, float]], optional): Function giving the rates of
+            change of equation of time and declination for epoch seconds, used by Solver.NEWTON.
+            Defaults to eot_decl_rates_seconds.
+
+    Returns:
+        float: The epoch seconds when Sun's altitude is as given
+    """
+    if solar is None:
+        solar = eot_decl_seconds
+
     # TODO: error checking to see if altitude is possible. timedelta_at_altitude will handle it
     # probably, but make it more explicit
 
@@ -271,33 +667,63 @@ def time_altitude(
     # periodic over year scales, so this is not that necessary, but also only takes 3 iterations
     # usually.
 
-    # x is the datetime guess
+    # x is the epoch seconds guess
     # f(x) is the difference between time calculated using the guess's declination and the guess
     #   itself
     # here x is guess and f(x) is diff (found with calc_difference)
 
-    def calc_difference(guess: dt.datetime) -> dt.timedelta:
+    def calc_difference(guess: float) -> float:
         """Using guess to calculate declination, calculate the time of when Sun is at altitude, and
         return difference between guess and calculated time.
         """
-        _, declination = eot_decl(guess)
-        T = timedelta_at_altitude(altitude, declination, latitude)
+        _, declination = solar(guess)
+        T = timedelta_at_altitude_seconds(altitude, declination, latitude)
         if rising:
             actual = zenith - T
         else:
             actual = zenith + T
         return actual - guess
 
+    if solver == Solver.JOINT:
+        return DeclinationModel(zenith, solar).time_offset(
+            _altitude_offset(altitude, latitude), rising
+        )
+
+    if solver == Solver.NEWTON:
+        if rates is None:
+            rates = eot_decl_rates_seconds
+        # the rate of change of declination hardly changes within 12 hours of zenith, so it is only
+        # evaluated once
+        _, decl_rate = rates(zenith)
+
+        def calc_difference_derivative(guess: float) -> "tuple[float, float]":
+            _, declination = solar(guess)
+            T, _, T_decl = timedelta_at_altitude_derivatives_seconds(
+                altitude, declination, latitude
+            )
+            if rising:
+                return zenith - T - guess, -T_decl * decl_rate - 1
+            return zenith + T - guess, T_decl * decl_rate - 1
+
+        return _newton_around_zenith(calc_difference_derivative, zenith, rising, guess)
+
+    if guess is not None:
+        try:
+            return linear_interpolation_seconds(calc_difference, guess, guess + SEED_STEP_SECONDS)
+        except (ValueError, RuntimeError):
+            # fall back to the bounding guesses below
+            pass
+
     if rising:
         # start guesses at zenith and 12 hours before zenith to bound solution
-        guess1 = zenith - dt.timedelta(hours=12)
+        guess1 = zenith - 12 * 60 * 60
         guess2 = zenith
     else:
         # start guesses at zenith and 12 hours after zenith to bound solution
         guess1 = zenith
-        guess2 = zenith + dt.timedelta(hours=12)
+        guess2 = zenith + 12 * 60 * 60
 
-    return linear_interpolation(calc_difference, guess1, guess2)
+    return linear_interpolation_seconds(calc_difference, guess1, guess2)
 
 
 def time_shadow_factor(
@@ -305,6 +731,7 @@ def time_shadow_factor(
     shadow_factor: float,
     latitude: float,
     rising: bool,
+    guess: dt.datetime = None,
 ) -> dt.datetime:
     """Calculates the time when shadow of an object is shadow_factor times its height, plus the
     length at zenith.
@@ -315,40 +742,587 @@ def time_shadow_factor(
         latitude (float): The latitude in degrees North
         rising (bool): Whether to calculate first time (before zenith, when Sun is rising) or to
             calculate the second time (after zenith, when sun is setting)
+        guess (datetime, optional): Approximate solution, such as the same event on the previous
+            day shifted by a day. When given, the solver starts next to it instead of bounding the
+            12 hours before or after zenith
 
     Returns:
         datetime: The time on the given date when shadow factor is as given and it is either rising
             or setting, depending on value of rising
     """
+    if guess is not None:
+        guess = to_seconds(guess)
+    time = time_shadow_factor_seconds(to_seconds(zenith), shadow_factor, latitude, rising, guess)
+    return to_datetime(time)
+
+
+def time_shadow_factor_seconds(
+    zenith: float,
+    shadow_factor: float,
+    latitude: float,
+    rising: bool,
+    guess: float = None,
+    solar: Callable[[float], "tuple[float, float]"] = None,
+    solver: Solver = Solver.SECANT,
+    rates: Callable[[float], "tuple[float, float]"] = None,
+) -> float:
+    """Same as time_shadow_factor, except with epoch seconds instead of datetimes.
+
+    Args:
+        zenith (float): The epoch seconds of zenith of the day
+        shadow_factor (float): Multiplication factor from height to shadow length
+        latitude (float): The latitude in degrees North
+        rising (bool): Whether to calculate the time before zenith or after zenith
+        guess (float, optional): Approximate epoch seconds of the solution
+        solar (Callable[[float], tuple[float, float]], optional): Function giving equation of time
+            (in seconds) and declination for epoch seconds. Defaults to eot_decl_seconds.
+        solver (Solver, optional): Root finder to use. Defaults to Solver.SECANT.
+        rates (Callable[[float], tuple[float, float]], optional): Function giving the rates of
+            change of equation of time and declination for epoch seconds, used by Solver.NEWTON.
+            Defaults to eot_decl_rates_seconds.
+
+    Returns:
+        float: The epoch seconds when shadow factor is as given
+    """
+    if solar is None:
+        solar = eot_decl_seconds
+
     # The declination depends on the date (and therefore changes slightly over the day) the time
     # when the sun is at a given altitude depends on the declination therefore this is a circular
     # dependency, so use interpolation method to find solution
 
-    # x is the datetime guess
+    # x is the epoch seconds guess
     # f(x) is the difference between time calculated using the guess's
     #   declination and the guess itself
     # here x is guess and f(x) is diff (found with calc_difference)
 
-    def calc_difference(guess: dt.datetime) -> dt.timedelta:
+    def calc_difference(guess: float) -> float:
         """Using guess to calculate declination, calculate the time of when shadow is at given
         length, and return difference between guess and calculated time.
         """
-        _, declination = eot_decl(guess)
+        _, declination = solar(guess)
         altitude = calc_altitude(shadow_factor, declination, latitude)
-        T = timedelta_at_altitude(altitude, declination, latitude)
+        T = timedelta_at_altitude_seconds(altitude, declination, latitude)
         if rising:
             actual = zenith - T
         else:
             actual = zenith + T
         return actual - guess
 
+    if solver == Solver.JOINT:
+        return DeclinationModel(zenith, solar).time_offset(
+            _shadow_factor_offset(shadow_factor, latitude), rising
+        )
+
+    if solver == Solver.NEWTON:
+        if rates is None:
+            rates = eot_decl_rates_seconds
+        # the rate of change of declination hardly changes within 12 hours of zenith, so it is only
+        # evaluated once
+        _, decl_rate = rates(zenith)
+
+        def calc_difference_derivative(guess: float) -> "tuple[float, float]":
+            _, declination = solar(guess)
+            altitude, altitude_decl = calc_altitude_derivative(shadow_factor, declination, latitude)
+            T, T_altitude, T_decl = timedelta_at_altitude_derivatives_seconds(
+                altitude, declination, latitude
+            )
+            rate = (T_altitude * altitude_decl + T_decl) * decl_rate
+            if rising:
+                return zenith - T - guess, -rate - 1
+            return zenith + T - guess, rate - 1
+
+        return _newton_around_zenith(calc_difference_derivative, zenith, rising, guess)
+
+    if guess is not None:
+        try:
+            return linear_interpolation_seconds(calc_difference, guess, guess + SEED_STEP_SECONDS)
+        except (ValueError, RuntimeError):
+            # fall back to the bounding guesses below
+            pass
+
     if rising:
         # start guesses at zenith and 12 hours before zenith to bound solution
-        guess1 = zenith - dt.timedelta(hours=12)
+        guess1 = zenith - 12 * 60 * 60
         guess2 = zenith
     else:
         # start guesses at zenith and 12 hours after zenith to bound solution
         guess1 = zenith
-        guess2 = zenith + dt.timedelta(hours=12)
+        guess2 = zenith + 12 * 60 * 60
+
+    return linear_interpolation_seconds(calc_difference, guess1, guess2)
+
+
+def _newton_around_zenith(
+    diff_function: Callable[[float], "tuple[float, float]"],
+    zenith: float,
+    rising: bool,
+    guess: float = None,
+) -> float:
+    """Solves for a time in the 12 hours before or after zenith with newton_seconds.
+
+    Without a guess the solver starts at zenith, which the other events of the day evaluate too.
+    """
+    if guess is None:
+        guess = zenith
+    if rising:
+        return newton_seconds(diff_function, guess, zenith - 12 * 60 * 60, zenith)
+    return newton_seconds(diff_function, guess, zenith, zenith + 12 * 60 * 60)
+
+
+def time_altitudes_seconds(
+    zenith: float,
+    altitudes: "Sequence[float]",
+    latitude: float,
+    rising: "Sequence[bool]",
+    solar: Callable[[float], "tuple[float, float]"] = None,
+) -> "list[float]":
+    """Calculates the times when Sun's altitude is each of several altitudes on one day, sharing a
+    DeclinationModel between them.
+
+    Args:
+        zenith (float): The epoch seconds of zenith of the day
+        altitudes (Sequence[float]): The desired altitudes of the Sun above the horizon, in
+            radians
+        latitude (float): The latitude in degrees North
+        rising (Sequence[bool]): For every altitude, whether to calculate the time before zenith or
+            after zenith
+        solar (Callable[[float], tuple[float, float]], optional): Function giving equation of time
+            (in seconds) and declination for epoch seconds. Defaults to eot_decl_seconds.
+
+    Raises:
+        ValueError: If the Sun does not reach one of the altitudes
+
+    Returns:
+        list[float]: The epoch seconds when Sun's altitude is each of altitudes
+    """
+    model = DeclinationModel(zenith, solar)
+    return [
+        model.time_offset(_altitude_offset(altitude, latitude), altitude_rising)
+        for altitude, altitude_rising in zip(altitudes, rising)
+    ]
 
-    return linear_interpolation(calc_difference, guess1, guess2)
+
+def _altitude_offset(altitude: float, latitude: float) -> Callable[[float], "tuple[float, float]"]:
+    """Offset from zenith of an altitude, and its derivative, as a function of declination"""
+
+    def offset(declination: float) -> "tuple[float, float]":
+        T, _, T_decl = timedelta_at_altitude_derivatives_seconds(altitude, declination, latitude)
+        return T, T_decl
+
+    return offset
+
+
+def _shadow_factor_offset(
+    shadow_factor: float, latitude: float
+) -> Callable[[float], "tuple[float, float]"]:
+    """Offset from zenith of a shadow factor, and its derivative, as a function of declination"""
+
+    def offset(declination: float) -> "tuple[float, float]":
+        altitude, altitude_decl = calc_altitude_derivative(shadow_factor, declination, latitude)
+        T, T_altitude, T_decl = timedelta_at_altitude_derivatives_seconds(
+            altitude, declination, latitude
+        )
+        return T, T_altitude * altitude_decl + T_decl
+
+    return offset
+
+
+def _offset_newton_step(
+    offset: Callable[[float], "tuple[float, float]"],
+    rising: bool,
+    zenith: float,
+    guess: float,
+    declination: float,
+    rate: float,
+) -> "tuple[float, float]":
+    """Newton step towards the time offset from zenith, and the slope of the offset at guess"""
+    sign = -1 if rising else 1
+    T, T_decl = offset(declination)
+    slope = sign * T_decl * rate
+    # the derivative is infinite where the Sun only just reaches the event
+    if not math.isfinite(slope):
+        slope = 0.0
+    return (zenith + sign * T - guess) / (1 - slope), slope
+
+
+class DeclinationModel:
+    def __init__(
+        self,
+        zenith: float,
+        solar: Callable[[float], "tuple[float, float]"] = None,
+        before: "tuple[float, float]" = None,
+    ):
+        """Quadratic model of the Sun's declination in the 12 hours before and after a zenith.
+
+        The declination changes by less than half a degree a day, and so smoothly that a parabola
+        through its values 12 hours before zenith, at zenith and 12 hours after zenith is within
+        about 1e-8 radians of it all day. Solving an event against the model needs no evaluations
+        of the solar function and puts it within a millisecond of its time, after which one exact
+        evaluation at that time is usually enough to correct it. So every event of a day shares
+        the three evaluations of the model, instead of bracketing its own solution.
+
+        The sample 12 hours after the previous day's zenith is within a minute of the one 12 hours
+        before this zenith, so consecutive days can share it by passing it as before.
+
+        Args:
+            zenith (float): The epoch seconds of zenith of the day
+            solar (Callable[[float], tuple[float, float]], optional): Function giving equation of
+                time (in seconds) and declination for epoch seconds. Defaults to eot_decl_seconds.
+            before (tuple[float, float], optional): Epoch seconds and declination of an already
+                evaluated sample within a few minutes of 12 hours before zenith, which is used
+                instead of evaluating that one
+        """
+        self.zenith = zenith
+        self.solar = solar if solar is not None else eot_decl_seconds
+
+        if before is None:
+            _, declination = self.solar(zenith - HALF_DAY_SECONDS)
+            before = zenith - HALF_DAY_SECONDS, declination
+        _, at_zenith = self.solar(zenith)
+        _, after = self.solar(zenith + HALF_DAY_SECONDS)
+        self.after = zenith + HALF_DAY_SECONDS, after
+
+        # coefficients of the parabola in hours of 12 from zenith, through the sample before at
+        # u_before (which is -1 unless it was passed in), 0 and 1
+        u_before = (before[0] - zenith) / HALF_DAY_SECONDS
+        self._constant = at_zenith
+        self._quadratic = (
+            (before[1] - at_zenith) - u_before * (after - at_zenith)
+        ) / (u_before ** 2 - u_before)
+        self._linear = after - at_zenith - self._quadratic
+
+    def declination(self, seconds: float) -> "tuple[float, float]":
+        """Modelled declination and its rate of change.
+
+        Args:
+            seconds (float): epoch seconds within 12 hours of zenith
+
+        Returns:
+            float: declination of sun (in radians)
+            float: rate of change of declination of sun (in radians per second)
+        """
+        u = (seconds - self.zenith) / HALF_DAY_SECONDS
+        declination = self._constant + u * (self._linear + u * self._quadratic)
+        rate = (self._linear + 2 * u * self._quadratic) / HALF_DAY_SECONDS
+        return declination, rate
+
+    def model_time_offset(
+        self,
+        offset: Callable[[float], "tuple[float, float]"],
+        rising: bool,
+        zenith: float = None,
+        guess: float = None,
+    ) -> float:
+        """Same as time_offset, solving against the model only, which evaluates nothing.
+
+        The result is within about a millisecond of time_offset. The zenith can be moved by minutes
+        from the one the model was built around, to solve for a nearby longitude with the
+        declination of this one.
+
+        Raises:
+            ValueError: If the Sun does not reach the event
+            RuntimeError: If the solution does not converge
+
+        Args:
+            offset (Callable[[float], tuple[float, float]]): Function giving the offset from
+                zenith in seconds (always positive) and its derivative with respect to declination
+                for a declination, such as the time Sun is at an altitude
+            rising (bool): Whether to calculate the time before zenith or after zenith
+            zenith (float, optional): The epoch seconds of zenith the offset is from. Defaults to
+                the zenith of the model.
+            guess (float, optional): Approximate epoch seconds of the event. Defaults to zenith.
+
+        Returns:
+            float: The epoch seconds of the event
+        """
+        if zenith is None:
+            zenith = self.zenith
+        time, iterations = self._solve_model(
+            offset, rising, zenith, zenith if guess is None else guess
+        )
+        count_iterations(iterations)
+        return time
+
+    def _solve_model(
+        self,
+        offset: Callable[[float], "tuple[float, float]"],
+        rising: bool,
+        zenith: float,
+        guess: float,
+    ) -> "tuple[float, int]":
+        """Newton's method against the model, returning the solution and the iterations taken"""
+        if guess != zenith:
+            # a guess near the event can reach a solution where the Sun does not reach the event
+            # at the declination of zenith, which the solution from zenith starts with and fails
+            # at. Fail the same way, so the guess only changes how fast the solution is found
+            offset(self.declination(zenith)[0])
+
+        # Newton's method converges quadratically, so the next step would be about
+        # step ** 2 / previous step
+        previous = 0.0
+        for iteration in range(MAX_ITERATIONS):
+            step, _ = _offset_newton_step(
+                offset, rising, zenith, guess, *self.declination(guess)
+            )
+            guess += step
+            if step ** 2 <= TIME_TOLERANCE_SECONDS * abs(previous):
+                return guess, iteration + 1
+            previous = step
+        count_iterations(MAX_ITERATIONS)
+        raise RuntimeError("Did not converge")
+
+    def time_offset(
+        self,
+        offset: Callable[[float], "tuple[float, float]"],
+        rising: bool,
+        guess: float = None,
+    ) -> float:
+        """Solves for the time which is offset from zenith by offset of the declination at it.
+
+        Raises:
+            ValueError: If the Sun does not reach the event
+            RuntimeError: If the solution does not converge
+
+        Args:
+            offset (Callable[[float], tuple[float, float]]): Function giving the offset from
+                zenith in seconds (always positive) and its derivative with respect to declination
+                for a declination, such as the time Sun is at an altitude
+            rising (bool): Whether to calculate the time before zenith or after zenith
+            guess (float, optional): Approximate epoch seconds of the event, which the solution
+                against the model starts from. Defaults to zenith.
+
+        Returns:
+            float: The epoch seconds of the event
+        """
+        # solve against the model first, which evaluates nothing
+        guess, model_iterations = self._solve_model(
+            offset, rising, self.zenith, self.zenith if guess is None else guess
+        )
+
+        # then correct with the exact declination. The model's rate of change of declination is
+        # far more accurate than the rate itself, so a step leaves an error of less than the step
+        # times the slope, and the solution is converged once that is within tolerance
+        for iteration in range(MAX_ITERATIONS):
+            _, declination = self.solar(guess)
+            _, rate = self.declination(guess)
+            step, slope = _offset_newton_step(
+                offset, rising, self.zenith, guess, declination, rate
+            )
+            guess += step
+            if math.isclose(step * slope, 0, abs_tol=TIME_TOLERANCE_SECONDS):
+                count_iterations(model_iterations + iteration + 1)
+                return guess
+        count_iterations(MAX_ITERATIONS)
+        raise RuntimeError("Did not converge")
+
+
+class SolarDay:
+    def __init__(
+        self,
+        date: dt.date,
+        longitude: float,
+        solar: Callable[[float], "tuple[float, float]"] = None,
+        guess: float = None,
+        solver: Solver = Solver.JOINT,
+        previous: "SolarDay" = None,
+    ):
+        """Solar context of one date at one longitude, shared by the events calculated for it.
+
+        The zenith is solved once on construction, and every equation of time and declination
+        evaluated by the solvers is remembered, so events that start from the same guesses (such as
+        zenith, and 12 hours before or after it) do not evaluate them again. With Solver.JOINT the
+        events share one DeclinationModel, built when the first event is solved.
+
+        Given the context of the previous date, the zenith starts from its zenith a day later.
+        With Solver.JOINT the DeclinationModel also reuses its last sample, which saves one
+        evaluation of the solar function a day, and every event starts from its time on the
+        previous date.
+
+        Args:
+            date (date): The utc date for which the zenith should be found
+            longitude (float): The longitude in degrees East
+            solar (Callable[[float], tuple[float, float]], optional): Function giving equation of
+                time (in seconds) and declination for epoch seconds. Defaults to eot_decl_seconds.
+            guess (float, optional): Approximate epoch seconds of zenith
+            solver (Solver, optional): Root finder to use for every event of the day. Defaults to
+                Solver.JOINT.
+            previous (SolarDay, optional): Solar context of the previous date at the same
+                longitude, with the same solar function, to seed the solutions from
+        """
+        self.date = date
+        self.longitude = longitude
+        self.solver = solver
+        self._solar = solar if solar is not None else eot_decl_seconds
+        self._samples = {}
+        self._rates = {}
+        self._model = None
+        # times of the events solved for this day, which seed the next day
+        self._solved = {}
+
+        # only the times of the previous day are kept, so a chain of days is not kept alive
+        self._seeds = {}
+        self._model_before = None
+        if previous is not None:
+            if guess is None:
+                guess = previous.zenith + 2 * HALF_DAY_SECONDS
+            self._seeds = previous._solved
+            if previous._model is not None:
+                self._model_before = previous._model.after
+
+        self.zenith = time_zenith_seconds(
+            date, longitude, guess, self.eot_decl, solver, self.eot_decl_rates
+        )
+        # events happen at about the same offset from zenith as on the previous day
+        self._seed_shift = None if previous is None else self.zenith - previous.zenith
+
+    @property
+    def solar_calls(self) -> int:
+        """Number of times the solar function has been evaluated"""
+        return len(self._samples)
+
+    def eot_decl(self, seconds: float) -> "tuple[float, float]":
+        """Same as eot_decl_seconds, remembering the outputs.
+
+        Args:
+            seconds (float): epoch seconds to calculate equation of time and declination for
+
+        Returns:
+            float: equation of time (in seconds)
+            float: declination of sun (in radians)
+        """
+        value = self._samples.get(seconds)
+        if value is None:
+            value = self._samples[seconds] = self._solar(seconds)
+        return value
+
+    def eot_decl_rates(self, seconds: float) -> "tuple[float, float]":
+        """Same as eot_decl_rates_seconds, remembering the outputs.
+
+        Args:
+            seconds (float): epoch seconds to calculate the rates for
+
+        Returns:
+            float: rate of change of equation of time (in seconds per second)
+            float: rate of change of declination of sun (in radians per second)
+        """
+        value = self._rates.get(seconds)
+        if value is None:
+            value = self._rates[seconds] = eot_decl_rates_seconds(seconds)
+        return value
+
+    @property
+    def declination_model(self) -> DeclinationModel:
+        """DeclinationModel of the day, shared by the events solved with Solver.JOINT"""
+        if self._model is None:
+            before = self._model_before
+            # the sample of the previous day is only used if it is about 12 hours before zenith
+            if before is not None and abs(self.zenith - HALF_DAY_SECONDS - before[0]) > 60 * 60:
+                before = None
+            self._model = DeclinationModel(self.zenith, self.eot_decl, before)
+        return self._model
+
+    def _seed(self, key: tuple) -> "float | None":
+        """Time of an event on the previous day moved to this day, or None if it is not known"""
+        seed = self._seeds.get(key)
+        if seed is None:
+            return None
+        return seed + self._seed_shift
+
+    def time_altitudes(
+        self, altitudes: "Sequence[float]", latitude: float, rising: "Sequence[bool]"
+    ) -> "list[float]":
+        """Same as time_altitudes_seconds using the zenith and declination model of the day.
+
+        Args:
+            altitudes (Sequence[float]): The desired altitudes of the Sun above the horizon, in
+                radians
+            latitude (float): The latitude in degrees North
+            rising (Sequence[bool]): For every altitude, whether to calculate the time before
+                zenith or after zenith
+
+        Returns:
+            list[float]: The epoch seconds when Sun's altitude is each of altitudes
+        """
+        return [
+            self.declination_model.time_offset(
+                _altitude_offset(altitude, latitude), altitude_rising
+            )
+            for altitude, altitude_rising in zip(altitudes, rising)
+        ]
+
+    def time_altitude(
+        self, altitude: float, latitude: float, rising: bool, guess: float = None
+    ) -> float:
+        """Same as time_altitude_seconds using the zenith of the day.
+
+        Args:
+            altitude (float): The desired altitude of the Sun above the horizon, in radians
+            latitude (float): The latitude in degrees North
+            rising (bool): Whether to calculate the time before zenith or after zenith
+            guess (float, optional): Approximate epoch seconds of the solution. Defaults to the
+                time of the event on the previous date with Solver.JOINT, if there is one.
+
+        Returns:
+            float: The epoch seconds when Sun's altitude is as given
+        """
+        key = ("altitude", altitude, latitude, rising)
+        # the other solvers start from brackets whose samples the events share, which a seed
+        # would only add to
+        if guess is None and self.solver == Solver.JOINT:
+            guess = self._seed(key)
+        if self.solver == Solver.JOINT:
+            time = self.declination_model.time_offset(
+                _altitude_offset(altitude, latitude), rising, guess
+            )
+        else:
+            time = time_altitude_seconds(
+                self.zenith,
+                altitude,
+                latitude,
+                rising,
+                guess,
+                self.eot_decl,
+                self.solver,
+                self.eot_decl_rates,
+            )
+        self._solved[key] = time
+        return time
+
+    def time_shadow_factor(
+        self, shadow_factor: float, latitude: float, rising: bool, guess: float = None
+    ) -> float:
+        """Same as time_shadow_factor_seconds using the zenith of the day.
+
+        Args:
+            shadow_factor (float): Multiplication factor from height to shadow length
+            latitude (float): The latitude in degrees North
+            rising (bool): Whether to calculate the time before zenith or after zenith
+            guess (float, optional): Approximate epoch seconds of the solution. Defaults to the
+                time of the event on the previous date with Solver.JOINT, if there is one.
+
+        Returns:
+            float: The epoch seconds when shadow factor is as given
+        """
+        key = ("shadow_factor", shadow_factor, latitude, rising)
+        # the other solvers start from brackets whose samples the events share, which a seed
+        # would only add to
+        if guess is None and self.solver == Solver.JOINT:
+            guess = self._seed(key)
+        if self.solver == Solver.JOINT:
+            time = self.declination_model.time_offset(
+                _shadow_factor_offset(shadow_factor, latitude), rising, guess
+            )
+        else:
+            time = time_shadow_factor_seconds(
+                self.zenith,
+                shadow_factor,
+                latitude,
+                rising,
+                guess,
+                self.eot_decl,
+                self.solver,
+                self.eot_decl_rates,
+            )
+        self._solved[key] = time
+        return time
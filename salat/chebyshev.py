@@ -0,0 +1,275 @@
+"""Compact Chebyshev approximation of the equation of time and declination.
+
+The range covered by salat._chebyshev_data is split into segments of equal length, and equation of
+time and declination are each approximated in every segment by a Chebyshev series fitted to
+eot_decl_seconds. Evaluating the series needs no root finding, so it is several times cheaper than
+eot_decl_seconds. With the shipped coefficients the equation of time is within 5 milliseconds and
+the declination within 2e-7 radians of eot_decl_seconds for 1900 to 2100, which moves prayer times
+by a few milliseconds at most. Times outside of that range fall back to eot_decl_seconds.
+
+The coefficients are generated from the model in salat.calculations, so if that changes they need
+to be refitted with:
+
+    python -m salat.chebyshev
+"""
+from array import array
+import argparse
+import base64
+import datetime as dt
+import math
+import os
+import sys
+import textwrap
+import zlib
+
+from .calculations import eot_decl_seconds, to_seconds
+from . import _chebyshev_data as data
+
+
+DEFAULT_START = dt.date(1900, 1, 1)
+DEFAULT_END = dt.date(2101, 1, 1)
+DEFAULT_SEGMENT_DAYS = 64
+DEFAULT_DEGREE = 7
+
+# coefficients are stored as integer multiples of these
+EOT_SCALE = 1e-3  # seconds
+DECL_SCALE = 1e-8  # radians
+
+
+def fit_coefficients(
+    start: float, segment_seconds: float, segments: int, degree: int
+) -> "list[int]":
+    """Fits Chebyshev series to eot_decl_seconds in consecutive segments.
+
+    Each series is interpolated at the Chebyshev nodes of its segment, so no least squares fit is
+    needed.
+
+    Args:
+        start (float): Epoch seconds of the start of the first segment
+        segment_seconds (float): Length of each segment in seconds
+        segments (int): Number of segments
+        degree (int): Degree of the series
+
+    Returns:
+        list[int]: For each segment, degree + 1 equation of time coefficients as multiples of
+            EOT_SCALE followed by degree + 1 declination coefficients as multiples of DECL_SCALE
+    """
+    n = degree + 1
+    thetas = [math.pi * (k + 0.5) / n for k in range(n)]
+
+    coefficients = []
+    for segment in range(segments):
+        segment_start = start + segment * segment_seconds
+        samples = [
+            eot_decl_seconds(segment_start + (math.cos(theta) + 1) / 2 * segment_seconds)
+            for theta in thetas
+        ]
+
+        for index, scale in ((0, EOT_SCALE), (1, DECL_SCALE)):
+            for j in range(n):
+                c = 2 / n * sum(s[index] * math.cos(j * t) for s, t in zip(samples, thetas))
+                if j == 0:
+                    c /= 2
+                coefficients.append(round(c / scale))
+    return coefficients
+
+
+def write_data_module(
+    path: str,
+    start: dt.date = DEFAULT_START,
+    end: dt.date = DEFAULT_END,
+    segment_days: int = DEFAULT_SEGMENT_DAYS,
+    degree: int = DEFAULT_DEGREE,
+):
+    """Fits the coefficients and writes them as a Python module, like salat._chebyshev_data.
+
+    Args:
+        path (str): Path of the module to write
+        start (dt.date, optional): Start of the first segment (at 00:00 UTC). Defaults to
+            1900-01-01.
+        end (dt.date, optional): The last segment ends on or after this date (at 00:00 UTC).
+            Defaults to 2101-01-01.
+        segment_days (int, optional): Length of each segment in days. Defaults to 64.
+        degree (int, optional): Degree of the series. Defaults to 7.
+    """
+    utc = dt.timezone.utc
+    start_seconds = to_seconds(dt.datetime(start.year, start.month, start.day, tzinfo=utc))
+    end_seconds = to_seconds(dt.datetime(end.year, end.month, end.day, tzinfo=utc))
+    segment_seconds = segment_days * 24 * 60 * 60
+    segments = math.ceil((end_seconds - start_seconds) / segment_seconds)
+
+    coefficients = array("i", fit_coefficients(start_seconds, segment_seconds, segments, degree))
+    if sys.byteorder == "big":
+        coefficients.byteswap()
+    encoded = base64.b64encode(zlib.compress(coefficients.tobytes(), 9)).decode("ascii")
+    lines = "\n".join(f'    "{line}"' for line in textwrap.wrap(encoded, 92))
+
+    with open(path, "w") as f:
+        f.write(
+            f'"""Chebyshev coefficients used by salat.chebyshev.\n'
+            f"\n"
+            f"Generated by python -m salat.chebyshev, do not edit.\n"
+            f'"""\n'
+            f"\n"
+            f"START_SECONDS = {start_seconds!r}\n"
+            f"SEGMENT_SECONDS = {float(segment_seconds)!r}\n"
+            f"SEGMENTS = {segments}\n"
+            f"DEGREE = {degree}\n"
+            f"EOT_SCALE = {EOT_SCALE!r}\n"
+            f"DECL_SCALE = {DECL_SCALE!r}\n"
+            f"\n"
+            f"# base64 of zlib compressed little-endian 32 bit integers\n"
+            f"COEFFICIENTS = (\n"
+            f"{lines}\n"
+            f")\n"
+        )
+
+
+def decode_coefficients(encoded: str, eot_scale: float, decl_scale: float, degree: int) -> array:
+    """Decodes the coefficients of a data module into floats.
+
+    Args:
+        encoded (str): COEFFICIENTS of the data module
+        eot_scale (float): EOT_SCALE of the data module
+        decl_scale (float): DECL_SCALE of the data module
+        degree (int): DEGREE of the data module
+
+    Returns:
+        array: flat array of coefficients, in the same order as fit_coefficients
+    """
+    integers = array("i", zlib.decompress(base64.b64decode(encoded)))
+    if sys.byteorder == "big":
+        integers.byteswap()
+
+    n = degree + 1
+    scales = [eot_scale] * n + [decl_scale] * n
+    return array("d", (c * scales[i % (2 * n)] for i, c in enumerate(integers)))
+
+
+def chebyshev_to_monomial(coefficients: "list[float]") -> "list[float]":
+    """Converts a Chebyshev series to the coefficients of the same polynomial in powers of x.
+
+    Args:
+        coefficients (list[float]): Chebyshev coefficients, lowest degree first
+
+    Returns:
+        list[float]: coefficients of powers of x, lowest degree first
+    """
+    n = len(coefficients)
+    result = [0.0] * n
+    # T_0 = 1, T_1 = x, T_k+1 = 2 x T_k - T_k-1
+    t_previous, t = [1.0] + [0.0] * (n - 1), [0.0, 1.0] + [0.0] * (n - 2)
+    for k, c in enumerate(coefficients):
+        term = t_previous if k == 0 else t
+        for i in range(n):
+            result[i] += c * term[i]
+        if k >= 1:
+            t_previous, t = t, [2 * a - b for a, b in zip([0.0] + t[:-1], t_previous)]
+    return result
+
+
+def _load_segments() -> "tuple[tuple[tuple[float, float], ...], ...]":
+    """Decodes the data module into, for each segment, pairs of equation of time and declination
+    coefficients of powers of x, highest degree first, ready for Horner's method.
+    """
+    coefficients = decode_coefficients(
+        data.COEFFICIENTS, data.EOT_SCALE, data.DECL_SCALE, data.DEGREE
+    )
+    n = data.DEGREE + 1
+
+    segments = []
+    for offset in range(0, len(coefficients), 2 * n):
+        eot = chebyshev_to_monomial(coefficients[offset:offset + n])
+        decl = chebyshev_to_monomial(coefficients[offset + n:offset + 2 * n])
+        segments.append(tuple(zip(reversed(eot), reversed(decl))))
+    return tuple(segments)
+
+
+# decoded once on import and never modified
+_segments = _load_segments()
+_end_seconds = data.START_SECONDS + data.SEGMENTS * data.SEGMENT_SECONDS
+
+
+def eot_decl_chebyshev(seconds: float) -> "tuple[float, float]":
+    """Approximates the equation of time and Sun's declination with the Chebyshev series.
+
+    This can be used as the solar function of the solvers and calculation methods.
+
+    Args:
+        seconds (float): epoch seconds to calculate equation of time and declination for
+
+    Returns:
+        float: equation of time (in seconds)
+        float: declination of sun (in radians)
+    """
+    if not data.START_SECONDS <= seconds < _end_seconds:
+        return eot_decl_seconds(seconds)
+
+    position = (seconds - data.START_SECONDS) / data.SEGMENT_SECONDS
+    segment = int(position)
+    # map position within the segment to [-1, 1]
+    x = 2 * (position - segment) - 1
+
+    # the series are stored as plain polynomials, which are cheaper to evaluate than with
+    # Clenshaw's recurrence and accurate enough on [-1, 1] for the low degrees used
+    eot = 0.0
+    decl = 0.0
+    for eot_coefficient, decl_coefficient in _segments[segment]:
+        eot = eot * x + eot_coefficient
+        decl = decl * x + decl_coefficient
+    return eot, decl
+
+
+def eot_decl_chebyshev_array(seconds: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+    """Array equivalent of eot_decl_chebyshev. Requires the optional numpy dependency.
+
+    Args:
+        seconds (np.ndarray): epoch seconds to calculate equation of time and declination for
+
+    Returns:
+        np.ndarray: equation of time (in seconds)
+        np.ndarray: declination of sun (in radians)
+    """
+    from .vectorized import np, eot_decl_array
+
+    seconds = np.asarray(seconds, dtype=np.float64)
+    # shape (segments, degree + 1, 2)
+    coefficients = np.array(_segments, dtype=np.float64)
+
+    inside = (data.START_SECONDS <= seconds) & (seconds < _end_seconds)
+    position = (seconds[inside] - data.START_SECONDS) / data.SEGMENT_SECONDS
+    segment = position.astype(np.int64)
+    x = (2 * (position - segment) - 1)[:, None]
+    c = coefficients[segment]
+
+    values = np.zeros((len(segment), 2))
+    for i in range(c.shape[1]):
+        values = values * x + c[:, i, :]
+
+    eot = np.empty_like(seconds)
+    decl = np.empty_like(seconds)
+    eot[inside] = values[:, 0]
+    decl[inside] = values[:, 1]
+    if not np.all(inside):
+        eot[~inside], decl[~inside] = eot_decl_array(seconds[~inside])
+    return eot, decl
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Refit the salat Chebyshev coefficients")
+    parser.add_argument(
+        "--path",
+        default=os.path.join(os.path.dirname(__file__), "_chebyshev_data.py"),
+        help="path of the module to write, defaults to the one in the package",
+    )
+    parser.add_argument("--start", type=dt.date.fromisoformat, default=DEFAULT_START)
+    parser.add_argument("--end", type=dt.date.fromisoformat, default=DEFAULT_END)
+    parser.add_argument("--segment-days", type=int, default=DEFAULT_SEGMENT_DAYS)
+    parser.add_argument("--degree", type=int, default=DEFAULT_DEGREE)
+    args = parser.parse_args(args)
+
+    write_data_module(args.path, args.start, args.end, args.segment_days, args.degree)
+
+
+if __name__ == "__main__":
+    main()
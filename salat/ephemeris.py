@@ -0,0 +1,196 @@
+"""Precomputed solar ephemeris stored in a memory-mapped file.
+
+Equation of time and declination only depend on the time, so for a fixed range of dates they can be
+sampled once from eot_decl_seconds and written to a binary file. An Ephemeris memory-maps that file
+and linearly interpolates between samples instead of solving Kepler's equation on every call. The
+file is mapped read-only, so every process using the same file shares it through the page cache.
+
+With the default hourly samples, interpolated values are within about a millisecond of equation
+of time and 1e-7 radians of declination of eot_decl_seconds, which moves prayer times by at most
+a few milliseconds.
+
+Build a file with:
+
+    python -m salat.ephemeris ephemeris.bin --start 1900-01-01 --end 2101-01-01
+
+and use it with:
+
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, solar=salat.ephemeris.Ephemeris(path))
+"""
+from array import array
+import argparse
+import datetime as dt
+import mmap
+import struct
+import sys
+
+from .calculations import eot_decl_seconds, to_seconds
+
+
+# magic, version, epoch seconds of first sample, seconds between samples, number of samples
+HEADER = struct.Struct("<8sQddQ")
+MAGIC = b"SALATEPH"
+VERSION = 1
+
+DEFAULT_START = dt.date(1900, 1, 1)
+DEFAULT_END = dt.date(2101, 1, 1)
+DEFAULT_STEP_SECONDS = 60 * 60
+
+
+def build_ephemeris(
+    path: str,
+    start: dt.date = DEFAULT_START,
+    end: dt.date = DEFAULT_END,
+    step: float = DEFAULT_STEP_SECONDS,
+):
+    """Samples eot_decl_seconds and writes the samples to an ephemeris file.
+
+    The file is a fixed size header followed by pairs of little-endian 32 bit floats, the equation
+    of time (in seconds) and declination (in radians) of each sample.
+
+    Args:
+        path (str): Path of the file to write
+        start (dt.date, optional): First date of the ephemeris (at 00:00 UTC). Defaults to
+            1900-01-01.
+        end (dt.date, optional): Last date of the ephemeris (at 00:00 UTC). Defaults to
+            2101-01-01.
+        step (float, optional): Seconds between samples. Defaults to one hour.
+    """
+    utc = dt.timezone.utc
+    start_seconds = to_seconds(dt.datetime(start.year, start.month, start.day, tzinfo=utc))
+    end_seconds = to_seconds(dt.datetime(end.year, end.month, end.day, tzinfo=utc))
+    if end_seconds <= start_seconds:
+        raise ValueError("end needs to be after start")
+    count = int((end_seconds - start_seconds) // step) + 1
+
+    samples = array("f")
+    for i in range(count):
+        samples.extend(eot_decl_seconds(start_seconds + i * step))
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, start_seconds, step, count))
+        samples.tofile(f)
+
+
+class Ephemeris:
+    def __init__(self, path: str):
+        """Memory-mapped ephemeris written by build_ephemeris.
+
+        Calling the object gives the same outputs as eot_decl_seconds, so it can be used as the
+        solar function of the solvers and calculation methods. Times outside of the range of the
+        file fall back to eot_decl_seconds.
+
+        The ephemeris is picklable. Only the path is pickled, and the file is mapped again when
+        unpickled, so methods using it can be sent to process pools such as salat.batch.generate,
+        whose workers then share the file through the page cache.
+
+        Raises:
+            ValueError: If the file is not an ephemeris file of a supported version
+
+        Args:
+            path (str): Path of the file written by build_ephemeris
+        """
+        if sys.byteorder == "big":
+            raise ValueError("Ephemeris files are only supported on little-endian machines")
+
+        self.path = path
+        self._map(path)
+
+    def _map(self, path: str):
+        """Maps the file and reads its header"""
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.start, self.step, self.count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a salat ephemeris file of version {VERSION}")
+        if len(self._mmap) != HEADER.size + self.count * 2 * 4:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated")
+
+        self.end = self.start + (self.count - 1) * self.step
+        self._samples = memoryview(self._mmap)[HEADER.size:].cast("f")
+
+    def __call__(self, seconds: float) -> "tuple[float, float]":
+        """Interpolates the equation of time and Sun's declination at a given time.
+
+        Args:
+            seconds (float): epoch seconds to calculate equation of time and declination for
+
+        Returns:
+            float: equation of time (in seconds)
+            float: declination of sun (in radians)
+        """
+        position = (seconds - self.start) / self.step
+        if not 0 <= position < self.count - 1:
+            return eot_decl_seconds(seconds)
+
+        i = int(position)
+        fraction = position - i
+        eot1, decl1, eot2, decl2 = self._samples[2 * i:2 * i + 4]
+        return eot1 + (eot2 - eot1) * fraction, decl1 + (decl2 - decl1) * fraction
+
+    def eot_decl_array(self, seconds: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+        """Array equivalent of calling the ephemeris, reading the file without copying it.
+
+        Requires the optional numpy dependency.
+
+        Args:
+            seconds (np.ndarray): epoch seconds to calculate equation of time and declination for
+
+        Returns:
+            np.ndarray: equation of time (in seconds)
+            np.ndarray: declination of sun (in radians)
+        """
+        from .vectorized import np, eot_decl_array
+
+        seconds = np.asarray(seconds, dtype=np.float64)
+        samples = np.frombuffer(self._samples, dtype="<f4").reshape(-1, 2)
+        position = (seconds - self.start) / self.step
+        inside = (0 <= position) & (position < self.count - 1)
+
+        eot = np.empty_like(seconds)
+        decl = np.empty_like(seconds)
+        i = np.floor(position[inside]).astype(np.int64)
+        fraction = position[inside] - i
+        eot[inside] = samples[i, 0] + (samples[i + 1, 0] - samples[i, 0]) * fraction
+        decl[inside] = samples[i, 1] + (samples[i + 1, 1] - samples[i, 1]) * fraction
+        if not np.all(inside):
+            eot[~inside], decl[~inside] = eot_decl_array(seconds[~inside])
+        return eot, decl
+
+    def close(self):
+        """Unmaps the file"""
+        self._samples.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._map(self.path)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Build a salat ephemeris file")
+    parser.add_argument("path", help="path of the file to write")
+    parser.add_argument("--start", type=dt.date.fromisoformat, default=DEFAULT_START)
+    parser.add_argument("--end", type=dt.date.fromisoformat, default=DEFAULT_END)
+    parser.add_argument("--step", type=float, default=DEFAULT_STEP_SECONDS, help="seconds")
+    args = parser.parse_args(args)
+
+    build_ephemeris(args.path, args.start, args.end, args.step)
+
+
+if __name__ == "__main__":
+    main()
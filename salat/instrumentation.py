@@ -0,0 +1,125 @@
+"""Opt-in instrumentation of the prayer time solvers.
+
+Inside an instrument block, every event solved by GeneralMethod (through calc_times,
+calc_times_range or iter_times) is measured: the number of solver iterations, the number of
+evaluations of the solar function, and the wall time. The measurements are summed per event, and
+can also be passed to a callback one by one, for example to find the dates and latitudes that are
+slow to solve:
+
+    def report(sample):
+        if sample.iterations > 20:
+            print(sample)
+
+    with salat.instrumentation.instrument(report) as recorder:
+        pt.calc_times_range(start, end, timezone, longitude, latitude)
+    print(recorder.events["isha"])
+
+Solving the zenith is shared by all events of a day, and is counted towards dhuhr.
+
+When no instrument block is active the solvers only check a context variable once per solve, so the
+overhead is negligible. The active recorder is stored in a context variable, so recorders in
+different threads or asyncio tasks do not see each other's events. Batch calculations with NumPy are
+not instrumented.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, NamedTuple
+import datetime as dt
+
+
+class Sample(NamedTuple):
+    """Measurements of solving one event for one date and location"""
+
+    name: str
+    date: dt.date
+    longitude: float
+    latitude: float
+    iterations: int
+    solar_calls: int
+    seconds: float
+    failed: bool
+
+
+class EventStats:
+    def __init__(self):
+        """Measurements of an event summed over all samples"""
+        self.count = 0
+        self.failures = 0
+        self.iterations = 0
+        self.solar_calls = 0
+        self.seconds = 0.0
+        self.max_iterations = 0
+        # sample that took the longest
+        self.slowest = None
+
+    def add(self, sample: Sample):
+        """Adds the measurements of a sample"""
+        self.count += 1
+        self.failures += sample.failed
+        self.iterations += sample.iterations
+        self.solar_calls += sample.solar_calls
+        self.seconds += sample.seconds
+        self.max_iterations = max(self.max_iterations, sample.iterations)
+        if self.slowest is None or sample.seconds > self.slowest.seconds:
+            self.slowest = sample
+
+    def __repr__(self):
+        return (
+            f"EventStats(count={self.count}, failures={self.failures}, "
+            f"iterations={self.iterations}, solar_calls={self.solar_calls}, "
+            f"seconds={self.seconds}, max_iterations={self.max_iterations})"
+        )
+
+
+class Recorder:
+    def __init__(self, callback: Callable[[Sample], None] = None):
+        """Collects the samples of an instrument block.
+
+        Args:
+            callback (Callable[[Sample], None], optional): Function called with every sample.
+                Defaults to None.
+        """
+        self.callback = callback
+        self.events: "dict[str, EventStats]" = {}
+        # running total of solver iterations, incremented by the solvers
+        self.iterations = 0
+
+    def record(self, sample: Sample):
+        """Adds a sample to the statistics of its event and passes it to the callback"""
+        stats = self.events.get(sample.name)
+        if stats is None:
+            stats = self.events[sample.name] = EventStats()
+        stats.add(sample)
+        if self.callback is not None:
+            self.callback(sample)
+
+
+# recorder of the innermost active instrument block, or None
+active_recorder: "ContextVar[Recorder | None]" = ContextVar("active_recorder", default=None)
+
+
+@contextmanager
+def instrument(callback: Callable[[Sample], None] = None) -> Iterator[Recorder]:
+    """Records measurements of every event solved inside the block.
+
+    Args:
+        callback (Callable[[Sample], None], optional): Function called with the measurements of
+            every event as it is solved. Defaults to None.
+
+    Yields:
+        Recorder: recorder with the summed measurements per event in its events attribute
+    """
+    recorder = Recorder(callback)
+    token = active_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        active_recorder.reset(token)
+
+
+def count_iterations(iterations: int):
+    """Adds iterations of a solver to the active recorder, if any"""
+    recorder = active_recorder.get()
+    if recorder is not None:
+        recorder.iterations += iterations
+
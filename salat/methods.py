@@ -1,8 +1,22 @@
 from enum import Enum, auto, unique
+from typing import Callable, Hashable, Iterable, Iterator, NamedTuple, Sequence
+import bisect
 import datetime as dt
+import functools
+import importlib.util
+import itertools
 import math
+import time
 
-from .calculations import time_zenith, time_altitude, time_shadow_factor
+from .approximate import ApproximateSolarDay
+from .calculations import SolarDay, Solver, to_datetime
+from .instrumentation import Sample, active_recorder
+from .results import DayTimes, TimesTable
+from .timezones import OffsetTransitions
+
+
+# days read from a persistent cache at once
+CACHE_CHUNK_DAYS = 366
 
 
 @unique
@@ -22,12 +36,138 @@ class AsrMethod(Enum):
     HANAFI = auto()
 
 
+@unique
+class Precision(Enum):
+    """How accurately prayer times are calculated.
+
+    EXACT solves for the times with the full solar model. TABLE solves for them with the Chebyshev
+    coefficients of salat.chebyshev, which are within a few milliseconds of EXACT. FAST calculates
+    them in a single pass with the series of salat.approximate, which is within 2 seconds of EXACT
+    up to 45 degrees of latitude, and can be off by a minute further from the equator.
+    """
+
+    EXACT = auto()
+    TABLE = auto()
+    FAST = auto()
+
+
+class Zenith(NamedTuple):
+    """Event when the Sun passes its zenith"""
+
+    def solve(self, day: SolarDay, latitude: float, times: "dict[str, float]") -> float:
+        return day.zenith
+
+    def solve_array(self, date, zenith, latitudes, solar, times):
+        return zenith
+
+
+class Altitude(NamedTuple):
+    """Event when the Sun is at altitude (in radians above the horizon), either rising or setting"""
+
+    altitude: float
+    rising: bool
+
+    def solve(self, day: SolarDay, latitude: float, times: "dict[str, float]") -> float:
+        return day.time_altitude(self.altitude, latitude, self.rising)
+
+    def solve_array(self, date, zenith, latitudes, solar, times):
+        from .vectorized import time_altitude_array
+
+        return time_altitude_array(zenith, self.altitude, latitudes, self.rising, solar)
+
+
+class ShadowFactor(NamedTuple):
+    """Event when the shadow of an object is shadow_factor times its height plus its length at
+    zenith, either before or after zenith
+    """
+
+    shadow_factor: float
+    rising: bool
+
+    def solve(self, day: SolarDay, latitude: float, times: "dict[str, float]") -> float:
+        return day.time_shadow_factor(self.shadow_factor, latitude, self.rising)
+
+    def solve_array(self, date, zenith, latitudes, solar, times):
+        from .vectorized import time_shadow_factor_array
+
+        return time_shadow_factor_array(zenith, self.shadow_factor, latitudes, self.rising, solar)
+
+
+class MinutesAfter(NamedTuple):
+    """Event a fixed number of minutes after an earlier event, or ramadan_minutes after it during
+    Ramadan if given. Ramadan is calculated with additional dependency hijri-converter
+    """
+
+    reference: str
+    minutes: float
+    ramadan_minutes: float = None
+
+    def solve(self, day: SolarDay, latitude: float, times: "dict[str, float]") -> float:
+        return times[self.reference] + self._minutes(day.date) * 60
+
+    def solve_array(self, date, zenith, latitudes, solar, times):
+        return times[self.reference] + self._minutes(date) * 60
+
+    def _minutes(self, date: dt.date) -> float:
+        if self.ramadan_minutes is None:
+            return self.minutes
+
+        if is_ramadan(date):
+            return self.ramadan_minutes
+        return self.minutes
+
+
+def is_ramadan(date: dt.date) -> bool:
+    """Whether a date is in Ramadan of the Umm al-Qura calendar.
+
+    The first call builds an index of Ramadan of every year hijri-converter supports, after which
+    a lookup needs no calendar conversion.
+
+    Raises:
+        OverflowError: If the date is outside of the range supported by hijri-converter, 1 August
+            1924 to 16 November 2077
+
+    Args:
+        date (dt.date): Gregorian date
+
+    Returns:
+        bool: True if the date is in Ramadan
+    """
+    first, last, starts, ends = _ramadan_index()
+    ordinal = date.toordinal()
+    if not first <= ordinal <= last:
+        raise OverflowError("date out of range")
+    index = bisect.bisect_right(starts, ordinal) - 1
+    return index >= 0 and ordinal < ends[index]
+
+
+@functools.lru_cache(maxsize=None)
+def _ramadan_index() -> "tuple[int, int, list[int], list[int]]":
+    """Ordinals of the first and last supported date, and of the first days of Ramadan and of the
+    month after it in every supported year
+    """
+    from hijri_converter import Hijri, ummalqura
+
+    first = dt.date(*ummalqura.GREGORIAN_RANGE[0]).toordinal()
+    last = dt.date(*ummalqura.GREGORIAN_RANGE[1]).toordinal()
+    starts = []
+    ends = []
+    for year in range(ummalqura.HIJRI_RANGE[0][0], ummalqura.HIJRI_RANGE[1][0] + 1):
+        starts.append(Hijri(year, 9, 1).to_gregorian().toordinal())
+        ends.append(Hijri(year, 10, 1).to_gregorian().toordinal())
+    return first, last, starts, ends
+
+
 class GeneralMethod:
     def __init__(
         self,
         fajr_altitude_deg: float,
         isha_altitude_deg: float,
         asr_method: AsrMethod = AsrMethod.STANDARD,
+        solar: Callable[[float], "tuple[float, float]"] = None,
+        solver: Solver = Solver.JOINT,
+        precision: Precision = Precision.EXACT,
+        cache: "TimetableCache" = None,
     ):
         """General system to define a method using Fajr and Isha altitudes.
 
@@ -41,15 +181,40 @@ class GeneralMethod:
 
         Raises:
             ValueError: If asr_method is not of type AsrMethod
-
+            ValueError: If solar is given with a precision other than Precision.EXACT
+            ValueError: If solar is given with a cache
 
         Args:
             fajr_altitude_deg (float): Altitude of Sun for Fajr in degrees below horizon
             isha_altitude_deg (float): Altitude of Sun for Isha in degrees below horizon
             asr_method (AsrMethod, optional): Method to calculate Asr time. Defaults to
                 AsrMethod.STANDARD.
+            solar (Callable[[float], tuple[float, float]], optional): Function giving equation of
+                time (in seconds) and declination for epoch seconds, such as a
+                salat.ephemeris.Ephemeris. Defaults to salat.calculations.eot_decl_seconds.
+            solver (Solver, optional): Root finder used for the times of events. Defaults to
+                Solver.JOINT.
+            precision (Precision, optional): How accurately times are calculated. Precisions other
+                than Precision.EXACT bring their own solar function. Defaults to Precision.EXACT.
+            cache (TimetableCache, optional): Persistent cache of calculated times, such as a
+                salat.persistent.TimetableCache, which is consulted before calculating. Times are
+                calculated at the location rounded by the cache. Defaults to no cache.
         """
         self.asr_method = asr_method
+        self.solar = solar
+        self.solver = solver
+        self.precision = precision
+        self.cache = cache
+
+        if precision != Precision.EXACT and solar is not None:
+            raise ValueError(f"solar can not be used with {precision}")
+        # a solar function can not be identified across processes, so neither can its times
+        if cache is not None and solar is not None:
+            raise ValueError("solar can not be used with a cache")
+        if precision == Precision.TABLE:
+            from .chebyshev import eot_decl_chebyshev
+
+            self.solar = eot_decl_chebyshev
 
         if self.asr_method == AsrMethod.STANDARD:
             self.shadow_factor = 1
@@ -62,6 +227,17 @@ class GeneralMethod:
         self.isha_altitude = -math.radians(isha_altitude_deg)
         self.sunset_altitude = -math.radians(0.833)
 
+        # times of interest in the order they are calculated. Subclasses change how a time is
+        # defined by replacing its event, and an event can refer to the times before it
+        self.events = {
+            "fajr": Altitude(self.fajr_altitude, rising=True),
+            "sunrise": Altitude(self.sunset_altitude, rising=True),
+            "dhuhr": Zenith(),
+            "asr": ShadowFactor(self.shadow_factor, rising=False),
+            "maghrib": Altitude(self.sunset_altitude, rising=False),
+            "isha": Altitude(self.isha_altitude, rising=False),
+        }
+
     def calc_times(
         self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float
     ) -> "dict[str, dt.datetime]":
@@ -77,94 +253,552 @@ class GeneralMethod:
         Returns:
             dict[str, dt.datetime]: dictionary from time of interest (string) to time
         """
-        # use zenith as reference point for other calculations.
-        zenith = time_zenith(date, longitude)
-
-        fajr = time_altitude(zenith, self.fajr_altitude, latitude, True)
-        sunrise = time_altitude(zenith, self.sunset_altitude, latitude, True)
-        asr = time_shadow_factor(zenith, self.shadow_factor, latitude, False)
-        maghrib = time_altitude(zenith, self.sunset_altitude, latitude, False)
-        isha = time_altitude(zenith, self.isha_altitude, latitude, False)
-
-        times = {
-            "fajr": fajr,
-            "sunrise": sunrise,
-            "dhuhr": zenith,
-            "asr": asr,
-            "maghrib": maghrib,
-            "isha": isha,
-        }
+        times = self._cached_times_utc(date, longitude, latitude)
 
         for name in times:
-            times[name] = times[name].astimezone(timezone)
+            times[name] = to_datetime(times[name]).astimezone(timezone)
         return times
 
+    def calc_times_range(
+        self,
+        start: dt.date,
+        end: dt.date,
+        timezone: dt.tzinfo,
+        longitude: float,
+        latitude: float,
+    ) -> "dict[dt.date, dict[str, dt.datetime]]":
+        """Calculates prayer times for every date from start to end (inclusive).
+
+        The results are the same as calling calc_times for each date, but each day is seeded from
+        the previous one, whose zenith and events are only seconds away and whose last declination
+        sample is shared, so fewer evaluations of the solar function are needed per day.
 
-class TehranMethod(GeneralMethod):
-    """Uses Fajr angle 17.7 deg, Isha angle 14 deg, Maghrib angle 4.5"""
+        Args:
+            start (dt.date): First date to calculate the prayer times for
+            end (dt.date): Last date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
 
-    def __init__(self, asr_method: AsrMethod = AsrMethod.STANDARD):
-        super().__init__(17.7, 14, asr_method=asr_method)
+        Returns:
+            dict[dt.date, dict[str, dt.datetime]]: dictionary from date to the output of calc_times
+                for that date
+        """
+        return dict(self.iter_times(start, end, timezone, longitude, latitude))
 
-    def calc_times(self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float):
-        times = super().calc_times(date, timezone, longitude, latitude)
+    def iter_times(
+        self,
+        start: dt.date,
+        end: "dt.date | None",
+        timezone: dt.tzinfo,
+        longitude: float,
+        latitude: float,
+    ) -> "Iterator[tuple[dt.date, dict[str, dt.datetime]]]":
+        """Lazily calculates prayer times for every date from start to end (inclusive).
+
+        This is the same as calc_times_range, except that each day is only calculated when it is
+        requested, so memory use does not depend on the length of the span. Stop early by breaking
+        out of the loop or calling close() on the generator.
 
-        # maghrib time is different
-        zenith = time_zenith(date, longitude)
-        magrib_altitude = -math.radians(4.5)
-        times["maghrib"] = time_altitude(zenith, magrib_altitude, latitude, rising=False).astimezone(timezone)
+        Args:
+            start (dt.date): First date to calculate the prayer times for
+            end (dt.date | None): Last date to calculate the prayer times for. If None, dates are
+                generated without end
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Yields:
+            tuple[dt.date, dict[str, dt.datetime]]: date and the output of calc_times for that date
+        """
+        # the days share a few UTC offsets, which are looked up once instead of for every time
+        transitions = OffsetTransitions(timezone)
+        for date, times in self._iter_times_utc(start, end, longitude, latitude):
+            yield date, transitions.to_datetimes(times)
 
+    def calc_day_times(
+        self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float
+    ) -> DayTimes:
+        """Same as calc_times, except the times are returned as a compact DayTimes record.
+
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the datetimes created on access
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            DayTimes: prayer times as epoch seconds
+        """
+        times = self._cached_times_utc(date, longitude, latitude)
+        seconds = [round(time) for time in times.values()]
+        return DayTimes(date, longitude, latitude, timezone, tuple(times), seconds)
+
+    def calc_times_table(
+        self,
+        start: dt.date,
+        end: dt.date,
+        timezone: dt.tzinfo,
+        locations: "Iterable[tuple[float, float]]",
+    ) -> TimesTable:
+        """Calculates prayer times for every date from start to end (inclusive) at every location
+        into a compact TimesTable.
+
+        Rows are ordered by location, then by date. Days on which the Sun does not reach an
+        altitude the method needs are MISSING instead of raising.
+
+        Args:
+            start (dt.date): First date to calculate the prayer times for
+            end (dt.date): Last date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the datetimes created on access
+            locations (Iterable[tuple[float, float]]): Longitude in degrees East and latitude in
+                degrees North of every location
+
+        Returns:
+            TimesTable: prayer times as columns of epoch seconds
+        """
+
+        def rows():
+            for longitude, latitude in locations:
+                days = self._iter_times_utc(start, end, longitude, latitude, errors=True)
+                for date, times in days:
+                    seconds = None if isinstance(times, ValueError) else times.values()
+                    yield longitude, latitude, date, seconds
+
+        return TimesTable.from_rows(tuple(self.events), timezone, rows())
+
+    def _iter_times_utc(
+        self,
+        start: dt.date,
+        end: "dt.date | None",
+        longitude: float,
+        latitude: float,
+        errors: bool = False,
+    ) -> "Iterator[tuple[dt.date, dict[str, float] | ValueError]]":
+        """Lazily calculates prayer times as epoch seconds for every date from start to end
+        (inclusive), seeding each day with the previous one.
+
+        Args:
+            start (dt.date): First date to calculate the prayer times for
+            end (dt.date | None): Last date to calculate the prayer times for, or None for no end
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+            errors (bool, optional): Whether to yield the ValueError of dates on which the Sun
+                does not reach an altitude instead of raising it. Defaults to False.
+
+        Yields:
+            tuple[dt.date, dict[str, float] | ValueError]: date and the output of _calc_times_utc
+                for that date, or its error
+        """
+        if self.cache is not None:
+            yield from self._iter_times_utc_cached(start, end, longitude, latitude, errors)
+            return
+
+        days = itertools.count() if end is None else range((end - start).days + 1)
+
+        previous = None
+        for day in days:
+            date = start + dt.timedelta(days=day)
+            try:
+                previous, times = self._calc_day_utc(date, longitude, latitude, previous)
+            except ValueError as error:
+                if not errors:
+                    raise
+                # the next day can not be seeded
+                previous = None
+                yield date, error
+                continue
+            yield date, times
+
+    def _iter_times_utc_cached(
+        self,
+        start: dt.date,
+        end: "dt.date | None",
+        longitude: float,
+        latitude: float,
+        errors: bool = False,
+    ) -> "Iterator[tuple[dt.date, dict[str, float] | ValueError]]":
+        """Same as _iter_times_utc, reading chunks of days from the cache at once, and calculating
+        and storing the missing days of a chunk in one transaction
+        """
+        key = self._cache_key()
+        names = tuple(self.events)
+        longitude, latitude = self.cache.round_location(longitude, latitude)
+
+        chunk_start = start
+        previous = None
+        while end is None or chunk_start <= end:
+            chunk_end = chunk_start + dt.timedelta(days=CACHE_CHUNK_DAYS - 1)
+            if end is not None:
+                chunk_end = min(chunk_end, end)
+            cached = self.cache.get_range(key, names, longitude, latitude, chunk_start, chunk_end)
+
+            calculated = []
+            try:
+                for day in range((chunk_end - chunk_start).days + 1):
+                    date = chunk_start + dt.timedelta(days=day)
+                    times = cached.get(date)
+                    if times is None:
+                        try:
+                            previous, times = self._calc_day_utc(
+                                date, longitude, latitude, previous
+                            )
+                        except ValueError as error:
+                            times = error
+                        calculated.append((date, times))
+                    else:
+                        # days read from the cache have no solar context to seed the next one
+                        previous = None
+
+                    if isinstance(times, ValueError):
+                        if not errors:
+                            raise times
+                        # the next day can not be seeded
+                        previous = None
+                    yield date, times
+            finally:
+                # also stores the days calculated before an error or the generator being closed
+                if calculated:
+                    self.cache.put_many(key, names, longitude, latitude, calculated)
+            chunk_start = chunk_end + dt.timedelta(days=1)
+
+    def _cached_times_utc(
+        self, date: dt.date, longitude: float, latitude: float
+    ) -> "dict[str, float]":
+        """Same as _calc_times_utc, consulting the cache first if there is one"""
+        if self.cache is None:
+            return self._calc_times_utc(date, longitude, latitude)
+        days = self._iter_times_utc_cached(date, date, longitude, latitude)
+        _, times = next(days)
+        days.close()
         return times
 
+    def _cache_key(self) -> str:
+        """Identifies everything besides location and date that the calculated times depend on"""
+        events = ", ".join(f"{name}={event!r}" for name, event in self.events.items())
+        return f"{events}; {self.solver.name}; {self.precision.name}"
 
-class JafariMethod(GeneralMethod):
-    """Uses Fajr angle 16 deg, Isha angle 14 deg, Maghrib angle 4 deg"""
+    def calc_times_batch(
+        self, date: dt.date, longitudes: "Sequence[float]", latitudes: "Sequence[float]"
+    ) -> "dict[str, np.ndarray]":
+        """Calculates prayer times for many locations on one date.
 
-    def __init__(self, asr_method: AsrMethod = AsrMethod.STANDARD):
-        super().__init__(16, 14, asr_method=asr_method)
+        Equation of time and declination only depend on the time, so they are tabulated once for
+        the date from the solar function of the method and shared by all locations, which are then
+        solved together with NumPy. Requires the optional numpy dependency.
 
-    def calc_times(self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float):
-        times = super().calc_times(date, timezone, longitude, latitude)
+        Methods with Precision.FAST or a cache are calculated location by location instead, with
+        the same times as calc_times. Either way only the times the Sun does not reach are NaN,
+        along with the times after them.
 
-        # maghrib time is different
-        zenith = time_zenith(date, longitude)
-        magrib_altitude = -math.radians(4)
-        times["maghrib"] = time_altitude(zenith, magrib_altitude, latitude, rising=False).astimezone(timezone)
+        Args:
+            date (dt.date): Date to calculate the prayer times for. This centers dhuhr on the date
+                and the other prayer times are calculated surrounding it.
+            longitudes (Sequence[float]): Longitudes of positions in degrees East
+            latitudes (Sequence[float]): Latitudes of positions in degrees North, same length as
+                longitudes
 
+        Returns:
+            dict[str, np.ndarray]: dictionary from time of interest (string) to array of UTC epoch
+                seconds, one per location. Times the Sun does not reach are NaN
+        """
+        from .vectorized import np, eot_decl_interpolator
+
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        if longitudes.shape != latitudes.shape:
+            raise ValueError("longitudes and latitudes need to be the same shape")
+
+        # the series of FAST have no array equivalent, and a cache is keyed by single locations
+        if self.precision == Precision.FAST or self.cache is not None:
+            return self._calc_times_batch_each(date, longitudes, latitudes)
+
+        # every time of interest is within a day of the zenith, which is within half a day of the
+        # utc noon of the date
+        midnight = dt.datetime(date.year, date.month, date.day, tzinfo=dt.timezone.utc).timestamp()
+        solar = eot_decl_interpolator(
+            midnight - 24 * 60 * 60, midnight + 2 * 24 * 60 * 60, solar=self._solar_array()
+        )
+
+        return self._calc_times_batch_utc(date, longitudes, latitudes, solar)
+
+    def _solar_array(self) -> "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]] | None":
+        """Array equivalent of the solar function of the method, or None for eot_decl_array"""
+        from .vectorized import np
+
+        if self.solar is None:
+            return None
+        # such as salat.ephemeris.Ephemeris
+        solar_array = getattr(self.solar, "eot_decl_array", None)
+        if solar_array is not None:
+            return solar_array
+        if self.precision == Precision.TABLE:
+            from .chebyshev import eot_decl_chebyshev_array
+
+            return eot_decl_chebyshev_array
+
+        def tabulate(seconds: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+            # only a few hundred samples of a date are tabulated, so evaluating them one by one
+            # costs little
+            values = [self.solar(float(second)) for second in seconds]
+            return np.array([eot for eot, _ in values]), np.array([decl for _, decl in values])
+
+        return tabulate
+
+    def _calc_times_batch_each(
+        self, date: dt.date, longitudes: "np.ndarray", latitudes: "np.ndarray"
+    ) -> "dict[str, np.ndarray]":
+        """Same as calc_times_batch, calculating every location with _cached_times_utc"""
+        from .vectorized import np
+
+        times = {name: np.full(longitudes.shape, np.nan) for name in self.events}
+        for index in np.ndindex(longitudes.shape):
+            longitude, latitude = float(longitudes[index]), float(latitudes[index])
+            try:
+                location_times = self._cached_times_utc(date, longitude, latitude)
+            except ValueError:
+                location_times = self._calc_events_utc(date, longitude, latitude)
+            for name, seconds in location_times.items():
+                times[name][index] = seconds
         return times
 
+    def _calc_events_utc(
+        self, date: dt.date, longitude: float, latitude: float
+    ) -> "dict[str, float]":
+        """Same as _calc_times_utc, with NaN for the events the Sun does not reach instead of
+        raising, like the times of calc_times_batch
+        """
+        day = self._solar_day(date, longitude)
+        times = {}
+        for name, event in self.events.items():
+            try:
+                times[name] = event.solve(day, latitude, times)
+            except ValueError:
+                times[name] = math.nan
+        return times
 
-class MakkahMethod(GeneralMethod):
-    """Uses Fajr angle 18.5 deg, Isha 90 minutes after Maghrib in general and
-    120 during Ramadan.
+    def _calc_times_batch_utc(
+        self,
+        date: dt.date,
+        longitudes: "np.ndarray",
+        latitudes: "np.ndarray",
+        solar: "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]",
+    ) -> "dict[str, np.ndarray]":
+        """Array equivalent of _calc_times_utc.
 
-    Note that Ramadan is calculated with additional dependency hijri-converter
-    """
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            longitudes (np.ndarray): Longitudes of positions in degrees East
+            latitudes (np.ndarray): Latitudes of positions in degrees North
+            solar (Callable): Function giving equation of time and declination for epoch seconds
 
-    def __init__(self, asr_method: AsrMethod = AsrMethod.STANDARD):
-        try:
-            import hijri_converter
-        except ImportError:
-            raise ImportError("Install hijri-converter to use MakkahMethod")
+        Returns:
+            dict[str, np.ndarray]: dictionary from time of interest (string) to UTC epoch seconds
+        """
+        from .vectorized import time_zenith_array
 
-        # Isha angle not used, so use Fajr angle as substitute
-        super().__init__(18.5, 18.5, asr_method=asr_method)
+        zenith = time_zenith_array(date, longitudes, solar)
 
-    def calc_times(self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float):
-        from hijri_converter import Gregorian
+        times = {}
+        for name, event in self.events.items():
+            times[name] = event.solve_array(date, zenith, latitudes, solar, times)
+        return times
 
-        times = super().calc_times(date, timezone, longitude, latitude)
+    def _calc_times_utc(
+        self, date: dt.date, longitude: float, latitude: float
+    ) -> "dict[str, float]":
+        """Calculates prayer times as epoch seconds.
 
-        hijri_date = Gregorian(date.year, date.month, date.day).to_hijri()
-        if hijri_date.month == 9:
-            times["isha"] = times["maghrib"] + dt.timedelta(minutes=120)
-        else:
-            times["isha"] = times["maghrib"] + dt.timedelta(minutes=90)
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
 
+        Returns:
+            dict[str, float]: dictionary from time of interest (string) to epoch seconds
+        """
+        _, times = self._calc_day_utc(date, longitude, latitude)
         return times
 
+    def _calc_day_utc(
+        self,
+        date: dt.date,
+        longitude: float,
+        latitude: float,
+        previous: "SolarDay | None" = None,
+    ) -> "tuple[SolarDay, dict[str, float]]":
+        """Same as _calc_times_utc, seeded from the previous date and also returning the solar
+        context of the date, which seeds the next one.
 
-def PrayerTimes(method=CalculationMethod.MWL, asr=AsrMethod.STANDARD) -> GeneralMethod:
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+            previous (SolarDay, optional): Solar context of the previous date, whose zenith,
+                events and declination seed this date's
+
+        Returns:
+            SolarDay: solar context of the date
+            dict[str, float]: dictionary from time of interest (string) to epoch seconds
+        """
+        recorder = active_recorder.get()
+        if recorder is not None:
+            return self._calc_times_utc_instrumented(recorder, date, longitude, latitude, previous)
+
+        # use zenith as reference point for other calculations.
+        day = self._solar_day(date, longitude, previous)
+
+        times = {}
+        for name, event in self.events.items():
+            times[name] = event.solve(day, latitude, times)
+        return day, times
+
+    def _solar_day(
+        self, date: dt.date, longitude: float, previous: "SolarDay | None" = None
+    ) -> SolarDay:
+        """Creates the solar context of a date at a longitude for the precision of the method"""
+        if self.precision == Precision.FAST:
+            return ApproximateSolarDay(date, longitude)
+        return SolarDay(date, longitude, self.solar, solver=self.solver, previous=previous)
+
+    def _calc_times_utc_instrumented(
+        self,
+        recorder,
+        date: dt.date,
+        longitude: float,
+        latitude: float,
+        previous: "SolarDay | None" = None,
+    ) -> "tuple[SolarDay, dict[str, float]]":
+        """Same as _calc_day_utc, recording a salat.instrumentation.Sample of every event"""
+        # solving the zenith is counted towards the zenith events
+        iterations = recorder.iterations
+        start = time.perf_counter()
+        day = self._solar_day(date, longitude, previous)
+        zenith_seconds = time.perf_counter() - start
+        zenith_iterations = recorder.iterations - iterations
+        zenith_solar_calls = day.solar_calls
+
+        times = {}
+        for name, event in self.events.items():
+            iterations = recorder.iterations
+            solar_calls = day.solar_calls
+            start = time.perf_counter()
+            failed = True
+            try:
+                times[name] = event.solve(day, latitude, times)
+                failed = False
+            finally:
+                sample = Sample(
+                    name,
+                    date,
+                    longitude,
+                    latitude,
+                    recorder.iterations - iterations,
+                    day.solar_calls - solar_calls,
+                    time.perf_counter() - start,
+                    failed,
+                )
+                if isinstance(event, Zenith):
+                    sample = sample._replace(
+                        iterations=sample.iterations + zenith_iterations,
+                        solar_calls=sample.solar_calls + zenith_solar_calls,
+                        seconds=sample.seconds + zenith_seconds,
+                    )
+                recorder.record(sample)
+        return day, times
+
+
+class TehranMethod(GeneralMethod):
+    """Uses Fajr angle 17.7 deg, Isha angle 14 deg, Maghrib angle 4.5"""
+
+    def __init__(
+        self,
+        asr_method: AsrMethod = AsrMethod.STANDARD,
+        solar=None,
+        solver=Solver.JOINT,
+        precision=Precision.EXACT,
+        cache=None,
+    ):
+        super().__init__(
+            17.7,
+            14,
+            asr_method=asr_method,
+            solar=solar,
+            solver=solver,
+            precision=precision,
+            cache=cache,
+        )
+
+        # maghrib time is different
+        self.events["maghrib"] = Altitude(-math.radians(4.5), rising=False)
+
+
+class JafariMethod(GeneralMethod):
+    """Uses Fajr angle 16 deg, Isha angle 14 deg, Maghrib angle 4 deg"""
+
+    def __init__(
+        self,
+        asr_method: AsrMethod = AsrMethod.STANDARD,
+        solar=None,
+        solver=Solver.JOINT,
+        precision=Precision.EXACT,
+        cache=None,
+    ):
+        super().__init__(
+            16,
+            14,
+            asr_method=asr_method,
+            solar=solar,
+            solver=solver,
+            precision=precision,
+            cache=cache,
+        )
+
+        # maghrib time is different
+        self.events["maghrib"] = Altitude(-math.radians(4), rising=False)
+
+
+class MakkahMethod(GeneralMethod):
+    """Uses Fajr angle 18.5 deg, Isha 90 minutes after Maghrib in general and
+    120 during Ramadan.
+
+    Note that Ramadan is calculated with additional dependency hijri-converter
+    """
+
+    def __init__(
+        self,
+        asr_method: AsrMethod = AsrMethod.STANDARD,
+        solar=None,
+        solver=Solver.JOINT,
+        precision=Precision.EXACT,
+        cache=None,
+    ):
+        # the calendar is only imported once a Ramadan lookup is needed
+        if importlib.util.find_spec("hijri_converter") is None:
+            raise ImportError("Install hijri-converter to use MakkahMethod")
+
+        # Isha angle not used, so use Fajr angle as substitute
+        super().__init__(
+            18.5,
+            18.5,
+            asr_method=asr_method,
+            solar=solar,
+            solver=solver,
+            precision=precision,
+            cache=cache,
+        )
+
+        self.events["isha"] = MinutesAfter("maghrib", 90, ramadan_minutes=120)
+
+
+def PrayerTimes(
+    method=CalculationMethod.MWL,
+    asr=AsrMethod.STANDARD,
+    solar=None,
+    solver=Solver.JOINT,
+    precision=Precision.EXACT,
+    cache=None,
+) -> GeneralMethod:
     """Generates an object that can be used to generate prayer times.
 
     Args:
@@ -172,26 +806,111 @@ def PrayerTimes(method=CalculationMethod.MWL, asr=AsrMethod.STANDARD) -> General
             Defaults to CalculationMethod.MWL.
         asr (AsrMethod): Method to determine Asr time. Defaults to
             AsrMethod.STANDARD.
+        solar (Callable[[float], tuple[float, float]], optional): Function giving equation of
+            time (in seconds) and declination for epoch seconds, such as a
+            salat.ephemeris.Ephemeris. Defaults to salat.calculations.eot_decl_seconds.
+        solver (Solver, optional): Root finder used for the times of events. Defaults to
+            Solver.JOINT.
+        precision (Precision, optional): How accurately times are calculated. Defaults to
+            Precision.EXACT.
+        cache (TimetableCache, optional): Persistent cache of calculated times, such as a
+            salat.persistent.TimetableCache. Defaults to no cache.
 
     Raises:
         ValueError: If asr_method is not of type AsrMethod
+        ValueError: If solar is given with a precision other than Precision.EXACT
+        ValueError: If solar is given with a cache
 
     Returns:
         GeneralMethod: Class that you can use to calculate prayer times
     """
     if method == CalculationMethod.ISNA:
-        return GeneralMethod(15, 15, asr)
+        return GeneralMethod(15, 15, asr, solar, solver, precision, cache)
     elif method == CalculationMethod.MWL:
-        return GeneralMethod(18, 17, asr)
+        return GeneralMethod(18, 17, asr, solar, solver, precision, cache)
     elif method == CalculationMethod.EGYPT:
-        return GeneralMethod(19.5, 17.5, asr)
+        return GeneralMethod(19.5, 17.5, asr, solar, solver, precision, cache)
     elif method == CalculationMethod.KARACHI:
-        return GeneralMethod(18, 18, asr)
+        return GeneralMethod(18, 18, asr, solar, solver, precision, cache)
     elif method == CalculationMethod.TEHRAN:
-        return TehranMethod(asr)
+        return TehranMethod(asr, solar, solver, precision, cache)
     elif method == CalculationMethod.JAFARI:
-        return JafariMethod(asr)
+        return JafariMethod(asr, solar, solver, precision, cache)
     elif method == CalculationMethod.MAKKAH:
-        return MakkahMethod(asr)
+        return MakkahMethod(asr, solar, solver, precision, cache)
     else:
         raise ValueError(f"Unknown CalculationMethod {method}")
+
+
+def calc_times_methods(
+    methods: "dict[Hashable, GeneralMethod]",
+    date: dt.date,
+    timezone: dt.tzinfo,
+    longitude: float,
+    latitude: float,
+) -> "dict[Hashable, dict[str, dt.datetime]]":
+    """Calculates prayer times of several methods at once, for showing them side by side.
+
+    Methods mostly differ only in the altitudes of Fajr and Isha, so every distinct event (the
+    zenith, an altitude, a shadow factor) is solved once and its time shared by all methods that
+    use it. Methods only share times if they also share solar function, solver and precision.
+    Methods with a cache are calculated with their own calc_times instead, which reads the times of
+    the location rounded by the cache from it, or calculates and stores them. So the results are
+    the same as calling calc_times of every method. Solves of this shared pass are not recorded by
+    salat.instrumentation.
+
+        methods = {
+            (method, asr): salat.PrayerTimes(method, asr)
+            for method in salat.CalculationMethod
+            for asr in salat.AsrMethod
+        }
+        times = salat.calc_times_methods(methods, date, timezone, longitude, latitude)
+
+    Raises:
+        ValueError: If the Sun does not reach an altitude needed by one of the methods on the date
+
+    Args:
+        methods (dict[Hashable, GeneralMethod]): dictionary from any key to a method
+        date (dt.date): Date to calculate the prayer times for
+        timezone (dt.tzinfo): Timezone of the output datetimes
+        longitude (float): Longitude of position in degrees East
+        latitude (float): Latitude of position in degrees North
+
+    Returns:
+        dict[Hashable, dict[str, dt.datetime]]: dictionary from the keys of methods to the output
+            of calc_times of that method
+    """
+    # solar context of every combination of solar function, solver and precision
+    days = {}
+    # solved and converted time of every distinct event in a solar context
+    solved = {}
+
+    results = {}
+    for key, method in methods.items():
+        if method.cache is not None:
+            results[key] = method.calc_times(date, timezone, longitude, latitude)
+            continue
+
+        context = (id(method.solar), method.solver, method.precision)
+        day = days.get(context)
+        if day is None:
+            day = days[context] = method._solar_day(date, longitude)
+
+        times = {}
+        event_keys = {}
+        for name, event in method.events.items():
+            # events referring to another time depend on how that time is defined
+            if isinstance(event, MinutesAfter):
+                event_key = (context, event, event_keys[event.reference])
+            else:
+                # events of different types can have equal fields, which compare equal
+                event_key = (context, type(event), event)
+            event_keys[name] = event_key
+
+            if event_key not in solved:
+                seconds = event.solve(day, latitude, times)
+                solved[event_key] = seconds, to_datetime(seconds).astimezone(timezone)
+            times[name] = solved[event_key][0]
+
+        results[key] = {name: solved[event_keys[name]][1] for name in times}
+    return results
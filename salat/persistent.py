@@ -0,0 +1,237 @@
+"""Persistent cache of calculated prayer times in a SQLite file.
+
+Calculated times only depend on the method, the location and the date, so they can be kept across
+restarts of a process. A TimetableCache stores the times of every calculated day as UTC epoch
+seconds in a local SQLite database, and a method configured with one looks days up there before
+calculating them:
+
+    cache = salat.persistent.TimetableCache("times.sqlite")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=cache)
+    pt.calc_times_range(start, end, timezone, longitude, latitude)  # calculated and stored
+    pt.calc_times_range(start, end, timezone, longitude, latitude)  # read in one query
+
+Locations are rounded to a number of decimal places (by default 4, about 10 meters, which moves
+the times by less than a tenth of a second), and the times are calculated at the rounded location,
+so nearby requests share entries. Days on which the Sun does not reach an altitude are stored too,
+and raise the same ValueError when read.
+
+The file records the version of the package and a hash of the source of the modules that calculate
+the times, and is cleared when opened by a version that calculates them differently.
+"""
+from array import array
+from typing import Iterable
+import datetime as dt
+import functools
+import hashlib
+import importlib.metadata
+import os
+import sqlite3
+import threading
+
+
+DEFAULT_DIGITS = 4
+
+# modules of the package whose source determines the calculated times
+ALGORITHM_MODULES = (
+    "approximate.py",
+    "calculations.py",
+    "chebyshev.py",
+    "_chebyshev_data.py",
+    "methods.py",
+)
+
+# seconds to wait for another process to finish writing before failing
+LOCK_TIMEOUT_SECONDS = 30
+
+
+@functools.lru_cache(maxsize=None)
+def algorithm_version() -> str:
+    """Identifies the package version and the source of the modules calculating times.
+
+    Returns:
+        str: hexadecimal hash, which changes whenever calculated times might change
+    """
+    try:
+        version = importlib.metadata.version("salat")
+    except importlib.metadata.PackageNotFoundError:
+        # running from a source checkout, where the hash of the sources still applies
+        version = "unknown"
+
+    digest = hashlib.sha256(version.encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in ALGORITHM_MODULES:
+        with open(os.path.join(directory, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class TimetableCache:
+    def __init__(self, path: str, digits: int = DEFAULT_DIGITS):
+        """SQLite file of calculated prayer times, keyed by method, rounded location and date.
+
+        The cache can be shared by several methods, threads (each uses its own connection) and
+        processes (SQLite locks the file while writing). It is picklable, and reopens the file
+        after unpickling, so methods using it can be sent to process pools.
+
+        Raises:
+            ValueError: If digits is negative
+
+        Args:
+            path (str): Path of the SQLite file, which is created if it does not exist
+            digits (int, optional): Decimal places longitudes and latitudes are rounded to.
+                Defaults to 4.
+        """
+        if digits < 0:
+            raise ValueError("digits can not be negative")
+
+        self.path = path
+        self.digits = digits
+        self._local = threading.local()
+
+        # checks the version once up front, instead of in every thread
+        self._connection()
+
+    def round_location(self, longitude: float, latitude: float) -> "tuple[float, float]":
+        """Rounds a location to the precision of the cache.
+
+        Args:
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            tuple[float, float]: rounded longitude and latitude
+        """
+        return round(longitude, self.digits), round(latitude, self.digits)
+
+    def get_range(
+        self,
+        method: str,
+        names: "tuple[str, ...]",
+        longitude: float,
+        latitude: float,
+        start: dt.date,
+        end: dt.date,
+    ) -> "dict[dt.date, dict[str, float] | ValueError]":
+        """Reads the stored days of a location from start to end (inclusive) in one query.
+
+        Args:
+            method (str): Key of the calculation method
+            names (tuple[str, ...]): Names of the times of interest of the method, in order
+            longitude (float): Longitude of position in degrees East, rounded with round_location
+            latitude (float): Latitude of position in degrees North, rounded with round_location
+            start (dt.date): First date to read
+            end (dt.date): Last date to read
+
+        Returns:
+            dict[dt.date, dict[str, float] | ValueError]: dictionary from stored date to its times
+                as epoch seconds, or the error calculating them
+        """
+        rows = self._connection().execute(
+            "SELECT ordinal, seconds, error FROM times"
+            " WHERE method = ? AND longitude = ? AND latitude = ? AND ordinal BETWEEN ? AND ?",
+            (
+                method,
+                self._scale(longitude),
+                self._scale(latitude),
+                start.toordinal(),
+                end.toordinal(),
+            ),
+        )
+
+        days = {}
+        for ordinal, seconds, error in rows:
+            date = dt.date.fromordinal(ordinal)
+            if error is not None:
+                days[date] = ValueError(error)
+            else:
+                days[date] = dict(zip(names, array("d", seconds)))
+        return days
+
+    def put_many(
+        self,
+        method: str,
+        names: "tuple[str, ...]",
+        longitude: float,
+        latitude: float,
+        days: "Iterable[tuple[dt.date, dict[str, float] | ValueError]]",
+    ):
+        """Stores the times of several days of a location in one transaction.
+
+        Args:
+            method (str): Key of the calculation method
+            names (tuple[str, ...]): Names of the times of interest of the method, in order
+            longitude (float): Longitude of position in degrees East, rounded with round_location
+            latitude (float): Latitude of position in degrees North, rounded with round_location
+            days (Iterable[tuple[dt.date, dict[str, float] | ValueError]]): dates and their times
+                as epoch seconds, or the error calculating them
+        """
+        longitude = self._scale(longitude)
+        latitude = self._scale(latitude)
+        rows = []
+        for date, times in days:
+            if isinstance(times, ValueError):
+                seconds, error = None, str(times)
+            else:
+                seconds, error = array("d", [times[name] for name in names]).tobytes(), None
+            rows.append((method, longitude, latitude, date.toordinal(), seconds, error))
+
+        with self._connection() as connection:
+            connection.executemany("INSERT OR REPLACE INTO times VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def clear(self):
+        """Removes all stored times"""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM times")
+
+    def close(self):
+        """Closes the connection of the current thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        return {"path": self.path, "digits": self.digits}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self.digits = state["digits"]
+        self._local = threading.local()
+
+    def _scale(self, coordinate: float) -> int:
+        """Exact integer key of a rounded coordinate"""
+        return round(coordinate * 10 ** self.digits)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread, opening the file the first time"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT_SECONDS)
+            self._prepare(connection)
+            self._local.connection = connection
+        return connection
+
+    def _prepare(self, connection: sqlite3.Connection):
+        """Creates the tables, and clears them if they were written by another algorithm version
+        or with other digits
+        """
+        version = f"{algorithm_version()}:{self.digits}"
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS times ("
+                "method TEXT, longitude INTEGER, latitude INTEGER, ordinal INTEGER, seconds BLOB, "
+                "error TEXT, PRIMARY KEY (method, longitude, latitude, ordinal)) WITHOUT ROWID"
+            )
+            stored = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if stored is None or stored[0] != version:
+                connection.execute("DELETE FROM times")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,)
+                )
@@ -0,0 +1,249 @@
+"""Compact representations of calculated prayer times.
+
+calc_times returns a dictionary of timezone aware datetimes, which is convenient but costs several
+Python objects per time. For many days or locations the types here store the times as integer epoch
+seconds (rounded to the nearest second) instead, and only create datetimes when they are accessed:
+
+- DayTimes holds the times of one day in a record with __slots__
+- TimesTable holds the times of many days and locations in one array of 64 bit integers, with a
+  column per time of interest, which can be viewed as a NumPy array with to_numpy or np.asarray,
+  or handed to other libraries without copying through its data array. On Python 3.12 and later
+  the table itself also supports the buffer protocol, so memoryview(table) works too
+"""
+from array import array
+from typing import Iterable, Iterator, Sequence
+import datetime as dt
+
+
+# epoch seconds of times that could not be calculated, because the Sun does not reach an altitude
+MISSING = -(2 ** 63)
+
+
+def _to_datetime(seconds: int, timezone: dt.tzinfo) -> "dt.datetime | None":
+    if seconds == MISSING:
+        return None
+    return dt.datetime.fromtimestamp(seconds, timezone)
+
+
+class DayTimes:
+    __slots__ = ("date", "longitude", "latitude", "timezone", "names", "seconds")
+
+    def __init__(
+        self,
+        date: dt.date,
+        longitude: float,
+        latitude: float,
+        timezone: dt.tzinfo,
+        names: "tuple[str, ...]",
+        seconds: "Sequence[int]",
+    ):
+        """Prayer times of one day at one location, as epoch seconds.
+
+        Times are looked up by name like the output of calc_times, either as items or attributes,
+        and converted to datetimes in timezone on access. Times that could not be calculated are
+        None.
+
+        Args:
+            date (dt.date): Date of the prayer times
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+            timezone (dt.tzinfo): Timezone of the datetimes
+            names (tuple[str, ...]): Names of the times of interest
+            seconds (Sequence[int]): Epoch seconds of every time of interest, or MISSING
+        """
+        self.date = date
+        self.longitude = longitude
+        self.latitude = latitude
+        self.timezone = timezone
+        self.names = names
+        self.seconds = tuple(seconds)
+
+    def __getitem__(self, name: str) -> "dt.datetime | None":
+        try:
+            index = self.names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        return _to_datetime(self.seconds[index], self.timezone)
+
+    def __getattr__(self, name: str) -> "dt.datetime | None":
+        # only called for names that are not set. Slots and special names are looked up while
+        # copying or unpickling, before the names of the times are set
+        if name in DayTimes.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def keys(self) -> "tuple[str, ...]":
+        return self.names
+
+    def items(self) -> "Iterator[tuple[str, dt.datetime | None]]":
+        for name, seconds in zip(self.names, self.seconds):
+            yield name, _to_datetime(seconds, self.timezone)
+
+    def to_dict(self) -> "dict[str, dt.datetime | None]":
+        """Converts the times to a dictionary like the output of calc_times"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return (
+            f"DayTimes(date={self.date!r}, longitude={self.longitude!r}, "
+            f"latitude={self.latitude!r}, {dict(zip(self.names, self.seconds))!r})"
+        )
+
+
+class TimesTable:
+    __slots__ = ("names", "timezone", "longitudes", "latitudes", "ordinals", "data")
+
+    def __init__(
+        self,
+        names: "tuple[str, ...]",
+        timezone: dt.tzinfo,
+        longitudes: array,
+        latitudes: array,
+        ordinals: array,
+        data: array,
+    ):
+        """Prayer times of many days and locations, as columns of epoch seconds.
+
+        Every row is one date at one location. The times are stored in data column after column,
+        so the times of interest are contiguous and the table is a two dimensional buffer with a
+        row per name and a column per row of the table.
+
+        Raises:
+            ValueError: If the arrays do not have matching lengths
+
+        Args:
+            names (tuple[str, ...]): Names of the times of interest
+            timezone (dt.tzinfo): Timezone of the datetimes created on access
+            longitudes (array): Longitude of every row, array of doubles
+            latitudes (array): Latitude of every row, array of doubles
+            ordinals (array): Proleptic Gregorian ordinal of the date of every row, array of 64 bit
+                integers
+            data (array): Epoch seconds of every time of interest of every row, or MISSING, array
+                of 64 bit integers of length len(names) * len(ordinals)
+        """
+        rows = len(ordinals)
+        if len(longitudes) != rows or len(latitudes) != rows or len(data) != len(names) * rows:
+            raise ValueError("arrays need to have matching lengths")
+
+        self.names = names
+        self.timezone = timezone
+        self.longitudes = longitudes
+        self.latitudes = latitudes
+        self.ordinals = ordinals
+        self.data = data
+
+    @classmethod
+    def from_rows(
+        cls,
+        names: "tuple[str, ...]",
+        timezone: dt.tzinfo,
+        rows: "Iterable[tuple[float, float, dt.date, Sequence[float] | None]]",
+    ) -> "TimesTable":
+        """Builds a table from rows of epoch seconds.
+
+        Args:
+            names (tuple[str, ...]): Names of the times of interest
+            timezone (dt.tzinfo): Timezone of the datetimes created on access
+            rows (Iterable[tuple[float, float, dt.date, Sequence[float] | None]]): Longitude,
+                latitude, date and epoch seconds of every time of interest (or None if they could
+                not be calculated) of every row
+
+        Returns:
+            TimesTable: table of the rows
+        """
+        longitudes = array("d")
+        latitudes = array("d")
+        ordinals = array("q")
+        columns = [array("q") for _ in names]
+        for longitude, latitude, date, seconds in rows:
+            longitudes.append(longitude)
+            latitudes.append(latitude)
+            ordinals.append(date.toordinal())
+            if seconds is None:
+                for column in columns:
+                    column.append(MISSING)
+            else:
+                for column, time in zip(columns, seconds):
+                    column.append(round(time))
+
+        data = array("q")
+        for column in columns:
+            data.extend(column)
+        return cls(names, timezone, longitudes, latitudes, ordinals, data)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __getitem__(self, row: int) -> DayTimes:
+        """Returns the times of a row as a DayTimes record"""
+        rows = len(self)
+        if row < 0:
+            row += rows
+        if not 0 <= row < rows:
+            raise IndexError("row out of range")
+        return DayTimes(
+            dt.date.fromordinal(self.ordinals[row]),
+            self.longitudes[row],
+            self.latitudes[row],
+            self.timezone,
+            self.names,
+            self.data[row::rows],
+        )
+
+    def __iter__(self) -> Iterator[DayTimes]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def column(self, name: str) -> memoryview:
+        """Returns the epoch seconds of a time of interest for every row, without copying.
+
+        Raises:
+            KeyError: If there is no time of interest with the name
+
+        Args:
+            name (str): Name of the time of interest
+
+        Returns:
+            memoryview: 64 bit integer epoch seconds, MISSING where they could not be calculated
+        """
+        try:
+            index = self.names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        rows = len(self)
+        return memoryview(self.data)[index * rows:(index + 1) * rows]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exposes data as a two dimensional buffer of shape (len(names), len(self)).
+
+        Python only calls this for memoryview(table) and other buffer consumers from version 3.12
+        (PEP 688). On earlier versions use data, column or to_numpy instead.
+        """
+        view = memoryview(self.data)
+        if len(self) == 0:
+            # memoryview can not have zeros in its shape
+            return view
+        return view.cast("B").cast("q", (len(self.names), len(self)))
+
+    def to_numpy(self) -> "np.ndarray":
+        """Views data as a NumPy array of shape (len(names), len(self)) without copying.
+
+        Requires the optional numpy dependency.
+        """
+        from .vectorized import np
+
+        return np.frombuffer(self.data, dtype=np.int64).reshape(len(self.names), len(self))
+
+    def __array__(self, dtype=None, copy=None) -> "np.ndarray":
+        """Lets np.asarray(table) view data like to_numpy, on every version of Python"""
+        array = self.to_numpy()
+        if dtype is not None and array.dtype != dtype:
+            if copy is False:
+                raise ValueError(f"viewing the table as {dtype} needs a copy")
+            return array.astype(dtype)
+        if copy:
+            return array.copy()
+        return array
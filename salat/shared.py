@@ -0,0 +1,209 @@
+"""Timetables shared between processes through shared memory.
+
+Web servers running many worker processes on one host would otherwise each calculate and cache the
+same popular timetables. Instead one process calculates the timetables of a configured set of
+locations and dates once into a block of shared memory, laid out like a salat.results.TimesTable,
+and every worker attaches to the block by name and reads from it without copying:
+
+    # in the process starting the workers
+    store = salat.shared.SharedTimetables.create(method, locations, start, end, name="salat")
+
+    # in every worker
+    store = salat.shared.SharedTimetables.attach("salat", method)
+    times = store.calc_times(date, timezone, longitude, latitude)
+
+Lookups of other locations or dates fall back to calculating them with the method. Times in the
+block are rounded to the second, like those of a TimesTable.
+"""
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable
+import datetime as dt
+import json
+import struct
+
+from .methods import GeneralMethod
+from .results import MISSING, TimesTable
+
+
+# magic, layout version, number of locations, number of days, size of the description, first date
+_HEADER = struct.Struct("<8sIIIIq")
+_MAGIC = b"SALATTT\0"
+_VERSION = 1
+# every array starts at a multiple of 8 bytes
+_ALIGNMENT = 8
+
+
+class SharedTimetables:
+    def __init__(self, memory: shared_memory.SharedMemory, method: GeneralMethod, owner: bool):
+        """Use create or attach instead"""
+        self.method = method
+        self._memory = memory
+        self._owner = owner
+
+        magic, version, locations, days, text_size, start = _HEADER.unpack_from(memory.buf)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"shared memory {memory.name} does not hold timetables")
+        offset = _aligned(_HEADER.size)
+        description = json.loads(bytes(memory.buf[offset : offset + text_size]))
+        if description["method"] != method._cache_key():
+            raise ValueError(f"timetables in {memory.name} were calculated with another method")
+        offset = _aligned(offset + text_size)
+
+        names = tuple(description["names"])
+        rows = locations * days
+        self._views = []
+        arrays = []
+        for format, length in [("d", rows), ("d", rows), ("q", rows), ("q", len(names) * rows)]:
+            view = memory.buf[offset : offset + 8 * length]
+            self._views.append(view)
+            arrays.append(view.cast(format))
+            offset += 8 * length
+        self._views.extend(arrays)
+
+        # every row is one date at one location, ordered by location and then by date
+        self.table = TimesTable(names, dt.timezone.utc, *arrays)
+        self.start = dt.date.fromordinal(start)
+        self.days = days
+        longitudes, latitudes = arrays[0], arrays[1]
+        self._locations = {
+            (longitudes[index * days], latitudes[index * days]): index
+            for index in range(locations)
+        }
+
+    @classmethod
+    def create(
+        cls,
+        method: GeneralMethod,
+        locations: "Iterable[tuple[float, float]]",
+        start: dt.date,
+        end: dt.date,
+        name: str = None,
+    ) -> "SharedTimetables":
+        """Calculates the timetables of locations into a new block of shared memory.
+
+        The creating process owns the block, and should unlink it when the workers are done.
+
+        Args:
+            method (GeneralMethod): Method to calculate the prayer times with
+            locations (Iterable[tuple[float, float]]): Longitude in degrees East and latitude in
+                degrees North of every location
+            start (dt.date): First date to calculate the prayer times for
+            end (dt.date): Last date to calculate the prayer times for
+            name (str, optional): Name of the block, which workers attach to. Defaults to a
+                random name.
+
+        Returns:
+            SharedTimetables: timetables in the new block
+        """
+        locations = list(locations)
+        table = method.calc_times_table(start, end, dt.timezone.utc, locations)
+        days = (end - start).days + 1
+
+        text = json.dumps({"names": table.names, "method": method._cache_key()}).encode()
+        arrays = [table.longitudes, table.latitudes, table.ordinals, table.data]
+        size = _aligned(_aligned(_HEADER.size) + len(text)) + sum(8 * len(a) for a in arrays)
+
+        memory = shared_memory.SharedMemory(name, create=True, size=size)
+        try:
+            offset = _aligned(_HEADER.size)
+            memory.buf[offset : offset + len(text)] = text
+            offset = _aligned(offset + len(text))
+            for values in arrays:
+                memory.buf[offset : offset + 8 * len(values)] = values.tobytes()
+                offset += 8 * len(values)
+            # written last, so a block is only recognized once it is complete
+            memory.buf[: _HEADER.size] = _HEADER.pack(
+                _MAGIC, _VERSION, len(locations), days, len(text), start.toordinal()
+            )
+            return cls(memory, method, owner=True)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str, method: GeneralMethod) -> "SharedTimetables":
+        """Attaches to timetables created by another process.
+
+        Raises:
+            FileNotFoundError: If there is no block of shared memory with the name
+            ValueError: If the block does not hold timetables of method
+
+        Args:
+            name (str): Name of the block
+            method (GeneralMethod): Method the timetables were calculated with, which calculates
+                the lookups that miss
+
+        Returns:
+            SharedTimetables: timetables in the block
+        """
+        try:
+            memory = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            # before Python 3.13 attaching registers the block to be unlinked when this process
+            # exits, which would remove it while the creator still uses it
+            memory = shared_memory.SharedMemory(name)
+            resource_tracker.unregister(memory._name, "shared_memory")
+        try:
+            return cls(memory, method, owner=False)
+        except BaseException:
+            memory.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        """Name of the block of shared memory, which workers attach to"""
+        return self._memory.name
+
+    def calc_times(
+        self, date: dt.date, timezone: dt.tzinfo, longitude: float, latitude: float
+    ) -> "dict[str, dt.datetime]":
+        """Same as GeneralMethod.calc_times, reading the times from shared memory if it has them.
+
+        Raises:
+            ValueError: If the Sun does not reach an altitude needed on the date
+
+        Args:
+            date (dt.date): Date to calculate the prayer times for
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            longitude (float): Longitude of position in degrees East
+            latitude (float): Latitude of position in degrees North
+
+        Returns:
+            dict[str, dt.datetime]: dictionary from time of interest (string) to time
+        """
+        index = self._locations.get((longitude, latitude))
+        day = (date - self.start).days
+        if index is None or not 0 <= day < self.days:
+            return self.method.calc_times(date, timezone, longitude, latitude)
+
+        row = self.table[index * self.days + day]
+        if row.seconds[0] == MISSING:
+            raise ValueError("Sun does not reach altitude")
+        row.timezone = timezone
+        return row.to_dict()
+
+    def close(self):
+        """Detaches this process from the block. Tables and columns taken from table need to be
+        released first
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._memory.close()
+
+    def unlink(self):
+        """Removes the block, once every process has closed it. Only the creator should unlink"""
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,143 @@
+"""Conversion of many epoch seconds to datetimes in one timezone.
+
+Converting with datetime.astimezone looks up the UTC offset of every instant separately, which for
+pytz and zoneinfo timezones costs a search of the timezone's transitions each time. Prayer times of
+consecutive days fall into the same few offsets, so OffsetTransitions finds the instants at which a
+timezone's offset changes once per span of time, and converts every instant in that span by adding
+the offset that applies to it. The results are identical to astimezone, including the tzinfo
+instance pytz attaches for each offset and the fold zoneinfo sets on repeated wall times.
+"""
+from bisect import bisect_right
+import datetime as dt
+import math
+
+from .calculations import to_datetime
+
+
+# length of the spans in which transitions are searched. A span is assumed not to change offset and
+# change back to the same one, which the tz database never does within a week
+DEFAULT_SPAN_SECONDS = 4 * 24 * 60 * 60
+
+
+class OffsetTransitions:
+    def __init__(self, timezone: dt.tzinfo, span: int = DEFAULT_SPAN_SECONDS):
+        """Lazily found UTC offsets of a timezone, for converting many instants.
+
+        Transitions are found with astimezone at the bounds of every span that contains an instant
+        to convert, and bisected to the second where the bounds differ, so it works for any tzinfo.
+        Instants may be converted in any order. Fixed offset datetime.timezone instances are
+        converted with astimezone directly, which is already faster.
+
+        Raises:
+            ValueError: If span is not positive
+
+        Args:
+            timezone (dt.tzinfo): Timezone of the output datetimes
+            span (int, optional): Seconds of the spans in which transitions are searched at once,
+                which need to be shorter than the time between any two transitions. Defaults to
+                four days.
+        """
+        if span <= 0:
+            raise ValueError("span needs to be positive")
+
+        self.timezone = timezone
+        self.span = span
+        self._fixed = isinstance(timezone, dt.timezone)
+        # index of a span to the starts of its segments of constant offset, and for each segment
+        # the unix epoch in local time with the segment's tzinfo, and the fold of its datetimes
+        self._spans: "dict[int, tuple[list[int], list[tuple[dt.datetime, int]]]]" = {}
+        # outputs of astimezone at whole seconds, as the end of a span is the start of the next
+        self._probes: "dict[int, tuple[dt.timedelta, dt.tzinfo, int]]" = {}
+        # bounds, epoch and fold of the last used segment, as consecutive instants mostly share it
+        self._last: "tuple[float, float, dt.datetime, int]" = (0.0, 0.0, None, 0)
+
+    def to_datetime(self, seconds: float) -> dt.datetime:
+        """Same as to_datetime(seconds).astimezone(timezone)
+
+        Args:
+            seconds (float): Epoch seconds (seconds since 1970-01-01 UTC)
+
+        Returns:
+            dt.datetime: time in timezone
+        """
+        if self._fixed:
+            return to_datetime(seconds).astimezone(self.timezone)
+
+        lower, upper, epoch, fold = self._last
+        if not lower <= seconds < upper:
+            lower, upper, epoch, fold = self._last = self._find_segment(seconds)
+
+        time = epoch + dt.timedelta(seconds=seconds)
+        # arithmetic on datetimes always gives fold 0
+        return time.replace(fold=1) if fold else time
+
+    def to_datetimes(self, times: "dict[str, float]") -> "dict[str, dt.datetime]":
+        """Converts every value of a dictionary of epoch seconds, like the output of
+        GeneralMethod._calc_times_utc
+
+        Args:
+            times (dict[str, float]): dictionary from time of interest to epoch seconds
+
+        Returns:
+            dict[str, dt.datetime]: dictionary from time of interest to time in timezone
+        """
+        return {name: self.to_datetime(time) for name, time in times.items()}
+
+    def _find_segment(self, seconds: float) -> "tuple[int, int, dt.datetime, int]":
+        """Finds the bounds, epoch and fold of the segment of constant offset containing seconds"""
+        index = math.floor(seconds / self.span)
+        segments = self._spans.get(index)
+        if segments is None:
+            segments = self._spans[index] = self._find_segments(index)
+        starts, infos = segments
+
+        position = bisect_right(starts, seconds) - 1
+        if position + 1 < len(starts):
+            upper = starts[position + 1]
+        else:
+            upper = (index + 1) * self.span
+        return (starts[position], upper, *infos[position])
+
+    def _find_segments(self, index: int):
+        """Finds the segments of constant offset in a span"""
+        start = index * self.span
+        end = start + self.span
+        first = self._probe(start)
+        starts = [start]
+        infos = [first]
+        self._bisect(start, first, end, self._probe(end), starts, infos)
+
+        epochs = [
+            (dt.datetime(1970, 1, 1, tzinfo=tzinfo) + offset, fold)
+            for offset, tzinfo, fold in infos
+        ]
+        return starts, epochs
+
+    def _bisect(self, lower: int, lower_info, upper: int, upper_info, starts, infos):
+        """Appends the transitions in (lower, upper) to starts and infos, in order"""
+        if _same(lower_info, upper_info):
+            return
+        if upper - lower == 1:
+            if upper < starts[0] + self.span:
+                starts.append(upper)
+                infos.append(upper_info)
+            return
+        middle = (lower + upper) // 2
+        middle_info = self._probe(middle)
+        self._bisect(lower, lower_info, middle, middle_info, starts, infos)
+        self._bisect(middle, middle_info, upper, upper_info, starts, infos)
+
+    def _probe(self, seconds: int) -> "tuple[dt.timedelta, dt.tzinfo, int]":
+        info = self._probes.pop(seconds, None)
+        if info is None:
+            time = to_datetime(seconds).astimezone(self.timezone)
+            info = time.utcoffset(), time.tzinfo, time.fold
+            # only the bounds of spans are probed again
+            if seconds % self.span == 0:
+                self._probes[seconds] = info
+        return info
+
+
+def _same(a: "tuple[dt.timedelta, dt.tzinfo, int]", b: "tuple[dt.timedelta, dt.tzinfo, int]"):
+    # pytz has a tzinfo instance per offset, which only compare equal to themselves
+    return a[0] == b[0] and a[1] is b[1] and a[2] == b[2]
@@ -0,0 +1,327 @@
+"""Array versions of the solar calculations in salat.calculations.
+
+These functions operate on NumPy arrays of epoch seconds (seconds since 1970-01-01 UTC) instead of
+single datetimes, so that many instants can be evaluated in one call. They follow the same
+equations as their scalar counterparts and require the optional numpy dependency.
+"""
+import datetime as dt
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("Install numpy to use salat.vectorized")
+
+from .calculations import MAX_ITERATIONS, TIME_TOLERANCE_SECONDS, J2000_EPOCH_SECONDS
+
+
+def eot_decl_array(seconds: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+    """Calculates the equation of time and Sun's declination at many times.
+
+    This is the array equivalent of salat.calculations.eot_decl.
+
+    Args:
+        seconds (np.ndarray): epoch seconds (seconds since 1970-01-01 UTC) to calculate equation
+            of time and declination for
+
+    Returns:
+        np.ndarray: equation of time (in seconds)
+        np.ndarray: declination of sun (in radians)
+    """
+    seconds = np.asarray(seconds, dtype=np.float64)
+    days_since_epoch = (seconds - J2000_EPOCH_SECONDS) / 60 / 60 / 24
+
+    # account for secular effets, same as eot_decl
+    y100 = days_since_epoch / 36525  # centuries since epoch
+    e = 1.6709e-2 - 4.193e-5 * y100 - 1.26e-7 * y100 ** 2
+    lam_p = np.radians(282.93807 + 1.7195 * y100 + 3.025e-4 * y100 ** 2)
+    epsilon = np.radians(23.4393 - 0.013 * y100 - 2e-7 * y100 ** 2 + 5e-7 * y100 ** 3)
+
+    MD = 6.24004077  # M at epoch (Jan 1 2000 at noon)
+    TY = 365.2596358  # days in a year
+    D = np.mod(days_since_epoch, TY)
+    M = MD + 2 * np.pi * D / TY
+    M = np.mod(M, 2 * np.pi)
+    E = kepler_solve_array(M, e)
+
+    nu = np.arccos((np.cos(E) - e) / (1 - e * np.cos(E)))
+    nu = np.where(E > np.pi, 2 * np.pi - nu, nu)
+
+    lam = np.mod(nu + lam_p, 2 * np.pi)
+
+    # arctan2 matches the quadrant of lam directly, which eot_decl does by hand
+    alpha = np.arctan2(np.cos(epsilon) * np.sin(lam), np.cos(lam))
+    alpha = np.mod(alpha, 2 * np.pi)
+
+    eot_rad = M + lam_p - alpha
+    eot_rad = np.where(eot_rad > np.pi, eot_rad - 2 * np.pi, eot_rad)
+
+    eot = eot_rad / (2 * np.pi) * 60 * 60 * 24
+    decl = np.arcsin(np.sin(epsilon) * np.sin(lam))
+
+    return eot, decl
+
+
+def kepler_solve_array(M: "np.ndarray", e: "np.ndarray") -> "np.ndarray":
+    """Solves Kepler's equation inverse problem for many elliptical orbits at once.
+
+    This is the array equivalent of salat.calculations.kepler_solve. Newton's method is applied to
+    every element simultaneously until all of them have converged.
+
+    Args:
+        M (np.ndarray): mean anomalies
+        e (np.ndarray): eccentricities, broadcastable against M
+
+    Returns:
+        np.ndarray: eccentric anomalies
+    """
+    M, e = np.broadcast_arrays(np.asarray(M, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    if not np.all((0 < e) & (e < 1)):
+        raise ValueError("Eccentricity of elliptical orbit required in range (0, 1)")
+
+    # find E such that M = E - e*sin(E)
+    E = M.copy()
+    for _ in range(MAX_ITERATIONS):
+        if np.all(np.isclose(E, M + e * np.sin(E), rtol=1e-9, atol=0)):
+            return E
+
+        E = E - (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+    raise RuntimeError("Did not converge")
+
+
+def eot_decl_interpolator(
+    start: float,
+    end: float,
+    step: float = 600,
+    solar: "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]" = None,
+) -> "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]":
+    """Tabulates the equation of time and declination once and returns a function interpolating it.
+
+    Equation of time and declination only depend on the time, not on the location, so when many
+    locations are solved for the same span of time the solar state can be evaluated once on a grid
+    and shared. Both vary slowly, so linear interpolation on the default 10 minute grid is within
+    a few microseconds of eot_decl_array.
+
+    Args:
+        start (float): epoch seconds of the start of the span to tabulate
+        end (float): epoch seconds of the end of the span to tabulate
+        step (float, optional): seconds between samples. Defaults to 600.
+        solar (Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]], optional): Function giving
+            equation of time (in seconds) and declination for an array of epoch seconds, which is
+            tabulated. Defaults to eot_decl_array.
+
+    Returns:
+        Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]: function with the same inputs and
+            outputs as eot_decl_array, valid between start and end
+    """
+    if solar is None:
+        solar = eot_decl_array
+    samples = np.arange(start, end + step, step, dtype=np.float64)
+    eot_samples, decl_samples = solar(samples)
+
+    def interpolate(seconds: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+        seconds = np.asarray(seconds, dtype=np.float64)
+        eot = np.interp(seconds, samples, eot_samples)
+        decl = np.interp(seconds, samples, decl_samples)
+        return eot, decl
+
+    return interpolate
+
+
+def calc_altitude_array(
+    shadow_factor: float, declination: "np.ndarray", latitude: "np.ndarray"
+) -> "np.ndarray":
+    """Array equivalent of salat.calculations.calc_altitude.
+
+    Args:
+        shadow_factor (float): Multiplication factor from height to shadow length
+        declination (np.ndarray): Declination of sun in radians
+        latitude (np.ndarray): The latitude in degrees North
+
+    Returns:
+        np.ndarray: The Sun's altitude below the horizon in radians
+    """
+    phi = np.radians(latitude)
+    delta = declination
+
+    shadow_factor_zenith = np.abs(np.tan(phi - delta))
+    alt = np.arctan(1 / (shadow_factor + shadow_factor_zenith))
+
+    return alt
+
+
+def timedelta_at_altitude_array(
+    altitude: "np.ndarray", declination: "np.ndarray", latitude: "np.ndarray"
+) -> "np.ndarray":
+    """Array equivalent of salat.calculations.timedelta_at_altitude.
+
+    Args:
+        altitude (np.ndarray): Altitude of sun above the horizon in radians
+        declination (np.ndarray): Declination of sun in radians
+        latitude (np.ndarray): Latitude of position on Earth in degrees North
+
+    Returns:
+        np.ndarray: Offset from zenith in seconds. Note that this is always positive, and NaN where
+            the Sun does not reach the altitude
+    """
+    alpha = altitude
+    phi = np.radians(latitude)
+    delta = declination
+
+    numerator = np.sin(alpha) - np.sin(phi) * np.sin(delta)
+    denominator = np.cos(phi) * np.cos(delta)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_hour_rad = numerator / denominator
+        # arccos gives NaN outside of [-1, 1], where the Sun does not reach the altitude
+        hour_rad = np.arccos(cos_hour_rad)
+    return hour_rad / (2 * np.pi) * 60 * 60 * 24
+
+
+def linear_interpolation_array(
+    diff_function: "Callable[[np.ndarray], np.ndarray]",
+    guess1: "np.ndarray",
+    guess2: "np.ndarray",
+) -> "np.ndarray":
+    """Array equivalent of salat.calculations.linear_interpolation.
+
+    Every element is iterated with the secant method until all of them have converged. Elements
+    whose diff_function output is NaN stop iterating and are NaN in the output.
+
+    Args:
+        diff_function (Callable[[np.ndarray], np.ndarray]): The function to find the roots for, in
+            seconds
+        guess1 (np.ndarray): First guesses in epoch seconds
+        guess2 (np.ndarray): Second guesses in epoch seconds (cannot be the same as first guesses)
+
+    Returns:
+        np.ndarray: inputs to diff_function which result in zero output
+    """
+    guess1, guess2 = np.broadcast_arrays(
+        np.asarray(guess1, dtype=np.float64), np.asarray(guess2, dtype=np.float64)
+    )
+    if np.any(np.isclose(guess1, guess2, rtol=0, atol=TIME_TOLERANCE_SECONDS)):
+        raise ValueError("guess1 and guess2 need to be different")
+
+    diff1 = diff_function(guess1)
+    diff2 = diff_function(guess2)
+    for _ in range(MAX_ITERATIONS):
+        done = (
+            np.isclose(guess1, guess2, rtol=0, atol=TIME_TOLERANCE_SECONDS)
+            | np.isclose(diff2, 0, rtol=0, atol=TIME_TOLERANCE_SECONDS)
+            | np.isnan(diff2)
+        )
+        if np.all(done):
+            return np.where(np.isnan(diff2), np.nan, guess2)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            guess3 = guess1 - diff1 * ((guess2 - guess1) / (diff2 - diff1))
+        guess3 = np.where(done, guess2, guess3)
+        diff3 = np.where(done, diff2, diff_function(guess3))
+
+        guess1, diff1 = guess2, diff2
+        guess2, diff2 = guess3, diff3
+    raise RuntimeError("Did not converge")
+
+
+def time_zenith_array(
+    date: dt.date,
+    longitude: "np.ndarray",
+    solar: "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]" = eot_decl_array,
+) -> "np.ndarray":
+    """Array equivalent of salat.calculations.time_zenith.
+
+    Args:
+        date (date): The utc date for which the zenith should be found
+        longitude (np.ndarray): The longitudes in degrees East
+        solar (Callable, optional): Function giving equation of time and declination for epoch
+            seconds. Defaults to eot_decl_array.
+
+    Returns:
+        np.ndarray: Epoch seconds of zenith for each longitude
+    """
+    longitude = np.asarray(longitude, dtype=np.float64)
+    utc_noon = dt.datetime(date.year, date.month, date.day, 12, tzinfo=dt.timezone.utc).timestamp()
+    time_zenith_approx = utc_noon - longitude / 15 * 60 * 60
+
+    def calc_difference(guess: "np.ndarray") -> "np.ndarray":
+        eot, _ = solar(guess)
+        actual = time_zenith_approx - eot
+        return actual - guess
+
+    # eot is usually between -14 to +16 minutes, so bound that by guess1 and guess2
+    guess1 = time_zenith_approx - 20 * 60
+    guess2 = time_zenith_approx + 20 * 60
+
+    return linear_interpolation_array(calc_difference, guess1, guess2)
+
+
+def time_altitude_array(
+    zenith: "np.ndarray",
+    altitude: float,
+    latitude: "np.ndarray",
+    rising: bool,
+    solar: "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]" = eot_decl_array,
+) -> "np.ndarray":
+    """Array equivalent of salat.calculations.time_altitude.
+
+    Args:
+        zenith (np.ndarray): Epoch seconds of zenith of the day
+        altitude (float): The desired altitude of the Sun above the horizon, in radians
+        latitude (np.ndarray): The latitudes in degrees North
+        rising (bool): Whether to calculate the time before zenith or after zenith
+        solar (Callable, optional): Function giving equation of time and declination for epoch
+            seconds. Defaults to eot_decl_array.
+
+    Returns:
+        np.ndarray: Epoch seconds when Sun's altitude is as given, NaN where the Sun does not reach
+            the altitude
+    """
+    sign = -1 if rising else 1
+
+    def calc_difference(guess: "np.ndarray") -> "np.ndarray":
+        _, declination = solar(guess)
+        T = timedelta_at_altitude_array(altitude, declination, latitude)
+        actual = zenith + sign * T
+        return actual - guess
+
+    # start guesses at zenith and 12 hours before or after zenith to bound solution
+    guess1 = zenith
+    guess2 = zenith + sign * 12 * 60 * 60
+
+    return linear_interpolation_array(calc_difference, guess1, guess2)
+
+
+def time_shadow_factor_array(
+    zenith: "np.ndarray",
+    shadow_factor: float,
+    latitude: "np.ndarray",
+    rising: bool,
+    solar: "Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]" = eot_decl_array,
+) -> "np.ndarray":
+    """Array equivalent of salat.calculations.time_shadow_factor.
+
+    Args:
+        zenith (np.ndarray): Epoch seconds of zenith of the day
+        shadow_factor (float): Multiplication factor from height to shadow length
+        latitude (np.ndarray): The latitudes in degrees North
+        rising (bool): Whether to calculate the time before zenith or after zenith
+        solar (Callable, optional): Function giving equation of time and declination for epoch
+            seconds. Defaults to eot_decl_array.
+
+    Returns:
+        np.ndarray: Epoch seconds when shadow factor is as given, NaN where it is never reached
+    """
+    sign = -1 if rising else 1
+
+    def calc_difference(guess: "np.ndarray") -> "np.ndarray":
+        _, declination = solar(guess)
+        altitude = calc_altitude_array(shadow_factor, declination, latitude)
+        T = timedelta_at_altitude_array(altitude, declination, latitude)
+        actual = zenith + sign * T
+        return actual - guess
+
+    # start guesses at zenith and 12 hours before or after zenith to bound solution
+    guess1 = zenith
+    guess2 = zenith + sign * 12 * 60 * 60
+
+    return linear_interpolation_array(calc_difference, guess1, guess2)
@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import datetime as dt
+import threading
+import pytest
+
+import salat
+from salat.aio import AsyncPrayerTimes
+
+EMPIRE_STATE_BUILDING_LAT_LONG = (40.748817, -73.985428)
+DATE = dt.date(2023, 3, 1)
+
+
+class CountingMethod:
+    """Wraps a method, counting calculations and blocking them until released"""
+
+    def __init__(self, method):
+        self.method = method
+        self.calls = 0
+        self.release = threading.Event()
+
+    def calc_times(self, *args):
+        self.calls += 1
+        self.release.wait()
+        return self.method.calc_times(*args)
+
+    def calc_times_range(self, *args):
+        self.calls += 1
+        self.release.wait()
+        return self.method.calc_times_range(*args)
+
+
+def test_acalc_times():
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    expected = pt.calc_times(DATE, dt.timezone.utc, long, lat)
+
+    async def main():
+        prayer_times = AsyncPrayerTimes(pt)
+        assert await prayer_times.acalc_times(DATE, dt.timezone.utc, long, lat) == expected
+        end = DATE + dt.timedelta(days=9)
+        times_range = await prayer_times.acalc_times_range(DATE, end, dt.timezone.utc, long, lat)
+        assert times_range == pt.calc_times_range(DATE, end, dt.timezone.utc, long, lat)
+
+    asyncio.run(main())
+
+
+def test_acalc_times_merges_requests():
+    """Checks that concurrent identical requests share one calculation"""
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    method = CountingMethod(salat.PrayerTimes(salat.CalculationMethod.ISNA))
+
+    async def main():
+        with ThreadPoolExecutor(4) as executor:
+            prayer_times = AsyncPrayerTimes(method, executor)
+            same = [prayer_times.acalc_times(DATE, dt.timezone.utc, long, lat) for _ in range(50)]
+            other = prayer_times.acalc_times(DATE, dt.timezone.utc, long, lat + 1)
+            tasks = [asyncio.ensure_future(request) for request in same + [other]]
+            # let every task start waiting
+            await asyncio.sleep(0.1)
+            method.release.set()
+            results = await asyncio.gather(*tasks)
+
+            assert method.calls == 2
+            assert all(times == results[0] for times in results[:50])
+            # callers do not share the dictionary
+            assert results[0] is not results[1]
+
+            # finished calculations are not reused
+            await prayer_times.acalc_times(DATE, dt.timezone.utc, long, lat)
+            assert method.calls == 3
+
+    asyncio.run(main())
+
+
+def test_acalc_times_errors_and_cancellation():
+    """Checks that errors reach every caller and cancelling one caller does not affect others"""
+    method = CountingMethod(salat.PrayerTimes(salat.CalculationMethod.ISNA))
+
+    async def main():
+        prayer_times = AsyncPrayerTimes(method)
+        # the Sun does not get 15 degrees below the horizon in Oslo in June
+        date = dt.date(2023, 6, 21)
+        args = (date, dt.timezone.utc, 10.75, 59.91)
+        first = asyncio.ensure_future(prayer_times.acalc_times(*args))
+        second = asyncio.ensure_future(prayer_times.acalc_times(*args))
+        await asyncio.sleep(0.1)
+        first.cancel()
+        method.release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        with pytest.raises(ValueError):
+            await second
+        assert method.calls == 1
+
+    asyncio.run(main())
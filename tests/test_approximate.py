@@ -0,0 +1,47 @@
+import datetime as dt
+import math
+import random
+
+from salat.approximate import ApproximateSolarDay, eot_decl_approx
+from salat.calculations import J2000_EPOCH_SECONDS, SolarDay, eot_decl_seconds
+
+EOT_MARGIN = 2 # seconds
+DECL_MARGIN = math.radians(0.01) # radians
+TIME_MARGIN = 15 # seconds
+
+
+def test_eot_decl_approx():
+    random.seed(0)
+    for _ in range(2000):
+        days = random.uniform(-36525, 36525)
+        seconds = J2000_EPOCH_SECONDS + days * 24 * 60 * 60
+        eot, decl = eot_decl_approx(seconds)
+        eot_expected, decl_expected = eot_decl_seconds(seconds)
+        assert math.isclose(eot, eot_expected, abs_tol=EOT_MARGIN)
+        assert math.isclose(decl, decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_approximate_solar_day():
+    altitude = -math.radians(18)
+    for days in range(0, 365, 5):
+        date = dt.date(2023, 1, 1) + dt.timedelta(days=days)
+        for latitude in [-55, -20, 0, 35, 55]:
+            exact = SolarDay(date, 100)
+            approximate = ApproximateSolarDay(date, 100)
+            assert math.isclose(approximate.zenith, exact.zenith, abs_tol=TIME_MARGIN)
+            for rising in [True, False]:
+                assert math.isclose(
+                    approximate.time_shadow_factor(1, latitude, rising),
+                    exact.time_shadow_factor(1, latitude, rising),
+                    abs_tol=TIME_MARGIN,
+                )
+                try:
+                    expected = exact.time_altitude(altitude, latitude, rising)
+                except ValueError:
+                    # the Sun does not reach the altitude
+                    continue
+                assert math.isclose(
+                    approximate.time_altitude(altitude, latitude, rising),
+                    expected,
+                    abs_tol=TIME_MARGIN,
+                )
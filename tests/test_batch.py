@@ -0,0 +1,156 @@
+import datetime as dt
+import pytest
+import pytz
+
+import salat
+from salat import batch
+
+LOCATIONS = [
+    (-73.985428, 40.748817),
+    (39.826206, 21.422487),
+    (10.75, 59.91),
+    (151.21, -33.86),
+    (-21.94, 64.15),
+]
+START = dt.date(2023, 6, 1)
+END = dt.date(2023, 6, 30)
+
+
+def expected_timetable(pt, location, timezone):
+    longitude, latitude = location
+    times = {}
+    errors = []
+    for day in range((END - START).days + 1):
+        date = START + dt.timedelta(days=day)
+        try:
+            times[date] = pt.calc_times(date, timezone, longitude, latitude)
+        except ValueError:
+            errors.append(date)
+    return times, errors
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate(jobs):
+    """Checks that results are in input order and failed days are reported per location"""
+    timezone = pytz.timezone("US/Eastern")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    results = list(
+        batch.generate(LOCATIONS, START, END, salat.CalculationMethod.ISNA, timezone, jobs, 2)
+    )
+
+    assert [result.location for result in results] == LOCATIONS
+    for result in results:
+        times, errors = expected_timetable(pt, result.location, timezone)
+        assert sorted(result.errors) == errors
+        assert all(isinstance(error, ValueError) for error in result.errors.values())
+        assert result.times.keys() == times.keys()
+        for date in times:
+            for name, time in times[date].items():
+                assert abs(result.times[date][name] - time) < dt.timedelta(milliseconds=1)
+                assert result.times[date][name].tzinfo.zone == timezone.zone
+
+    # the Sun does not get 15 degrees below the horizon in Oslo and Reykjavik in June
+    assert len(results[2].errors) > 0
+    assert len(results[4].errors) == 30
+
+
+def test_generate_streaming():
+    """Checks that results can be consumed one at a time and the generator closed early"""
+    locations = iter(LOCATIONS * 20)
+    results = batch.generate(locations, START, END, jobs=2, chunksize=1)
+    first = next(results)
+    assert first.location == LOCATIONS[0]
+    results.close()
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_generate_bounded(threads):
+    """Checks that only a bounded number of locations are read ahead of the consumer"""
+    read = []
+
+    def locations():
+        for location in LOCATIONS * 40:
+            read.append(location)
+            yield location
+
+    results = batch.generate(locations(), START, START, jobs=2, chunksize=3, threads=threads)
+    assert next(results).location == LOCATIONS[0]
+    limit = 2 * batch.CHUNKS_PER_WORKER * 3
+    assert len(read) <= limit
+    for _ in range(10):
+        next(results)
+    assert len(read) <= 11 + limit
+    assert len(list(results)) == len(LOCATIONS) * 40 - 11
+
+
+def test_generate_arguments():
+    with pytest.raises(ValueError):
+        batch.generate(LOCATIONS, START, END, jobs=0)
+    with pytest.raises(ValueError):
+        batch.generate(LOCATIONS, START, END, chunksize=0)
+
+
+def test_generate_threads():
+    """Checks that thread workers give the same results as a single thread"""
+    timezone = pytz.timezone("US/Eastern")
+    expected = list(batch.generate(LOCATIONS, START, END, timezone=timezone, jobs=1))
+    results = list(
+        batch.generate(LOCATIONS * 4, START, END, timezone=timezone, jobs=4, threads=True)
+    )
+    assert [result.location for result in results] == LOCATIONS * 4
+    for result, expected_result in zip(results, expected * 4):
+        assert result.times == expected_result.times
+        assert result.errors.keys() == expected_result.errors.keys()
+
+
+def test_shared_cache_threads():
+    """Checks that methods sharing an EotDeclCache give the same results from many threads"""
+    from concurrent.futures import ThreadPoolExecutor
+    from salat.cache import EotDeclCache
+
+    cache = EotDeclCache(maxsize=64)
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL, solar=cache)
+    dates = [START + dt.timedelta(days=day) for day in range(60)]
+    longitude, latitude = LOCATIONS[0]
+
+    def calc(date):
+        return pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+
+    expected = list(map(calc, dates))
+    cache.cache_clear()
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(calc, dates * 4)) == expected * 4
+
+
+def test_no_shared_mutable_state():
+    """The modules used while calculating prayer times only keep immutable module level state, so
+    threads calculating in parallel need no locking
+    """
+    import contextvars
+    import enum
+    import inspect
+    import types
+    from salat import approximate, calculations, chebyshev, instrumentation, methods
+
+    immutable = (
+        int,
+        float,
+        str,
+        bytes,
+        tuple,
+        frozenset,
+        type(None),
+        dt.date,
+        dt.datetime,
+        dt.timedelta,
+        dt.tzinfo,
+        contextvars.ContextVar,
+        enum.Enum,
+    )
+    for module in [approximate, calculations, chebyshev, instrumentation, methods]:
+        for name, value in vars(module).items():
+            if name.startswith("__") or inspect.isclass(value) or callable(value):
+                continue
+            if isinstance(value, types.ModuleType):
+                continue
+            assert isinstance(value, immutable), f"{module.__name__}.{name} is mutable"
@@ -0,0 +1,33 @@
+import json
+
+from benchmarks import bench
+
+
+def test_run_and_compare(tmp_path):
+    """Checks that results are JSON and regressions against a baseline fail the run"""
+    results = bench.run("micro.eot_decl_seconds", repeat=1)
+    assert list(results["results"]) == ["micro.eot_decl_seconds"]
+    assert results["results"]["micro.eot_decl_seconds"]["seconds"] > 0
+    assert bench.compare(results, results) == []
+
+    faster = json.loads(json.dumps(results))
+    faster["results"]["micro.eot_decl_seconds"]["seconds"] /= 10
+    assert [name for name, _, _ in bench.compare(results, faster)] == ["micro.eot_decl_seconds"]
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(faster))
+    args = ["--filter", "micro.eot_decl_seconds", "--repeat", "1"]
+    assert bench.main(args + ["--baseline", str(baseline)]) == 1
+
+    output = tmp_path / "output.json"
+    assert bench.main(args + ["--output", str(output)]) == 0
+    assert list(json.loads(output.read_text())["results"]) == ["micro.eot_decl_seconds"]
+
+
+def test_run_filter():
+    """Checks that the filter selects a benchmark by its name, or a group by its prefix"""
+    assert list(bench.run("micro.kepler_solve", repeat=1)["results"]) == ["micro.kepler_solve"]
+    assert list(bench.run("micro.kepler", repeat=1)["results"]) == []
+
+    micro = [name for name in bench.BENCHMARKS if name.startswith("micro.")]
+    assert list(bench.run("micro", repeat=1)["results"]) == micro
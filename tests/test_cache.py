@@ -0,0 +1,256 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime as dt
+import math
+import random
+import pytest
+
+import salat
+from salat.cache import EotDeclCache, TileCache
+from salat.calculations import eot_decl_seconds
+
+EOT_MARGIN = 1e-5 # seconds
+DECL_MARGIN = 1e-9 # radians
+TIME_MARGIN = 1e-3 # seconds
+
+START = dt.datetime(2023, 1, 1, tzinfo=dt.timezone.utc).timestamp()
+
+
+def test_cache_matches_eot_decl():
+    cache = EotDeclCache()
+    random.seed(0)
+    for _ in range(2000):
+        seconds = START + random.uniform(0, 365 * 24 * 60 * 60)
+        eot, decl = cache(seconds)
+        eot_expected, decl_expected = eot_decl_seconds(seconds)
+        assert math.isclose(eot, eot_expected, abs_tol=EOT_MARGIN)
+        assert math.isclose(decl, decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_cache_on_grid():
+    cache = EotDeclCache(resolution=60)
+    assert cache(START) == eot_decl_seconds(START)
+    assert cache.cache_info() == (0, 1, 4096, 1)
+
+
+def test_cache_statistics():
+    cache = EotDeclCache(resolution=600)
+    cache(START + 1)
+    assert cache.cache_info() == (0, 2, 4096, 2)
+    cache(START + 2)
+    assert cache.cache_info() == (2, 2, 4096, 2)
+    cache(START + 601)
+    assert cache.cache_info() == (3, 3, 4096, 3)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 4096, 0)
+
+
+def test_cache_eviction():
+    cache = EotDeclCache(resolution=60, maxsize=3)
+    for i in range(10):
+        cache(START + i * 60)
+    assert cache.cache_info().currsize == 3
+
+    # most recent samples are kept
+    cache(START + 9 * 60)
+    assert cache.cache_info().hits == 1
+    cache(START)
+    assert cache.cache_info().misses == 11
+
+
+def test_cache_invalid():
+    with pytest.raises(ValueError):
+        EotDeclCache(resolution=0)
+    with pytest.raises(ValueError):
+        EotDeclCache(maxsize=0)
+
+
+def test_cache_wraps_solar():
+    calls = []
+
+    def solar(seconds):
+        calls.append(seconds)
+        return 1.0, 2.0
+
+    cache = EotDeclCache(resolution=10, solar=solar)
+    assert cache(START + 5) == (1.0, 2.0)
+    assert cache(START + 7) == (1.0, 2.0)
+    assert calls == [START, START + 10]
+
+
+def test_cache_prayer_times():
+    cache = EotDeclCache()
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    cached_pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, solar=cache)
+    date = dt.date(2023, 1, 1)
+
+    # nearby locations
+    for i in range(30):
+        longitude, latitude = -73.985428 + i / 100, 40.748817 - i / 100
+        times = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        cached_times = cached_pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        for name in times:
+            difference = (cached_times[name] - times[name]).total_seconds()
+            assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
+
+    info = cache.cache_info()
+    assert info.hits > info.misses
+
+
+def test_cache_threads():
+    cache = EotDeclCache(resolution=60, maxsize=100)
+    random.seed(0)
+    inputs = [START + random.uniform(0, 10 * 24 * 60 * 60) for _ in range(5000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(cache, inputs))
+
+    for seconds, (eot, decl) in zip(inputs, outputs):
+        eot_expected, decl_expected = eot_decl_seconds(seconds)
+        assert math.isclose(eot, eot_expected, abs_tol=EOT_MARGIN)
+        assert math.isclose(decl, decl_expected, abs_tol=DECL_MARGIN)
+
+    info = cache.cache_info()
+    assert info.currsize <= 100
+    assert info.hits + info.misses >= 5000
+
+
+@pytest.mark.parametrize("spacing", [0.01, 1.0])
+@pytest.mark.parametrize("method", list(salat.CalculationMethod))
+def test_tile_cache_matches_calc_times(method, spacing):
+    pt = salat.PrayerTimes(method)
+    tiles = TileCache(pt, spacing)
+    random.seed(0)
+    for _ in range(50):
+        date = dt.date(2023, 1, 1) + dt.timedelta(days=random.randrange(365))
+        longitude, latitude = random.uniform(-180, 180), random.uniform(-60, 60)
+        try:
+            times = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        except ValueError:
+            with pytest.raises(ValueError):
+                tiles.calc_times(date, dt.timezone.utc, longitude, latitude)
+            continue
+        tile_times = tiles.calc_times(date, dt.timezone.utc, longitude, latitude)
+        assert tile_times.keys() == times.keys()
+        for name in times:
+            difference = (tile_times[name] - times[name]).total_seconds()
+            assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
+
+
+@pytest.mark.parametrize("method", list(salat.CalculationMethod))
+def test_tile_cache_high_latitudes(method):
+    """Checks locations near the latitudes where the Sun stops reaching altitudes, where a tile's
+    center can miss events the location reaches or the other way around
+    """
+    pt = salat.PrayerTimes(method)
+    tiles = TileCache(pt, spacing=1)
+    date = dt.date(2023, 6, 21)
+    for latitude in [48.2, 48.6, 55.4, 58.6, 64.6, 65.6, 66.4, 67.0]:
+        try:
+            times = pt.calc_times(date, dt.timezone.utc, 10, latitude)
+        except ValueError:
+            with pytest.raises(ValueError):
+                tiles.calc_times(date, dt.timezone.utc, 10, latitude)
+            continue
+        tile_times = tiles.calc_times(date, dt.timezone.utc, 10, latitude)
+        for name in times:
+            difference = (tile_times[name] - times[name]).total_seconds()
+            assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
+
+
+@pytest.mark.parametrize("method", ["MWL", "ISNA", "JAFARI"])
+@pytest.mark.parametrize("spacing", [1, 5])
+def test_tile_cache_raises_like_calc_times(method, spacing):
+    """Checks that a location fails exactly where calc_times fails, on the days around the start
+    of a period in which the Sun does not get low enough, even when its tile's center succeeds
+    """
+    pt = salat.PrayerTimes(salat.CalculationMethod[method])
+    tiles = TileCache(pt, spacing=spacing)
+    for month, sign in [(6, 1), (12, -1)]:
+        for step in range(40):
+            latitude = sign * (47 + step * 0.1)
+            longitude = 12 + step * 0.37
+            for day in range(1, 31):
+                date = dt.date(2023, month, day)
+                try:
+                    pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+                except ValueError:
+                    with pytest.raises(ValueError):
+                        tiles.calc_times(date, dt.timezone.utc, longitude, latitude)
+                    continue
+                tiles.calc_times(date, dt.timezone.utc, longitude, latitude)
+
+
+def test_tile_cache_minutes_after_missing_center():
+    """Checks a MinutesAfter event whose reference the Sun reaches at the location but not at the
+    center of its tile
+    """
+    pt = salat.PrayerTimes(salat.CalculationMethod.MAKKAH)
+    pt.events["fajr"] = pt.events["fajr"]._replace(altitude=-math.radians(0.5))
+    tiles = TileCache(pt, spacing=1)
+    date = dt.date(2023, 6, 21)
+    times = pt.calc_times(date, dt.timezone.utc, 10, 65.6)
+    tile_times = tiles.calc_times(date, dt.timezone.utc, 10, 65.6)
+    for name in times:
+        difference = (tile_times[name] - times[name]).total_seconds()
+        assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
+
+
+def test_tile_cache_shares_tiles(monkeypatch):
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    tiles = TileCache(pt, spacing=0.01)
+    date = dt.date(2023, 1, 1)
+
+    calls = []
+
+    def solar(seconds):
+        calls.append(seconds)
+        return eot_decl_seconds(seconds)
+
+    monkeypatch.setattr(salat.calculations, "eot_decl_seconds", solar)
+    tiles.calc_times(date, dt.timezone.utc, -73.98, 40.75)
+    solar_calls = len(calls)
+    assert solar_calls > 0
+
+    # every location within the same tile is solved without evaluating the solar function
+    locations = [(-73.98 + i / 2000, 40.75 - i / 2000) for i in range(-4, 5)]
+    tile_times = [tiles.calc_times(date, dt.timezone.utc, *location) for location in locations]
+    assert len(calls) == solar_calls
+    assert tiles.cache_info() == (9, 1, 4096, 1)
+
+    for location, times in zip(locations, tile_times):
+        expected = pt.calc_times(date, dt.timezone.utc, *location)
+        for name in times:
+            difference = (times[name] - expected[name]).total_seconds()
+            assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
+
+    tiles.calc_times(date + dt.timedelta(days=1), dt.timezone.utc, -73.98, 40.75)
+    tiles.calc_times(date, dt.timezone.utc, -73.97, 40.75)
+    assert tiles.cache_info() == (9, 3, 4096, 3)
+
+    tiles.cache_clear()
+    assert tiles.cache_info() == (0, 0, 4096, 0)
+
+
+def test_tile_cache_eviction():
+    tiles = TileCache(salat.PrayerTimes(salat.CalculationMethod.ISNA), maxsize=2)
+    date = dt.date(2023, 1, 1)
+    for i in range(3):
+        tiles.calc_times(date, dt.timezone.utc, i, 0)
+    assert tiles.cache_info().currsize == 2
+
+    # most recent tiles are kept
+    tiles.calc_times(date, dt.timezone.utc, 2, 0)
+    assert tiles.cache_info().hits == 1
+    tiles.calc_times(date, dt.timezone.utc, 0, 0)
+    assert tiles.cache_info().misses == 4
+
+
+def test_tile_cache_invalid():
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    with pytest.raises(ValueError):
+        TileCache(pt, spacing=0)
+    with pytest.raises(ValueError):
+        TileCache(pt, maxsize=0)
+    with pytest.raises(ValueError):
+        TileCache(salat.PrayerTimes(salat.CalculationMethod.ISNA, precision=salat.Precision.FAST))
@@ -1,10 +1,12 @@
 import datetime as dt
 import math
+import pytest
 from salat.calculations import *
 
 EOT_MARGIN = 1 # seconds
 KEPLER_SOLVE_MARGIN = 1e-3 # relative tolerance
 ALTITUDE_MARGIN = 1e-5 # relative tolerance
+SECONDS_MARGIN = 1e-5 # seconds, datetimes have microsecond resolution
 
 def test_eot1():
     time = dt.datetime(2023, 1, 1, hour=12, tzinfo=dt.timezone.utc)
@@ -126,8 +128,23 @@ def test_timedelta_at_altitude():
 
 
 def test_linear_interpolation():
-    # TODO: add test
-    pass
+    target = dt.datetime(2000, 1, 1, 6, tzinfo=dt.timezone.utc)
+
+    def diff_function(guess: dt.datetime) -> dt.timedelta:
+        return (target - guess) / 2
+
+    guess1 = dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc)
+    guess2 = dt.datetime(2000, 1, 1, 12, tzinfo=dt.timezone.utc)
+    root = linear_interpolation(diff_function, guess1, guess2)
+    assert math.isclose((root - target).total_seconds(), 0, abs_tol=TIME_TOLERANCE_SECONDS)
+
+
+def test_linear_interpolation_seconds():
+    def diff_function(guess: float) -> float:
+        return math.cos(guess / 1000)
+
+    root = linear_interpolation_seconds(diff_function, 1000, 2000)
+    assert math.isclose(root, 1000 * math.pi / 2, abs_tol=TIME_TOLERANCE_SECONDS)
 
 
 def test_time_zenith1():
@@ -240,3 +257,241 @@ def test_time_shadow_factor():
     altitude = calc_altitude(shadow_factor, declination, latitude)
     time_shadow_calc = zenith + timedelta_at_altitude(altitude, declination, latitude)
     assert math.isclose((time_shadow_calc - time_shadow).total_seconds(), 0)
+
+
+def test_seconds_match_datetimes():
+    date = dt.date(2023, 7, 15)
+    latitude = 40
+    longitude = -74
+
+    zenith = time_zenith(date, longitude)
+    zenith_seconds = time_zenith_seconds(date, longitude)
+    assert math.isclose(to_seconds(zenith), zenith_seconds, abs_tol=SECONDS_MARGIN)
+
+    eot, declination = eot_decl(zenith)
+    eot_seconds, declination_seconds = eot_decl_seconds(zenith_seconds)
+    assert math.isclose(eot.total_seconds(), eot_seconds, abs_tol=SECONDS_MARGIN)
+    assert math.isclose(declination, declination_seconds, rel_tol=ALTITUDE_MARGIN)
+
+    altitude = -math.radians(18)
+    T = timedelta_at_altitude(altitude, declination, latitude)
+    T_seconds = timedelta_at_altitude_seconds(altitude, declination, latitude)
+    assert math.isclose(T.total_seconds(), T_seconds, abs_tol=SECONDS_MARGIN)
+
+    time_alt = time_altitude(zenith, altitude, latitude, True)
+    time_alt_seconds = time_altitude_seconds(zenith_seconds, altitude, latitude, True)
+    assert math.isclose(to_seconds(time_alt), time_alt_seconds, abs_tol=SECONDS_MARGIN)
+
+    time_shadow = time_shadow_factor(zenith, 1, latitude, False)
+    time_shadow_seconds = time_shadow_factor_seconds(zenith_seconds, 1, latitude, False)
+    assert math.isclose(to_seconds(time_shadow), time_shadow_seconds, abs_tol=SECONDS_MARGIN)
+
+
+def test_to_seconds_to_datetime():
+    time = dt.datetime(2023, 7, 15, 12, 30, 15, 123456, tzinfo=dt.timezone.utc)
+    assert to_seconds(time) == time.timestamp()
+    assert to_datetime(to_seconds(time)) == time
+
+
+def test_solar_day():
+    date = dt.date(2000, 1, 1)
+    latitude = 40
+    longitude = -74
+    calls = []
+
+    def solar(seconds):
+        calls.append(seconds)
+        return eot_decl_seconds(seconds)
+
+    day = SolarDay(date, longitude, solar)
+    assert day.zenith == time_zenith_seconds(date, longitude)
+
+    altitude = -math.radians(18)
+    assert day.time_altitude(altitude, latitude, True) == time_altitude_seconds(
+        day.zenith, altitude, latitude, True, solver=Solver.JOINT
+    )
+    assert day.time_shadow_factor(1, latitude, False) == time_shadow_factor_seconds(
+        day.zenith, 1, latitude, False, solver=Solver.JOINT
+    )
+
+    # each time is only evaluated once
+    assert len(calls) == len(set(calls))
+    assert day.eot_decl(day.zenith) == eot_decl_seconds(day.zenith)
+    assert calls.count(day.zenith) == 1
+
+
+def test_solar_day_previous():
+    """Checks that seeding a day from the previous one gives the same times with fewer solar
+    evaluations
+    """
+    latitude = 40
+    longitude = -74
+    altitude = -math.radians(18)
+    previous = SolarDay(dt.date(2000, 1, 1), longitude)
+    previous.time_altitude(altitude, latitude, True)
+    previous.time_shadow_factor(1, latitude, False)
+
+    date = dt.date(2000, 1, 2)
+    cold = SolarDay(date, longitude)
+    seeded = SolarDay(date, longitude, previous=previous)
+    assert seeded.zenith == pytest.approx(cold.zenith, abs=1e-3)
+    assert seeded.time_altitude(altitude, latitude, True) == pytest.approx(
+        cold.time_altitude(altitude, latitude, True), abs=1e-3
+    )
+    assert seeded.time_shadow_factor(1, latitude, False) == pytest.approx(
+        cold.time_shadow_factor(1, latitude, False), abs=1e-3
+    )
+    assert seeded.solar_calls < cold.solar_calls
+    # the model reuses the previous day's last sample instead of evaluating its own
+    assert previous.declination_model.after[0] not in seeded._samples
+
+
+def test_declination_model():
+    """Checks the model against eot_decl_seconds over the day, and its rate against the
+    derivative of the model
+    """
+    step = 60
+    for days in range(-36500, 36500, 997):
+        zenith = J2000_EPOCH_SECONDS + days * 24 * 60 * 60
+        model = DeclinationModel(zenith)
+        for hours in range(-12, 13):
+            seconds = zenith + hours * 60 * 60
+            declination, rate = model.declination(seconds)
+            assert declination == pytest.approx(eot_decl_seconds(seconds)[1], abs=1e-7)
+            before, _ = model.declination(seconds - step)
+            after, _ = model.declination(seconds + step)
+            assert rate == pytest.approx((after - before) / (2 * step), rel=1e-6, abs=1e-15)
+
+
+def test_model_time_offset():
+    """Checks solving against the model of a nearby longitude's zenith against solving exactly"""
+    from salat.calculations import _altitude_offset
+
+    date = dt.date(2023, 3, 1)
+    model = DeclinationModel(time_zenith_seconds(date, -74))
+    for longitude in [-75, -74, -73.5]:
+        zenith = time_zenith_seconds(date, longitude)
+        for latitude in [-40, 0, 40]:
+            for rising in [True, False]:
+                altitude = -math.radians(18)
+                time = model.model_time_offset(_altitude_offset(altitude, latitude), rising, zenith)
+                expected = time_altitude_seconds(zenith, altitude, latitude, rising)
+                assert time == pytest.approx(expected, abs=1e-3)
+
+
+def test_time_altitudes_seconds():
+    """Checks the joint solve against solving every altitude with the secant solver, at latitudes
+    up to where the Sun only just reaches the altitudes
+    """
+    date = dt.date(2023, 6, 21)
+    altitudes = [-math.radians(angle) for angle in [0.833, 4, 12, 15, 18]]
+    for latitude in [-40, 0, 21.4, 40, 45]:
+        zenith = time_zenith_seconds(date, -74)
+        rising = [True, False] * len(altitudes)
+        doubled = [altitude for altitude in altitudes for _ in range(2)]
+        times = time_altitudes_seconds(zenith, doubled, latitude, rising)
+        for time, altitude, altitude_rising in zip(times, doubled, rising):
+            expected = time_altitude_seconds(zenith, altitude, latitude, altitude_rising)
+            assert time == pytest.approx(expected, abs=1e-3)
+
+    with pytest.raises(ValueError):
+        time_altitudes_seconds(zenith, [-math.radians(18)], 60, [True])
+
+
+def test_eot_decl_rates_seconds():
+    """Checks the analytic rates against finite differences of eot_decl_seconds"""
+    step = 60
+    for days in range(-36500, 36500, 997):
+        seconds = J2000_EPOCH_SECONDS + days * 24 * 60 * 60
+        eot1, decl1 = eot_decl_seconds(seconds - step)
+        eot2, decl2 = eot_decl_seconds(seconds + step)
+        eot_rate, decl_rate = eot_decl_rates_seconds(seconds)
+        # secular effects are ignored, so the rates are only within a few percent of their range
+        # the equation of time changes by at most 3.5e-4 seconds per second
+        assert math.isclose(eot_rate, (eot2 - eot1) / (2 * step), abs_tol=3.5e-4 * 0.06)
+        # the declination changes by at most 8e-8 radians per second
+        assert math.isclose(decl_rate, (decl2 - decl1) / (2 * step), abs_tol=8e-8 * 0.05)
+
+
+def test_derivatives():
+    """Checks the analytic derivatives against finite differences"""
+    step = 1e-6
+    for latitude in [-50, 0, 21.4, 40, 60]:
+        for declination in [-0.4, -0.1, 0.2, 0.4]:
+            _, derivative = calc_altitude_derivative(1, declination, latitude)
+            expected = (
+                calc_altitude(1, declination + step, latitude)
+                - calc_altitude(1, declination - step, latitude)
+            ) / (2 * step)
+            assert math.isclose(derivative, expected, rel_tol=1e-5)
+
+            for altitude in [-0.3, -0.015, 0.2]:
+                try:
+                    T, T_altitude, T_decl = timedelta_at_altitude_derivatives_seconds(
+                        altitude, declination, latitude
+                    )
+                except ValueError:
+                    continue
+                assert T == timedelta_at_altitude_seconds(altitude, declination, latitude)
+                expected = (
+                    timedelta_at_altitude_seconds(altitude + step, declination, latitude)
+                    - timedelta_at_altitude_seconds(altitude - step, declination, latitude)
+                ) / (2 * step)
+                assert math.isclose(T_altitude, expected, rel_tol=1e-4)
+                expected = (
+                    timedelta_at_altitude_seconds(altitude, declination + step, latitude)
+                    - timedelta_at_altitude_seconds(altitude, declination - step, latitude)
+                ) / (2 * step)
+                assert math.isclose(T_decl, expected, rel_tol=1e-4, abs_tol=1e-3)
+
+
+def test_newton_seconds():
+    def diff_function(guess: float) -> "tuple[float, float]":
+        return 1000 * math.cos(guess / 1000), -math.sin(guess / 1000)
+
+    root = newton_seconds(diff_function, 1000, 1000, 3000)
+    assert math.isclose(root, 1000 * math.pi / 2, abs_tol=TIME_TOLERANCE_SECONDS)
+
+    # a useless derivative falls back to bisection within the bracket
+    def bad_derivative(guess: float) -> "tuple[float, float]":
+        return diff_function(guess)[0], math.inf
+
+    root = newton_seconds(bad_derivative, 1000, 1000, 3000)
+    assert math.isclose(root, 1000 * math.pi / 2, abs_tol=TIME_TOLERANCE_SECONDS)
+
+
+def test_newton_matches_secant():
+    altitude = -math.radians(18)
+    for days in range(0, 365, 7):
+        date = dt.date(2023, 1, 1) + dt.timedelta(days=days)
+        for latitude in [-45, 0, 40, 58]:
+            secant = SolarDay(date, -74, solver=Solver.SECANT)
+            newton = SolarDay(date, -74, solver=Solver.NEWTON)
+            assert math.isclose(newton.zenith, secant.zenith, abs_tol=SECONDS_MARGIN)
+            for rising in [True, False]:
+                assert math.isclose(
+                    newton.time_shadow_factor(2, latitude, rising),
+                    secant.time_shadow_factor(2, latitude, rising),
+                    abs_tol=SECONDS_MARGIN,
+                )
+                try:
+                    expected = secant.time_altitude(altitude, latitude, rising)
+                except ValueError:
+                    with pytest.raises(ValueError):
+                        newton.time_altitude(altitude, latitude, rising)
+                    continue
+                assert math.isclose(
+                    newton.time_altitude(altitude, latitude, rising),
+                    expected,
+                    abs_tol=SECONDS_MARGIN,
+                )
+
+
+def test_eot_decl_kepler():
+    """Checks that eot_decl_seconds gives the same output with the bounded Kepler solver"""
+    for days in range(-36500, 36600, 373):
+        seconds = J2000_EPOCH_SECONDS + days * 24 * 60 * 60
+        eot, decl = eot_decl_seconds(seconds, kepler=kepler_solve_series)
+        eot_expected, decl_expected = eot_decl_seconds(seconds)
+        assert math.isclose(eot, eot_expected, abs_tol=1e-3)
+        assert math.isclose(decl, decl_expected, abs_tol=1e-8)
@@ -0,0 +1,95 @@
+import datetime as dt
+import math
+import random
+import pytest
+
+import salat
+from salat import _chebyshev_data as data
+from salat.calculations import eot_decl_seconds
+from salat.chebyshev import (
+    chebyshev_to_monomial,
+    decode_coefficients,
+    eot_decl_chebyshev,
+    eot_decl_chebyshev_array,
+    fit_coefficients,
+    write_data_module,
+)
+
+EOT_MARGIN = 5e-3 # seconds
+DECL_MARGIN = 2e-7 # radians
+TIME_MARGIN = 5e-2 # seconds
+
+START = data.START_SECONDS
+END = data.START_SECONDS + data.SEGMENTS * data.SEGMENT_SECONDS
+
+
+def test_chebyshev_matches_eot_decl():
+    random.seed(0)
+    for _ in range(20000):
+        seconds = random.uniform(START, END)
+        eot, decl = eot_decl_chebyshev(seconds)
+        eot_expected, decl_expected = eot_decl_seconds(seconds)
+        assert math.isclose(eot, eot_expected, abs_tol=EOT_MARGIN)
+        assert math.isclose(decl, decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_chebyshev_fallback():
+    for seconds in (START - 1, END, END + 1e6):
+        assert eot_decl_chebyshev(seconds) == eot_decl_seconds(seconds)
+
+
+def test_chebyshev_array():
+    np = pytest.importorskip("numpy")
+
+    seconds = np.linspace(START - 1e7, END + 1e7, 5000)
+    eot, decl = eot_decl_chebyshev_array(seconds)
+    for i, second in enumerate(seconds):
+        eot_expected, decl_expected = eot_decl_chebyshev(second)
+        assert math.isclose(eot[i], eot_expected, abs_tol=1e-9)
+        assert math.isclose(decl[i], decl_expected, abs_tol=1e-12)
+
+
+def test_chebyshev_to_monomial():
+    # T_3 = 4x^3 - 3x
+    assert chebyshev_to_monomial([0, 0, 0, 1]) == [0, -3, 0, 4]
+    # 1 + 2 T_1 + 3 T_2 = 1 + 2x + 3(2x^2 - 1)
+    assert chebyshev_to_monomial([1, 2, 3]) == [-2, 2, 6]
+
+
+def test_coefficients_up_to_date():
+    """Checks that the shipped coefficients are fitted to the current model in calculations.py. If
+    this fails, refit them with python -m salat.chebyshev
+    """
+    coefficients = fit_coefficients(START, data.SEGMENT_SECONDS, data.SEGMENTS, data.DEGREE)
+    shipped = decode_coefficients(data.COEFFICIENTS, 1, 1, data.DEGREE)
+    assert len(coefficients) == len(shipped)
+    # allow for rounding differences in the last digit between platforms
+    assert all(abs(a - b) <= 1 for a, b in zip(coefficients, shipped))
+
+
+def test_write_data_module(tmp_path):
+    path = tmp_path / "data.py"
+    write_data_module(path, dt.date(2000, 1, 1), dt.date(2001, 1, 1), 30, 5)
+
+    namespace = {}
+    exec(path.read_text(), namespace)
+    assert namespace["SEGMENTS"] == 13
+    assert namespace["DEGREE"] == 5
+    coefficients = decode_coefficients(
+        namespace["COEFFICIENTS"], namespace["EOT_SCALE"], namespace["DECL_SCALE"], 5
+    )
+    assert len(coefficients) == 13 * 2 * 6
+
+
+def test_chebyshev_prayer_times():
+    date = dt.date(2023, 6, 1)
+    longitude, latitude = 39.826206, 21.422487
+
+    for calc_method in salat.CalculationMethod:
+        pt = salat.PrayerTimes(calc_method)
+        times = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        pt = salat.PrayerTimes(calc_method, solar=eot_decl_chebyshev)
+        chebyshev_times = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        for name in times:
+            difference = (chebyshev_times[name] - times[name]).total_seconds()
+            assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
@@ -0,0 +1,107 @@
+import datetime as dt
+import math
+import pytest
+
+import salat
+from salat.calculations import eot_decl_seconds, to_seconds
+from salat.ephemeris import Ephemeris, build_ephemeris, main
+
+EOT_MARGIN = 1e-3 # seconds
+DECL_MARGIN = 1e-7 # radians
+TIME_MARGIN = 1e-2 # seconds
+
+START = dt.date(2023, 1, 1)
+END = dt.date(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def ephemeris(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephemeris") / "ephemeris.bin"
+    build_ephemeris(path, START, END)
+    with Ephemeris(path) as ephemeris:
+        yield ephemeris
+
+
+def test_ephemeris_matches_eot_decl(ephemeris):
+    assert ephemeris.start == to_seconds(dt.datetime(2023, 1, 1, tzinfo=dt.timezone.utc))
+    assert ephemeris.count == 365 * 24 + 1
+
+    # sample at times that are not on the hour to test interpolation
+    for i in range(2000):
+        seconds = ephemeris.start + i * 15731.3
+        eot, decl = ephemeris(seconds)
+        eot_expected, decl_expected = eot_decl_seconds(seconds)
+        assert math.isclose(eot, eot_expected, abs_tol=EOT_MARGIN)
+        assert math.isclose(decl, decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_ephemeris_fallback(ephemeris):
+    for seconds in (ephemeris.start - 1, ephemeris.end + 1, 0.0, 4e9):
+        assert ephemeris(seconds) == eot_decl_seconds(seconds)
+
+
+def test_ephemeris_array(ephemeris):
+    np = pytest.importorskip("numpy")
+
+    margin = 10 * 24 * 60 * 60
+    seconds = np.linspace(ephemeris.start - margin, ephemeris.end + margin, 500)
+    eot, decl = ephemeris.eot_decl_array(seconds)
+    for i, second in enumerate(seconds):
+        eot_expected, decl_expected = ephemeris(second)
+        assert math.isclose(eot[i], eot_expected, abs_tol=EOT_MARGIN)
+        assert math.isclose(decl[i], decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_ephemeris_prayer_times(ephemeris):
+    date = dt.date(2023, 6, 1)
+    longitude, latitude = -73.985428, 40.748817
+
+    for calc_method in salat.CalculationMethod:
+        pt = salat.PrayerTimes(calc_method)
+        times = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        pt = salat.PrayerTimes(calc_method, solar=ephemeris)
+        ephemeris_times = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        for name in times:
+            difference = (ephemeris_times[name] - times[name]).total_seconds()
+            assert math.isclose(difference, 0, abs_tol=TIME_MARGIN)
+
+
+def test_ephemeris_pickle(ephemeris):
+    import pickle
+
+    copy = pickle.loads(pickle.dumps(ephemeris))
+    try:
+        assert copy.path == ephemeris.path
+        assert copy.start == ephemeris.start
+        assert copy.count == ephemeris.count
+        seconds = ephemeris.start + 12345.6
+        assert copy(seconds) == ephemeris(seconds)
+    finally:
+        copy.close()
+
+
+def test_ephemeris_process_pool(ephemeris):
+    """Checks that methods using an ephemeris can be sent to worker processes"""
+    from salat import batch
+
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, solar=ephemeris)
+    locations = [(-73.985428, 40.748817), (39.826206, 21.422487)]
+    date = dt.date(2023, 6, 1)
+    expected = list(batch.generate(locations, date, date, pt, jobs=1))
+    results = list(batch.generate(locations, date, date, pt, jobs=2, chunksize=1))
+    assert [result.times for result in results] == [result.times for result in expected]
+
+
+def test_ephemeris_bad_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not an ephemeris file" * 10)
+    with pytest.raises(ValueError):
+        Ephemeris(path)
+
+
+def test_ephemeris_main(tmp_path):
+    path = tmp_path / "ephemeris.bin"
+    main([str(path), "--start", "2023-01-01", "--end", "2023-01-02", "--step", "600"])
+    with Ephemeris(path) as ephemeris:
+        assert ephemeris.count == 24 * 6 + 1
+        assert ephemeris.step == 600
@@ -1,5 +1,7 @@
 import salat
 import datetime as dt
+import math
+from salat.calculations import kepler_solve, kepler_solve_series
 from salat.methods import CalculationMethod, AsrMethod
 from hypothesis import assume, given, settings, strategies as st
 
@@ -35,4 +37,23 @@ def test_prayer_times_execution(calc_method, asr_method, date, timezone, longitu
         # For certain altitudes and dates, the sun doesn't ever cross the horizon.
         if str(error) == "Sun does not reach altitude":
             return
-        raise
\ No newline at end of file
+        raise
+
+@settings(max_examples=5000)
+@given(
+    M=st.floats(min_value=0, max_value=2 * math.pi, exclude_max=True),
+    # centuries since 2000, 1900 to 2100
+    y100=st.floats(min_value=-1.0, max_value=1.01),
+)
+def test_kepler_solve_series(M, y100):
+    """
+    Tests that the bounded kepler_solve_series matches kepler_solve over the eccentricities
+    eot_decl produces for 1900 to 2100.
+    """
+    # same as salat.calculations.eot_decl_seconds
+    e = 1.6709e-2 - 4.193e-5 * y100 - 1.26e-7 * y100 ** 2
+
+    E = kepler_solve_series(M, e)
+    # kepler_solve stops when it is within a relative tolerance of 1e-9
+    assert math.isclose(E, kepler_solve(M, e), rel_tol=1e-8, abs_tol=1e-8)
+    assert math.isclose(E - e * math.sin(E), M, abs_tol=1e-14)
@@ -0,0 +1,80 @@
+import datetime as dt
+import pytest
+
+import salat
+from salat import calculations
+from salat.instrumentation import instrument
+
+EMPIRE_STATE_BUILDING_LAT_LONG = (40.748333, -73.985278)
+
+
+def test_instrument_events():
+    """Checks that every event is recorded with its iterations, solar calls and time"""
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    date = dt.date(2023, 3, 1)
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+
+    samples = []
+    with instrument(samples.append) as recorder:
+        times = pt.calc_times(date, dt.timezone.utc, long, lat)
+    assert times == pt.calc_times(date, dt.timezone.utc, long, lat)
+
+    assert [sample.name for sample in samples] == list(times)
+    assert list(recorder.events) == list(times)
+    for sample in samples:
+        assert sample.date == date
+        assert (sample.longitude, sample.latitude) == (long, lat)
+        assert sample.iterations > 0
+        assert sample.solar_calls > 0
+        assert sample.seconds > 0
+        assert not sample.failed
+
+        stats = recorder.events[sample.name]
+        assert stats.count == 1
+        assert stats.iterations == stats.max_iterations == sample.iterations
+        assert stats.slowest == sample
+
+    assert recorder.iterations == sum(sample.iterations for sample in samples)
+
+
+def test_instrument_solar_calls(monkeypatch):
+    """Checks that solar calls match the evaluations of eot_decl_seconds"""
+    calls = 0
+    eot_decl_seconds = calculations.eot_decl_seconds
+
+    def counted(seconds):
+        nonlocal calls
+        calls += 1
+        return eot_decl_seconds(seconds)
+
+    monkeypatch.setattr(calculations, "eot_decl_seconds", counted)
+
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    with instrument() as recorder:
+        pt.calc_times_range(dt.date(2023, 1, 1), dt.date(2023, 1, 10), dt.timezone.utc, long, lat)
+
+    assert sum(stats.solar_calls for stats in recorder.events.values()) == calls
+    assert all(stats.count == 10 for stats in recorder.events.values())
+
+
+def test_instrument_failure():
+    """Checks that events the Sun does not reach are recorded as failed"""
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    with instrument() as recorder:
+        with pytest.raises(ValueError):
+            pt.calc_times(dt.date(2023, 6, 21), dt.timezone.utc, 0, 70)
+
+    assert recorder.events["fajr"].failures == 1
+    assert recorder.events["fajr"].slowest.failed
+
+
+def test_instrument_disabled():
+    """Checks that nothing is recorded outside of the block"""
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    with instrument() as recorder:
+        pass
+    pt.calc_times(dt.date(2023, 3, 1), dt.timezone.utc, long, lat)
+    assert recorder.events == {}
+    assert recorder.iterations == 0
@@ -1,6 +1,7 @@
 import salat
 import datetime as dt
 import math
+import pytest
 import pytz
 
 
@@ -210,6 +211,368 @@ def test6():
     output_timezone_correct(times, timezone)
 
 
+def test_calc_times_range():
+    """Checks that calc_times_range gives the same output as calc_times for every date"""
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    start = dt.date(2023, 3, 1)
+    end = dt.date(2023, 3, 31)
+    timezone = pytz.timezone("US/Eastern")
+
+    for calc_method in salat.CalculationMethod:
+        pt = salat.PrayerTimes(calc_method, salat.AsrMethod.STANDARD)
+        times_range = pt.calc_times_range(start, end, timezone, long, lat)
+        assert list(times_range) == [start + dt.timedelta(days=i) for i in range(31)]
+
+        for date, times in times_range.items():
+            true_times = pt.calc_times(date, timezone, long, lat)
+            output_correct(times, true_times, dt.timedelta(milliseconds=1))
+            output_timezone_correct(times, timezone)
+
+
+@pytest.mark.parametrize(
+    "latitude, start", [(48.6, dt.date(2023, 6, 10)), (-48.6, dt.date(2023, 12, 11))]
+)
+def test_calc_times_range_unreachable(latitude, start):
+    """Checks that days seeded from the previous one fail exactly where calc_times does, at the
+    start of a period in which the Sun does not get low enough for fajr and isha
+    """
+    from salat import batch
+
+    longitude = 10.0
+    end = start + dt.timedelta(days=20)
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    dates = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+
+    expected = {}
+    for date in dates:
+        try:
+            expected[date] = pt.calc_times(date, dt.timezone.utc, longitude, latitude)
+        except ValueError:
+            expected[date] = None
+    assert None in expected.values()
+
+    for previous, date in zip(dates, dates[1:]):
+        if expected[previous] is None or expected[date] is None:
+            with pytest.raises(ValueError):
+                pt.calc_times_range(previous, date, dt.timezone.utc, longitude, latitude)
+        else:
+            times = pt.calc_times_range(previous, date, dt.timezone.utc, longitude, latitude)
+            output_correct(times[date], expected[date], dt.timedelta(milliseconds=1))
+
+    table = batch.timetable((longitude, latitude), start, end, pt)
+    assert sorted(table.errors) == [date for date in dates if expected[date] is None]
+    for date, times in table.times.items():
+        output_correct(times, expected[date], dt.timedelta(milliseconds=1))
+
+
+def test_calc_times_range_fewer_evaluations(monkeypatch):
+    """Checks that seeding each day from the previous one reduces the number of solar evaluations"""
+    import salat.calculations
+
+    calls = [0]
+    eot_decl_seconds = salat.calculations.eot_decl_seconds
+
+    def counting_eot_decl_seconds(seconds):
+        calls[0] += 1
+        return eot_decl_seconds(seconds)
+
+    monkeypatch.setattr(salat.calculations, "eot_decl_seconds", counting_eot_decl_seconds)
+
+    lat, long = KAABAH_LAT_LONG
+    start = dt.date(2023, 1, 1)
+    end = dt.date(2023, 1, 31)
+    timezone = pytz.timezone("Asia/Riyadh")
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL, salat.AsrMethod.STANDARD)
+
+    pt.calc_times_range(start, end, timezone, long, lat)
+    range_calls = calls[0]
+
+    calls[0] = 0
+    for i in range((end - start).days + 1):
+        pt.calc_times(start + dt.timedelta(days=i), timezone, long, lat)
+    cold_calls = calls[0]
+
+    assert range_calls < cold_calls * 0.85
+
+
+def test_events_solved_once(monkeypatch):
+    """Checks that methods which change an event do not also calculate the default one"""
+    import salat.calculations
+
+    altitudes = []
+    time_altitude = salat.calculations.SolarDay.time_altitude
+
+    def recording_time_altitude(self, altitude, latitude, rising, guess=None):
+        altitudes.append((altitude, rising))
+        return time_altitude(self, altitude, latitude, rising, guess)
+
+    monkeypatch.setattr(salat.calculations.SolarDay, "time_altitude", recording_time_altitude)
+
+    lat, long = KAABAH_LAT_LONG
+    for calc_method in salat.CalculationMethod:
+        altitudes.clear()
+        pt = salat.PrayerTimes(calc_method, salat.AsrMethod.STANDARD)
+        pt.calc_times(EPOCH_DATE, dt.timezone.utc, long, lat)
+        assert len(altitudes) == len(set(altitudes))
+        if calc_method == salat.CalculationMethod.MAKKAH:
+            # isha is relative to maghrib
+            assert len(altitudes) == 3
+        else:
+            assert len(altitudes) == 4
+
+
+def test_makkah_high_latitude():
+    """Isha of MakkahMethod is relative to maghrib, so it exists even when the Sun does not reach
+    the Fajr angle after sunset
+    """
+    pt = salat.PrayerTimes(salat.CalculationMethod.MAKKAH)
+    date = dt.date(2023, 6, 21)
+    timezone = pytz.timezone("Europe/Oslo")
+
+    # fajr angle is never reached
+    with pytest.raises(ValueError):
+        pt.calc_times(date, timezone, 10.75, 59.91)
+
+    # the Sun reaches 6 degrees below the horizon
+    pt.events["fajr"] = salat.methods.Altitude(-math.radians(6), rising=True)
+    times = pt.calc_times(date, timezone, 10.75, 59.91)
+    assert times["isha"] - times["maghrib"] == dt.timedelta(minutes=90)
+
+
+def test_newton_solver():
+    """Checks that the Newton solver gives the same times as the secant solver with fewer solar
+    evaluations
+    """
+    from salat.instrumentation import instrument
+
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    start = dt.date(2023, 1, 1)
+    end = dt.date(2023, 12, 31)
+    timezone = pytz.timezone("US/Eastern")
+
+    for calc_method in salat.CalculationMethod:
+        secant = salat.PrayerTimes(calc_method, solver=salat.Solver.SECANT)
+        newton = salat.PrayerTimes(calc_method, solver=salat.Solver.NEWTON)
+        assert newton.solver == salat.Solver.NEWTON
+
+        with instrument() as secant_recorder:
+            secant_times = secant.calc_times_range(start, end, timezone, long, lat)
+        with instrument() as newton_recorder:
+            newton_times = newton.calc_times_range(start, end, timezone, long, lat)
+
+        for date, times in secant_times.items():
+            output_correct(newton_times[date], times, dt.timedelta(milliseconds=1))
+
+        secant_calls = sum(stats.solar_calls for stats in secant_recorder.events.values())
+        newton_calls = sum(stats.solar_calls for stats in newton_recorder.events.values())
+        assert newton_calls < secant_calls
+
+
+def test_joint_solver():
+    """Checks that the default joint solver gives the same times as the secant solver with fewer
+    solar evaluations than any other solver
+    """
+    from salat.instrumentation import instrument
+
+    start = dt.date(2023, 1, 1)
+    end = dt.date(2023, 12, 31)
+    timezone = pytz.timezone("US/Eastern")
+
+    for lat, long in [EMPIRE_STATE_BUILDING_LAT_LONG, KAABAH_LAT_LONG]:
+        for calc_method in salat.CalculationMethod:
+            joint = salat.PrayerTimes(calc_method)
+            assert joint.solver == salat.Solver.JOINT
+
+            calls = {}
+            times = {}
+            for solver in salat.Solver:
+                pt = salat.PrayerTimes(calc_method, solver=solver)
+                with instrument() as recorder:
+                    times[solver] = pt.calc_times_range(start, end, timezone, long, lat)
+                calls[solver] = sum(stats.solar_calls for stats in recorder.events.values())
+
+            for date, secant_times in times[salat.Solver.SECANT].items():
+                output_correct(
+                    times[salat.Solver.JOINT][date], secant_times, dt.timedelta(milliseconds=1)
+                )
+            assert calls[salat.Solver.JOINT] < calls[salat.Solver.NEWTON]
+            assert calls[salat.Solver.JOINT] < calls[salat.Solver.SECANT]
+
+
+def test_precision():
+    """Checks every precision against the exact one, within its documented error"""
+    margins = {
+        salat.Precision.TABLE: dt.timedelta(milliseconds=50),
+        salat.Precision.FAST: dt.timedelta(seconds=2),
+    }
+    timezone = dt.timezone.utc
+    start = dt.date(2023, 1, 1)
+    end = dt.date(2023, 12, 31)
+
+    for calc_method in salat.CalculationMethod:
+        exact = salat.PrayerTimes(calc_method)
+        for precision, margin in margins.items():
+            pt = salat.PrayerTimes(calc_method, precision=precision)
+            assert pt.precision == precision
+            # up to the documented limit of 45 degrees of latitude
+            locations = [
+                KAABAH_LAT_LONG,
+                EMPIRE_STATE_BUILDING_LAT_LONG,
+                (-33.86, 151.21),
+                (45.0, -74.0),
+                (-45.0, 170.5),
+            ]
+            for lat, long in locations:
+                exact_times = exact.calc_times_range(start, end, timezone, long, lat)
+                times = pt.calc_times_range(start, end, timezone, long, lat)
+                for date in exact_times:
+                    output_correct(times[date], exact_times[date], margin)
+
+
+def test_precision_solar():
+    """Precisions other than exact bring their own solar function"""
+    from salat.calculations import eot_decl_seconds
+
+    salat.PrayerTimes(solar=eot_decl_seconds, precision=salat.Precision.EXACT)
+    with pytest.raises(ValueError):
+        salat.PrayerTimes(solar=eot_decl_seconds, precision=salat.Precision.FAST)
+    with pytest.raises(ValueError):
+        salat.PrayerTimes(solar=eot_decl_seconds, precision=salat.Precision.TABLE)
+
+
+def test_iter_times():
+    """Checks that iter_times yields the same output as calc_times_range, one day at a time"""
+    lat, long = KAABAH_LAT_LONG
+    start = dt.date(2023, 3, 1)
+    end = dt.date(2023, 3, 10)
+    timezone = pytz.timezone("Asia/Riyadh")
+    pt = salat.PrayerTimes(salat.CalculationMethod.MAKKAH)
+
+    times_range = pt.calc_times_range(start, end, timezone, long, lat)
+    iterator = pt.iter_times(start, end, timezone, long, lat)
+    assert not isinstance(iterator, (list, dict))
+    assert list(iterator) == list(times_range.items())
+
+
+def test_iter_times_cancel():
+    """Checks that iter_times only calculates requested days and can be stopped early"""
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+    start = dt.date(2000, 1, 1)
+    timezone = pytz.timezone("US/Eastern")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+
+    # would take minutes if calculated eagerly
+    iterator = pt.iter_times(start, dt.date(9999, 12, 31), timezone, long, lat)
+    date, times = next(iterator)
+    assert date == start
+    output_correct(times, pt.calc_times(start, timezone, long, lat), dt.timedelta(milliseconds=1))
+
+    iterator.close()
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+    # no end
+    dates = []
+    for date, _ in pt.iter_times(start, None, timezone, long, lat):
+        dates.append(date)
+        if len(dates) == 400:
+            break
+    assert dates == [start + dt.timedelta(days=i) for i in range(400)]
+
+
+def test_is_ramadan():
+    """Checks the Ramadan index against converting every supported date"""
+    from hijri_converter import Gregorian
+
+    date = dt.date(1924, 8, 1)
+    while date <= dt.date(2077, 11, 16):
+        hijri_date = Gregorian(date.year, date.month, date.day).to_hijri()
+        assert salat.methods.is_ramadan(date) == (hijri_date.month == 9)
+        date += dt.timedelta(days=1)
+
+    for date in [dt.date(1924, 7, 31), dt.date(2077, 11, 17)]:
+        with pytest.raises(OverflowError):
+            salat.methods.is_ramadan(date)
+
+
+def test_calc_times_methods(monkeypatch):
+    """Checks that every method gets the same times as calc_times, and that the events they share
+    are solved once
+    """
+    import salat.calculations
+
+    methods = {
+        (calc_method, asr_method): salat.PrayerTimes(calc_method, asr_method)
+        for calc_method in salat.CalculationMethod
+        for asr_method in salat.AsrMethod
+    }
+    methods["table"] = salat.PrayerTimes(precision=salat.Precision.TABLE)
+    timezone = pytz.timezone("US/Eastern")
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+
+    results = salat.calc_times_methods(methods, EPOCH_DATE, timezone, long, lat)
+    assert list(results) == list(methods)
+    for key, method in methods.items():
+        assert results[key] == method.calc_times(EPOCH_DATE, timezone, long, lat)
+
+    solves = []
+    time_altitude = salat.calculations.SolarDay.time_altitude
+
+    def recording_time_altitude(self, altitude, latitude, rising, guess=None):
+        solves.append((id(self), altitude, rising))
+        return time_altitude(self, altitude, latitude, rising, guess)
+
+    monkeypatch.setattr(salat.calculations.SolarDay, "time_altitude", recording_time_altitude)
+    salat.calc_times_methods(methods, EPOCH_DATE, timezone, long, lat)
+    assert len(solves) == len(set(solves))
+
+
+def test_calc_times_methods_event_types():
+    """Checks that events of different types with equal fields are solved separately"""
+    from salat.methods import Altitude, ShadowFactor
+
+    methods = {
+        "altitude": salat.PrayerTimes(salat.CalculationMethod.ISNA),
+        "shadow_factor": salat.PrayerTimes(salat.CalculationMethod.ISNA),
+    }
+    methods["altitude"].events["asr"] = Altitude(0.2, False)
+    methods["shadow_factor"].events["asr"] = ShadowFactor(0.2, False)
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+
+    results = salat.calc_times_methods(methods, EPOCH_DATE, dt.timezone.utc, long, lat)
+    for key, method in methods.items():
+        assert results[key] == method.calc_times(EPOCH_DATE, dt.timezone.utc, long, lat)
+    assert results["altitude"]["asr"] != results["shadow_factor"]["asr"]
+
+
+def test_calc_times_methods_cache(tmp_path):
+    """Checks that methods with a cache get the times of calc_times at the rounded location, and
+    store them
+    """
+    from salat.persistent import TimetableCache
+
+    cache = TimetableCache(str(tmp_path / "times.sqlite"), digits=1)
+    methods = {
+        "cached": salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=cache),
+        "plain": salat.PrayerTimes(salat.CalculationMethod.ISNA),
+    }
+    lat, long = EMPIRE_STATE_BUILDING_LAT_LONG
+
+    results = salat.calc_times_methods(methods, EPOCH_DATE, dt.timezone.utc, long, lat)
+    for key, method in methods.items():
+        assert results[key] == method.calc_times(EPOCH_DATE, dt.timezone.utc, long, lat)
+    assert results["cached"] != results["plain"]
+
+    stored = cache.get_range(
+        methods["cached"]._cache_key(),
+        tuple(methods["cached"].events),
+        *cache.round_location(long, lat),
+        EPOCH_DATE,
+        EPOCH_DATE,
+    )
+    assert list(stored) == [EPOCH_DATE]
+
+
 # TODO:
 # 1. check locations where signs of longitude and timezone offset are different (ie. long = -170, timezone= +12)
 # 2. check daylight savings time transition points
@@ -0,0 +1,131 @@
+import datetime as dt
+import pickle
+import pytest
+import pytz
+
+import salat
+from salat import persistent
+from salat.persistent import TimetableCache
+
+LONGITUDE, LATITUDE = -73.985428, 40.748817
+START = dt.date(2023, 1, 1)
+END = dt.date(2023, 3, 31)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "times.sqlite")
+
+
+def count_calculations(monkeypatch, method):
+    """Counts the days method calculates instead of reading from its cache"""
+    calls = []
+    calc_day_utc = method._calc_day_utc
+
+    def counting_calc_day_utc(*args, **kwargs):
+        calls.append(args[0])
+        return calc_day_utc(*args, **kwargs)
+
+    monkeypatch.setattr(method, "_calc_day_utc", counting_calc_day_utc)
+    return calls
+
+
+def test_calc_times(path, monkeypatch):
+    """Checks that cached times are the same as the times of the rounded location"""
+    timezone = pytz.timezone("US/Eastern")
+    plain = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    cached = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path))
+    calls = count_calculations(monkeypatch, cached)
+
+    longitude, latitude = round(LONGITUDE, 4), round(LATITUDE, 4)
+    expected = plain.calc_times(START, timezone, longitude, latitude)
+    assert cached.calc_times(START, timezone, LONGITUDE, LATITUDE) == expected
+    assert cached.calc_times(START, timezone, longitude, latitude) == expected
+    assert len(calls) == 1
+
+    # a new process with the same file does not calculate again
+    reopened = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path))
+    calls = count_calculations(monkeypatch, reopened)
+    assert reopened.calc_times(START, timezone, LONGITUDE, LATITUDE) == expected
+    assert calls == []
+
+
+def test_calc_times_range(path, monkeypatch):
+    """Checks that a range only calculates the days that are not stored yet"""
+    timezone = pytz.timezone("US/Eastern")
+    cache = TimetableCache(path)
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL, cache=cache)
+    plain = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    calls = count_calculations(monkeypatch, pt)
+
+    middle = dt.date(2023, 2, 1)
+    pt.calc_times_range(middle, END, timezone, LONGITUDE, LATITUDE)
+    assert len(calls) == (END - middle).days + 1
+    calls.clear()
+
+    times = pt.calc_times_range(START, END, timezone, LONGITUDE, LATITUDE)
+    assert calls == [START + dt.timedelta(days=day) for day in range((middle - START).days)]
+    expected = plain.calc_times_range(
+        START, END, timezone, round(LONGITUDE, 4), round(LATITUDE, 4)
+    )
+    assert times.keys() == expected.keys()
+    for date, day_times in expected.items():
+        for name, time in day_times.items():
+            assert abs(times[date][name] - time) < dt.timedelta(milliseconds=1)
+
+    # methods only share the times of the same events
+    other = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=cache)
+    calls = count_calculations(monkeypatch, other)
+    other.calc_times(START, timezone, LONGITUDE, LATITUDE)
+    assert calls == [START]
+
+
+def test_errors(path, monkeypatch):
+    """Checks that days the Sun does not reach an altitude are stored as errors"""
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL, cache=TimetableCache(path))
+    date = dt.date(2023, 6, 21)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            pt.calc_times(date, dt.timezone.utc, 10.75, 59.91)
+
+    calls = count_calculations(monkeypatch, pt)
+    with pytest.raises(ValueError):
+        pt.calc_times(date, dt.timezone.utc, 10.75, 59.91)
+    assert calls == []
+
+    from salat import batch
+
+    result = batch.timetable((10.75, 59.91), date, date, pt)
+    assert list(result.errors) == [date]
+
+
+def test_invalidation(path, monkeypatch):
+    """Checks that the file is cleared when the algorithm or rounding changes"""
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path))
+    pt.calc_times(START, dt.timezone.utc, LONGITUDE, LATITUDE)
+
+    reopened = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path, 3))
+    calls = count_calculations(monkeypatch, reopened)
+    reopened.calc_times(START, dt.timezone.utc, LONGITUDE, LATITUDE)
+    assert calls == [START]
+
+    monkeypatch.setattr(persistent, "algorithm_version", lambda: "changed")
+    reopened = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path, 3))
+    calls = count_calculations(monkeypatch, reopened)
+    reopened.calc_times(START, dt.timezone.utc, LONGITUDE, LATITUDE)
+    assert calls == [START]
+
+
+def test_arguments(path):
+    with pytest.raises(ValueError):
+        TimetableCache(path, -1)
+    with pytest.raises(ValueError):
+        salat.PrayerTimes(solar=lambda seconds: (0, 0), cache=TimetableCache(path))
+
+
+def test_pickle(path):
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA, cache=TimetableCache(path))
+    times = pt.calc_times(START, dt.timezone.utc, LONGITUDE, LATITUDE)
+    unpickled = pickle.loads(pickle.dumps(pt))
+    assert unpickled.cache.path == path
+    assert unpickled.calc_times(START, dt.timezone.utc, LONGITUDE, LATITUDE) == times
@@ -0,0 +1,141 @@
+from array import array
+import copy
+import datetime as dt
+import pickle
+import sys
+import pytest
+import pytz
+
+import salat
+from salat.results import MISSING, DayTimes, TimesTable
+
+# times are stored as whole seconds
+MARGIN = dt.timedelta(seconds=0.5)
+
+LOCATIONS = [(-73.985428, 40.748817), (10.75, 78.22)]  # New York and Svalbard
+START = dt.date(2023, 5, 1)
+END = dt.date(2023, 5, 10)
+
+
+def test_day_times():
+    timezone = pytz.timezone("US/Eastern")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    date = dt.date(2023, 5, 1)
+    longitude, latitude = LOCATIONS[0]
+
+    expected = pt.calc_times(date, timezone, longitude, latitude)
+    day = pt.calc_day_times(date, timezone, longitude, latitude)
+    assert tuple(day.keys()) == tuple(expected)
+    for name, time in expected.items():
+        assert abs(day[name] - time) <= MARGIN
+        assert day[name].utcoffset() == time.utcoffset()
+    assert day.fajr == day["fajr"]
+    assert day.to_dict() == dict(day.items())
+
+    with pytest.raises(KeyError):
+        day["sunset"]
+    with pytest.raises(AttributeError):
+        day.sunset
+    # records have no __dict__
+    with pytest.raises(AttributeError):
+        day.extra = 1
+
+
+def test_day_times_copy():
+    """Checks that records survive pickling and copying, as when sent between processes"""
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    day = pt.calc_day_times(START, pytz.timezone("US/Eastern"), *LOCATIONS[0])
+
+    for copied in [pickle.loads(pickle.dumps(day)), copy.copy(day), copy.deepcopy(day)]:
+        assert copied is not day
+        assert repr(copied) == repr(day)
+        assert copied.timezone.zone == "US/Eastern"
+        assert copied.to_dict() == day.to_dict()
+        assert copied.fajr == day.fajr
+
+
+def test_times_table():
+    """Checks the table against calc_times, and that days that fail are MISSING"""
+    timezone = pytz.timezone("US/Eastern")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    table = pt.calc_times_table(START, END, timezone, LOCATIONS)
+    days = (END - START).days + 1
+    assert len(table) == days * len(LOCATIONS)
+
+    rows = iter(table)
+    for longitude, latitude in LOCATIONS:
+        for day in range(days):
+            date = START + dt.timedelta(days=day)
+            row = next(rows)
+            assert row.date == date
+            assert (row.longitude, row.latitude) == (longitude, latitude)
+            try:
+                expected = pt.calc_times(date, timezone, longitude, latitude)
+            except ValueError:
+                assert set(row.seconds) == {MISSING}
+                assert row.to_dict() == dict.fromkeys(pt.events)
+                continue
+            for name, time in expected.items():
+                assert abs(row[name] - time) <= MARGIN
+
+    assert table[-1].date == END
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+
+def test_times_table_buffers():
+    """Checks that columns and the NumPy arrays share the table's memory"""
+    np = pytest.importorskip("numpy")
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    table = pt.calc_times_table(START, END, dt.timezone.utc, LOCATIONS[:1])
+    rows = len(table)
+
+    fajr = table.column("fajr")
+    assert fajr.format == "q"
+    assert list(fajr) == [row.seconds[0] for row in table]
+    with pytest.raises(KeyError):
+        table.column("sunset")
+
+    array = table.to_numpy()
+    assert array.shape == (len(table.names), rows)
+    as_array = np.asarray(table)
+    assert as_array.dtype == np.int64
+    assert as_array.shape == (len(table.names), rows)
+    assert np.asarray(table, dtype=float).dtype == float
+    table.data[0] += 1
+    assert array[0, 0] == as_array[0, 0] == fajr[0]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="buffer protocol in Python needs 3.12")
+def test_times_table_buffer_protocol():
+    pt = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    table = pt.calc_times_table(START, END, dt.timezone.utc, LOCATIONS[:1])
+
+    view = memoryview(table)
+    assert view.shape == (len(table.names), len(table))
+    table.data[0] += 1
+    assert view[0, 0] == table.column("fajr")[0]
+
+
+def test_times_table_empty():
+    np = pytest.importorskip("numpy")
+    table = TimesTable.from_rows(("fajr",), dt.timezone.utc, [])
+    assert len(table) == 0
+    assert list(table) == []
+    assert table.to_numpy().shape == (1, 0)
+    assert np.asarray(table).shape == (1, 0)
+    if sys.version_info >= (3, 12):
+        assert len(memoryview(table)) == 0
+
+
+def test_times_table_lengths():
+    coordinates = array("d", [0.0])
+    ordinals = array("q", [dt.date(2023, 1, 1).toordinal()])
+    with pytest.raises(ValueError):
+        TimesTable(("fajr", "isha"), dt.timezone.utc, coordinates, coordinates, ordinals, array("q"))
+
+
+def test_day_times_missing():
+    day = DayTimes(dt.date(2023, 1, 1), 0, 0, dt.timezone.utc, ("fajr", "isha"), [0, MISSING])
+    assert day.fajr == dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+    assert day.isha is None
@@ -0,0 +1,103 @@
+from concurrent.futures import ProcessPoolExecutor
+import datetime as dt
+import pytest
+import pytz
+
+import salat
+from salat.shared import SharedTimetables
+
+LOCATIONS = [(-73.985428, 40.748817), (39.826206, 21.422487), (31.235712, 30.044420)]
+START = dt.date(2023, 6, 1)
+END = dt.date(2023, 6, 30)
+
+
+@pytest.fixture
+def store():
+    method = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    with SharedTimetables.create(method, LOCATIONS, START, END) as store:
+        yield store
+
+
+def test_calc_times(store):
+    """Checks that stored times are the calculated times rounded to the second"""
+    timezone = pytz.timezone("US/Eastern")
+    method = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    worker = SharedTimetables.attach(store.name, method)
+    try:
+        for longitude, latitude in LOCATIONS:
+            for date in [START, dt.date(2023, 6, 15), END]:
+                stored = worker.calc_times(date, timezone, longitude, latitude)
+                expected = method.calc_times(date, timezone, longitude, latitude)
+                assert stored.keys() == expected.keys()
+                for name, time in stored.items():
+                    assert abs(time - expected[name]) <= dt.timedelta(seconds=0.5)
+                    assert time.utcoffset() == expected[name].utcoffset()
+    finally:
+        worker.close()
+
+
+def test_calc_times_miss(store, monkeypatch):
+    """Checks that locations and dates outside the store are calculated"""
+    calls = []
+    calc_times = store.method.calc_times
+
+    def counting_calc_times(*args):
+        calls.append(args)
+        return calc_times(*args)
+
+    monkeypatch.setattr(store.method, "calc_times", counting_calc_times)
+    longitude, latitude = LOCATIONS[0]
+    store.calc_times(START, pytz.utc, longitude, latitude)
+    assert calls == []
+
+    for date, location in [
+        (START - dt.timedelta(days=1), LOCATIONS[0]),
+        (END + dt.timedelta(days=1), LOCATIONS[0]),
+        (START, (0.0, 0.0)),
+    ]:
+        times = store.calc_times(date, pytz.utc, *location)
+        assert times == calc_times(date, pytz.utc, *location)
+    assert len(calls) == 3
+
+
+def test_calc_times_missing():
+    """Checks that days the Sun does not reach an altitude raise like calc_times"""
+    method = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    with SharedTimetables.create(method, [(18.95, 69.65)], START, START) as store:
+        with pytest.raises(ValueError):
+            method.calc_times(START, pytz.utc, 18.95, 69.65)
+        with pytest.raises(ValueError):
+            store.calc_times(START, pytz.utc, 18.95, 69.65)
+
+
+def test_table(store):
+    """Checks that the table in shared memory matches calc_times_table"""
+    expected = store.method.calc_times_table(START, END, dt.timezone.utc, LOCATIONS)
+    assert store.table.names == expected.names
+    assert list(store.table.ordinals) == list(expected.ordinals)
+    assert list(store.table.longitudes) == list(expected.longitudes)
+    assert list(store.table.data) == list(expected.data)
+
+
+def test_attach_other_method(store):
+    with pytest.raises(ValueError):
+        SharedTimetables.attach(store.name, salat.PrayerTimes(salat.CalculationMethod.ISNA))
+
+
+def lookup(name):
+    method = salat.PrayerTimes(salat.CalculationMethod.MWL)
+    worker = SharedTimetables.attach(name, method)
+    try:
+        return worker.calc_times(START, pytz.utc, *LOCATIONS[1])
+    finally:
+        worker.close()
+
+
+def test_attach_process(store):
+    """Checks that worker processes read the store, and leave it in place when they exit"""
+    with ProcessPoolExecutor(1) as executor:
+        times = executor.submit(lookup, store.name).result()
+    assert times == store.calc_times(START, pytz.utc, *LOCATIONS[1])
+
+    # still attachable after the worker exited
+    assert lookup(store.name) == times
@@ -0,0 +1,82 @@
+import datetime as dt
+import random
+import zoneinfo
+import pytest
+import pytz
+
+import salat
+from salat.calculations import to_datetime, to_seconds
+from salat.timezones import OffsetTransitions
+
+TIMEZONES = [
+    pytz.timezone("US/Eastern"),
+    pytz.timezone("Asia/Tehran"),
+    # changed offset twice within a week in October 2000
+    pytz.timezone("America/Recife"),
+    zoneinfo.ZoneInfo("America/New_York"),
+    # daylight saving time of 30 minutes
+    zoneinfo.ZoneInfo("Australia/Lord_Howe"),
+    dt.timezone.utc,
+    dt.timezone(dt.timedelta(hours=-3, minutes=-30)),
+]
+
+
+def assert_identical(time: dt.datetime, expected: dt.datetime):
+    assert time.replace(tzinfo=None) == expected.replace(tzinfo=None)
+    assert time.tzinfo is expected.tzinfo
+    assert time.fold == expected.fold
+
+
+@pytest.mark.parametrize("timezone", TIMEZONES, ids=str)
+def test_to_datetime(timezone):
+    """Checks that conversions are identical to astimezone, in random order and around
+    transitions
+    """
+    rng = random.Random(0)
+    transitions = OffsetTransitions(timezone)
+    instants = [rng.uniform(-1e9, 4e9) for _ in range(2000)]
+    # every hour plus a fraction of a second, covering every transition of 2000 and 2023
+    for year in [2000, 2023]:
+        start = to_seconds(dt.datetime(year, 1, 1, tzinfo=dt.timezone.utc))
+        instants += [start + hour * 3600 + rng.random() for hour in range(366 * 24)]
+
+    for seconds in instants:
+        assert_identical(
+            transitions.to_datetime(seconds), to_datetime(seconds).astimezone(timezone)
+        )
+
+
+def test_to_datetime_transition():
+    """Checks the instants right before and after a transition and the repeated hour"""
+    timezone = zoneinfo.ZoneInfo("America/New_York")
+    transition = to_seconds(dt.datetime(2023, 11, 5, 6, tzinfo=dt.timezone.utc))
+    transitions = OffsetTransitions(timezone)
+
+    for seconds in [transition - 1e-6, transition, transition + 3600 - 1e-6, transition + 3600]:
+        assert_identical(
+            transitions.to_datetime(seconds), to_datetime(seconds).astimezone(timezone)
+        )
+    assert transitions.to_datetime(transition).fold == 1
+    assert transitions.to_datetime(transition + 3600).fold == 0
+
+
+def test_span():
+    with pytest.raises(ValueError):
+        OffsetTransitions(dt.timezone.utc, 0)
+
+
+def test_calc_times_range():
+    """Checks that a range over both daylight saving time changes matches calc_times exactly"""
+    timezone = pytz.timezone("US/Eastern")
+    pt = salat.PrayerTimes(salat.CalculationMethod.ISNA)
+    longitude, latitude = -73.985428, 40.748817
+    times_range = pt.calc_times_range(
+        dt.date(2023, 1, 1), dt.date(2023, 12, 31), timezone, longitude, latitude
+    )
+
+    for date in [dt.date(2023, 3, 12), dt.date(2023, 3, 13), dt.date(2023, 11, 5)]:
+        expected = pt.calc_times(date, timezone, longitude, latitude)
+        for name, time in expected.items():
+            # seeded days differ from calc_times by solver tolerance, not by offset
+            assert times_range[date][name].tzinfo is time.tzinfo
+            assert abs(times_range[date][name] - time) < dt.timedelta(seconds=1)
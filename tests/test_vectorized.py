@@ -0,0 +1,128 @@
+import datetime as dt
+import math
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from salat.calculations import eot_decl, kepler_solve
+from salat.vectorized import eot_decl_array, kepler_solve_array
+
+EOT_MARGIN = 1e-3 # seconds
+DECL_MARGIN = 1e-8 # radians
+KEPLER_SOLVE_MARGIN = 1e-6 # radians
+BATCH_MARGIN = 1e-3 # seconds
+
+
+def test_eot_decl_array_matches_scalar():
+    start = dt.datetime(1900, 1, 1, tzinfo=dt.timezone.utc).timestamp()
+    end = dt.datetime(2100, 12, 31, tzinfo=dt.timezone.utc).timestamp()
+    seconds = np.linspace(start, end, 5000)
+
+    eot, decl = eot_decl_array(seconds)
+    assert eot.shape == seconds.shape
+    assert decl.shape == seconds.shape
+
+    for i, second in enumerate(seconds):
+        time = dt.datetime.fromtimestamp(second, tz=dt.timezone.utc)
+        eot_expected, decl_expected = eot_decl(time)
+        assert math.isclose(eot[i], eot_expected.total_seconds(), abs_tol=EOT_MARGIN)
+        assert math.isclose(decl[i], decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_eot_decl_array_scalar_input():
+    time = dt.datetime(2023, 1, 1, hour=12, tzinfo=dt.timezone.utc)
+    eot, decl = eot_decl_array(time.timestamp())
+    eot_expected, decl_expected = eot_decl(time)
+    assert math.isclose(float(eot), eot_expected.total_seconds(), abs_tol=EOT_MARGIN)
+    assert math.isclose(float(decl), decl_expected, abs_tol=DECL_MARGIN)
+
+
+def test_kepler_solve_array():
+    M = np.linspace(0, 2 * math.pi, 1000, endpoint=False)
+    e = 0.5
+    E = kepler_solve_array(M, e)
+    for i in range(len(M)):
+        assert math.isclose(E[i], kepler_solve(M[i], e), abs_tol=KEPLER_SOLVE_MARGIN)
+
+
+def test_kepler_solve_array_bad_eccentricity():
+    with pytest.raises(ValueError):
+        kepler_solve_array(np.array([1.0, 2.0]), np.array([0.5, 1.0]))
+
+
+def test_calc_times_batch():
+    """Checks that calc_times_batch matches calc_times for every location"""
+    import salat
+
+    date = dt.date(2023, 5, 22)
+    rng = np.random.default_rng(0)
+    longitudes = rng.uniform(-180, 180, 50)
+    latitudes = rng.uniform(-45, 45, 50)
+
+    for calc_method in salat.CalculationMethod:
+        pt = salat.PrayerTimes(calc_method, salat.AsrMethod.HANAFI)
+        batch = pt.calc_times_batch(date, longitudes, latitudes)
+
+        for i in range(len(longitudes)):
+            times = pt.calc_times(date, dt.timezone.utc, longitudes[i], latitudes[i])
+            assert batch.keys() == times.keys()
+            for name, time in times.items():
+                assert batch[name].shape == longitudes.shape
+                assert math.isclose(batch[name][i], time.timestamp(), abs_tol=BATCH_MARGIN)
+
+
+def test_calc_times_batch_unreachable(tmp_path):
+    """Checks that times the Sun does not reach are NaN instead of failing the batch, whether the
+    locations are calculated together or one by one
+    """
+    import salat
+    from salat.persistent import TimetableCache
+
+    date = dt.date(2023, 6, 21)
+    methods = [
+        salat.PrayerTimes(salat.CalculationMethod.MWL),
+        salat.PrayerTimes(salat.CalculationMethod.MWL, precision=salat.Precision.FAST),
+        salat.PrayerTimes(
+            salat.CalculationMethod.MWL, cache=TimetableCache(str(tmp_path / "times.sqlite"), 1)
+        ),
+    ]
+    for pt in methods:
+        batch = pt.calc_times_batch(date, [0, 0], [0, 70])
+
+        assert not np.isnan(batch["fajr"][0])
+        assert np.isnan(batch["fajr"][1])
+        assert np.isnan(batch["isha"][1])
+        assert not np.isnan(batch["dhuhr"][1])
+        assert not np.isnan(batch["asr"][1])
+
+
+def test_calc_times_batch_settings(tmp_path):
+    """Checks that calc_times_batch honours the solar function, precision and cache of a method"""
+    import salat
+    from salat.calculations import eot_decl_seconds
+    from salat.persistent import TimetableCache
+
+    def shifted_solar(seconds):
+        eot, decl = eot_decl_seconds(seconds)
+        return eot + 60, decl
+
+    date = dt.date(2023, 5, 22)
+    longitudes = np.array([-73.985428, 39.826206, 151.21, 10.75])
+    latitudes = np.array([40.748817, 21.422487, -33.86, 59.91])
+    methods = [
+        (salat.PrayerTimes(solar=shifted_solar), BATCH_MARGIN),
+        (salat.PrayerTimes(precision=salat.Precision.TABLE), BATCH_MARGIN),
+        (salat.PrayerTimes(precision=salat.Precision.FAST), 0),
+        (salat.PrayerTimes(cache=TimetableCache(str(tmp_path / "times.sqlite"), 1)), 0),
+    ]
+
+    for pt, margin in methods:
+        batch = pt.calc_times_batch(date, longitudes, latitudes)
+        for i in range(len(longitudes)):
+            try:
+                times = pt.calc_times(date, dt.timezone.utc, longitudes[i], latitudes[i])
+            except ValueError:
+                assert np.isnan(batch["fajr"][i])
+                continue
+            for name, time in times.items():
+                assert math.isclose(batch[name][i], time.timestamp(), abs_tol=margin)